@@ -0,0 +1,93 @@
+# noqa: INP001
+"""Measure per-row ``JsonlFileDataPersistenceBackend.save`` cost per codec.
+
+Usage::
+
+    uv run python bin/bench_jsonl_codecs.py --rows 200000 --repeat 3
+
+Every installed JSON codec (see ``JSON_CODEC_PREFERENCE``) saves the same
+batch of ``--rows`` rows x 5 columns (int, float, str, bool, date); the best
+of ``--repeat`` runs is reported in microseconds per row. Codecs whose
+library is not installed are listed as skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from limbo_core.adapters.connections.errors import MissingPackageError
+from limbo_core.domain.value_objects import (
+    LocalFilesystemStorageRef,
+    TabularBatch,
+)
+from limbo_core.plugins.builtin.persistence import (
+    JsonlFileDataPersistenceBackend,
+)
+from limbo_core.plugins.builtin.persistence.tabular_file_utils import (
+    JSON_CODEC_PREFERENCE,
+    resolve_json_codec,
+)
+
+
+def _batch(rows: int) -> TabularBatch:
+    start = date(2024, 1, 1)
+    return TabularBatch.from_columns(
+        ("id", "score", "name", "active", "born"),
+        {
+            "id": list(range(rows)),
+            "score": [i * 0.5 for i in range(rows)],
+            "name": [f"user-{i}" for i in range(rows)],
+            "active": [i % 2 == 0 for i in range(rows)],
+            "born": [start + timedelta(days=i % 3650) for i in range(rows)],
+        },
+    )
+
+
+def _best_save_seconds(
+    backend: JsonlFileDataPersistenceBackend,
+    data: TabularBatch,
+    directory: Path,
+    repeat: int,
+) -> float:
+    path = directory / "bench.jsonl"
+    ref = LocalFilesystemStorageRef(
+        backend="file", uri=str(path), local_path=path
+    )
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        backend.save(ref, data)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    """Print the per-row save cost of every installed codec."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    data = _batch(args.rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        for name in JSON_CODEC_PREFERENCE:
+            try:
+                resolve_json_codec(name)
+            except MissingPackageError:
+                sys.stdout.write(f"{name:>8}: skipped (not installed)\n")
+                continue
+            backend = JsonlFileDataPersistenceBackend(
+                directory=directory, json_codec=name
+            )
+            seconds = _best_save_seconds(backend, data, directory, args.repeat)
+            per_row = seconds / args.rows * 1e6
+            sys.stdout.write(f"{name:>8}: {per_row:.2f} us/row\n")
+
+
+if __name__ == "__main__":
+    main()
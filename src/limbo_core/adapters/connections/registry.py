@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from limbo_core.adapters.base_registry import BaseRegistry
 from limbo_core.application.context.errors import ConnectionNotFoundError
@@ -17,16 +17,61 @@ from limbo_core.domain.entities.backends.connection_spec import (
 
 from .errors import UnknownConnectionBackendError
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from limbo_core.application.interfaces.connections import (
+        RowChunk,
+        TableScan,
+        TableStats,
+    )
+
 
 @dataclass(slots=True)
 class ConnectionRegistry(
     BaseRegistry[ConnectionBackend, ConnectionBackendSpec],
     ConnectionRegistryPort,
 ):
-    """Registry for keyed connection backend classes and named instances."""
+    """Registry for keyed connection backend classes and named instances.
+
+    Backends keep their engine between ``connect`` calls; reconfiguring or
+    clearing an instance disposes of the connections it held.
+    """
 
     _backend_label: str = "connection backend"
 
+    def configure(self, spec: ConnectionBackendSpec) -> None:
+        """Configure one named backend, disposing the one it replaces."""
+        previous = self._instances.get(self._normalize_name(spec.name))
+        super(ConnectionRegistry, self).configure(spec)
+        if previous is not None:
+            previous.dispose()
+
+    def clear_instances(self) -> None:
+        """Dispose and clear all configured named backend instances."""
+        self.dispose()
+        super(ConnectionRegistry, self).clear_instances()
+
+    def dispose(self, name: str | None = None) -> None:
+        """Release pooled connections of backend ``name`` (default: all).
+
+        Instances stay configured and reconnect on the next ``connect``.
+
+        Raises:
+            ConnectionNotFoundError: If no backend is configured under *name*.
+        """
+        if name is None:
+            for backend in self._instances.values():
+                backend.dispose()
+            return
+        named = self._instances.get(self._normalize_name(name))
+        if named is None:
+            raise ConnectionNotFoundError(
+                connection_name=name,
+                available_connections=self._instances.keys(),
+            )
+        named.dispose()
+
     def connect(self, name: str) -> Any:
         """Establish the underlying connection for a named backend.
 
@@ -45,5 +90,58 @@ class ConnectionRegistry(
             )
         return backend.connect()
 
+    def scan(
+        self, name: str, scan: TableScan, *, chunk_rows: int
+    ) -> Iterator[RowChunk]:
+        """Stream the rows of ``scan`` through the named backend.
+
+        Returns:
+            An iterator of row chunks.
+        """
+        return self._get_instance(name).scan(scan, chunk_rows=chunk_rows)
+
+    def table_stats(
+        self,
+        name: str,
+        scan: TableScan,
+        *,
+        updated_at_column: str | None = None,
+    ) -> TableStats:
+        """Probe the table of ``scan`` through the named backend.
+
+        Returns:
+            The row count and, if requested, the max ``updated_at_column``.
+        """
+        return self._get_instance(name).table_stats(
+            scan, updated_at_column=updated_at_column
+        )
+
+    def key_bounds(
+        self, name: str, scan: TableScan, *, key_column: str
+    ) -> tuple[object | None, object | None]:
+        """Return the min and max of ``key_column`` via the named backend.
+
+        Returns:
+            The bounds; both None for an empty table.
+        """
+        return self._get_instance(name).key_bounds(scan, key_column=key_column)
+
+    def _get_instance(self, name: str) -> ConnectionBackend:
+        """Return the backend configured under ``name``.
+
+        Returns:
+            The configured backend.
+
+        Raises:
+            ConnectionNotFoundError: If no backend is configured under *name*.
+        """
+        backend = self._instances.get(self._normalize_name(name))
+        if backend is None:
+            raise ConnectionNotFoundError(
+                connection_name=name,
+                available_connections=self._instances.keys(),
+            )
+        return backend
+
     def _unknown_backend_error(self, backend_key: str) -> Exception:
         return UnknownConnectionBackendError(backend_key)
@@ -1,11 +1,23 @@
 """Persistence adapters."""
 
+from .batch_cache import BatchCache, estimate_batch_bytes
 from .data_persistence_registry import DataPersistenceRegistry
 from .path_resolver_registry import PathResolverRegistry
 from .persistor import DefaultPersistor
+from .run_manifest_store import MANIFEST_OBJECT_NAME, FileRunManifestStore
+from .snapshot_index_store import (
+    SNAPSHOT_INDEX_OBJECT_NAME,
+    FileSnapshotIndexStore,
+)
 
 __all__ = [
+    "MANIFEST_OBJECT_NAME",
+    "SNAPSHOT_INDEX_OBJECT_NAME",
+    "BatchCache",
     "DataPersistenceRegistry",
     "DefaultPersistor",
+    "FileRunManifestStore",
+    "FileSnapshotIndexStore",
     "PathResolverRegistry",
+    "estimate_batch_bytes",
 ]
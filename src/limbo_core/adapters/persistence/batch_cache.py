@@ -0,0 +1,231 @@
+"""Byte-bounded LRU cache for tabular batches with spill-to-disk."""
+
+from __future__ import annotations
+
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from limbo_core.domain.value_objects import TabularBatch
+from limbo_core.validation import ValidationError
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from limbo_core.domain.value_objects import CellValue
+
+SIZE_SAMPLE_CELLS = 64
+
+
+def estimate_batch_bytes(batch: TabularBatch) -> int:
+    """Estimate the in-memory size of ``batch`` in bytes.
+
+    Per column, the size of up to ``SIZE_SAMPLE_CELLS`` evenly spaced cells
+    is measured and extrapolated to all rows, so the cost is independent of
+    the row count. Columns exposing an integer ``nbytes`` (such as lazily
+    decoded Arrow columns) report that size instead and are not decoded.
+    Row-major batches are sampled row by row, counting the row mappings,
+    without building their column view.
+
+    Returns:
+        Approximate number of bytes held by the batch's column data.
+    """
+    rows = batch.num_rows
+    total = sys.getsizeof(batch)
+    if rows == 0:
+        return total
+    step = max(1, rows // SIZE_SAMPLE_CELLS)
+    indices = range(0, rows, step)[:SIZE_SAMPLE_CELLS]
+    if not batch.has_column_view:
+        return total + _row_major_bytes(batch.rows, indices)
+    for name in batch.column_names:
+        column: Sequence[CellValue] = batch.column(name)
+        nbytes = getattr(column, "nbytes", None)
+        if isinstance(nbytes, int):
+            total += nbytes
+            continue
+        cell_bytes = sum(sys.getsizeof(column[i]) for i in indices)
+        total += sys.getsizeof(column) + cell_bytes * rows // len(indices)
+    return total
+
+
+def _row_major_bytes(
+    rows: Sequence[Mapping[str, CellValue]], indices: Sequence[int]
+) -> int:
+    """Extrapolate the size of ``rows`` from the rows at ``indices``.
+
+    Returns:
+        Bytes of the row sequence, the row mappings and their cells.
+    """
+    sampled = sum(
+        sys.getsizeof(row) + sum(sys.getsizeof(v) for v in row.values())
+        for row in (rows[i] for i in indices)
+    )
+    return sys.getsizeof(rows) + sampled * len(rows) // len(indices)
+
+
+@dataclass(slots=True)
+class _Entry:
+    batch: TabularBatch
+    nbytes: int
+    spill: bool
+    spill_path: Path | None = None
+
+
+@dataclass(slots=True)
+class BatchCache:
+    """Thread-safe LRU cache of batches bounded by estimated bytes.
+
+    When ``max_bytes`` is exceeded, least recently used entries are evicted.
+    Entries stored with ``spill=True`` (data that exists nowhere else) are
+    written to ``spill_dir`` with pickle protocol 5 and reloaded on access;
+    other entries are simply dropped. ``max_bytes=None`` disables eviction.
+    Without an explicit ``spill_dir`` a temporary directory is created on
+    first spill and removed by ``clear``.
+    """
+
+    max_bytes: int | None = None
+    spill_dir: Path | None = None
+    _entries: OrderedDict[str, _Entry] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _spilled: dict[str, Path] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _nbytes: int = field(default=0, init=False, repr=False)
+    _owned_dir: Path | None = field(default=None, init=False, repr=False)
+    _lock: threading.RLock = field(
+        default_factory=threading.RLock, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        """Validate the memory budget.
+
+        Raises:
+            ValidationError: If ``max_bytes`` is negative.
+        """
+        if self.max_bytes is not None and self.max_bytes < 0:
+            raise ValidationError("max_bytes must not be negative")
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated bytes currently held in memory."""
+        return self._nbytes
+
+    def put(self, name: str, batch: TabularBatch, *, spill: bool) -> None:
+        """Cache ``batch`` under ``name`` as the most recently used entry."""
+        with self._lock:
+            self._discard(name)
+            entry = _Entry(batch, estimate_batch_bytes(batch), spill)
+            self._entries[name] = entry
+            self._nbytes += entry.nbytes
+            self._evict()
+
+    def get(self, name: str) -> TabularBatch | None:
+        """Return the batch for ``name``, reloading it if it was spilled.
+
+        Returns:
+            The cached batch, or None if ``name`` is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None:
+                self._entries.move_to_end(name)
+                return entry.batch
+            path = self._spilled.get(name)
+            if path is None:
+                return None
+            batch = self._read_spill(path)
+            del self._spilled[name]
+            entry = _Entry(batch, estimate_batch_bytes(batch), True, path)
+            self._entries[name] = entry
+            self._nbytes += entry.nbytes
+            self._evict()
+            return batch
+
+    def __contains__(self, name: object) -> bool:
+        """Return True if ``name`` is held in memory or spilled."""
+        with self._lock:
+            return name in self._entries or name in self._spilled
+
+    def pop(self, name: str) -> None:
+        """Remove ``name`` from memory and disk if present."""
+        with self._lock:
+            self._discard(name)
+
+    def clear(self) -> None:
+        """Remove all entries, spill files and the owned scratch directory."""
+        with self._lock:
+            for name in [*self._entries, *self._spilled]:
+                self._discard(name)
+            if self._owned_dir is not None:
+                shutil.rmtree(self._owned_dir, ignore_errors=True)
+                self._owned_dir = None
+
+    def _discard(self, name: str) -> None:
+        entry = self._entries.pop(name, None)
+        if entry is not None:
+            self._nbytes -= entry.nbytes
+            if entry.spill_path is not None:
+                entry.spill_path.unlink(missing_ok=True)
+        path = self._spilled.pop(name, None)
+        if path is not None:
+            path.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """Drop or spill least recently used entries until within budget.
+
+        A spill file is written before its entry leaves memory, so a failed
+        write keeps the entry; entries reloaded from disk reuse their file.
+        """
+        if self.max_bytes is None:
+            return
+        while self._nbytes > self.max_bytes and self._entries:
+            name, entry = next(iter(self._entries.items()))
+            if entry.spill:
+                path = entry.spill_path or self._write_spill(name, entry.batch)
+                self._spilled[name] = path
+            del self._entries[name]
+            self._nbytes -= entry.nbytes
+
+    def _scratch_dir(self) -> Path:
+        if self.spill_dir is not None:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            return self.spill_dir
+        if self._owned_dir is None:
+            self._owned_dir = Path(tempfile.mkdtemp(prefix="limbo-spill-"))
+        return self._owned_dir
+
+    def _write_spill(self, name: str, batch: TabularBatch) -> Path:
+        fd, raw_path = tempfile.mkstemp(
+            prefix=f"{Path(name).name}-", suffix=".pkl", dir=self._scratch_dir()
+        )
+        names = batch.column_names
+        columns = zip(*batch.iter_row_values(), strict=True)
+        payload: tuple[tuple[str, ...], dict[str, Any]] = (
+            names,
+            {c: list(values) for c, values in zip(names, columns, strict=True)}
+            if batch.num_rows
+            else {c: [] for c in names},
+        )
+        path = Path(raw_path)
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump(payload, fh, protocol=5)
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+        return path
+
+    @staticmethod
+    def _read_spill(path: Path) -> TabularBatch:
+        with path.open("rb") as fh:
+            names, columns = pickle.load(fh)
+        return TabularBatch.from_columns(names, columns)
@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from limbo_core.adapters.base_registry import BaseRegistry
 from limbo_core.application.interfaces import (
+    ConnectionProviderPort,
     DataPersistenceBackend,
     DataPersistenceRegistryPort,
     PathResolverRegistryPort,
 )
+from limbo_core.application.interfaces.persistence import DEFAULT_CHUNK_ROWS
 from limbo_core.domain.entities.backends.destination_backend_spec import (
     DestinationBackendSpec,
 )
@@ -20,6 +22,12 @@ from limbo_core.domain.value_objects import LocalFilesystemStorageRef
 from limbo_core.validation import ValidationError
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from limbo_core.application.interfaces.persistence import (
+        ColumnTypes,
+        RowFilter,
+    )
     from limbo_core.domain.value_objects import ResolvedStorageRef, TabularBatch
 
 
@@ -28,14 +36,75 @@ class DataPersistenceRegistry(
     BaseRegistry[DataPersistenceBackend, DestinationBackendSpec],
     DataPersistenceRegistryPort,
 ):
-    """Registry for tabular data persistence backend types and instances."""
+    """Registry for tabular data persistence backend types and instances.
+
+    Storage refs of logical names are resolved once per configured backend
+    and memoized. ``configure`` and ``clear_instances`` drop the memo, as
+    does replacing ``path_resolver_registry`` or changing its resolvers
+    (tracked through its ``revision``, when it has one).
+    Configured backends are bound to ``connection_provider``, if given, so
+    database backends can reach their named connection.
+    """
 
     path_resolver_registry: PathResolverRegistryPort | None = None
+    connection_provider: ConnectionProviderPort | None = None
     _backend_label: str = "data persistence backend"
+    _refs: dict[tuple[str, str], ResolvedStorageRef] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _refs_resolvers: PathResolverRegistryPort | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _refs_revision: object = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def configure(self, spec: DestinationBackendSpec) -> None:
+        """Configure one named backend instance and drop memoized refs."""
+        super(DataPersistenceRegistry, self).configure(spec)
+        if self.connection_provider is not None:
+            self._get_instance(spec.name).bind_connections(
+                self.connection_provider
+            )
+        self._refs.clear()
+
+    def clear_instances(self) -> None:
+        """Clear configured backend instances and memoized refs."""
+        super(DataPersistenceRegistry, self).clear_instances()
+        self._refs.clear()
+
+    def _backend_and_ref(
+        self, backend_key: str, name: str
+    ) -> tuple[DataPersistenceBackend, ResolvedStorageRef]:
+        """Return the backend and the (memoized) storage ref for ``name``.
+
+        Returns:
+            The configured backend and the ref of its object for ``name``.
+        """
+        backend = self._get_instance(backend_key)
+        resolvers = self.path_resolver_registry
+        revision = getattr(resolvers, "revision", None)
+        if (
+            resolvers is not self._refs_resolvers
+            or revision != self._refs_revision
+        ):
+            self._refs.clear()
+            self._refs_resolvers, self._refs_revision = resolvers, revision
+        cache_key = (self._normalize_name(backend_key), name)
+        ref = self._refs.get(cache_key)
+        if ref is None:
+            ref = self._resolve_storage_ref(
+                backend, backend.storage_object_name(name)
+            )
+            self._refs[cache_key] = ref
+        return backend, ref
 
     def _resolve_storage_ref(
         self, backend: DataPersistenceBackend, artifact: str
     ) -> ResolvedStorageRef:
+        own_ref = backend.resolve_storage_ref(artifact)
+        if own_ref is not None:
+            return own_ref
         root = getattr(backend, "directory", None)
         if root is None:
             raise ValidationError(
@@ -43,21 +112,38 @@ class DataPersistenceRegistry(
                 "has no output directory; cannot resolve storage location"
             )
         root_path = Path(root) if not isinstance(root, Path) else root
-        path_spec = PathSpec(backend="file", location=artifact, base=None)
+        storage_backend = getattr(backend, "storage_backend", "file")
+        path_spec = PathSpec(
+            backend=storage_backend, location=artifact, base=None
+        )
         if self.path_resolver_registry is not None:
             return self.path_resolver_registry.resolve_spec(
                 path_spec, base=root_path, allow_missing=True
             )
+        if storage_backend != "file":
+            raise ValidationError(
+                f"Storage backend {storage_backend!r} requires a path "
+                "resolver registry"
+            )
         resolved = root_path / artifact
         return LocalFilesystemStorageRef(
             backend="file", uri=str(resolved), local_path=resolved
         )
 
+    def storage_ref(
+        self, backend_key: str, object_name: str
+    ) -> ResolvedStorageRef:
+        """Resolve a raw object (e.g. a manifest) in the backend's directory.
+
+        Returns:
+            The storage ref for ``object_name``; the object may not exist.
+        """
+        backend = self._get_instance(backend_key)
+        return self._resolve_storage_ref(backend, object_name)
+
     def save(self, backend_key: str, name: str, data: TabularBatch) -> None:
         """Serialize ``data`` for logical ``name`` via the backend."""
-        backend = self._get_instance(backend_key)
-        artifact = backend.storage_object_name(name)
-        ref = self._resolve_storage_ref(backend, artifact)
+        backend, ref = self._backend_and_ref(backend_key, name)
         backend.save(ref, data)
 
     def load(self, backend_key: str, name: str) -> TabularBatch:
@@ -66,23 +152,79 @@ class DataPersistenceRegistry(
         Returns:
             The deserialized ``TabularBatch``.
         """
-        backend = self._get_instance(backend_key)
-        artifact = backend.storage_object_name(name)
-        ref = self._resolve_storage_ref(backend, artifact)
+        backend, ref = self._backend_and_ref(backend_key, name)
         return backend.load(ref)
 
+    def load_projected(
+        self,
+        backend_key: str,
+        name: str,
+        *,
+        columns: Sequence[str] | None = None,
+        filters: Sequence[RowFilter] | None = None,
+    ) -> TabularBatch:
+        """Load selected columns of rows matching ``filters`` for ``name``.
+
+        Returns:
+            The projected ``TabularBatch``.
+        """
+        backend, ref = self._backend_and_ref(backend_key, name)
+        return backend.load_projected(ref, columns=columns, filters=filters)
+
+    def load_typed(
+        self, backend_key: str, name: str, column_types: ColumnTypes
+    ) -> TabularBatch:
+        """Load ``name`` with columns converted to their declared types.
+
+        Returns:
+            The typed ``TabularBatch``.
+        """
+        backend, ref = self._backend_and_ref(backend_key, name)
+        return backend.load_typed(ref, column_types)
+
+    def save_stream(
+        self,
+        backend_key: str,
+        name: str,
+        column_names: tuple[str, ...],
+        chunks: Iterable[TabularBatch],
+        *,
+        column_types: ColumnTypes | None = None,
+    ) -> None:
+        """Write consecutive chunks for logical ``name`` via the backend."""
+        backend, ref = self._backend_and_ref(backend_key, name)
+        backend.save_stream(
+            ref, column_names, chunks, column_types=column_types
+        )
+
+    def iter_load(
+        self,
+        backend_key: str,
+        name: str,
+        *,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    ) -> Iterator[TabularBatch]:
+        """Load ``name`` from the backend as batches of at most ``chunk_rows``.
+
+        Returns:
+            An iterator of ``TabularBatch`` chunks in storage order.
+
+        Raises:
+            ValidationError: If ``chunk_rows`` is not positive.
+        """
+        if chunk_rows < 1:
+            raise ValidationError("chunk_rows must be at least 1")
+        backend, ref = self._backend_and_ref(backend_key, name)
+        return backend.iter_load(ref, chunk_rows=chunk_rows)
+
     def exists(self, backend_key: str, name: str) -> bool:
         """Return True if persisted data exists for ``name``."""
-        backend = self._get_instance(backend_key)
-        artifact = backend.storage_object_name(name)
-        ref = self._resolve_storage_ref(backend, artifact)
+        backend, ref = self._backend_and_ref(backend_key, name)
         return backend.exists(ref)
 
     def cleanup(self, backend_key: str, name: str) -> None:
         """Remove persisted data for ``name`` if present."""
-        backend = self._get_instance(backend_key)
-        artifact = backend.storage_object_name(name)
-        ref = self._resolve_storage_ref(backend, artifact)
+        backend, ref = self._backend_and_ref(backend_key, name)
         backend.cleanup(ref)
 
     def _get_instance(self, backend_key: str) -> DataPersistenceBackend:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from limbo_core.adapters.base_registry import BaseRegistry
@@ -28,9 +28,46 @@ if TYPE_CHECKING:
 class PathResolverRegistry(
     BaseRegistry[PathResolverBackend, PathBackendSpec], PathResolverRegistryPort
 ):
-    """Resolve path expressions through backend dispatch."""
+    """Resolve path expressions through backend dispatch.
+
+    Backends without a configured instance are created with default config
+    on first use and reused until ``register`` or ``clear_types``.
+    ``revision`` changes whenever backend types or instances do, so callers
+    memoizing resolved refs can tell when to drop them.
+    """
 
     _backend_label: str = "path resolver backend"
+    _defaults: dict[str, PathResolverBackend] = field(default_factory=dict)
+    _revision: int = field(default=0, init=False, repr=False, compare=False)
+
+    @property
+    def revision(self) -> int:
+        """Counter bumped by every change to backend types or instances."""
+        return self._revision
+
+    def register(
+        self, backend_key: str, backend_class: type[PathResolverBackend]
+    ) -> None:
+        """Register one backend class and drop default instances."""
+        super(PathResolverRegistry, self).register(backend_key, backend_class)
+        self._defaults.clear()
+        self._revision += 1
+
+    def configure(self, spec: PathBackendSpec) -> None:
+        """Configure one named backend instance."""
+        super(PathResolverRegistry, self).configure(spec)
+        self._revision += 1
+
+    def clear_instances(self) -> None:
+        """Clear configured backend instances."""
+        super(PathResolverRegistry, self).clear_instances()
+        self._revision += 1
+
+    def clear_types(self) -> None:
+        """Clear registered backend classes and default instances."""
+        super(PathResolverRegistry, self).clear_types()
+        self._defaults.clear()
+        self._revision += 1
 
     def resolve(
         self, raw_path: Any, *, context: ResolutionContext | None = None
@@ -41,10 +78,7 @@ class PathResolverRegistry(
             A storage reference for the resolved object.
         """
         path_spec = parse_path_spec(raw_path)
-        backend_name = self._normalize_name(path_spec.backend)
-        backend = self._instances.get(backend_name)
-        if backend is None:
-            backend = self.create(path_spec.backend)
+        backend = self._backend_for(path_spec.backend)
         aliases = context.build_alias_map() if context is not None else {}
         base = self._resolve_base_alias(path_spec.base, aliases=aliases)
         return backend.resolve(path_spec, base=base, allow_missing=False)
@@ -62,10 +96,7 @@ class PathResolverRegistry(
         Returns:
             A ``ResolvedStorageRef`` for the resolved location.
         """
-        backend_name = self._normalize_name(path_spec.backend)
-        backend = self._instances.get(backend_name)
-        if backend is None:
-            backend = self.create(path_spec.backend)
+        backend = self._backend_for(path_spec.backend)
         if path_spec.base is not None and context is not None:
             resolved_base = self._resolve_base_alias(
                 path_spec.base, aliases=context.build_alias_map()
@@ -76,6 +107,22 @@ class PathResolverRegistry(
             path_spec, base=resolved_base, allow_missing=allow_missing
         )
 
+    def _backend_for(self, backend_key: str) -> PathResolverBackend:
+        """Return the configured instance or the cached default backend.
+
+        Returns:
+            The backend resolving paths for ``backend_key``.
+        """
+        backend = self._instances.get(self._normalize_name(backend_key))
+        if backend is not None:
+            return backend
+        normalized = self._normalize_key(backend_key)
+        backend = self._defaults.get(normalized)
+        if backend is None:
+            backend = self.create(normalized)
+            self._defaults[normalized] = backend
+        return backend
+
     @staticmethod
     def _resolve_base_alias(
         base: str | None, *, aliases: dict[str, Any]
@@ -7,8 +7,13 @@ from typing import TYPE_CHECKING
 
 from limbo_core.application.interfaces.persistence import Persistor
 
+from .batch_cache import BatchCache
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from limbo_core.application.interfaces.persistence import (
+        ColumnTypes,
         DataPersistenceResolverPort,
     )
     from limbo_core.domain.value_objects import TabularBatch
@@ -22,30 +27,64 @@ class DefaultPersistor(Persistor):
     data persistence backend **and** cached locally. When False the data is
     only held in the local cache for downstream dependents.
 
+    The cache is a byte-bounded LRU (see ``BatchCache``): evicted
+    materialized entries are reloaded from the backend, while evicted
+    cache-only entries are spilled to local scratch files and reloaded
+    transparently.
+
     ``backend_key`` must name a configured data persistence backend instance
     (no default).
     """
 
     data_resolver: DataPersistenceResolverPort
     backend_key: str
-    _cache: dict[str, TabularBatch] = field(default_factory=dict)
+    cache: BatchCache = field(default_factory=BatchCache)
 
     def save(
         self, name: str, data: TabularBatch, *, materialize: bool = True
     ) -> None:
         """Save data, optionally materializing to permanent storage."""
-        self._cache[name] = data
+        self.cache.put(name, data, spill=not materialize)
         if materialize:
             self.data_resolver.save(self.backend_key, name, data)
 
+    def save_stream(
+        self,
+        name: str,
+        column_names: tuple[str, ...],
+        chunks: Iterable[TabularBatch],
+        *,
+        materialize: bool = True,
+        column_types: ColumnTypes | None = None,
+    ) -> None:
+        """Stream chunks to the backend, or cache them when not materialized.
+
+        Materialized streams are written chunk by chunk and are not cached,
+        so ``load`` reads them back from the backend.
+        """
+        if not materialize:
+            Persistor.save_stream(
+                self, name, column_names, chunks, materialize=False
+            )
+            return
+        self.cache.pop(name)
+        self.data_resolver.save_stream(
+            self.backend_key,
+            name,
+            column_names,
+            chunks,
+            column_types=column_types,
+        )
+
     def load(self, name: str) -> TabularBatch:
         """Load data from cache first, falling back to data backend.
 
         Returns:
             The tabular batch for ``name``.
         """
-        if name in self._cache:
-            return self._cache[name]
+        cached = self.cache.get(name)
+        if cached is not None:
+            return cached
         return self.data_resolver.load(self.backend_key, name)
 
     def exists(self, name: str) -> bool:
@@ -54,11 +93,15 @@ class DefaultPersistor(Persistor):
         Returns:
             True if the name is cached or persisted.
         """
-        if name in self._cache:
+        if name in self.cache:
             return True
         return self.data_resolver.exists(self.backend_key, name)
 
     def cleanup(self, name: str) -> None:
         """Remove data from both cache and data backend."""
-        self._cache.pop(name, None)
+        self.cache.pop(name)
         self.data_resolver.cleanup(self.backend_key, name)
+
+    def release(self, name: str) -> None:
+        """Drop the cached copy; materialized data stays in the backend."""
+        self.cache.pop(name)
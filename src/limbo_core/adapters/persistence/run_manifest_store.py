@@ -0,0 +1,37 @@
+"""JSON run manifest stored next to destination outputs."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from limbo_core.application.interfaces.persistence import RunManifestStorePort
+from limbo_core.domain.value_objects import RunManifest
+
+if TYPE_CHECKING:
+    from limbo_core.domain.value_objects import ResolvedStorageRef
+
+MANIFEST_OBJECT_NAME = "_limbo_run_manifest.json"
+
+
+@dataclass(slots=True)
+class FileRunManifestStore(RunManifestStorePort):
+    """Read/write the run manifest as a JSON document at ``ref``."""
+
+    ref: ResolvedStorageRef
+
+    def load(self) -> RunManifest:
+        """Read the manifest.
+
+        Returns:
+            The stored manifest, or an empty one if the file is missing.
+        """
+        if not self.ref.exists():
+            return RunManifest()
+        return RunManifest.from_document(json.loads(self.ref.read_bytes()))
+
+    def save(self, manifest: RunManifest) -> None:
+        """Write ``manifest`` atomically."""
+        payload = json.dumps(manifest.to_document(), indent=2, sort_keys=True)
+        self.ref.write_bytes(payload.encode())
@@ -0,0 +1,37 @@
+"""JSON index of source snapshots stored next to the snapshots."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from limbo_core.application.interfaces.persistence import SnapshotIndexStorePort
+from limbo_core.domain.value_objects import SnapshotIndex
+
+if TYPE_CHECKING:
+    from limbo_core.domain.value_objects import ResolvedStorageRef
+
+SNAPSHOT_INDEX_OBJECT_NAME = "_limbo_snapshots.json"
+
+
+@dataclass(slots=True)
+class FileSnapshotIndexStore(SnapshotIndexStorePort):
+    """Read/write the snapshot index as a JSON document at ``ref``."""
+
+    ref: ResolvedStorageRef
+
+    def load(self) -> SnapshotIndex:
+        """Read the index.
+
+        Returns:
+            The stored index, or an empty one if the file is missing.
+        """
+        if not self.ref.exists():
+            return SnapshotIndex()
+        return SnapshotIndex.from_document(json.loads(self.ref.read_bytes()))
+
+    def save(self, index: SnapshotIndex) -> None:
+        """Write ``index`` atomically."""
+        payload = json.dumps(index.to_document(), indent=2, sort_keys=True)
+        self.ref.write_bytes(payload.encode())
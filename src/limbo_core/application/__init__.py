@@ -2,12 +2,25 @@
 
 from .interfaces import PluginLoader
 from .parsers import ParseError, ProjectParser
-from .services import ProjectLoaderService, ProjectValidatorService
+from .services import (
+    ArtifactScheduler,
+    GenerationRunService,
+    ProjectLoaderService,
+    ProjectValidatorService,
+    SourceReaderService,
+    SourceSnapshotService,
+    TableGenerationService,
+)
 
 __all__ = [
+    "ArtifactScheduler",
+    "GenerationRunService",
     "ParseError",
     "PluginLoader",
     "ProjectLoaderService",
     "ProjectParser",
     "ProjectValidatorService",
+    "SourceReaderService",
+    "SourceSnapshotService",
+    "TableGenerationService",
 ]
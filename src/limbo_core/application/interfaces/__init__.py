@@ -11,7 +11,9 @@ from .generators import (
     Generator,
     GeneratorRegistration,
     GeneratorRegistryPort,
+    ResolvedGeneratorHook,
     generates,
+    generates_batch,
 )
 from .persistence import (
     CellValue,
@@ -51,9 +53,11 @@ __all__ = [
     "Persistor",
     "PluginLoader",
     "ReferenceResolver",
+    "ResolvedGeneratorHook",
     "TabularBatch",
     "ValueReaderBackend",
     "ValueReaderRegistryPort",
     "ValueResolverPort",
     "generates",
+    "generates_batch",
 ]
@@ -3,9 +3,14 @@
 from .connection_backend import ConnectionBackend
 from .connection_provider import ConnectionProviderPort
 from .connection_registry import ConnectionRegistryPort
+from .table_scan import KeyRange, RowChunk, TableScan, TableStats
 
 __all__ = [
     "ConnectionBackend",
     "ConnectionProviderPort",
     "ConnectionRegistryPort",
+    "KeyRange",
+    "RowChunk",
+    "TableScan",
+    "TableStats",
 ]
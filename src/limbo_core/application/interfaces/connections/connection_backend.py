@@ -5,9 +5,15 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Self
 
+from limbo_core.validation import ValidationError
+
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from limbo_core.domain.entities import ConnectionBackendSpec
 
+    from .table_scan import RowChunk, TableScan, TableStats
+
 
 class ConnectionBackend(ABC):
     """Runtime backend created from project connection specs."""
@@ -20,3 +26,46 @@ class ConnectionBackend(ABC):
     @abstractmethod
     def connect(self) -> Any:
         """Establish the underlying connection."""
+
+    def dispose(self) -> None:  # noqa: B027
+        """Release pooled connections; the next ``connect`` reopens them."""
+
+    def scan(self, scan: TableScan, *, chunk_rows: int) -> Iterator[RowChunk]:
+        """Stream the rows of ``scan`` in chunks of at most ``chunk_rows``.
+
+        Implementations should use server-side cursors so that memory stays
+        bounded by one chunk, and restrict the rows to ``scan.key_range``
+        when it is set.
+
+        Raises:
+            ValidationError: If the backend cannot read tables.
+        """
+        raise ValidationError(
+            f"Connection backend {type(self).__name__!r} cannot scan tables"
+        )
+
+    def table_stats(
+        self, scan: TableScan, *, updated_at_column: str | None = None
+    ) -> TableStats:
+        """Return the row count (and max ``updated_at_column``) of a table.
+
+        Used as a cheap freshness probe; it must not read the rows.
+
+        Raises:
+            ValidationError: If the backend cannot probe tables.
+        """
+        raise ValidationError(
+            f"Connection backend {type(self).__name__!r} cannot probe tables"
+        )
+
+    def key_bounds(
+        self, scan: TableScan, *, key_column: str
+    ) -> tuple[object | None, object | None]:
+        """Return the min and max of ``key_column`` in the table of ``scan``.
+
+        Raises:
+            ValidationError: If the backend cannot probe tables.
+        """
+        raise ValidationError(
+            f"Connection backend {type(self).__name__!r} cannot probe tables"
+        )
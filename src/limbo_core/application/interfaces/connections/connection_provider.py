@@ -7,7 +7,14 @@ not the full ``ConnectionRegistryPort``.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from limbo_core.validation import ValidationError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .table_scan import RowChunk, TableScan, TableStats
 
 
 class ConnectionProviderPort(ABC):
@@ -16,3 +23,43 @@ class ConnectionProviderPort(ABC):
     @abstractmethod
     def connect(self, name: str) -> Any:
         """Establish the underlying connection for a named backend."""
+
+    def scan(
+        self, name: str, scan: TableScan, *, chunk_rows: int
+    ) -> Iterator[RowChunk]:
+        """Stream the rows of ``scan`` through the named connection.
+
+        Raises:
+            ValidationError: If the provider cannot read tables.
+        """
+        raise ValidationError(
+            f"Connection provider {type(self).__name__!r} cannot scan tables"
+        )
+
+    def table_stats(
+        self,
+        name: str,
+        scan: TableScan,
+        *,
+        updated_at_column: str | None = None,
+    ) -> TableStats:
+        """Probe the table of ``scan`` through the named connection.
+
+        Raises:
+            ValidationError: If the provider cannot probe tables.
+        """
+        raise ValidationError(
+            f"Connection provider {type(self).__name__!r} cannot probe tables"
+        )
+
+    def key_bounds(
+        self, name: str, scan: TableScan, *, key_column: str
+    ) -> tuple[object | None, object | None]:
+        """Return the min and max of ``key_column`` via the named connection.
+
+        Raises:
+            ValidationError: If the provider cannot probe tables.
+        """
+        raise ValidationError(
+            f"Connection provider {type(self).__name__!r} cannot probe tables"
+        )
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from abc import abstractmethod
+
 from limbo_core.application.interfaces.base_registry import BaseRegistryPort
 from limbo_core.domain.entities.backends.connection_spec import (
     ConnectionBackendSpec,
@@ -16,3 +18,7 @@ class ConnectionRegistryPort(
     ConnectionProviderPort,
 ):
     """Registry contract for connection backend classes and instances."""
+
+    @abstractmethod
+    def dispose(self, name: str | None = None) -> None:
+        """Release the connections of backend ``name`` (default: all)."""
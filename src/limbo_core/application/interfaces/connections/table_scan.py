@@ -0,0 +1,43 @@
+"""Table scan request passed to connection backends."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+RowChunk = list[tuple[object, ...]]
+"""Rows of one fetched chunk, values in ``TableScan.column_names`` order."""
+
+
+@dataclass(frozen=True, slots=True)
+class KeyRange:
+    """Half-open range ``[lower, upper)`` of a partitioning key column.
+
+    A None bound is unbounded; a range without ``lower`` also matches rows
+    whose key is NULL, so a set of adjacent ranges covers the whole table.
+    """
+
+    column: str
+    lower: object | None = None
+    upper: object | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class TableScan:
+    """Columns of one database table to read, optionally one key range."""
+
+    table_name: str
+    column_names: tuple[str, ...]
+    schema_name: str | None = None
+    key_range: KeyRange | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class TableStats:
+    """Cheap freshness probe of a table.
+
+    ``max_updated_at`` is the largest value of the probed timestamp column,
+    or None when no column was probed or the table is empty.
+    """
+
+    row_count: int
+    max_updated_at: object | None = None
@@ -1,13 +1,16 @@
 """Generator interfaces."""
 
-from .generates import generates
+from .generates import generates, generates_batch
 from .generator import Generator
 from .registration import GeneratorRegistration
 from .registry import GeneratorRegistryPort
+from .resolved_hook import ResolvedGeneratorHook
 
 __all__ = [
     "Generator",
     "GeneratorRegistration",
     "GeneratorRegistryPort",
+    "ResolvedGeneratorHook",
     "generates",
+    "generates_batch",
 ]
@@ -28,3 +28,27 @@ def generates(hook: str) -> Callable[[GenerateMethod], GenerateMethod]:
         return method
 
     return decorator
+
+
+def generates_batch(hook: str) -> Callable[[GenerateMethod], GenerateMethod]:
+    """Declare that a method generates a whole column for a local hook.
+
+    The decorated method is called as ``method(context, count, **options)``
+    and must return ``count`` values as a list, tuple, or array (e.g. a NumPy
+    array). It may be combined with a ``@generates`` method for the same hook;
+    callers fall back to looping the scalar method when no batch method exists.
+
+    Args:
+        hook: The local hook name.
+
+    Returns:
+        The decorated method that handles the given hook for whole batches.
+    """
+
+    def decorator(method: GenerateMethod) -> GenerateMethod:
+        hooks: list[str] = getattr(method, "_limbo_batch_hooks", [])
+        hooks.append(hook)
+        method._limbo_batch_hooks = hooks  # type: ignore[attr-defined]
+        return method
+
+    return decorator
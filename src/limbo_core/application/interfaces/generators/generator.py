@@ -2,39 +2,141 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
+from functools import cache
+from importlib import metadata
 from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
     from limbo_core.domain.entities import GenerationContext
 
+ScalarHook = Callable[..., Any]
+BatchHook = Callable[..., Sequence[Any]]
+
 
 class Generator:
-    """Base class for value generators with multiple hooks."""
+    """Base class for value generators with multiple hooks.
+
+    ``version`` identifies the generator's behaviour in content
+    fingerprints; when unset, the version of the distribution providing the
+    generator's package is used.
+    """
 
+    version: ClassVar[str | None] = None
     _hook_registry: ClassVar[dict[str, str]]  # local_hook -> method_name
+    _batch_hook_registry: ClassVar[dict[str, str]]  # local_hook -> method_name
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
-        """Discover all @generates-decorated methods on subclass definition.
+        """Discover all @generates/@generates_batch methods on the subclass.
 
         Raises:
-            TypeError: If the same hook is declared more than once on the
-                subclass hierarchy.
+            TypeError: If the same hook is declared more than once (per kind)
+                on the subclass hierarchy.
         """
         super().__init_subclass__(**kwargs)
         cls._hook_registry = {}
+        cls._batch_hook_registry = {}
         for attr_name in dir(cls):
             attr = getattr(cls, attr_name, None)
-            if callable(attr):
-                for hook in getattr(attr, "_limbo_hooks", []):
-                    if hook in cls._hook_registry:
-                        msg = f"Duplicate hook '{hook}' in {cls.__name__}"
-                        raise TypeError(msg)
-                    cls._hook_registry[hook] = attr_name
+            if not callable(attr):
+                continue
+            for hook in getattr(attr, "_limbo_hooks", []):
+                if hook in cls._hook_registry:
+                    msg = f"Duplicate hook '{hook}' in {cls.__name__}"
+                    raise TypeError(msg)
+                cls._hook_registry[hook] = attr_name
+            for hook in getattr(attr, "_limbo_batch_hooks", []):
+                if hook in cls._batch_hook_registry:
+                    msg = f"Duplicate batch hook '{hook}' in {cls.__name__}"
+                    raise TypeError(msg)
+                cls._batch_hook_registry[hook] = attr_name
 
     @classmethod
     def get_hooks(cls) -> frozenset[str]:
         """Return all local hooks supported by this generator class."""
-        return frozenset(cls._hook_registry)
+        return frozenset(cls._hook_registry) | frozenset(
+            cls._batch_hook_registry
+        )
+
+    @classmethod
+    def has_batch_hook(cls, hook: str) -> bool:
+        """Return True if ``hook`` has a native ``@generates_batch`` method."""
+        return hook in cls._batch_hook_registry
+
+    @classmethod
+    def plugin_version(cls) -> str | None:
+        """Return ``version`` or the providing distribution's version.
+
+        Returns:
+            The version string, or None if it cannot be determined.
+        """
+        if cls.version is not None:
+            return cls.version
+        return _distribution_version(cls.__module__.partition(".")[0])
+
+    def scalar_hook(self, hook: str) -> ScalarHook:
+        """Return a callable producing one value for ``hook``.
+
+        Resolve once per column and call it per row to avoid repeated hook
+        lookups. Batch-only hooks are wrapped to generate a batch of one.
+
+        Returns:
+            A callable taking ``(context, **options)``.
+
+        Raises:
+            ValueError: If the hook is not supported by this generator.
+        """
+        method_name = self._hook_registry.get(hook)
+        if method_name is not None:
+            method: ScalarHook = getattr(self, method_name)
+            return method
+        batch_name = self._batch_hook_registry.get(hook)
+        if batch_name is None:
+            msg = f"Hook '{hook}' not supported by {type(self).__name__}"
+            raise ValueError(msg)
+        batch_method: BatchHook = getattr(self, batch_name)
+
+        def generate_one(context: GenerationContext, **options: Any) -> Any:
+            return batch_method(context, 1, **options)[0]
+
+        return generate_one
+
+    def batch_hook(self, hook: str) -> BatchHook:
+        """Return a callable producing a whole column for ``hook``.
+
+        Without a native batch method the scalar method is looped, advancing
+        ``context.row_index`` for each value and restoring it afterwards.
+
+        Returns:
+            A callable taking ``(context, count, **options)``.
+
+        Raises:
+            ValueError: If the hook is not supported by this generator.
+        """
+        batch_name = self._batch_hook_registry.get(hook)
+        if batch_name is not None:
+            method: BatchHook = getattr(self, batch_name)
+            return method
+        method_name = self._hook_registry.get(hook)
+        if method_name is None:
+            msg = f"Hook '{hook}' not supported by {type(self).__name__}"
+            raise ValueError(msg)
+        scalar: ScalarHook = getattr(self, method_name)
+
+        def generate_many(
+            context: GenerationContext, count: int, **options: Any
+        ) -> list[Any]:
+            start = context.row_index
+            values = []
+            try:
+                for offset in range(count):
+                    context.row_index = start + offset
+                    values.append(scalar(context, **options))
+            finally:
+                context.row_index = start
+            return values
+
+        return generate_many
 
     def generate(
         self, hook: str, context: GenerationContext, **options: Any
@@ -48,19 +150,50 @@ class Generator:
 
         Returns:
             Generated value for the requested hook.
+        """
+        return self.scalar_hook(hook)(context, **options)
+
+    def generate_batch(
+        self, hook: str, context: GenerationContext, count: int, **options: Any
+    ) -> Sequence[Any]:
+        """Generate ``count`` values for the given local hook.
+
+        Args:
+            hook: Local hook name (without namespace).
+            context: Shared generation context; ``row_index`` is the index of
+                the first row in the batch.
+            count: Number of values to generate.
+            **options: Generator-specific options.
+
+        Returns:
+            Sequence (list, tuple, or array) of ``count`` generated values.
 
         Raises:
-            ValueError: If the hook is not supported by this generator.
+            ValueError: If the batch hook returns the wrong number of values.
         """
-        method_name = self._hook_registry.get(hook)
-        if method_name is None:
-            msg = f"Hook '{hook}' not supported by {type(self).__name__}"
+        values = self.batch_hook(hook)(context, count, **options)
+        if len(values) != count:
+            msg = (
+                f"Batch hook '{hook}' of {type(self).__name__} returned "
+                f"{len(values)} values, expected {count}"
+            )
             raise ValueError(msg)
-        method = getattr(self, method_name)
-        return method(context, **options)
+        return values
 
     def setup(self, context: GenerationContext) -> None:
         """Optional lifecycle hook called before a table is generated."""
 
     def teardown(self, context: GenerationContext) -> None:
         """Optional lifecycle hook called after a table is generated."""
+
+
+@cache
+def _distribution_version(package: str) -> str | None:
+    """Return the version of the distribution providing ``package``."""
+    distributions = metadata.packages_distributions().get(package)
+    if not distributions:
+        return None
+    try:
+        return metadata.version(distributions[0])
+    except metadata.PackageNotFoundError:
+        return None
@@ -5,6 +5,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from .resolved_hook import ResolvedGeneratorHook
+
 if TYPE_CHECKING:
     from .generator import Generator
     from .registration import GeneratorRegistration
@@ -25,6 +27,20 @@ class GeneratorRegistryPort(ABC):
     def resolve(self, qualified_hook: str) -> tuple[type[Generator], str]:
         """Resolve a fully-qualified hook to (generator_class, local_hook)."""
 
+    def resolve_hook(self, qualified_hook: str) -> ResolvedGeneratorHook:
+        """Resolve a fully-qualified hook including batch support details.
+
+        Returns:
+            The generator class, local hook name, and whether the hook has a
+            native ``@generates_batch`` implementation.
+        """
+        generator_class, local_hook = self.resolve(qualified_hook)
+        return ResolvedGeneratorHook(
+            generator_class=generator_class,
+            local_hook=local_hook,
+            supports_batch=generator_class.has_batch_hook(local_hook),
+        )
+
     @abstractmethod
     def clear(self) -> None:
         """Clear all registered generators."""
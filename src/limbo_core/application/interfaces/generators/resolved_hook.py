@@ -0,0 +1,23 @@
+"""Resolved generator hook descriptor."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .generator import Generator
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedGeneratorHook:
+    """Generator class and local hook behind a fully qualified hook.
+
+    ``supports_batch`` is True when the hook has a native
+    ``@generates_batch`` method; otherwise batch generation loops the scalar
+    method.
+    """
+
+    generator_class: type[Generator]
+    local_hook: str
+    supports_batch: bool
@@ -2,22 +2,43 @@
 
 from limbo_core.domain.value_objects import CellValue, TabularBatch
 
-from .data_persistence_backend import DataPersistenceBackend
+from .column_types import (
+    FALSE_TEXT,
+    TRUE_TEXT,
+    ColumnTypes,
+    convert_batch,
+    text_converter,
+)
+from .data_persistence_backend import DEFAULT_CHUNK_ROWS, DataPersistenceBackend
 from .data_persistence_registry_port import DataPersistenceRegistryPort
 from .data_persistence_resolver_port import DataPersistenceResolverPort
 from .path_resolver_backend import PathResolverBackend
 from .path_resolver_port import PathResolverPort
 from .path_resolver_registry_port import PathResolverRegistryPort
 from .persistor import Persistor
+from .row_filter import FilterOp, RowFilter, validate_row_filters
+from .run_manifest_store_port import RunManifestStorePort
+from .snapshot_index_store_port import SnapshotIndexStorePort
 
 __all__ = [
+    "DEFAULT_CHUNK_ROWS",
+    "FALSE_TEXT",
+    "TRUE_TEXT",
     "CellValue",
+    "ColumnTypes",
     "DataPersistenceBackend",
     "DataPersistenceRegistryPort",
     "DataPersistenceResolverPort",
+    "FilterOp",
     "PathResolverBackend",
     "PathResolverPort",
     "PathResolverRegistryPort",
     "Persistor",
+    "RowFilter",
+    "RunManifestStorePort",
+    "SnapshotIndexStorePort",
     "TabularBatch",
+    "convert_batch",
+    "text_converter",
+    "validate_row_filters",
 ]
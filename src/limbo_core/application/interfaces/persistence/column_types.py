@@ -0,0 +1,129 @@
+"""Per-column conversion of loaded cells to declared ``DataType``s."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from datetime import date, datetime
+from typing import Any
+
+from limbo_core.domain.entities import DataType
+from limbo_core.domain.validation import ValidationError
+from limbo_core.domain.value_objects import CellValue, TabularBatch
+
+ColumnTypes = Mapping[str, DataType]
+"""Declared type per column name, e.g. ``artifact.column_types``."""
+
+CellConverter = Callable[[Any], CellValue]
+
+TRUE_TEXT = frozenset({"true", "t", "1", "yes", "y"})
+"""Spellings (compared case-insensitively) parsed as ``BOOLEAN`` true."""
+
+FALSE_TEXT = frozenset({"false", "f", "0", "no", "n"})
+"""Spellings (compared case-insensitively) parsed as ``BOOLEAN`` false."""
+
+
+def _parse_bool(text: str) -> bool:
+    lowered = text.strip().lower()
+    if lowered in TRUE_TEXT:
+        return True
+    if lowered in FALSE_TEXT:
+        return False
+    raise ValueError(text)
+
+
+def _parse_datetime(text: str) -> datetime:
+    value = datetime.fromisoformat(text)
+    if value.tzinfo is not None:
+        raise ValueError(text)
+    return value
+
+
+def _parse_timestamp(text: str) -> datetime:
+    value = datetime.fromisoformat(text)
+    if value.tzinfo is None:
+        raise ValueError(text)
+    return value
+
+
+_TEXT_PARSERS: dict[DataType, Callable[[str], CellValue]] = {
+    DataType.STRING: str,
+    DataType.INTEGER: int,
+    DataType.FLOAT: float,
+    DataType.BOOLEAN: _parse_bool,
+    DataType.DATE: date.fromisoformat,
+    DataType.DATETIME: _parse_datetime,
+    DataType.TIMESTAMP: _parse_timestamp,
+}
+
+
+def text_converter(column: str, data_type: DataType) -> CellConverter:
+    """Build a converter from non-empty text to ``data_type``.
+
+    ``DATETIME`` values are naive wall-clock times and ``TIMESTAMP`` values
+    must carry a UTC offset, matching Arrow's ``timestamp`` semantics.
+
+    Returns:
+        A callable converting one text cell.
+    """
+    parse = _TEXT_PARSERS[data_type]
+
+    def convert(text: Any) -> CellValue:
+        try:
+            return parse(text)
+        except ValueError:
+            raise ValidationError(
+                f"Column {column!r}: cannot convert {text!r} to {data_type}"
+            ) from None
+
+    return convert
+
+
+def value_converter(column: str, data_type: DataType) -> CellConverter:
+    """Build a converter for already decoded cells.
+
+    Text is parsed as in ``text_converter``, ints are widened for ``FLOAT``,
+    ``STRING`` columns render values as text and other values are kept.
+
+    Returns:
+        A callable converting one cell.
+    """
+    from_text = text_converter(column, data_type)
+
+    def convert(value: Any) -> CellValue:
+        if isinstance(value, str):
+            if data_type is DataType.STRING:
+                return value
+            return from_text(value) if value else None
+        if data_type is DataType.FLOAT and type(value) is int:
+            return float(value)
+        if data_type is DataType.STRING:
+            if isinstance(value, bool):
+                return "true" if value else "false"
+            if isinstance(value, date):
+                return value.isoformat()
+            return str(value)
+        return value  # type: ignore[no-any-return]
+
+    return convert
+
+
+def convert_batch(
+    batch: TabularBatch, column_types: ColumnTypes
+) -> TabularBatch:
+    """Convert the typed columns of ``batch`` to their declared types.
+
+    Columns absent from ``column_types`` are kept unchanged.
+
+    Returns:
+        A column-major batch with converted columns.
+    """
+    columns: dict[str, Any] = {}
+    for name in batch.column_names:
+        column = batch.column(name)
+        data_type = column_types.get(name)
+        if data_type is None:
+            columns[name] = column
+            continue
+        convert = value_converter(name, data_type)
+        columns[name] = [None if v is None else convert(v) for v in column]
+    return TabularBatch.from_columns(batch.column_names, columns)
@@ -5,17 +5,60 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from limbo_core.domain.validation import ValidationError
+from limbo_core.domain.value_objects import TabularBatch
+
+from .column_types import convert_batch
+from .row_filter import matching_row_indices
+
 if TYPE_CHECKING:
-    from limbo_core.domain.value_objects import ResolvedStorageRef, TabularBatch
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from limbo_core.application.interfaces.connections import (
+        ConnectionProviderPort,
+    )
+    from limbo_core.domain.value_objects import ResolvedStorageRef
+
+    from .column_types import ColumnTypes
+    from .row_filter import RowFilter
+
+DEFAULT_CHUNK_ROWS = 65_536
 
 
 class DataPersistenceBackend(ABC):
-    """Serialize and deserialize TabularBatch through resolved storage refs."""
+    """Serialize and deserialize TabularBatch through resolved storage refs.
+
+    ``save_stream``, ``iter_load``, ``load_projected`` and ``load_typed``
+    have whole-batch fallbacks built on ``save``/``load``; backends that can
+    write or read incrementally, push projections down into the file format
+    or decode cells straight to their declared types should override them.
+    """
 
     @abstractmethod
     def storage_object_name(self, logical_name: str) -> str:
         """Return storage id for the artifact (e.g. filename with suffix)."""
 
+    def resolve_storage_ref(
+        self, object_name: str
+    ) -> ResolvedStorageRef | None:
+        """Return the ref of ``object_name`` if the backend resolves it.
+
+        The default returns None: the registry resolves ``object_name``
+        under the backend's ``directory`` through the path resolvers.
+        Backends storing data outside files (e.g. database tables) return
+        their own refs.
+
+        Returns:
+            A backend-specific ref, or None to use the path resolvers.
+        """
+        del object_name
+        return None
+
+    def bind_connections(  # noqa: B027
+        self, connections: ConnectionProviderPort
+    ) -> None:
+        """Receive the configured connections; file backends ignore them."""
+
     @abstractmethod
     def save(self, ref: ResolvedStorageRef, data: TabularBatch) -> None:
         """Write data to the given ref."""
@@ -31,3 +74,82 @@ class DataPersistenceBackend(ABC):
     @abstractmethod
     def cleanup(self, ref: ResolvedStorageRef) -> None:
         """Remove data at the ref if present."""
+
+    def save_stream(
+        self,
+        ref: ResolvedStorageRef,
+        column_names: tuple[str, ...],
+        chunks: Iterable[TabularBatch],
+        *,
+        column_types: ColumnTypes | None = None,
+    ) -> None:
+        """Write consecutive chunks sharing ``column_names`` to the given ref.
+
+        ``column_types`` declares column types for backends that fix a schema
+        before the first chunk is written; backends infer the types of
+        undeclared columns. The default implementation ignores it,
+        concatenates all chunks and calls ``save``.
+        """
+        del column_types
+        self.save(ref, TabularBatch.concat(column_names, chunks))
+
+    def iter_load(
+        self, ref: ResolvedStorageRef, *, chunk_rows: int = DEFAULT_CHUNK_ROWS
+    ) -> Iterator[TabularBatch]:
+        """Load data from the given ref as batches of at most ``chunk_rows``.
+
+        At least one batch is yielded, so column names are always known even
+        when the stored data has no rows. The default implementation slices
+        the result of ``load``.
+
+        Returns:
+            An iterator of batches in storage order.
+
+        Raises:
+            ValidationError: If ``chunk_rows`` is not positive.
+        """
+        if chunk_rows < 1:
+            raise ValidationError("chunk_rows must be at least 1")
+        data = self.load(ref)
+        if data.num_rows == 0:
+            return iter((data,))
+        return (
+            data.slice(start, start + chunk_rows)
+            for start in range(0, data.num_rows, chunk_rows)
+        )
+
+    def load_projected(
+        self,
+        ref: ResolvedStorageRef,
+        *,
+        columns: Sequence[str] | None = None,
+        filters: Sequence[RowFilter] | None = None,
+    ) -> TabularBatch:
+        """Load only ``columns`` of the rows matching every filter.
+
+        ``columns=None`` keeps all columns; filters may reference columns that
+        are not selected. The default implementation loads everything and
+        projects in Python.
+
+        Returns:
+            The projected batch, columns in the requested order.
+        """
+        data = self.load(ref)
+        if filters:
+            data = data.take(matching_row_indices(data, filters))
+        if columns is not None:
+            data = data.select(columns)
+        return data
+
+    def load_typed(
+        self, ref: ResolvedStorageRef, column_types: ColumnTypes
+    ) -> TabularBatch:
+        """Load a batch with columns converted to their declared types.
+
+        Columns missing from ``column_types`` keep the backend's own
+        decoding. The default implementation converts after ``load``.
+
+        Returns:
+            The typed ``TabularBatch``.
+        """
+        return convert_batch(self.load(ref), column_types)
@@ -5,9 +5,16 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from .data_persistence_backend import DEFAULT_CHUNK_ROWS
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
     from limbo_core.domain.value_objects import TabularBatch
 
+    from .column_types import ColumnTypes
+    from .row_filter import RowFilter
+
 
 class DataPersistenceResolverPort(ABC):
     """Read and write persisted tabular data through configured backends."""
@@ -20,6 +27,45 @@ class DataPersistenceResolverPort(ABC):
     def load(self, backend_key: str, name: str) -> TabularBatch:
         """Load previously saved data from a configured backend."""
 
+    @abstractmethod
+    def load_projected(
+        self,
+        backend_key: str,
+        name: str,
+        *,
+        columns: Sequence[str] | None = None,
+        filters: Sequence[RowFilter] | None = None,
+    ) -> TabularBatch:
+        """Load selected columns of matching rows from a configured backend."""
+
+    @abstractmethod
+    def load_typed(
+        self, backend_key: str, name: str, column_types: ColumnTypes
+    ) -> TabularBatch:
+        """Load data with columns converted to their declared types."""
+
+    @abstractmethod
+    def save_stream(
+        self,
+        backend_key: str,
+        name: str,
+        column_names: tuple[str, ...],
+        chunks: Iterable[TabularBatch],
+        *,
+        column_types: ColumnTypes | None = None,
+    ) -> None:
+        """Write consecutive chunks to a configured backend instance."""
+
+    @abstractmethod
+    def iter_load(
+        self,
+        backend_key: str,
+        name: str,
+        *,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    ) -> Iterator[TabularBatch]:
+        """Load previously saved data as batches of at most ``chunk_rows``."""
+
     @abstractmethod
     def exists(self, backend_key: str, name: str) -> bool:
         """Check whether named data exists in a configured backend."""
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from limbo_core.application.context import ResolutionContext
+    from limbo_core.domain.entities import SeedFile
     from limbo_core.domain.value_objects import ResolvedStorageRef
 
 
@@ -18,3 +19,17 @@ class PathResolverPort(ABC):
         self, raw_path: Any, *, context: ResolutionContext | None = None
     ) -> ResolvedStorageRef:
         """Resolve and validate a resource expression."""
+
+    def resolve_seed_file(
+        self, seed_file: SeedFile, *, context: ResolutionContext | None = None
+    ) -> ResolvedStorageRef:
+        """Resolve ``seed_file.path`` with ``seed_file.compression`` applied.
+
+        ``infer`` keeps the codec implied by the file suffix; an explicit
+        codec applies regardless of the file name.
+
+        Returns:
+            A ref whose streams decompress the seed file.
+        """
+        ref = self.resolve(seed_file.path, context=context)
+        return ref.with_compression(seed_file.compression)
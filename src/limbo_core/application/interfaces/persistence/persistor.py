@@ -5,8 +5,12 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from limbo_core.domain.value_objects import TabularBatch
+
 if TYPE_CHECKING:
-    from limbo_core.domain.value_objects import TabularBatch
+    from collections.abc import Iterable
+
+    from .column_types import ColumnTypes
 
 
 class Persistor(ABC):
@@ -25,6 +29,28 @@ class Persistor(ABC):
                 cache for intermediate reuse by downstream dependents.
         """
 
+    def save_stream(
+        self,
+        name: str,
+        column_names: tuple[str, ...],
+        chunks: Iterable[TabularBatch],
+        *,
+        materialize: bool = True,
+        column_types: ColumnTypes | None = None,
+    ) -> None:
+        """Save consecutive chunks sharing ``column_names`` under ``name``.
+
+        ``column_types`` is passed on to backends that fix a schema up
+        front. The default implementation ignores it, concatenates the
+        chunks and calls ``save``.
+        """
+        del column_types
+        self.save(
+            name,
+            TabularBatch.concat(column_names, chunks),
+            materialize=materialize,
+        )
+
     @abstractmethod
     def load(self, name: str) -> TabularBatch:
         """Load previously saved or cached data."""
@@ -36,3 +62,10 @@ class Persistor(ABC):
     @abstractmethod
     def cleanup(self, name: str) -> None:
         """Remove saved or cached data for the given name."""
+
+    def release(self, name: str) -> None:  # noqa: B027
+        """Drop cached data for the given name, keeping materialized data.
+
+        Called once the last downstream dependent no longer needs the data.
+        The default does nothing, for persistors that keep no cache.
+        """
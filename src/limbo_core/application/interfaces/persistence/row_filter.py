@@ -0,0 +1,81 @@
+"""Simple row predicates for projected tabular loads."""
+
+from __future__ import annotations
+
+import operator
+from typing import TYPE_CHECKING, Any, Literal, get_args
+
+from limbo_core.domain.validation import ValidationError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from limbo_core.domain.value_objects import TabularBatch
+
+FilterOp = Literal["==", "=", "!=", "<", "<=", ">", ">=", "in", "not in"]
+RowFilter = tuple[str, FilterOp, Any]
+"""``(column, op, value)``; a list of filters is combined with AND."""
+
+_FILTER_OPS = frozenset(get_args(FilterOp))
+
+_COMPARATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda cell, values: cell in values,
+    "not in": lambda cell, values: cell not in values,
+}
+
+
+def validate_row_filters(filters: Sequence[RowFilter]) -> None:
+    """Check the shape and operators of ``filters``.
+
+    Raises:
+        ValidationError: If a filter is malformed or uses an unknown operator.
+    """
+    for i, row_filter in enumerate(filters):
+        if len(row_filter) != 3 or not isinstance(row_filter[0], str):
+            raise ValidationError(
+                f"filter {i} must be a (column, op, value) tuple"
+            )
+        op = row_filter[1]
+        if op not in _FILTER_OPS:
+            raise ValidationError(f"filter {i} has unknown operator {op!r}")
+        if op in ("in", "not in") and isinstance(row_filter[2], str):
+            raise ValidationError(
+                f"filter {i} operator {op!r} expects a collection"
+            )
+
+
+def matching_row_indices(
+    batch: TabularBatch, filters: Sequence[RowFilter]
+) -> list[int]:
+    """Return indices of rows satisfying every filter.
+
+    Nulls never satisfy a comparison, matching Parquet/Arrow semantics.
+
+    Returns:
+        Sorted row indices.
+
+    Raises:
+        ValidationError: If a filter names an unknown column.
+    """
+    validate_row_filters(filters)
+    indices = list(range(batch.num_rows))
+    for column_name, op, value in filters:
+        if column_name not in batch.column_names:
+            raise ValidationError(f"unknown filter column {column_name!r}")
+        compare = _COMPARATORS[op]
+        if op in ("in", "not in"):
+            value = set(value)
+        column = batch.column(column_name)
+        indices = [
+            i
+            for i in indices
+            if column[i] is not None and compare(column[i], value)
+        ]
+    return indices
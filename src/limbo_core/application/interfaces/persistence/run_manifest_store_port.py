@@ -0,0 +1,21 @@
+"""Run manifest storage interface."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from limbo_core.domain.value_objects import RunManifest
+
+
+class RunManifestStorePort(ABC):
+    """Load and checkpoint the manifest of a generation run."""
+
+    @abstractmethod
+    def load(self) -> RunManifest:
+        """Return the stored manifest, or an empty one if none exists."""
+
+    @abstractmethod
+    def save(self, manifest: RunManifest) -> None:
+        """Persist ``manifest``, replacing the stored one atomically."""
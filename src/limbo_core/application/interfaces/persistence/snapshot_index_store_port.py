@@ -0,0 +1,21 @@
+"""Source snapshot index storage interface."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from limbo_core.domain.value_objects import SnapshotIndex
+
+
+class SnapshotIndexStorePort(ABC):
+    """Load and save the index of local source snapshots."""
+
+    @abstractmethod
+    def load(self) -> SnapshotIndex:
+        """Return the stored index, or an empty one if none exists."""
+
+    @abstractmethod
+    def save(self, index: SnapshotIndex) -> None:
+        """Persist ``index``, replacing the stored one atomically."""
@@ -4,7 +4,13 @@ from __future__ import annotations
 
 from typing import Any
 
-from limbo_core.domain.entities import Source, SourceColumn, SourceConfig
+from limbo_core.domain.entities import (
+    Source,
+    SourceColumn,
+    SourceConfig,
+    SourceSnapshot,
+)
+from limbo_core.validation import ValidationError
 
 from .artifacts_parser import _parse_artifact_column
 from .common import (
@@ -76,12 +82,61 @@ def _parse_source_config(
     table_name = _expect_optional_str(
         payload.get("table_name"), path=(*path, "table_name")
     )
+    snapshot = _parse_source_snapshot(
+        payload.get("snapshot"), path=(*path, "snapshot")
+    )
     return SourceConfig(
         materialize=materialize,
         connection=connection,
         schema_name=schema_name,
         table_name=table_name,
+        snapshot=snapshot,
+    )
+
+
+def _parse_source_snapshot(
+    value: Any, *, path: tuple[PathPart, ...]
+) -> SourceSnapshot | None:
+    """Parse the optional source snapshot payload.
+
+    ``true`` enables a snapshot with the default row count probe.
+
+    Returns:
+        Parsed snapshot config, or None if snapshots are disabled.
+
+    Raises:
+        ParseError: If snapshot payload fields are invalid.
+    """
+    if value is None or value is False:
+        return None
+    if value is True:
+        return SourceSnapshot()
+    payload = _expect_mapping(value, path=path)
+    freshness = payload.get("freshness", "row_count")
+    if freshness not in {"row_count", "updated_at", "ttl"}:
+        raise ParseError(
+            path=(*path, "freshness"),
+            message=f"unsupported snapshot freshness: {freshness}",
+        )
+    updated_at_column = _expect_optional_str(
+        payload.get("updated_at_column"), path=(*path, "updated_at_column")
     )
+    ttl_seconds = payload.get("ttl_seconds")
+    if ttl_seconds is not None and (
+        not isinstance(ttl_seconds, int | float)
+        or isinstance(ttl_seconds, bool)
+    ):
+        raise ParseError(
+            path=(*path, "ttl_seconds"), message="expects a number value"
+        )
+    try:
+        return SourceSnapshot(
+            freshness=freshness,
+            updated_at_column=updated_at_column,
+            ttl_seconds=ttl_seconds,
+        )
+    except ValidationError as err:
+        raise ParseError(path=path, message=str(err)) from err
 
 
 def _parse_source_columns(
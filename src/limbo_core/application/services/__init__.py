@@ -1,6 +1,23 @@
 """Application orchestration services."""
 
+from .artifact_scheduler import ArtifactScheduler, ExecutorKind
+from .generation_run import GenerationRunService, RunPlan, RunStatus
 from .project_loader import ProjectLoaderService
 from .project_validator import ProjectValidatorService
+from .source_reader import SourceReaderService
+from .source_snapshot import SourceSnapshotService
+from .table_generation import ShardOutput, TableGenerationService
 
-__all__ = ["ProjectLoaderService", "ProjectValidatorService"]
+__all__ = [
+    "ArtifactScheduler",
+    "ExecutorKind",
+    "GenerationRunService",
+    "ProjectLoaderService",
+    "ProjectValidatorService",
+    "RunPlan",
+    "RunStatus",
+    "ShardOutput",
+    "SourceReaderService",
+    "SourceSnapshotService",
+    "TableGenerationService",
+]
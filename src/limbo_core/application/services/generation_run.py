@@ -0,0 +1,325 @@
+"""Resumable, dependency-ordered generation of a project's tables."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal, cast
+
+from limbo_core.application.interfaces.persistence import DEFAULT_CHUNK_ROWS
+from limbo_core.domain.entities import Source
+from limbo_core.domain.value_objects import (
+    ArtifactGraph,
+    ArtifactKey,
+    ManifestEntry,
+    RunManifest,
+    fingerprint,
+)
+from limbo_core.validation import ValidationError
+
+from .artifact_scheduler import ArtifactScheduler
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from limbo_core.application.context import ResolutionContext, RuntimeContext
+    from limbo_core.application.interfaces.persistence import (
+        PathResolverPort,
+        RunManifestStorePort,
+    )
+    from limbo_core.domain.entities import Project, Seed, Table
+    from limbo_core.domain.value_objects import ResolvedStorageRef
+
+    from .source_reader import SourceReaderService
+    from .table_generation import TableGenerationService
+
+RunStatus = Literal["generated", "skipped", "input"]
+
+_HASH_BLOCK_BYTES = 1 << 20
+
+
+@dataclass(frozen=True, slots=True)
+class RunPlan:
+    """Expected manifest entries and the tables a run must rebuild.
+
+    ``dirty`` lists, in dependency order, the tables whose recorded entry
+    differs from ``entries`` (definition, resolved options, generator,
+    upstream fingerprints, seed or row count) or whose output is missing.
+    Non-materialized tables keep no output, so they are dirty only when
+    their entry changed or a dirty dependent needs their data. Seed and
+    source entries also cover their content signature, so edited
+    inputs dirty their dependents.
+    """
+
+    entries: dict[ArtifactKey, ManifestEntry]
+    manifest: RunManifest
+    dirty: tuple[ArtifactKey, ...]
+
+
+@dataclass(slots=True)
+class GenerationRunService:
+    """Generate every table of a project in dependency order, with resume.
+
+    After each table is generated its ``ManifestEntry`` (definition
+    fingerprint, upstream fingerprints, seed and row count) is recorded and
+    the manifest is checkpointed through ``manifest_store``. With
+    ``resume=True``, tables whose recorded entry is unchanged and whose
+    output still exists are skipped; dependents that need their data load it
+    lazily through the persistor. Non-materialized tables are regenerated
+    only for dirty dependents (see ``RunPlan``). Seeds and sources are run
+    inputs and are not generated.
+
+    Input fingerprints include a content signature: the size and
+    modification time of local seed files (a content hash for other
+    storage) via ``path_registry``, and the row count and maximum
+    ``snapshot.updated_at_column`` of sources via ``source_reader``. Without
+    these collaborators seeds and sources are fingerprinted by definition
+    only and assumed immutable.
+
+    The scheduler must use threads: tasks share the persistor and manifest.
+    """
+
+    generation: TableGenerationService
+    manifest_store: RunManifestStorePort
+    scheduler: ArtifactScheduler = field(default_factory=ArtifactScheduler)
+    path_registry: PathResolverPort | None = None
+    source_reader: SourceReaderService | None = None
+
+    def plan(
+        self,
+        project: Project,
+        *,
+        num_rows: Mapping[str, int],
+        context: RuntimeContext,
+        seed: int = 0,
+        resume: bool = True,
+        resolution_context: ResolutionContext | None = None,
+    ) -> RunPlan:
+        """Determine which tables of ``project`` need to be (re)generated.
+
+        Args:
+            project: Project to plan.
+            num_rows: Row count per table name.
+            context: Runtime context for generator lookup and references.
+            seed: Project seed.
+            resume: Compare against the stored manifest; without it every
+                table is dirty.
+            resolution_context: Context resolving relative seed file paths.
+
+        Returns:
+            The plan; entries of artifacts no longer in the project are
+            dropped from its manifest.
+
+        Raises:
+            ValidationError: If a table has no row count.
+        """
+        missing = sorted(
+            t.name for t in project.tables if t.name not in num_rows
+        )
+        if missing:
+            raise ValidationError(f"num_rows missing for tables {missing!r}")
+        graph = ArtifactGraph.from_project(project)
+        expected = self._expected_entries(
+            project,
+            graph,
+            num_rows=num_rows,
+            context=context,
+            seed=seed,
+            resolution_context=resolution_context,
+        )
+        manifest = self.manifest_store.load() if resume else RunManifest()
+        for key in [k for k in manifest.entries if k not in expected]:
+            manifest.discard(key)
+        persistor = self.generation.persistor
+        tables = {table.name: table for table in project.tables}
+        stale: set[ArtifactKey] = set()
+        for key in reversed(list(expected)):
+            if key.type != "table":
+                continue
+            complete = manifest.is_complete(key, expected[key])
+            if tables[key.name].config.materialize:
+                complete = complete and persistor.exists(key.name)
+            else:
+                complete = complete and stale.isdisjoint(graph.dependents[key])
+            if not complete:
+                stale.add(key)
+        dirty = tuple(key for key in expected if key in stale)
+        return RunPlan(entries=expected, manifest=manifest, dirty=dirty)
+
+    def run(
+        self,
+        project: Project,
+        *,
+        num_rows: Mapping[str, int],
+        context: RuntimeContext,
+        seed: int = 0,
+        resume: bool = False,
+        batch_rows: int = DEFAULT_CHUNK_ROWS,
+        resolution_context: ResolutionContext | None = None,
+    ) -> dict[ArtifactKey, RunStatus]:
+        """Generate the tables of ``project``, skipping completed ones.
+
+        Args:
+            project: Project whose tables are generated.
+            num_rows: Row count per table name.
+            context: Runtime context for generator lookup and references.
+            seed: Project seed passed to every table.
+            resume: Rebuild only the tables ``plan`` reports as dirty.
+                Without it, the manifest starts empty and every table is
+                regenerated.
+            batch_rows: Rows per generated batch.
+            resolution_context: Context resolving relative seed file paths.
+
+        Returns:
+            Each artifact's outcome.
+
+        Raises:
+            ValidationError: If a table has no row count or the scheduler
+                uses processes.
+        """
+        if self.scheduler.executor != "thread":
+            raise ValidationError("Generation runs require a thread scheduler")
+        plan = self.plan(
+            project,
+            num_rows=num_rows,
+            context=context,
+            seed=seed,
+            resume=resume,
+            resolution_context=resolution_context,
+        )
+        manifest, dirty = plan.manifest, frozenset(plan.dirty)
+        tables = {table.name: table for table in project.tables}
+        persistor = self.generation.persistor
+        lock = threading.Lock()
+
+        def task(key: ArtifactKey) -> RunStatus:
+            if key.type != "table":
+                return "input"
+            if key not in dirty:
+                return "skipped"
+            table, entry = tables[key.name], plan.entries[key]
+            self.generation.generate(
+                table,
+                num_rows=entry.num_rows,
+                context=context,
+                batch_rows=batch_rows,
+                seed=seed,
+            )
+            with lock:
+                manifest.record(key, entry)
+                self.manifest_store.save(manifest)
+            return "generated"
+
+        def release(key: ArtifactKey) -> None:
+            if key.type == "table":
+                persistor.release(key.name)
+
+        graph = ArtifactGraph.from_project(project)
+        results = self.scheduler.run(graph, task, release=release)
+        return cast("dict[ArtifactKey, RunStatus]", results)
+
+    def _expected_entries(
+        self,
+        project: Project,
+        graph: ArtifactGraph,
+        *,
+        num_rows: Mapping[str, int],
+        context: RuntimeContext,
+        seed: int,
+        resolution_context: ResolutionContext | None,
+    ) -> dict[ArtifactKey, ManifestEntry]:
+        """Compute each artifact's manifest entry in dependency order.
+
+        Table fingerprints come from ``TableGenerationService.fingerprint``;
+        seeds and sources hash their definition and content signature (see
+        ``_content_signature``). Upstream fingerprints hash
+        the dependency's whole entry, so a change anywhere upstream
+        invalidates every transitive dependent.
+
+        Returns:
+            The expected entry per artifact.
+        """
+        artifacts: dict[ArtifactKey, Table | Seed | Source] = {
+            **{ArtifactKey("seed", s.name): s for s in project.seeds},
+            **{ArtifactKey("source", s.name): s for s in project.sources},
+            **{ArtifactKey("table", t.name): t for t in project.tables},
+        }
+        entries: dict[ArtifactKey, ManifestEntry] = {}
+        for key in graph.topological_order():
+            artifact = artifacts[key]
+            is_table = key.type == "table"
+            entries[key] = ManifestEntry(
+                fingerprint=(
+                    self.generation.fingerprint(
+                        cast("Table", artifact), context=context
+                    )
+                    if is_table
+                    else fingerprint(
+                        artifact,
+                        self._content_signature(
+                            cast("Seed | Source", artifact),
+                            resolution_context=resolution_context,
+                        ),
+                    )
+                ),
+                upstream={
+                    str(dep): fingerprint(entries[dep])
+                    for dep in sorted(graph.dependencies[key])
+                },
+                seed=seed,
+                num_rows=num_rows.get(key.name, 0) if is_table else 0,
+            )
+        return entries
+
+    def _content_signature(
+        self,
+        artifact: Seed | Source,
+        *,
+        resolution_context: ResolutionContext | None,
+    ) -> object:
+        """Return a value that changes when ``artifact``'s data does.
+
+        Returns:
+            The seed file's signature (see ``_file_signature``) or the
+            source's row count and maximum ``updated_at_column``; None when
+            the needed collaborator is not configured.
+        """
+        if isinstance(artifact, Source):
+            if self.source_reader is None:
+                return None
+            policy = artifact.config.snapshot
+            stats = self.source_reader.connections.table_stats(
+                artifact.config.connection,
+                self.source_reader.scan_for(artifact),
+                updated_at_column=(
+                    None if policy is None else policy.updated_at_column
+                ),
+            )
+            return [stats.row_count, str(stats.max_updated_at)]
+        if self.path_registry is None:
+            return None
+        ref = self.path_registry.resolve_seed_file(
+            artifact.seed_file, context=resolution_context
+        )
+        return _file_signature(ref)
+
+
+def _file_signature(ref: ResolvedStorageRef) -> object:
+    """Return the size and mtime of a local file, else a content hash.
+
+    Returns:
+        ``[size, mtime_ns]``, a hex digest of the decoded content, or None
+        when the file does not exist.
+    """
+    if not ref.exists():
+        return None
+    try:
+        stat = ref.as_local_path().stat()
+    except ValidationError:
+        digest = hashlib.blake2b(digest_size=16)
+        with ref.open_binary("rb") as fh:
+            while block := fh.read(_HASH_BLOCK_BYTES):
+                digest.update(block)
+        return digest.hexdigest()
+    return [stat.st_size, stat.st_mtime_ns]
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from limbo_core.domain.errors import DomainValidationError
+from limbo_core.domain.value_objects import ArtifactGraph
 
 if TYPE_CHECKING:
     from limbo_core.application.context import ResolutionContext, RuntimeContext
@@ -46,7 +47,12 @@ class ProjectValidatorService:
         context: RuntimeContext,
         resolution_context: ResolutionContext | None = None,
     ) -> Project:
-        """Validate generators, connections, and seed paths.
+        """Validate generators, connections, seed files and dependencies.
+
+        Seed files are resolved with their ``compression`` applied (see
+        ``PathResolverPort.resolve_seed_file``). Table references must name
+        declared artifacts and must not form a cycle (see
+        ``ArtifactGraph.from_project``).
 
         Returns:
             Same project instance after runtime validation.
@@ -67,8 +73,9 @@ class ProjectValidatorService:
                 raise UnknownSourceConnectionError(source.config.connection)
 
         for seed in project.seeds:
-            self.path_registry.resolve(
-                seed.seed_file.path, context=resolution_context
+            self.path_registry.resolve_seed_file(
+                seed.seed_file, context=resolution_context
             )
 
+        ArtifactGraph.from_project(project)
         return project
@@ -0,0 +1,325 @@
+"""Streaming reads of source tables into typed batches."""
+
+from __future__ import annotations
+
+import itertools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+
+from limbo_core.application.interfaces.connections import (
+    KeyRange,
+    RowChunk,
+    TableScan,
+)
+from limbo_core.application.interfaces.persistence import DEFAULT_CHUNK_ROWS
+from limbo_core.application.interfaces.persistence.column_types import (
+    value_converter,
+)
+from limbo_core.domain.value_objects import TabularBatch
+from limbo_core.validation import ValidationError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from limbo_core.application.interfaces import (
+        ConnectionProviderPort,
+        Persistor,
+    )
+    from limbo_core.domain.entities import Source
+
+_PUT_TIMEOUT = 0.1
+
+
+@dataclass(slots=True)
+class SourceReaderService:
+    """Read source tables chunk by chunk through their connection.
+
+    Rows are streamed with server-side cursors (``ConnectionBackend.scan``),
+    so at most one chunk of a table is held in memory. Each chunk becomes a
+    column-major ``TabularBatch`` whose cells are converted to the columns'
+    declared ``SourceColumn.data_type``.
+
+    Large tables can be read in ``partitions`` key ranges fetched
+    concurrently, each over its own pooled connection.
+    """
+
+    connections: ConnectionProviderPort
+
+    def scan_for(self, source: Source) -> TableScan:
+        """Build the table scan reading ``source``'s declared columns.
+
+        ``table_name`` defaults to the source name.
+
+        Returns:
+            The scan request.
+        """
+        return TableScan(
+            table_name=source.config.table_name or source.name,
+            column_names=tuple(column.name for column in source.columns),
+            schema_name=source.config.schema_name,
+        )
+
+    def iter_batches(
+        self, source: Source, *, chunk_rows: int = DEFAULT_CHUNK_ROWS
+    ) -> Iterator[TabularBatch]:
+        """Stream ``source`` as typed batches of at most ``chunk_rows`` rows.
+
+        Returns:
+            An iterator of batches in cursor order; empty tables yield no
+            batches.
+
+        Raises:
+            ValidationError: If ``chunk_rows`` is not positive.
+        """
+        if chunk_rows < 1:
+            raise ValidationError("chunk_rows must be at least 1")
+        scan = self.scan_for(source)
+        chunks = self.connections.scan(
+            source.config.connection, scan, chunk_rows=chunk_rows
+        )
+        return _typed_batches(source, scan, chunks)
+
+    def iter_partitioned(
+        self,
+        source: Source,
+        *,
+        key_column: str,
+        partitions: int,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        max_workers: int | None = None,
+    ) -> Iterator[TabularBatch]:
+        """Stream ``source`` as ``partitions`` concurrently read key ranges.
+
+        The min and max of ``key_column`` (numeric, date or datetime) are
+        probed first and split into equal-width ranges; the first and last
+        ranges are open-ended so NULL keys and rows added meanwhile are not
+        lost. Up to ``max_workers`` (default ``partitions``) ranges are read
+        at once, each over its own connection from the backend's pool.
+        Batches are yielded as they arrive, so their order differs between
+        runs just as for an unordered ``SELECT``.
+
+        Returns:
+            An iterator of typed batches.
+
+        Raises:
+            ValidationError: If ``partitions`` or ``chunk_rows`` is not
+                positive.
+        """
+        if partitions < 1:
+            raise ValidationError("partitions must be at least 1")
+        if chunk_rows < 1:
+            raise ValidationError("chunk_rows must be at least 1")
+        scan = self.scan_for(source)
+        lower, upper = self.connections.key_bounds(
+            source.config.connection, scan, key_column=key_column
+        )
+        if lower is None or upper is None or partitions == 1:
+            return self.iter_batches(source, chunk_rows=chunk_rows)
+        streams = [
+            _typed_batches(
+                source,
+                scan,
+                self.connections.scan(
+                    source.config.connection,
+                    replace(scan, key_range=key_range),
+                    chunk_rows=chunk_rows,
+                ),
+            )
+            for key_range in split_key_range(
+                key_column, lower, upper, partitions
+            )
+        ]
+        return _interleave(streams, max_workers=max_workers or len(streams))
+
+    def copy_to(
+        self,
+        source: Source,
+        persistor: Persistor,
+        *,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        key_column: str | None = None,
+        partitions: int = 1,
+    ) -> None:
+        """Stream ``source`` into ``persistor.save_stream`` under its name.
+
+        With ``key_column`` the table is read as in ``iter_partitioned``
+        and batches are written as soon as any partition delivers them.
+        """
+        names = tuple(column.name for column in source.columns)
+        batches = (
+            self.iter_batches(source, chunk_rows=chunk_rows)
+            if key_column is None
+            else self.iter_partitioned(
+                source,
+                key_column=key_column,
+                partitions=partitions,
+                chunk_rows=chunk_rows,
+            )
+        )
+        persistor.save_stream(
+            source.name,
+            names,
+            batches,
+            materialize=source.config.materialize,
+            column_types=source.column_types,
+        )
+
+
+def _typed_batches(
+    source: Source, scan: TableScan, chunks: Iterator[RowChunk]
+) -> Iterator[TabularBatch]:
+    """Convert row chunks to typed column-major batches.
+
+    Yields:
+        One batch per non-empty chunk.
+    """
+    converters = [
+        value_converter(column.name, column.data_type)
+        for column in source.columns
+    ]
+    for rows in chunks:
+        if not rows:
+            continue
+        columns: dict[str, Any] = {
+            name: [None if v is None else convert(v) for v in values]
+            for name, convert, values in zip(
+                scan.column_names,
+                converters,
+                zip(*rows, strict=True),
+                strict=True,
+            )
+        }
+        yield TabularBatch.from_columns(scan.column_names, columns)
+
+
+def split_key_range(
+    column: str, lower: object, upper: object, partitions: int
+) -> list[KeyRange]:
+    """Split ``[lower, upper]`` of ``column`` into adjacent key ranges.
+
+    Ints and dates are split on whole values, floats and datetimes into
+    equal widths; boundaries that coincide are merged, so fewer than
+    ``partitions`` ranges are returned for narrow spans. The first range has
+    no lower and the last no upper bound.
+
+    Returns:
+        Between 1 and ``partitions`` ranges covering every key.
+
+    Raises:
+        ValidationError: If the bounds are not numbers, dates or datetimes.
+    """
+    if isinstance(lower, bool) or not isinstance(lower, int | float | date):
+        raise ValidationError(
+            f"Cannot partition on {column!r}: values of type "
+            f"{type(lower).__name__} cannot be split into ranges"
+        )
+    bounds: list[Any] = []
+    for i in range(1, partitions):
+        bound = _key_at(lower, upper, i, partitions)
+        if bound > lower and (not bounds or bound > bounds[-1]):
+            bounds.append(bound)
+    edges: list[Any] = [None, *bounds, None]
+    return [
+        KeyRange(column=column, lower=start, upper=end)
+        for start, end in itertools.pairwise(edges)
+    ]
+
+
+def _key_at(lower: Any, upper: Any, i: int, n: int) -> Any:
+    """Return the ``i``-th of ``n`` equal-width boundaries of the bounds.
+
+    Returns:
+        A key of the same type as ``lower``.
+    """
+    if isinstance(lower, datetime | float):
+        return lower + (upper - lower) * i / n
+    if isinstance(lower, date):
+        span = upper.toordinal() - lower.toordinal() + 1
+        return date.fromordinal(lower.toordinal() + span * i // n)
+    return lower + (upper - lower + 1) * i // n
+
+
+@dataclass(frozen=True, slots=True)
+class _StreamEnd:
+    """Marks the end of one partition stream, with its error if it failed."""
+
+    error: Exception | None = None
+
+
+@dataclass(slots=True)
+class _PartitionFeed:
+    """Bounded queue filled from partition streams by worker threads.
+
+    The queue holds at most two batches per worker, so memory stays bounded
+    when the consumer is slower than the database. Setting ``stop`` makes
+    blocked workers give up.
+    """
+
+    max_workers: int
+    buffer: queue.Queue[TabularBatch | _StreamEnd] = field(init=False)
+    stop: threading.Event = field(default_factory=threading.Event)
+
+    def __post_init__(self) -> None:
+        """Create the bounded queue."""
+        self.buffer = queue.Queue(maxsize=2 * self.max_workers)
+
+    def put(self, item: TabularBatch | _StreamEnd) -> bool:
+        """Enqueue ``item``, waiting for space until stopped.
+
+        Returns:
+            False if the feed was stopped before ``item`` was enqueued.
+        """
+        while not self.stop.is_set():
+            try:
+                self.buffer.put(item, timeout=_PUT_TIMEOUT)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def pump(self, stream: Iterator[TabularBatch]) -> None:
+        """Enqueue every batch of ``stream`` followed by its end marker."""
+        try:
+            for batch in stream:
+                if not self.put(batch):
+                    return
+        except Exception as err:
+            self.put(_StreamEnd(err))
+            return
+        self.put(_StreamEnd())
+
+
+def _interleave(
+    streams: Sequence[Iterator[TabularBatch]], *, max_workers: int
+) -> Iterator[TabularBatch]:
+    """Drain ``streams`` on worker threads into one bounded queue.
+
+    The first failing stream re-raises its error in the consumer; closing
+    the iterator stops the workers.
+
+    Yields:
+        Batches of all streams in arrival order.
+    """
+    feed = _PartitionFeed(max_workers)
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="limbo-source"
+    )
+    try:
+        for stream in streams:
+            executor.submit(feed.pump, stream)
+        pending = len(streams)
+        while pending:
+            item = feed.buffer.get()
+            if isinstance(item, TabularBatch):
+                yield item
+                continue
+            if item.error is not None:
+                raise item.error
+            pending -= 1
+    finally:
+        feed.stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
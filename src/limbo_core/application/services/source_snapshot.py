@@ -0,0 +1,197 @@
+"""Local snapshot cache of source tables with freshness probes."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from limbo_core.application.interfaces.persistence import DEFAULT_CHUNK_ROWS
+from limbo_core.domain.value_objects import (
+    SnapshotIndex,
+    SnapshotRecord,
+    TabularBatch,
+    fingerprint,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from limbo_core.application.interfaces import DataPersistenceResolverPort
+    from limbo_core.application.interfaces.persistence import (
+        SnapshotIndexStorePort,
+    )
+    from limbo_core.domain.entities import Source, SourceSnapshot
+
+    from .source_reader import SourceReaderService
+
+
+@dataclass(slots=True)
+class SourceSnapshotService:
+    """Serve sources from local snapshots, re-reading them only when stale.
+
+    Sources whose ``SourceConfig.snapshot`` is set are copied once into the
+    persistence backend ``backend_key`` (ideally Arrow IPC, which later
+    runs memory-map, or Parquet) under a name keyed by connection, schema,
+    table and columns. Each later read first runs the configured freshness
+    check (``ConnectionBackend.table_stats`` or a TTL) against the record
+    kept in ``index_store`` and re-copies the source if it changed. Other
+    sources are streamed from the database as by ``SourceReaderService``.
+    """
+
+    reader: SourceReaderService
+    persistence: DataPersistenceResolverPort
+    backend_key: str
+    index_store: SnapshotIndexStorePort
+    clock: Callable[[], float] = time.time
+    _index: SnapshotIndex | None = field(default=None, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+
+    def snapshot_name(self, source: Source) -> str:
+        """Return the object name of ``source``'s snapshot.
+
+        Returns:
+            ``<source>-<digest>``, where the digest covers the connection,
+            schema, table and the declared columns and their types.
+        """
+        scan = self.reader.scan_for(source)
+        key = fingerprint(
+            source.config.connection,
+            scan.schema_name,
+            scan.table_name,
+            source.column_types,
+        )
+        return f"{source.name}-{key[:16]}"
+
+    def is_fresh(self, source: Source) -> bool:
+        """Check whether ``source``'s snapshot can be served as is.
+
+        Returns:
+            True if a snapshot of the current definition exists and passes
+            the freshness check; False if the source must be re-read.
+        """
+        policy = source.config.snapshot
+        if policy is None:
+            return False
+        name = self.snapshot_name(source)
+        with self._lock:
+            record = self._load_index().get(source.name)
+        if (
+            record is None
+            or record.object_name != name
+            or not self.persistence.exists(self.backend_key, name)
+        ):
+            return False
+        if policy.freshness == "ttl":
+            ttl_seconds = policy.ttl_seconds or 0.0
+            return self.clock() - record.taken_at < ttl_seconds
+        current = self._probe(source, policy, name)
+        return (current.row_count, current.max_updated_at) == (
+            record.row_count,
+            record.max_updated_at,
+        )
+
+    def refresh(
+        self, source: Source, *, chunk_rows: int = DEFAULT_CHUNK_ROWS
+    ) -> None:
+        """Re-read ``source`` from its connection into a new snapshot.
+
+        The probe runs before the copy, so changes made while copying are
+        detected by the next freshness check. A snapshot of a previous
+        definition of the source is removed.
+        """
+        policy = source.config.snapshot
+        name = self.snapshot_name(source)
+        record = (
+            self._probe(source, policy, name)
+            if policy is not None and policy.freshness != "ttl"
+            else SnapshotRecord(object_name=name, taken_at=self.clock())
+        )
+        self.persistence.save_stream(
+            self.backend_key,
+            name,
+            tuple(column.name for column in source.columns),
+            self.reader.iter_batches(source, chunk_rows=chunk_rows),
+            column_types=source.column_types,
+        )
+        with self._lock:
+            index = self._load_index()
+            previous = index.get(source.name)
+            index.record(source.name, record)
+            self.index_store.save(index)
+        if previous is not None and previous.object_name != name:
+            self.persistence.cleanup(self.backend_key, previous.object_name)
+
+    def iter_batches(
+        self, source: Source, *, chunk_rows: int = DEFAULT_CHUNK_ROWS
+    ) -> Iterator[TabularBatch]:
+        """Stream ``source``, from its snapshot when it has one.
+
+        Returns:
+            An iterator of batches of at most ``chunk_rows`` rows.
+        """
+        if source.config.snapshot is None:
+            return self.reader.iter_batches(source, chunk_rows=chunk_rows)
+        self._ensure_fresh(source, chunk_rows=chunk_rows)
+        return self.persistence.iter_load(
+            self.backend_key, self.snapshot_name(source), chunk_rows=chunk_rows
+        )
+
+    def load(
+        self, source: Source, *, chunk_rows: int = DEFAULT_CHUNK_ROWS
+    ) -> TabularBatch:
+        """Load ``source`` in full, refreshing its snapshot if stale.
+
+        Sources without snapshot config are read from the database.
+
+        Returns:
+            The source data.
+        """
+        if source.config.snapshot is None:
+            batches = list(
+                self.reader.iter_batches(source, chunk_rows=chunk_rows)
+            )
+            names = tuple(column.name for column in source.columns)
+            return TabularBatch.concat(names, batches)
+        self._ensure_fresh(source, chunk_rows=chunk_rows)
+        return self.persistence.load(
+            self.backend_key, self.snapshot_name(source)
+        )
+
+    def _ensure_fresh(self, source: Source, *, chunk_rows: int) -> None:
+        if not self.is_fresh(source):
+            self.refresh(source, chunk_rows=chunk_rows)
+
+    def _probe(
+        self, source: Source, policy: SourceSnapshot, name: str
+    ) -> SnapshotRecord:
+        """Run the freshness probe of ``policy`` against the source.
+
+        Returns:
+            A record of the probe taken now.
+        """
+        column = (
+            policy.updated_at_column
+            if policy.freshness == "updated_at"
+            else None
+        )
+        stats = self.reader.connections.table_stats(
+            source.config.connection,
+            self.reader.scan_for(source),
+            updated_at_column=column,
+        )
+        max_updated_at = stats.max_updated_at
+        return SnapshotRecord(
+            object_name=name,
+            taken_at=self.clock(),
+            row_count=stats.row_count,
+            max_updated_at=(
+                None if max_updated_at is None else str(max_updated_at)
+            ),
+        )
+
+    def _load_index(self) -> SnapshotIndex:
+        if self._index is None:
+            self._index = self.index_store.load()
+        return self._index
@@ -0,0 +1,486 @@
+"""Table generation orchestration service."""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Literal
+
+from limbo_core.application.interfaces.persistence import DEFAULT_CHUNK_ROWS
+from limbo_core.domain.entities import (
+    GenerationContext,
+    LiteralValue,
+    LookupValue,
+    ReferenceValue,
+)
+from limbo_core.domain.value_objects import TabularBatch, fingerprint
+from limbo_core.validation import ValidationError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from limbo_core.application.context import RuntimeContext
+    from limbo_core.application.interfaces import (
+        Generator,
+        Persistor,
+        ValueResolverPort,
+    )
+    from limbo_core.application.interfaces.generators.generator import (
+        BatchHook,
+        ScalarHook,
+    )
+    from limbo_core.domain.entities import Table, ValueSpec
+    from limbo_core.domain.value_objects import CellValue
+
+ShardOutput = Literal["merge", "parts"]
+
+
+@dataclass(frozen=True, slots=True)
+class _ColumnSpec:
+    """One column's resolved hook and options; picklable for workers."""
+
+    name: str
+    generator_class: type[Generator]
+    local_hook: str
+    supports_batch: bool
+    options: dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class _BatchColumnPlan:
+    """One column's ``@generates_batch`` hook bound to a generator."""
+
+    name: str
+    options: dict[str, Any]
+    hook: BatchHook
+
+
+@dataclass(frozen=True, slots=True)
+class _ScalarColumnPlan:
+    """One column's scalar hook bound to a generator."""
+
+    name: str
+    options: dict[str, Any]
+    hook: ScalarHook
+
+
+_ColumnPlan = _BatchColumnPlan | _ScalarColumnPlan
+
+
+@dataclass(frozen=True, slots=True)
+class _Shard:
+    """A contiguous row range of one table, generated in a worker process."""
+
+    table_name: str
+    columns: tuple[_ColumnSpec, ...]
+    seed: int
+    index: int
+    start_row: int
+    num_rows: int
+    batch_rows: int
+
+
+@dataclass(slots=True)
+class TableGenerationService:
+    """Generate table data batch-at-a-time and hand it to a persistor.
+
+    Every column's hook is resolved once and each generator class is
+    instantiated once per table (or per shard). Columns with a native
+    ``@generates_batch`` method are produced with one call per batch;
+    scalar-only columns are looped row by row with ``context.row_data``
+    holding the row's values of the preceding columns. While a column is
+    generated ``context.column_name`` names it, so ``context.random_stream()``
+    returns that column's stream for the current shard.
+    """
+
+    persistor: Persistor
+    value_resolver: ValueResolverPort | None = None
+
+    def generate(
+        self,
+        table: Table,
+        *,
+        num_rows: int,
+        context: RuntimeContext,
+        batch_rows: int = DEFAULT_CHUNK_ROWS,
+        seed: int = 0,
+    ) -> None:
+        """Generate ``num_rows`` rows for ``table`` and stream them out.
+
+        Batches of at most ``batch_rows`` rows go to ``persistor.save_stream``
+        under the table name as they are generated, materialized according
+        to ``table.config.materialize``, so the whole table is never held
+        in memory here. Read the result back with ``persistor.load``.
+        """
+        names = tuple(column.name for column in table.columns)
+        self.persistor.save_stream(
+            table.name,
+            names,
+            self.iter_batches(
+                table,
+                num_rows=num_rows,
+                context=context,
+                batch_rows=batch_rows,
+                seed=seed,
+            ),
+            materialize=table.config.materialize,
+            column_types=table.column_types,
+        )
+
+    def iter_batches(
+        self,
+        table: Table,
+        *,
+        num_rows: int,
+        context: RuntimeContext,
+        batch_rows: int = DEFAULT_CHUNK_ROWS,
+        start_row: int = 0,
+        seed: int = 0,
+        shard_index: int = 0,
+    ) -> Iterator[TabularBatch]:
+        """Generate rows for ``table`` as batches of at most ``batch_rows``.
+
+        Generators are set up before the first batch and torn down after the
+        last one (or when the iterator is closed early).
+
+        Args:
+            table: Table definition to generate.
+            num_rows: Number of rows to generate.
+            context: Runtime context providing the generator registry.
+            batch_rows: Maximum rows per yielded batch.
+            start_row: Index of the first generated row.
+            seed: Project seed exposed as ``GenerationContext.seed``.
+            shard_index: Shard exposed as ``GenerationContext.shard_index``.
+
+        Returns:
+            An iterator of column-major batches; one empty batch when
+            ``num_rows`` is zero.
+
+        Raises:
+            ValidationError: If ``num_rows`` is negative or ``batch_rows`` is
+                not positive.
+        """
+        if num_rows < 0:
+            raise ValidationError("num_rows must not be negative")
+        if batch_rows < 1:
+            raise ValidationError("batch_rows must be at least 1")
+        return _iter_shard_batches(
+            _Shard(
+                table_name=table.name,
+                columns=self._resolve_columns(table, context=context),
+                seed=seed,
+                index=shard_index,
+                start_row=start_row,
+                num_rows=num_rows,
+                batch_rows=batch_rows,
+            )
+        )
+
+    def generate_sharded(
+        self,
+        table: Table,
+        *,
+        num_rows: int,
+        context: RuntimeContext,
+        shard_rows: int,
+        max_workers: int | None = None,
+        output: ShardOutput = "merge",
+        batch_rows: int = DEFAULT_CHUNK_ROWS,
+        seed: int = 0,
+    ) -> list[str]:
+        """Generate ``table`` in row-range shards on a process pool.
+
+        Shard ``i`` covers rows ``[i * shard_rows, (i + 1) * shard_rows)`` and
+        its context is seeded from ``(seed, table, i)``, so the output does
+        not depend on ``max_workers``. Shard results are consumed in shard
+        order with at most two shards per worker in flight. With ``merge``
+        they are streamed into one artifact named after the table; with
+        ``parts`` each shard is saved as ``<table>.part-<i:05d>``, a flat name
+        that file backends keep distinct per table.
+
+        Generator classes and resolved column options must be picklable.
+
+        Returns:
+            Names of the saved artifacts in row order.
+
+        Raises:
+            ValidationError: If sizes or ``output`` are invalid.
+        """
+        if num_rows < 0:
+            raise ValidationError("num_rows must not be negative")
+        if shard_rows < 1:
+            raise ValidationError("shard_rows must be at least 1")
+        if batch_rows < 1:
+            raise ValidationError("batch_rows must be at least 1")
+        if max_workers is not None and max_workers < 1:
+            raise ValidationError("max_workers must be at least 1")
+        if output not in ("merge", "parts"):
+            raise ValidationError(
+                f"output must be 'merge' or 'parts', got {output!r}"
+            )
+        columns = self._resolve_columns(table, context=context)
+        starts = range(0, num_rows, shard_rows) if num_rows else range(1)
+        shards = (
+            _Shard(
+                table_name=table.name,
+                columns=columns,
+                seed=seed,
+                index=index,
+                start_row=start,
+                num_rows=min(shard_rows, num_rows - start),
+                batch_rows=batch_rows,
+            )
+            for index, start in enumerate(starts)
+        )
+        results = _iter_shard_results(shards, max_workers=max_workers)
+        materialize = table.config.materialize
+        if output == "merge":
+            names = tuple(column.name for column in columns)
+            self.persistor.save_stream(
+                table.name,
+                names,
+                results,
+                materialize=materialize,
+                column_types=table.column_types,
+            )
+            return [table.name]
+        saved: list[str] = []
+        for index, batch in enumerate(results):
+            part = f"{table.name}.part-{index:05d}"
+            self.persistor.save(part, batch, materialize=materialize)
+            saved.append(part)
+        return saved
+
+    def fingerprint(self, table: Table, *, context: RuntimeContext) -> str:
+        """Return a content fingerprint of everything shaping ``table``.
+
+        Covers the table definition, each column's resolved options, the
+        generator class and hook it resolves to, and the generator's
+        ``plugin_version``. Upstream data is not included; callers chain
+        dependency fingerprints themselves.
+
+        Returns:
+            A stable hex digest.
+        """
+        columns = [
+            {
+                "name": spec.name,
+                "generator": (
+                    f"{spec.generator_class.__module__}."
+                    f"{spec.generator_class.__qualname__}"
+                ),
+                "hook": spec.local_hook,
+                "batch": spec.supports_batch,
+                "version": spec.generator_class.plugin_version(),
+                "options": spec.options,
+            }
+            for spec in self._resolve_columns(table, context=context)
+        ]
+        return fingerprint(table, columns)
+
+    def _resolve_columns(
+        self, table: Table, *, context: RuntimeContext
+    ) -> tuple[_ColumnSpec, ...]:
+        specs: list[_ColumnSpec] = []
+        for column in table.columns:
+            resolved = context.generator_registry.resolve_hook(column.generator)
+            specs.append(
+                _ColumnSpec(
+                    name=column.name,
+                    generator_class=resolved.generator_class,
+                    local_hook=resolved.local_hook,
+                    supports_batch=resolved.supports_batch,
+                    options=self._resolve_options(
+                        column.options, context=context
+                    ),
+                )
+            )
+        return tuple(specs)
+
+    def _resolve_options(
+        self, options: dict[str, ValueSpec] | None, *, context: RuntimeContext
+    ) -> dict[str, Any]:
+        """Resolve column option value specs to concrete values.
+
+        Returns:
+            Mapping of option name to resolved value.
+
+        Raises:
+            RuntimeError: If a lookup option is used without a value resolver.
+        """
+        resolved: dict[str, Any] = {}
+        for key, spec in (options or {}).items():
+            match spec:
+                case LiteralValue():
+                    resolved[key] = spec.value
+                case LookupValue():
+                    if self.value_resolver is None:
+                        raise RuntimeError("Value resolver is not configured")
+                    resolved[key] = self.value_resolver.resolve(spec)
+                case ReferenceValue():
+                    resolved[key] = context.resolve_reference(spec.ref)
+        return resolved
+
+
+def _bind_columns(
+    columns: Iterable[_ColumnSpec],
+) -> tuple[list[_ColumnPlan], list[Generator]]:
+    """Instantiate each generator class once and bind column hooks.
+
+    Returns:
+        Bound column plans and the distinct generator instances.
+    """
+    generators: dict[type[Generator], Generator] = {}
+    plans: list[_ColumnPlan] = []
+    for spec in columns:
+        generator = generators.get(spec.generator_class)
+        if generator is None:
+            generator = spec.generator_class()
+            generators[spec.generator_class] = generator
+        plans.append(
+            _BatchColumnPlan(
+                name=spec.name,
+                options=spec.options,
+                hook=generator.batch_hook(spec.local_hook),
+            )
+            if spec.supports_batch
+            else _ScalarColumnPlan(
+                name=spec.name,
+                options=spec.options,
+                hook=generator.scalar_hook(spec.local_hook),
+            )
+        )
+    return plans, list(generators.values())
+
+
+def _iter_shard_batches(shard: _Shard) -> Iterator[TabularBatch]:
+    plans, generators = _bind_columns(shard.columns)
+    names = tuple(plan.name for plan in plans)
+    context = GenerationContext(
+        table_name=shard.table_name,
+        row_index=shard.start_row,
+        seed=shard.seed,
+        shard_index=shard.index,
+    )
+    for generator in generators:
+        generator.setup(context)
+    try:
+        if shard.num_rows == 0:
+            yield TabularBatch.from_columns(names, {n: [] for n in names})
+            return
+        end_row = shard.start_row + shard.num_rows
+        for start in range(shard.start_row, end_row, shard.batch_rows):
+            count = min(shard.batch_rows, end_row - start)
+            yield _generate_batch(plans, names, context, start, count)
+    finally:
+        for generator in generators:
+            generator.teardown(context)
+
+
+def _generate_shard(shard: _Shard) -> TabularBatch:
+    """Worker entry point: generate one whole shard.
+
+    Returns:
+        The shard's rows as one column-major batch.
+    """
+    names = tuple(column.name for column in shard.columns)
+    return TabularBatch.concat(names, _iter_shard_batches(shard))
+
+
+def _iter_shard_results(
+    shards: Iterable[_Shard], *, max_workers: int | None
+) -> Iterator[TabularBatch]:
+    """Run shards on a process pool and yield their results in order.
+
+    Yields:
+        Shard batches in shard order.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        remaining = iter(shards)
+        pending: deque[Future[TabularBatch]] = deque(
+            pool.submit(_generate_shard, shard)
+            for shard in islice(remaining, 2 * workers)
+        )
+        while pending:
+            batch = pending.popleft().result()
+            for shard in islice(remaining, 1):
+                pending.append(pool.submit(_generate_shard, shard))
+            yield batch
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _generate_batch(
+    plans: list[_ColumnPlan],
+    names: tuple[str, ...],
+    context: GenerationContext,
+    start: int,
+    count: int,
+) -> TabularBatch:
+    """Generate one batch of ``count`` rows starting at row ``start``.
+
+    Returns:
+        A column-major batch.
+
+    Raises:
+        ValidationError: If a batch hook returns the wrong number of values.
+    """
+    last_scalar = max(
+        (
+            i
+            for i, plan in enumerate(plans)
+            if isinstance(plan, _ScalarColumnPlan)
+        ),
+        default=-1,
+    )
+    columns: dict[str, list[CellValue]] = {}
+    row_data: list[dict[str, Any]] | None = None
+    for i, plan in enumerate(plans):
+        context.row_index = start
+        context.column_name = plan.name
+        if isinstance(plan, _BatchColumnPlan):
+            values = _as_column(plan.hook(context, count, **plan.options))
+            if len(values) != count:
+                raise ValidationError(
+                    f"Column '{plan.name}' generated {len(values)} "
+                    f"values, expected {count}"
+                )
+        else:
+            if row_data is None:
+                row_data = [
+                    {n: col[r] for n, col in columns.items()}
+                    for r in range(count)
+                ]
+            values = []
+            for offset, row in enumerate(row_data):
+                context.row_index = start + offset
+                context.row_data = row
+                values.append(plan.hook(context, **plan.options))
+        columns[plan.name] = values
+        if row_data is not None and i < last_scalar:
+            for row, value in zip(row_data, values, strict=True):
+                row[plan.name] = value
+    context.row_index = start
+    context.row_data = {}
+    context.column_name = ""
+    return TabularBatch.from_columns(names, columns)
+
+
+def _as_column(values: Sequence[Any]) -> list[CellValue]:
+    """Convert a batch hook result to a list of Python values.
+
+    Returns:
+        ``values`` as a list (array results are converted via ``tolist``).
+    """
+    if isinstance(values, list):
+        return values
+    tolist = getattr(values, "tolist", None)
+    if callable(tolist):
+        converted: list[CellValue] = tolist()
+        return converted
+    return list(values)
@@ -8,21 +8,33 @@ from typing import TYPE_CHECKING, Any
 from limbo_core.adapters.connections import ConnectionRegistry
 from limbo_core.adapters.generators import GeneratorRegistry
 from limbo_core.adapters.persistence import (
+    MANIFEST_OBJECT_NAME,
+    SNAPSHOT_INDEX_OBJECT_NAME,
     DataPersistenceRegistry,
+    DefaultPersistor,
+    FileRunManifestStore,
+    FileSnapshotIndexStore,
     PathResolverRegistry,
 )
 from limbo_core.adapters.plugins import PluggyPluginLoader
 from limbo_core.adapters.value_reader import ValueReaderRegistry
 from limbo_core.application.parsers import ProjectParser
 from limbo_core.application.services import (
+    GenerationRunService,
     ProjectLoaderService,
     ProjectValidatorService,
+    SourceReaderService,
+    SourceSnapshotService,
+    TableGenerationService,
 )
+from limbo_core.domain.value_objects import TableStorageRef
 from limbo_core.plugins import PluginManager
+from limbo_core.validation import ValidationError
 
 if TYPE_CHECKING:
     from limbo_core.application.context import ResolutionContext, RuntimeContext
     from limbo_core.domain.entities import Project
+    from limbo_core.domain.value_objects import ResolvedStorageRef
 
 
 @dataclass(slots=True)
@@ -51,7 +63,8 @@ class Container:
     def __post_init__(self) -> None:
         """Instantiate services after dependencies are available."""
         self.data_persistence_registry = DataPersistenceRegistry(
-            path_resolver_registry=self.path_resolver_registry
+            path_resolver_registry=self.path_resolver_registry,
+            connection_provider=self.connection_registry,
         )
         self.plugin_manager = PluginManager(
             connection_registry=self.connection_registry,
@@ -93,6 +106,90 @@ class Container:
             payload, context=context, resolution_context=resolution_context
         )
 
+    def table_generation_service(
+        self, backend_key: str
+    ) -> TableGenerationService:
+        """Build a table generation service persisting via ``backend_key``.
+
+        Returns:
+            Service saving generated tables through the data persistence
+            registry and resolving lookup options via value readers.
+        """
+        return TableGenerationService(
+            persistor=DefaultPersistor(
+                data_resolver=self.data_persistence_registry,
+                backend_key=backend_key,
+            ),
+            value_resolver=self.value_reader_registry,
+        )
+
+    def generation_run_service(self, backend_key: str) -> GenerationRunService:
+        """Build a resumable project run persisting via ``backend_key``.
+
+        Returns:
+            Service checkpointing completed tables in a manifest stored next
+            to the backend's outputs, fingerprinting seed files and sources
+            by content.
+        """
+        ref = self._document_ref(backend_key, MANIFEST_OBJECT_NAME)
+        return GenerationRunService(
+            generation=self.table_generation_service(backend_key),
+            manifest_store=FileRunManifestStore(ref),
+            path_registry=self.path_resolver_registry,
+            source_reader=self.source_reader_service(),
+        )
+
+    def source_reader_service(self) -> SourceReaderService:
+        """Build a source reader over the configured connections.
+
+        Returns:
+            Service streaming source tables as typed batches.
+        """
+        return SourceReaderService(connections=self.connection_registry)
+
+    def source_snapshot_service(
+        self, backend_key: str
+    ) -> SourceSnapshotService:
+        """Build a source snapshot cache stored via ``backend_key``.
+
+        Returns:
+            Service serving snapshot-enabled sources from local copies,
+            indexed in a JSON document next to the snapshots.
+        """
+        ref = self._document_ref(backend_key, SNAPSHOT_INDEX_OBJECT_NAME)
+        return SourceSnapshotService(
+            reader=self.source_reader_service(),
+            persistence=self.data_persistence_registry,
+            backend_key=backend_key,
+            index_store=FileSnapshotIndexStore(ref),
+        )
+
+    def _document_ref(
+        self, backend_key: str, object_name: str
+    ) -> ResolvedStorageRef:
+        """Return the ref of JSON document ``object_name`` of a backend.
+
+        Returns:
+            The ref next to the backend's outputs.
+
+        Raises:
+            ValidationError: If the backend stores database tables, which
+                cannot hold documents.
+        """
+        ref = self.data_persistence_registry.storage_ref(
+            backend_key, object_name
+        )
+        if isinstance(ref, TableStorageRef):
+            raise ValidationError(
+                f"Backend {backend_key!r} stores database tables and cannot "
+                f"hold {object_name!r}; use a file or object store backend"
+            )
+        return ref
+
+    def shutdown(self) -> None:
+        """Release the connection pools of all configured connections."""
+        self.connection_registry.dispose()
+
 
 _default_container: Container | None = None
 
@@ -8,11 +8,17 @@ from .backends import (
     PathBackendSpec,
     ValueReaderBackendSpec,
 )
-from .generation import GenerationContext
+from .generation import GenerationContext, RandomStream
 from .project import Project
 from .resources import PathSpec
 from .seeds import Seed, SeedColumn, SeedConfig, SeedFile
-from .sources import Source, SourceColumn, SourceConfig
+from .sources import (
+    SnapshotFreshness,
+    Source,
+    SourceColumn,
+    SourceConfig,
+    SourceSnapshot,
+)
 from .tables import (
     Table,
     TableColumn,
@@ -36,14 +42,17 @@ __all__ = [
     "PathBackendSpec",
     "PathSpec",
     "Project",
+    "RandomStream",
     "ReferenceValue",
     "Seed",
     "SeedColumn",
     "SeedConfig",
     "SeedFile",
+    "SnapshotFreshness",
     "Source",
     "SourceColumn",
     "SourceConfig",
+    "SourceSnapshot",
     "Table",
     "TableColumn",
     "TableConfig",
@@ -8,6 +8,7 @@ from limbo_core.domain.validation import ValidationError
 
 from .column import ArtifactColumn
 from .config import ArtifactConfig
+from .data_types import DataType
 
 ConfigType = TypeVar("ConfigType", bound=ArtifactConfig)
 ColumnType = TypeVar("ColumnType", bound=ArtifactColumn)
@@ -30,3 +31,8 @@ class Artifact(ABC, Generic[ConfigType, ColumnType]):
         """
         if not self.columns:
             raise ValidationError("Field 'columns' must have at least one item")
+
+    @property
+    def column_types(self) -> dict[str, DataType]:
+        """Declared ``DataType`` per column name, in column order."""
+        return {column.name: column.data_type for column in self.columns}
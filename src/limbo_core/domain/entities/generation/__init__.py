@@ -1,5 +1,6 @@
 """Generation-related domain entities."""
 
 from .context import GenerationContext
+from .random_stream import RandomStream, derive_seed
 
-__all__ = ["GenerationContext"]
+__all__ = ["GenerationContext", "RandomStream", "derive_seed"]
@@ -5,12 +5,50 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
+from .random_stream import RandomStream, derive_seed
+
 
 @dataclass(slots=True)
 class GenerationContext:
-    """Mutable context for a single table generation run."""
+    """Mutable context for a single table generation run.
+
+    ``seed`` is the project-level seed and ``shard_index`` the row-range
+    shard being generated. Generators that need randomness should draw from
+    ``random_stream()`` (or seed from ``shard_seed``) so output does not
+    depend on how shards are scheduled.
+    """
 
     table_name: str = ""
     row_index: int = 0
     row_data: dict[str, Any] = field(default_factory=dict)
     shared_state: dict[str, Any] = field(default_factory=dict)
+    seed: int = 0
+    shard_index: int = 0
+    column_name: str = ""
+    _streams: dict[str, RandomStream] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    @property
+    def shard_seed(self) -> int:
+        """Seed derived from ``(seed, table_name, shard_index)``."""
+        return derive_seed(self.seed, self.table_name, self.shard_index)
+
+    def random_stream(self, column: str | None = None) -> RandomStream:
+        """Return the stream for ``column`` (default: the current column).
+
+        Streams are keyed by ``(seed, table_name, column, shard_index)`` and
+        created on first use; later calls return the same stream, which
+        continues where the previous draw stopped.
+
+        Returns:
+            The column's random stream for this shard.
+        """
+        name = self.column_name if column is None else column
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = RandomStream.for_key(
+                self.seed, self.table_name, name, self.shard_index
+            )
+            self._streams[name] = stream
+        return stream
@@ -2,6 +2,13 @@
 
 from .column import SourceColumn
 from .config import SourceConfig
+from .snapshot import SnapshotFreshness, SourceSnapshot
 from .source import Source
 
-__all__ = ["Source", "SourceColumn", "SourceConfig"]
+__all__ = [
+    "SnapshotFreshness",
+    "Source",
+    "SourceColumn",
+    "SourceConfig",
+    "SourceSnapshot",
+]
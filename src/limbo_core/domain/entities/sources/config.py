@@ -3,18 +3,27 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from limbo_core.domain.entities.artifacts.config import ArtifactConfig
 from limbo_core.domain.validation import ValidationError
 
+if TYPE_CHECKING:
+    from .snapshot import SourceSnapshot
+
 
 @dataclass(slots=True, kw_only=True)
 class SourceConfig(ArtifactConfig):
-    """Source configuration."""
+    """Source configuration.
+
+    ``snapshot`` opts the source into a local snapshot cache; None reads
+    the database on every run.
+    """
 
     connection: str = ""
     schema_name: str | None = None
     table_name: str | None = None
+    snapshot: SourceSnapshot | None = None
 
     def __post_init__(self) -> None:
         """Validate source config invariants.
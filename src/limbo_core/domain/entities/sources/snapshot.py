@@ -0,0 +1,43 @@
+"""Source snapshot configuration entity."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal
+
+from limbo_core.domain.validation import ValidationError
+
+SnapshotFreshness = Literal["row_count", "updated_at", "ttl"]
+
+
+@dataclass(slots=True, kw_only=True)
+class SourceSnapshot:
+    """Opt-in local snapshot of a source and how to revalidate it.
+
+    ``row_count`` re-reads the source when its row count changed,
+    ``updated_at`` additionally compares the max of ``updated_at_column``
+    and ``ttl`` trusts the snapshot for ``ttl_seconds`` without probing.
+    """
+
+    freshness: SnapshotFreshness = "row_count"
+    updated_at_column: str | None = None
+    ttl_seconds: float | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the options required by ``freshness``.
+
+        Raises:
+            ValidationError: If the probe column or TTL is missing.
+        """
+        if self.freshness == "updated_at" and not self.updated_at_column:
+            raise ValidationError(
+                "SourceSnapshot: 'updated_at' freshness requires "
+                "'updated_at_column'"
+            )
+        if self.freshness == "ttl" and (
+            self.ttl_seconds is None or self.ttl_seconds <= 0
+        ):
+            raise ValidationError(
+                "SourceSnapshot: 'ttl' freshness requires a positive "
+                "'ttl_seconds'"
+            )
@@ -1,11 +1,56 @@
 """Domain value objects."""
 
+from .artifact_graph import (
+    ArtifactCycleError,
+    ArtifactGraph,
+    ArtifactKey,
+    ArtifactType,
+    UnknownArtifactReferenceError,
+)
+from .fingerprint import fingerprint
+from .object_store_ref import (
+    DEFAULT_PART_SIZE,
+    ObjectStoreClient,
+    ObjectStorePool,
+    ObjectStoreStorageRef,
+)
 from .resolved_storage_ref import LocalFilesystemStorageRef, ResolvedStorageRef
-from .tabular_batch import CellValue, TabularBatch
+from .run_manifest import ManifestEntry, RunManifest
+from .snapshot_index import SnapshotIndex, SnapshotRecord
+from .stream_compression import (
+    COMPRESSION_SUFFIXES,
+    CompressionSetting,
+    MissingCodecError,
+    StreamCompression,
+    infer_compression,
+)
+from .table_storage_ref import TableStorageRef
+from .tabular_batch import CellValue, RowValidation, TabularBatch
 
 __all__ = [
+    "COMPRESSION_SUFFIXES",
+    "DEFAULT_PART_SIZE",
+    "ArtifactCycleError",
+    "ArtifactGraph",
+    "ArtifactKey",
+    "ArtifactType",
     "CellValue",
+    "CompressionSetting",
     "LocalFilesystemStorageRef",
+    "ManifestEntry",
+    "MissingCodecError",
+    "ObjectStoreClient",
+    "ObjectStorePool",
+    "ObjectStoreStorageRef",
     "ResolvedStorageRef",
+    "RowValidation",
+    "RunManifest",
+    "SnapshotIndex",
+    "SnapshotRecord",
+    "StreamCompression",
+    "TableStorageRef",
     "TabularBatch",
+    "UnknownArtifactReferenceError",
+    "fingerprint",
+    "infer_compression",
 ]
@@ -0,0 +1,159 @@
+"""Dependency graph over project artifacts."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+from limbo_core.domain.validation import ValidationError
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from limbo_core.domain.entities import Project
+
+ArtifactType = Literal["table", "seed", "source"]
+
+
+class UnknownArtifactReferenceError(ValidationError):
+    """Raised when a table references an artifact that is not declared."""
+
+    def __init__(self, referrer: ArtifactKey, target: ArtifactKey) -> None:
+        """Initialize the UnknownArtifactReferenceError."""
+        super().__init__(f"{referrer} references unknown {target}")
+
+
+class ArtifactCycleError(ValidationError):
+    """Raised when artifact references form a cycle."""
+
+    def __init__(self, cycle: tuple[ArtifactKey, ...]) -> None:
+        """Initialize the ArtifactCycleError."""
+        self.cycle = cycle
+        path = " -> ".join(str(key) for key in cycle)
+        super().__init__(f"Artifact references form a cycle: {path}")
+
+
+@dataclass(frozen=True, slots=True, order=True)
+class ArtifactKey:
+    """Identify one table, seed or source of a project."""
+
+    type: ArtifactType
+    name: str
+
+    def __str__(self) -> str:
+        """Return ``type 'name'``."""
+        return f"{self.type} '{self.name}'"
+
+
+@dataclass(frozen=True, slots=True)
+class ArtifactGraph:
+    """Acyclic dependency graph over project artifacts.
+
+    ``dependencies[key]`` holds the artifacts ``key`` reads from and
+    ``dependents[key]`` the artifacts reading from ``key``. Every declared
+    artifact is a node, including those without edges.
+    """
+
+    dependencies: Mapping[ArtifactKey, frozenset[ArtifactKey]]
+    dependents: Mapping[ArtifactKey, frozenset[ArtifactKey]]
+
+    @classmethod
+    def from_project(cls, project: Project) -> ArtifactGraph:
+        """Build the graph from table references of ``project``.
+
+        Returns:
+            The validated dependency graph.
+
+        Raises:
+            ValidationError: If an artifact name is declared twice.
+            UnknownArtifactReferenceError: If a reference targets an artifact
+                that is not declared.
+        """
+        declared = [
+            *(ArtifactKey("seed", seed.name) for seed in project.seeds),
+            *(ArtifactKey("source", source.name) for source in project.sources),
+            *(ArtifactKey("table", table.name) for table in project.tables),
+        ]
+        dependencies: dict[ArtifactKey, set[ArtifactKey]] = {}
+        for key in declared:
+            if key in dependencies:
+                raise ValidationError(f"Duplicate {key}")
+            dependencies[key] = set()
+        for table in project.tables:
+            referrer = ArtifactKey("table", table.name)
+            for reference in table.references or ():
+                target = ArtifactKey(reference.type, reference.name)
+                if target not in dependencies:
+                    raise UnknownArtifactReferenceError(referrer, target)
+                dependencies[referrer].add(target)
+        return cls.from_dependencies(dependencies)
+
+    @classmethod
+    def from_dependencies(
+        cls, dependencies: Mapping[ArtifactKey, set[ArtifactKey]]
+    ) -> ArtifactGraph:
+        """Build the graph from a complete ``key -> dependencies`` mapping.
+
+        Returns:
+            The validated dependency graph.
+
+        Raises:
+            ValidationError: If a dependency is not itself a key.
+        """
+        dependents: dict[ArtifactKey, set[ArtifactKey]] = {
+            key: set() for key in dependencies
+        }
+        for key, deps in dependencies.items():
+            for dep in deps:
+                if dep not in dependents:
+                    raise ValidationError(f"{key} depends on undeclared {dep}")
+                dependents[dep].add(key)
+        graph = cls(
+            dependencies={k: frozenset(v) for k, v in dependencies.items()},
+            dependents={k: frozenset(v) for k, v in dependents.items()},
+        )
+        graph.topological_order()
+        return graph
+
+    def topological_order(self) -> list[ArtifactKey]:
+        """Return artifacts ordered so dependencies precede dependents.
+
+        Ties are broken by ``(type, name)`` so the order is deterministic.
+
+        Returns:
+            Every artifact exactly once.
+
+        Raises:
+            ArtifactCycleError: If the references form a cycle.
+        """
+        remaining = {k: len(v) for k, v in self.dependencies.items()}
+        ready = sorted(k for k, n in remaining.items() if n == 0)
+        order: list[ArtifactKey] = []
+        while ready:
+            key = ready.pop(0)
+            order.append(key)
+            for child in sorted(self.dependents[key]):
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    ready.append(child)
+        if len(order) != len(remaining):
+            raise ArtifactCycleError(self._find_cycle(set(order)))
+        return order
+
+    def _find_cycle(self, acyclic: set[ArtifactKey]) -> tuple[ArtifactKey, ...]:
+        """Walk dependencies from a node left over by the topological sort.
+
+        Every leftover node has a leftover dependency, so the walk must
+        revisit a node.
+
+        Returns:
+            The cycle, starting and ending with the same artifact.
+        """
+        key = min(k for k in self.dependencies if k not in acyclic)
+        path: list[ArtifactKey] = []
+        seen: dict[ArtifactKey, int] = {}
+        while key not in seen:
+            seen[key] = len(path)
+            path.append(key)
+            key = min(d for d in self.dependencies[key] if d not in acyclic)
+        return (*path[seen[key] :], key)
@@ -0,0 +1,77 @@
+"""Stable content fingerprints for artifact definitions."""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from pathlib import PurePath
+from typing import Any
+from uuid import UUID
+
+_STRING_FORMS = (Decimal, UUID, PurePath)
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(
+        value, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+
+
+def _canonical(value: Any) -> Any:
+    """Convert ``value`` to a JSON-serializable, order-independent form.
+
+    Returns:
+        Nested dicts, lists and scalars; dataclasses carry their type name.
+
+    Raises:
+        TypeError: If ``value`` (or a nested item) has no stable form; a
+            ``repr`` may embed memory addresses and differ across runs.
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            "__type__": type(value).__name__,
+            **{
+                f.name: _canonical(getattr(value, f.name))
+                for f in dataclasses.fields(value)
+            },
+        }
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [_canonical(v) for v in value]
+    if isinstance(value, frozenset | set):
+        return sorted((_canonical(v) for v in value), key=_dumps)
+    if isinstance(value, datetime | date | time):
+        return {"__type__": type(value).__name__, "iso": value.isoformat()}
+    if isinstance(value, timedelta):
+        return {"__type__": "timedelta", "seconds": value.total_seconds()}
+    if isinstance(value, _STRING_FORMS):
+        return {"__type__": type(value).__name__, "str": str(value)}
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    raise TypeError(f"cannot fingerprint {type(value).__name__}")
+
+
+def fingerprint(*parts: object) -> str:
+    """Return a stable hex digest of ``parts``.
+
+    Dataclasses (e.g. ``Table`` definitions) are hashed field by field, so
+    the digest changes exactly when the definition does and is identical
+    across processes and runs.
+
+    Sets are ordered by the serialized form of their items. Values other
+    than dataclasses, enums, containers, scalars, dates and times,
+    ``Decimal``, ``UUID`` and paths are rejected rather than hashed by
+    ``repr``.
+
+    Returns:
+        A 32-character hex string.
+    """
+    payload = _dumps(_canonical(list(parts)))
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
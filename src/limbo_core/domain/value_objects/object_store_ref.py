@@ -0,0 +1,454 @@
+"""Object-store storage refs with ranged reads and multipart writes."""
+
+from __future__ import annotations
+
+import io
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator  # noqa: TC003
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
+from typing import Any, BinaryIO, Literal, TextIO, cast
+
+from limbo_core.domain.validation import ValidationError
+
+from .resolved_storage_ref import ResolvedStorageRef
+from .stream_compression import (
+    CompressionSetting,
+    StreamCompression,
+    open_compressed,
+    resolve_compression,
+    validate_compression,
+)
+
+DEFAULT_PART_SIZE = 8 << 20
+"""Bytes per multipart upload part and per ranged read."""
+
+
+class ObjectStoreClient(ABC):
+    """Connection to one bucket of an object store.
+
+    Objects appear only when a multipart upload completes, so readers never
+    observe partial writes. A client is used by one thread at a time;
+    ``ObjectStorePool`` bounds how many exist.
+    """
+
+    @abstractmethod
+    def head(self, key: str) -> int | None:
+        """Return the size of object ``key``, or None if it is missing."""
+        ...
+
+    @abstractmethod
+    def get_range(self, key: str, start: int, end: int) -> bytes:
+        """Return bytes ``[start, end)`` of object ``key``."""
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove object ``key`` if present."""
+        ...
+
+    @abstractmethod
+    def list_keys(self, prefix: str) -> list[str]:
+        """Return the sorted keys starting with ``prefix``."""
+        ...
+
+    @abstractmethod
+    def start_upload(self, key: str) -> str:
+        """Begin a multipart upload to ``key`` and return its upload id."""
+        ...
+
+    @abstractmethod
+    def upload_part(
+        self, upload_id: str, part_number: int, data: bytes
+    ) -> None:
+        """Store part ``part_number`` (1-based) of an upload."""
+        ...
+
+    @abstractmethod
+    def complete_upload(self, upload_id: str) -> None:
+        """Publish the uploaded parts, in part order, as the object."""
+        ...
+
+    @abstractmethod
+    def abort_upload(self, upload_id: str) -> None:
+        """Discard an upload and its parts."""
+        ...
+
+
+class ObjectStorePool:
+    """Bounded pool of object store connections.
+
+    Connections are opened lazily by ``connect`` and reused; at most
+    ``max_connections`` are open and ``connection()`` blocks while all of
+    them are borrowed.
+    """
+
+    __slots__ = ("_connect", "_idle", "_opened", "_ready", "max_connections")
+
+    def __init__(
+        self,
+        connect: Callable[[], ObjectStoreClient],
+        *,
+        max_connections: int = 8,
+    ) -> None:
+        """Build an empty pool.
+
+        Raises:
+            ValidationError: If ``max_connections`` is not positive.
+        """
+        if max_connections < 1:
+            raise ValidationError("max_connections must be at least 1")
+        self._connect = connect
+        self.max_connections = max_connections
+        self._idle: list[ObjectStoreClient] = []
+        self._opened = 0
+        self._ready = threading.Condition()
+
+    @property
+    def opened(self) -> int:
+        """Number of connections opened so far."""
+        return self._opened
+
+    @contextmanager
+    def connection(self) -> Iterator[ObjectStoreClient]:
+        """Borrow a connection for the duration of the context.
+
+        Yields:
+            A connection not used by any other thread.
+        """
+        client = self._acquire()
+        try:
+            yield client
+        finally:
+            with self._ready:
+                self._idle.append(client)
+                self._ready.notify()
+
+    def _acquire(self) -> ObjectStoreClient:
+        with self._ready:
+            while not self._idle and self._opened >= self.max_connections:
+                self._ready.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._opened += 1
+        try:
+            return self._connect()
+        except BaseException:
+            with self._ready:
+                self._opened -= 1
+                self._ready.notify()
+            raise
+
+
+class ObjectStoreStorageRef(ResolvedStorageRef):
+    """Ref to one object of an object store, accessed through a pool.
+
+    Reads fetch ``part_size`` byte ranges on demand, so streams are seekable
+    without downloading the whole object. Writes are multipart uploads of
+    ``part_size`` parts that publish the object only on success; they are
+    therefore always atomic (``open_atomic_binary`` streams the upload
+    directly) and ``fsync`` is a no-op. Objects cannot be
+    appended to. ``compression`` behaves as for local files, inferring the
+    codec from the key suffix by default.
+    """
+
+    __slots__ = ("_backend", "_compression", "key", "part_size", "pool")
+
+    def __init__(
+        self,
+        *,
+        backend: str,
+        key: str,
+        pool: ObjectStorePool,
+        part_size: int = DEFAULT_PART_SIZE,
+        compression: CompressionSetting = "infer",
+    ) -> None:
+        """Build a ref to ``key`` in the pool's bucket.
+
+        Raises:
+            ValidationError: If ``part_size`` is not positive.
+        """
+        if part_size < 1:
+            raise ValidationError("part_size must be at least 1")
+        self._backend = backend
+        self.key = key
+        self.pool = pool
+        self.part_size = part_size
+        self._compression = validate_compression(compression)
+
+    @property
+    def backend(self) -> str:
+        """Logical storage backend key from the original path spec."""
+        return self._backend
+
+    @property
+    def uri(self) -> str:
+        """``<backend>://<key>`` URI of the object."""
+        return f"{self._backend}://{self.key}"
+
+    @property
+    def compression(self) -> StreamCompression | None:
+        """Codec applied to streams, with ``"infer"`` resolved."""
+        return resolve_compression(self._compression, PurePosixPath(self.key))
+
+    def with_compression(
+        self, compression: CompressionSetting
+    ) -> ObjectStoreStorageRef:
+        """Return a copy of this ref using ``compression``.
+
+        Returns:
+            A ref to the same object.
+        """
+        return ObjectStoreStorageRef(
+            backend=self._backend,
+            key=self.key,
+            pool=self.pool,
+            part_size=self.part_size,
+            compression=compression,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if the other ref denotes the same object."""
+        if not isinstance(other, ObjectStoreStorageRef):
+            return NotImplemented
+        return (
+            self._backend == other._backend
+            and self.key == other.key
+            and self.pool is other.pool
+            and self.compression == other.compression
+        )
+
+    def child(self, name: str) -> ObjectStoreStorageRef:
+        """Return the ref of object ``<key>/<name>`` in the same bucket.
+
+        Returns:
+            A ref sharing this ref's pool and part size.
+        """
+        return ObjectStoreStorageRef(
+            backend=self._backend,
+            key=f"{self.key}/{name}",
+            pool=self.pool,
+            part_size=self.part_size,
+        )
+
+    def list_children(self) -> list[str]:
+        """Return the sorted names of objects under the ``<key>/`` prefix.
+
+        Returns:
+            Keys relative to the prefix.
+        """
+        prefix = f"{self.key}/"
+        with self.pool.connection() as client:
+            keys = client.list_keys(prefix)
+        return [key.removeprefix(prefix) for key in keys]
+
+    def size(self) -> int | None:
+        """Return the stored (raw) size in bytes, or None if missing."""
+        with self.pool.connection() as client:
+            return client.head(self.key)
+
+    def exists(self) -> bool:
+        """Return True if the object exists."""
+        return self.size() is not None
+
+    def unlink(self) -> None:
+        """Remove the object if present."""
+        with self.pool.connection() as client:
+            client.delete(self.key)
+
+    def as_local_path(self) -> Path:
+        """Object store refs have no local path.
+
+        Raises:
+            ValidationError: Always.
+        """
+        raise ValidationError(f"{self.uri} is not filesystem-backed")
+
+    def read_range(self, start: int, end: int) -> bytes:
+        """Return raw bytes ``[start, end)`` of the stored object.
+
+        Returns:
+            The bytes, without decompression.
+        """
+        with self.pool.connection() as client:
+            return client.get_range(self.key, start, end)
+
+    def read_bytes(self) -> bytes:
+        """Read the entire object, decompressing if configured.
+
+        Returns:
+            The object's bytes.
+        """
+        with self.open_binary("rb") as fh:
+            return fh.read()
+
+    def write_bytes(self, data: bytes) -> None:
+        """Replace the object with ``data``."""
+        with self.open_binary("wb") as fh:
+            fh.write(data)
+
+    @contextmanager
+    def open_binary(
+        self, mode: Literal["rb", "wb", "ab"]
+    ) -> Iterator[BinaryIO]:
+        """Open a ranged reader or a multipart writer.
+
+        Yields:
+            A binary stream, closed after the context exits.
+
+        Raises:
+            ValidationError: If appending, or reading a missing object.
+        """
+        if mode == "ab":
+            raise ValidationError("object store refs do not support append")
+        if mode == "rb":
+            size = self.size()
+            if size is None:
+                raise ValidationError(f"Object {self.uri} does not exist")
+            reader = io.BufferedReader(
+                _RangedReader(self, size), self.part_size
+            )
+            with reader:
+                yield from self._wrap_codec(cast("BinaryIO", reader), mode)
+            return
+        writer = _MultipartWriter(self)
+        buffered = io.BufferedWriter(writer, self.part_size)
+        try:
+            yield from self._wrap_codec(cast("BinaryIO", buffered), mode)
+        except BaseException:
+            writer.abort()
+            raise
+        finally:
+            buffered.close()
+
+    @contextmanager
+    def open_atomic_binary(self, *, fsync: bool = False) -> Iterator[BinaryIO]:
+        """Open a multipart writer; uploads already publish atomically.
+
+        Yields:
+            The ``open_binary('wb')`` stream.
+        """
+        del fsync  # uploads are durable once published
+        with self.open_binary("wb") as fh:
+            yield fh
+
+    def _wrap_codec(
+        self, fh: BinaryIO, mode: Literal["rb", "wb", "ab"]
+    ) -> Iterator[BinaryIO]:
+        compression = self.compression
+        if compression is None:
+            yield fh
+            return
+        with open_compressed(fh, compression, mode) as stream:
+            yield stream
+
+    @contextmanager
+    def open_text(
+        self,
+        mode: Literal["r", "w", "a"],
+        *,
+        encoding: str,
+        newline: str | None = None,
+    ) -> Iterator[TextIO]:
+        """Open a text stream over ``open_binary``.
+
+        Yields:
+            A text stream, closed after the context exits.
+        """
+        binary_mode = cast("Literal['rb', 'wb', 'ab']", f"{mode}b")
+        with self.open_binary(binary_mode) as raw:
+            text = io.TextIOWrapper(raw, encoding=encoding, newline=newline)
+            try:
+                yield text
+            finally:
+                text.flush()
+                text.detach()
+
+
+class _RangedReader(io.RawIOBase):
+    """Seekable raw reader fetching byte ranges of an object on demand."""
+
+    def __init__(self, ref: ObjectStoreStorageRef, size: int) -> None:
+        self._ref = ref
+        self._size = size
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._position}.get(
+            whence, self._size
+        )
+        self._position = max(0, base + offset)
+        return self._position
+
+    def readinto(self, buffer: Any) -> int:
+        end = min(self._size, self._position + len(buffer))
+        if end <= self._position:
+            return 0
+        data = self._ref.read_range(self._position, end)
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
+class _MultipartWriter(io.RawIOBase):
+    """Raw writer uploading one part per write; ``close`` completes it."""
+
+    def __init__(self, ref: ObjectStoreStorageRef) -> None:
+        self._ref = ref
+        self._pending = bytearray()
+        self._parts = 0
+        self._upload_id: str | None = None
+        self._aborted = False
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        if self._aborted:
+            return len(data)
+        self._pending += data
+        while len(self._pending) >= self._ref.part_size:
+            self._upload(bytes(self._pending[: self._ref.part_size]))
+            del self._pending[: self._ref.part_size]
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed and not self._aborted:
+            if self._pending or self._parts == 0:
+                self._upload(bytes(self._pending))
+                self._pending.clear()
+            with self._ref.pool.connection() as client:
+                client.complete_upload(self._started())
+        super().close()
+
+    def abort(self) -> None:
+        """Discard the upload; the object is left unchanged."""
+        if self._aborted:
+            return
+        self._aborted = True
+        self._pending.clear()
+        if self._upload_id is not None:
+            with self._ref.pool.connection() as client:
+                client.abort_upload(self._upload_id)
+
+    def _started(self) -> str:
+        if self._upload_id is None:
+            with self._ref.pool.connection() as client:
+                self._upload_id = client.start_upload(self._ref.key)
+        return self._upload_id
+
+    def _upload(self, data: bytes) -> None:
+        upload_id = self._started()
+        self._parts += 1
+        with self._ref.pool.connection() as client:
+            client.upload_part(upload_id, self._parts, data)
@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
+import io
+import os
+import uuid
 from abc import ABC, abstractmethod
 from collections.abc import Iterator  # noqa: TC003
 from contextlib import AbstractContextManager, contextmanager
 from pathlib import Path  # noqa: TC003
-from typing import Any, BinaryIO, Literal, TextIO
+from typing import Any, BinaryIO, Literal, TextIO, cast
+
+from limbo_core.domain.validation import ValidationError
+
+from .stream_compression import (
+    CompressionSetting,
+    StreamCompression,
+    open_compressed,
+    resolve_compression,
+    validate_compression,
+)
 
 
 class ResolvedStorageRef(ABC):
@@ -67,11 +80,96 @@ class ResolvedStorageRef(ABC):
         """Open a text stream; use ``with ref.open_text(...) as fh:``."""
         ...
 
+    @contextmanager
+    def open_atomic_binary(self, *, fsync: bool = False) -> Iterator[BinaryIO]:
+        """Open a stream replacing the object only if the context succeeds.
+
+        Readers never observe a partial write; ``fsync=True`` additionally
+        flushes the data to stable storage before it becomes visible. This
+        fallback buffers the content in memory and stores it with
+        ``write_bytes`` on success (so ``fsync`` is whatever that gives);
+        refs that can stage writes in storage override it.
+
+        Yields:
+            A binary stream, discarded if the context raises.
+        """
+        del fsync
+        buffer = io.BytesIO()
+        yield buffer
+        self.write_bytes(buffer.getvalue())
+
+    @contextmanager
+    def open_atomic_text(
+        self, *, encoding: str, newline: str | None = None, fsync: bool = False
+    ) -> Iterator[TextIO]:
+        """Open a text stream over ``open_atomic_binary``.
+
+        Yields:
+            A text stream, discarded if the context raises.
+        """
+        with self.open_atomic_binary(fsync=fsync) as raw:
+            text = io.TextIOWrapper(
+                cast("Any", raw), encoding=encoding, newline=newline
+            )
+            try:
+                yield text
+            finally:
+                text.flush()
+                text.detach()
+
+    def child(self, name: str) -> ResolvedStorageRef:
+        """Return the ref of object ``name`` under this ref as a directory.
+
+        ``name`` is a relative ``/``-separated path. Refs that cannot hold
+        other objects do not support children.
+
+        Raises:
+            ValidationError: If this ref cannot hold other objects.
+        """
+        raise ValidationError(
+            f"{type(self).__name__} cannot hold object {name!r}"
+        )
+
+    def list_children(self) -> list[str]:
+        """Return the names of all objects under this ref as a directory.
+
+        Raises:
+            ValidationError: If this ref cannot hold other objects.
+        """
+        raise ValidationError(
+            f"{type(self).__name__} cannot hold other objects"
+        )
+
+    def with_compression(
+        self, compression: CompressionSetting
+    ) -> ResolvedStorageRef:
+        """Return a ref whose streams use ``compression``.
+
+        Refs without codec support only accept ``"infer"``.
+
+        Returns:
+            A ref to the same object.
+
+        Raises:
+            ValidationError: If this ref cannot apply ``compression``.
+        """
+        if compression == "infer":
+            return self
+        raise ValidationError(
+            f"{type(self).__name__} does not support stream compression"
+        )
+
 
 class LocalFilesystemStorageRef(ResolvedStorageRef):
-    """Filesystem-backed ref (local Path) with read/write/delete."""
+    """Filesystem-backed ref (local Path) with read/write/delete.
 
-    __slots__ = ("_backend", "_metadata", "_uri", "local_path")
+    ``open_binary``/``open_text`` (and ``read_bytes``/``write_bytes``)
+    transparently (de)compress with ``compression``; the default ``"infer"``
+    picks gzip, zstd or brotli from the file suffix (``.gz``, ``.zst``,
+    ``.br``). ``as_local_path`` always denotes the raw file.
+    """
+
+    __slots__ = ("_backend", "_compression", "_metadata", "_uri", "local_path")
 
     def __init__(
         self,
@@ -80,12 +178,14 @@ class LocalFilesystemStorageRef(ResolvedStorageRef):
         uri: str,
         local_path: Path,
         metadata: dict[str, Any] | None = None,
+        compression: CompressionSetting = "infer",
     ) -> None:
         """Build a ref for a concrete local file path."""
         self._backend = backend
         self._uri = uri
         self.local_path = local_path
         self._metadata = {} if metadata is None else dict(metadata)
+        self._compression = validate_compression(compression)
 
     @staticmethod
     def _ensure_parent(path: Path) -> None:
@@ -106,6 +206,27 @@ class LocalFilesystemStorageRef(ResolvedStorageRef):
         """Optional extra attributes for this ref."""
         return self._metadata
 
+    @property
+    def compression(self) -> StreamCompression | None:
+        """Codec applied to streams, with ``"infer"`` resolved."""
+        return resolve_compression(self._compression, self.local_path)
+
+    def with_compression(
+        self, compression: CompressionSetting
+    ) -> LocalFilesystemStorageRef:
+        """Return a copy of this ref using ``compression``.
+
+        Returns:
+            A ref to the same file.
+        """
+        return LocalFilesystemStorageRef(
+            backend=self._backend,
+            uri=self._uri,
+            local_path=self.local_path,
+            metadata=self._metadata,
+            compression=compression,
+        )
+
     def __eq__(self, other: object) -> bool:
         """Return True if the other ref denotes the same logical object."""
         if not isinstance(other, LocalFilesystemStorageRef):
@@ -115,6 +236,35 @@ class LocalFilesystemStorageRef(ResolvedStorageRef):
             and self._uri == other._uri
             and self.local_path == other.local_path
             and self._metadata == other._metadata
+            and self.compression == other.compression
+        )
+
+    def child(self, name: str) -> LocalFilesystemStorageRef:
+        """Return the ref of file ``name`` below this path.
+
+        Returns:
+            A ref to ``<local_path>/<name>``.
+        """
+        return LocalFilesystemStorageRef(
+            backend=self._backend,
+            uri=f"{self._uri}/{name}",
+            local_path=self.local_path / name,
+            metadata=self._metadata,
+        )
+
+    def list_children(self) -> list[str]:
+        """Return the sorted ``/``-separated paths of files below this path.
+
+        Returns:
+            Relative paths of all files, or an empty list without a
+            directory.
+        """
+        if not self.local_path.is_dir():
+            return []
+        return sorted(
+            path.relative_to(self.local_path).as_posix()
+            for path in self.local_path.rglob("*")
+            if path.is_file()
         )
 
     def exists(self) -> bool:
@@ -139,15 +289,15 @@ class LocalFilesystemStorageRef(ResolvedStorageRef):
             return fh.read()
 
     def write_bytes(self, data: bytes) -> None:
-        """Write bytes, creating parent directories if needed."""
-        with self.open_binary("wb") as fh:
+        """Atomically replace the file, creating parent directories."""
+        with self.open_atomic_binary() as fh:
             fh.write(data)
 
     @contextmanager
     def open_binary(
         self, mode: Literal["rb", "wb", "ab"]
     ) -> Iterator[BinaryIO]:
-        """Open the file in binary mode.
+        """Open the file in binary mode, decompressing if configured.
 
         Yields:
             An open binary stream, closed after the context exits.
@@ -155,7 +305,44 @@ class LocalFilesystemStorageRef(ResolvedStorageRef):
         if mode != "rb":
             self._ensure_parent(self.local_path)
         with self.local_path.open(mode) as fh:
+            yield from self._wrap_codec(fh, mode)
+
+    @contextmanager
+    def open_atomic_binary(self, *, fsync: bool = False) -> Iterator[BinaryIO]:
+        """Write to a hidden temp file renamed over the file on success.
+
+        The temp file lives in the target's directory and is moved with
+        ``os.replace``, or removed on failure. ``fsync=True`` syncs the file
+        and, after the rename, its directory.
+
+        Yields:
+            An open binary stream, compressing if configured.
+        """
+        target = self.local_path
+        self._ensure_parent(target)
+        path = target.with_name(f".{target.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with path.open("xb") as fh:
+                yield from self._wrap_codec(fh, "wb")
+                if fsync:
+                    fh.flush()
+                    os.fsync(fh.fileno())
+            path.replace(target)
+            if fsync:
+                _fsync_directory(target.parent)
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+
+    def _wrap_codec(
+        self, fh: BinaryIO, mode: Literal["rb", "wb", "ab"]
+    ) -> Iterator[BinaryIO]:
+        compression = self.compression
+        if compression is None:
             yield fh
+            return
+        with open_compressed(fh, compression, mode) as stream:
+            yield stream
 
     @contextmanager
     def open_text(
@@ -165,14 +352,38 @@ class LocalFilesystemStorageRef(ResolvedStorageRef):
         encoding: str,
         newline: str | None = None,
     ) -> Iterator[TextIO]:
-        """Open the file in text mode.
+        """Open the file in text mode, decompressing if configured.
 
         Yields:
             An open text stream, closed after the context exits.
         """
+        if self.compression is not None:
+            binary_mode = cast("Literal['rb', 'wb', 'ab']", f"{mode}b")
+            with self.open_binary(binary_mode) as raw:
+                text = io.TextIOWrapper(raw, encoding=encoding, newline=newline)
+                try:
+                    yield text
+                finally:
+                    text.flush()
+                    text.detach()
+            return
         if mode != "r":
             self._ensure_parent(self.local_path)
         with self.local_path.open(
             mode, encoding=encoding, newline=newline
         ) as fh:
             yield fh
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist a rename by syncing its directory (no-op where unsupported)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,98 @@
+"""Run manifest recording completed artifacts for checkpoint/resume."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from limbo_core.domain.validation import ValidationError
+
+from .artifact_graph import ArtifactKey
+
+MANIFEST_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class ManifestEntry:
+    """Completion record for one artifact.
+
+    ``fingerprint`` covers the artifact definition, ``upstream`` maps each
+    dependency (``str(ArtifactKey)``) to its fingerprint at the time of the
+    run, and ``seed``/``num_rows`` are the generation parameters used.
+    """
+
+    fingerprint: str
+    upstream: dict[str, str] = field(default_factory=dict)
+    seed: int = 0
+    num_rows: int = 0
+
+
+@dataclass(slots=True)
+class RunManifest:
+    """Completed artifacts of a (possibly interrupted) run."""
+
+    entries: dict[ArtifactKey, ManifestEntry] = field(default_factory=dict)
+
+    def is_complete(self, key: ArtifactKey, expected: ManifestEntry) -> bool:
+        """Return True if ``key`` was completed with exactly ``expected``."""
+        return self.entries.get(key) == expected
+
+    def record(self, key: ArtifactKey, entry: ManifestEntry) -> None:
+        """Mark ``key`` as completed with ``entry``."""
+        self.entries[key] = entry
+
+    def discard(self, key: ArtifactKey) -> None:
+        """Forget the completion record of ``key``."""
+        self.entries.pop(key, None)
+
+    def to_document(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible document.
+
+        Returns:
+            A versioned mapping with one item per completed artifact.
+        """
+        return {
+            "version": MANIFEST_VERSION,
+            "artifacts": [
+                {
+                    "type": key.type,
+                    "name": key.name,
+                    "fingerprint": entry.fingerprint,
+                    "upstream": dict(sorted(entry.upstream.items())),
+                    "seed": entry.seed,
+                    "num_rows": entry.num_rows,
+                }
+                for key, entry in sorted(self.entries.items())
+            ],
+        }
+
+    @classmethod
+    def from_document(cls, doc: Any) -> RunManifest:
+        """Deserialize a document produced by ``to_document``.
+
+        Returns:
+            The manifest.
+
+        Raises:
+            ValidationError: If the document is malformed or of another
+                version.
+        """
+        if not isinstance(doc, dict) or doc.get("version") != MANIFEST_VERSION:
+            raise ValidationError(
+                f"Run manifest must be a version {MANIFEST_VERSION} document"
+            )
+        entries: dict[ArtifactKey, ManifestEntry] = {}
+        try:
+            for item in doc["artifacts"]:
+                key = ArtifactKey(item["type"], item["name"])
+                entries[key] = ManifestEntry(
+                    fingerprint=str(item["fingerprint"]),
+                    upstream={
+                        str(k): str(v) for k, v in item["upstream"].items()
+                    },
+                    seed=int(item["seed"]),
+                    num_rows=int(item["num_rows"]),
+                )
+        except (KeyError, TypeError, AttributeError, ValueError) as err:
+            raise ValidationError(f"Malformed run manifest: {err}") from err
+        return cls(entries)
@@ -0,0 +1,96 @@
+"""Index of local source snapshots and their freshness probes."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from limbo_core.domain.validation import ValidationError
+
+SNAPSHOT_INDEX_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotRecord:
+    """State of a source when its snapshot was taken.
+
+    ``object_name`` names the stored snapshot, ``row_count`` and
+    ``max_updated_at`` (rendered as a string) are the probe results, if a
+    probe ran, and ``taken_at`` is a POSIX timestamp.
+    """
+
+    object_name: str
+    taken_at: float
+    row_count: int | None = None
+    max_updated_at: str | None = None
+
+
+@dataclass(slots=True)
+class SnapshotIndex:
+    """Snapshot records keyed by source name."""
+
+    records: dict[str, SnapshotRecord] = field(default_factory=dict)
+
+    def get(self, source_name: str) -> SnapshotRecord | None:
+        """Return the record of ``source_name``, if any."""
+        return self.records.get(source_name)
+
+    def record(self, source_name: str, record: SnapshotRecord) -> None:
+        """Store ``record`` as the current snapshot of ``source_name``."""
+        self.records[source_name] = record
+
+    def to_document(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible document.
+
+        Returns:
+            A versioned mapping with one item per snapshot.
+        """
+        return {
+            "version": SNAPSHOT_INDEX_VERSION,
+            "snapshots": [
+                {
+                    "source": name,
+                    "object_name": record.object_name,
+                    "taken_at": record.taken_at,
+                    "row_count": record.row_count,
+                    "max_updated_at": record.max_updated_at,
+                }
+                for name, record in sorted(self.records.items())
+            ],
+        }
+
+    @classmethod
+    def from_document(cls, doc: Any) -> SnapshotIndex:
+        """Deserialize a document produced by ``to_document``.
+
+        Returns:
+            The index.
+
+        Raises:
+            ValidationError: If the document is malformed or of another
+                version.
+        """
+        if (
+            not isinstance(doc, dict)
+            or doc.get("version") != SNAPSHOT_INDEX_VERSION
+        ):
+            raise ValidationError(
+                "Snapshot index must be a version "
+                f"{SNAPSHOT_INDEX_VERSION} document"
+            )
+        records: dict[str, SnapshotRecord] = {}
+        try:
+            for item in doc["snapshots"]:
+                row_count = item["row_count"]
+                max_updated_at = item["max_updated_at"]
+                records[str(item["source"])] = SnapshotRecord(
+                    object_name=str(item["object_name"]),
+                    taken_at=float(item["taken_at"]),
+                    row_count=None if row_count is None else int(row_count),
+                    max_updated_at=(
+                        None if max_updated_at is None else str(max_updated_at)
+                    ),
+                )
+        except (KeyError, TypeError, AttributeError, ValueError) as err:
+            raise ValidationError(f"Malformed snapshot index: {err}") from err
+        return cls(records)
@@ -0,0 +1,202 @@
+"""Streaming compression codecs for storage refs."""
+
+from __future__ import annotations
+
+import gzip
+import io
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, cast, get_args
+
+from limbo_core.domain.errors import DomainError
+from limbo_core.domain.validation import ValidationError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import PurePath
+
+StreamCompression = Literal["gzip", "zstd", "brotli"]
+CompressionSetting = StreamCompression | Literal["infer"] | None
+"""Explicit codec, ``"infer"`` (from the file suffix) or None (raw)."""
+
+COMPRESSION_SUFFIXES: dict[StreamCompression, str] = {
+    "gzip": ".gz",
+    "zstd": ".zst",
+    "brotli": ".br",
+}
+
+_SUFFIX_CODECS: dict[str, StreamCompression] = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+    ".br": "brotli",
+}
+
+_CHUNK_BYTES = 1 << 16
+
+
+class MissingCodecError(DomainError):
+    """Raised when the package implementing a codec is not installed."""
+
+    def __init__(self, package_name: str, compression: str) -> None:
+        """Initialize the MissingCodecError."""
+        super().__init__(
+            f"Package {package_name} is required for {compression} compression."
+        )
+
+
+def validate_compression(compression: object) -> CompressionSetting:
+    """Check that ``compression`` is a supported setting.
+
+    Returns:
+        The setting, typed.
+
+    Raises:
+        ValidationError: If the value is not a codec, ``"infer"`` or None.
+    """
+    if compression is not None and compression not in (
+        *get_args(StreamCompression),
+        "infer",
+    ):
+        raise ValidationError(
+            "compression must be 'gzip', 'zstd', 'brotli', 'infer' or None, "
+            f"got {compression!r}"
+        )
+    return cast("CompressionSetting", compression)
+
+
+def infer_compression(path: PurePath) -> StreamCompression | None:
+    """Return the codec implied by the suffix of ``path``.
+
+    Returns:
+        The codec, or None for uncompressed files.
+    """
+    return _SUFFIX_CODECS.get(path.suffix.lower())
+
+
+def resolve_compression(
+    compression: CompressionSetting, path: PurePath
+) -> StreamCompression | None:
+    """Resolve ``"infer"`` against ``path``.
+
+    Returns:
+        The codec to use for ``path``, or None.
+    """
+    if compression == "infer":
+        return infer_compression(path)
+    return compression
+
+
+@contextmanager
+def open_compressed(
+    raw: BinaryIO,
+    compression: StreamCompression,
+    mode: Literal["rb", "wb", "ab"],
+) -> Iterator[BinaryIO]:
+    """Wrap ``raw`` in a streaming (de)compressor for ``compression``.
+
+    ``raw`` is left open. Appending adds a new gzip member or zstd frame;
+    brotli streams cannot be appended to.
+
+    Yields:
+        A binary stream of uncompressed bytes.
+
+    Raises:
+        ValidationError: If appending to a brotli stream.
+    """
+    if compression == "gzip":
+        with gzip.GzipFile(fileobj=raw, mode=mode) as fh:
+            yield cast("BinaryIO", fh)
+        return
+    if compression == "zstd":
+        with _open_zstd(raw, mode) as fh:
+            yield fh
+        return
+    if mode == "ab":
+        raise ValidationError("brotli streams do not support append mode")
+    stream = _open_brotli(raw, mode)
+    try:
+        yield stream
+    finally:
+        stream.close()
+
+
+@contextmanager
+def _open_zstd(raw: BinaryIO, mode: str) -> Iterator[BinaryIO]:
+    try:
+        import zstandard
+    except ImportError as err:
+        raise MissingCodecError("zstandard", "zstd") from err
+    stream: Any
+    if mode == "rb":
+        stream = zstandard.ZstdDecompressor().stream_reader(
+            raw, read_across_frames=True, closefd=False
+        )
+    else:
+        stream = zstandard.ZstdCompressor().stream_writer(raw, closefd=False)
+    with stream:
+        yield cast("BinaryIO", stream)
+
+
+def _open_brotli(raw: BinaryIO, mode: str) -> BinaryIO:
+    try:
+        import brotli
+    except ImportError as err:
+        raise MissingCodecError("brotli", "brotli") from err
+    if mode == "rb":
+        reader = _BrotliReader(raw, brotli.Decompressor())
+        return cast("BinaryIO", io.BufferedReader(reader, _CHUNK_BYTES))
+    writer = _BrotliWriter(raw, brotli.Compressor())
+    return cast("BinaryIO", io.BufferedWriter(writer, _CHUNK_BYTES))
+
+
+class _BrotliReader(io.RawIOBase):
+    """Raw reader decompressing ``raw`` chunk by chunk.
+
+    Like ``gzip``, reaching the end of ``raw`` before the end of the
+    compressed stream raises ``EOFError`` instead of returning short data.
+    """
+
+    def __init__(self, raw: BinaryIO, decompressor: Any) -> None:
+        self._raw = raw
+        self._decompressor = decompressor
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            chunk = self._raw.read(_CHUNK_BYTES)
+            if not chunk:
+                if not self._decompressor.is_finished():
+                    raise EOFError(
+                        "Compressed file ended before the end-of-stream "
+                        "marker was reached"
+                    )
+                return 0
+            self._pending = self._decompressor.process(chunk)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+class _BrotliWriter(io.RawIOBase):
+    """Raw writer compressing into ``raw``; ``close`` ends the stream."""
+
+    def __init__(self, raw: BinaryIO, compressor: Any) -> None:
+        self._raw = raw
+        self._compressor = compressor
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._raw.write(self._compressor.process(bytes(data)))
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._raw.write(self._compressor.finish())
+        super().close()
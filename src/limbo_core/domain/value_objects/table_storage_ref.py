@@ -0,0 +1,92 @@
+"""Storage refs naming a table of a configured database connection."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal, NoReturn
+
+from limbo_core.domain.validation import ValidationError
+
+from .resolved_storage_ref import ResolvedStorageRef
+
+
+@dataclass(frozen=True, slots=True)
+class TableStorageRef(ResolvedStorageRef):
+    """Ref to table ``table_name`` reached through connection ``connection``.
+
+    The table is read and written by a database persistence backend, which
+    also implements ``exists`` and removal; the ref itself holds no bytes,
+    so every byte-level operation raises ``ValidationError``.
+    """
+
+    connection: str
+    table_name: str
+    schema_name: str | None = None
+
+    @property
+    def backend(self) -> str:
+        """Name of the connection holding the table."""
+        return self.connection
+
+    @property
+    def uri(self) -> str:
+        """``<connection>://[<schema>.]<table>`` URI of the table."""
+        qualified = (
+            self.table_name
+            if self.schema_name is None
+            else f"{self.schema_name}.{self.table_name}"
+        )
+        return f"{self.connection}://{qualified}"
+
+    def _not_a_file(self) -> NoReturn:
+        """Reject a byte-level operation.
+
+        Raises:
+            ValidationError: Always.
+        """
+        raise ValidationError(
+            f"{self.uri} is a database table, not a byte stream; "
+            "use its persistence backend"
+        )
+
+    def exists(self) -> NoReturn:
+        """Table existence is only known to the persistence backend."""
+        self._not_a_file()
+
+    def unlink(self) -> NoReturn:
+        """Tables are dropped by the persistence backend."""
+        self._not_a_file()
+
+    def as_local_path(self) -> NoReturn:
+        """Tables have no local path."""
+        self._not_a_file()
+
+    def read_bytes(self) -> NoReturn:
+        """Tables cannot be read as bytes."""
+        self._not_a_file()
+
+    def write_bytes(self, data: bytes) -> NoReturn:
+        """Tables cannot be written as bytes."""
+        del data
+        self._not_a_file()
+
+    def open_binary(self, mode: Literal["rb", "wb", "ab"]) -> NoReturn:
+        """Tables cannot be opened as streams."""
+        del mode
+        self._not_a_file()
+
+    def open_text(
+        self,
+        mode: Literal["r", "w", "a"],
+        *,
+        encoding: str,
+        newline: str | None = None,
+    ) -> NoReturn:
+        """Tables cannot be opened as streams."""
+        del mode, encoding, newline
+        self._not_a_file()
+
+    def open_atomic_binary(self, *, fsync: bool = False) -> NoReturn:
+        """Tables cannot be opened as streams."""
+        del fsync
+        self._not_a_file()
@@ -2,39 +2,391 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError
 from datetime import date, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
 
 from limbo_core.domain.validation import ValidationError
 
 CellValue = str | int | float | bool | date | datetime | None
+RowValidation = Literal["full", "sampled", "trusted"]
+
+DEFAULT_VALIDATION_SAMPLE_SIZE = 64
 
 
-@dataclass(frozen=True, slots=True)
 class TabularBatch:
-    """Immutable tabular payload crossing the persistence write boundary."""
+    """Immutable tabular payload crossing the persistence write boundary.
+
+    A batch is stored either row-major (``TabularBatch(column_names, rows)``)
+    or column-major (``TabularBatch.from_columns``). The other view is derived
+    lazily on first access and cached, so producers and backends that work
+    per column never pay for one mapping per row.
+
+    Column sequences passed to ``from_columns`` are kept by reference and must
+    not be mutated afterwards.
+
+    Row-major batches check every row's keys by default (``validation="full"``).
+    Producers that build rows from ``column_names`` themselves can pass
+    ``validation="trusted"`` to skip the per-row check, and untrusted but large
+    inputs can use ``validation="sampled"`` to check an evenly spaced subset of
+    ``sample_size`` rows. ``validate_rows`` runs the full check on demand.
+
+    Attributes cannot be assigned or deleted after construction; only the
+    lazily derived row and column views are filled in internally.
+    """
 
-    column_names: tuple[str, ...]
-    rows: tuple[Mapping[str, CellValue], ...]
+    __slots__ = ("_column_names", "_columns", "_num_rows", "_rows")
 
-    def __post_init__(self) -> None:
-        """Validate column names and row key alignment.
+    _column_names: tuple[str, ...]
+    _columns: dict[str, Sequence[CellValue]] | None
+    _rows: tuple[Mapping[str, CellValue], ...] | None
+    _num_rows: int
+
+    def __init__(
+        self,
+        column_names: tuple[str, ...],
+        rows: tuple[Mapping[str, CellValue], ...],
+        *,
+        validation: RowValidation = "full",
+        sample_size: int = DEFAULT_VALIDATION_SAMPLE_SIZE,
+    ) -> None:
+        """Build a row-major batch and validate row key alignment.
+
+        Args:
+            column_names: Ordered, unique column names.
+            rows: One mapping per row keyed by ``column_names``.
+            validation: ``full`` checks every row, ``sampled`` checks at most
+                ``sample_size`` evenly spaced rows, ``trusted`` checks none.
+            sample_size: Number of rows checked in ``sampled`` mode.
 
         Raises:
-            ValidationError: If columns are empty, duplicated, or rows mismatch.
+            ValidationError: If columns are empty, duplicated, rows mismatch,
+                or ``validation``/``sample_size`` are invalid.
         """
-        if not self.column_names:
+        row_tuple = tuple(rows)
+        self._init_slots(tuple(column_names), None, row_tuple, len(row_tuple))
+        col_set = self._validate_column_names(self._column_names)
+        if validation == "full":
+            indices: Iterable[int] = range(self._num_rows)
+        elif validation == "sampled":
+            if sample_size < 1:
+                raise ValidationError("sample_size must be at least 1")
+            indices = self._sample_indices(self._num_rows, sample_size)
+        elif validation == "trusted":
+            return
+        else:
+            raise ValidationError(
+                "validation must be 'full', 'sampled' or 'trusted', "
+                f"got {validation!r}"
+            )
+        self._check_row_keys(row_tuple, indices, col_set)
+
+    @classmethod
+    def from_columns(
+        cls,
+        column_names: Iterable[str],
+        columns: Mapping[str, Sequence[CellValue]],
+    ) -> TabularBatch:
+        """Build a column-major batch from one sequence per column.
+
+        Validation is O(columns): keys must match ``column_names`` and every
+        column must have the same length.
+
+        Returns:
+            A batch backed by the given column sequences.
+
+        Raises:
+            ValidationError: If columns are empty, duplicated, missing, or
+                have different lengths.
+        """
+        names = tuple(column_names)
+        col_set = cls._validate_column_names(names)
+        keys = set(columns.keys())
+        if keys != col_set:
+            raise ValidationError(
+                f"column keys {keys!r} do not match column_names"
+            )
+        lengths = {len(columns[c]) for c in names}
+        if len(lengths) != 1:
+            raise ValidationError("all columns must have the same length")
+        batch = cls.__new__(cls)
+        batch._init_slots(
+            names, {c: columns[c] for c in names}, None, lengths.pop()
+        )
+        return batch
+
+    def _init_slots(
+        self,
+        column_names: tuple[str, ...],
+        columns: dict[str, Sequence[CellValue]] | None,
+        rows: tuple[Mapping[str, CellValue], ...] | None,
+        num_rows: int,
+    ) -> None:
+        """Set every slot of a new batch, bypassing ``__setattr__``."""
+        object.__setattr__(self, "_column_names", column_names)
+        object.__setattr__(self, "_columns", columns)
+        object.__setattr__(self, "_rows", rows)
+        object.__setattr__(self, "_num_rows", num_rows)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Reject attribute assignment; batches are immutable.
+
+        Raises:
+            FrozenInstanceError: Always.
+        """
+        del value
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __getstate__(
+        self,
+    ) -> tuple[
+        tuple[str, ...],
+        dict[str, Sequence[CellValue]] | None,
+        tuple[Mapping[str, CellValue], ...] | None,
+        int,
+    ]:
+        """Return the slot values for pickling.
+
+        Returns:
+            Column names, column view, row view and row count.
+        """
+        return self._column_names, self._columns, self._rows, self._num_rows
+
+    def __setstate__(
+        self,
+        state: tuple[
+            tuple[str, ...],
+            dict[str, Sequence[CellValue]] | None,
+            tuple[Mapping[str, CellValue], ...] | None,
+            int,
+        ],
+    ) -> None:
+        """Restore a pickled batch without going through ``__setattr__``."""
+        self._init_slots(*state)
+
+    def __delattr__(self, name: str) -> None:
+        """Reject attribute deletion; batches are immutable.
+
+        Raises:
+            FrozenInstanceError: Always.
+        """
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    @classmethod
+    def concat(
+        cls, column_names: Iterable[str], batches: Iterable[TabularBatch]
+    ) -> TabularBatch:
+        """Concatenate batches sharing ``column_names`` into one batch.
+
+        Returns:
+            A column-major batch holding every row in input order.
+
+        Raises:
+            ValidationError: If a batch has different column names.
+        """
+        names = tuple(column_names)
+        columns: dict[str, list[CellValue]] = {c: [] for c in names}
+        for i, batch in enumerate(batches):
+            if batch.column_names != names:
+                raise ValidationError(
+                    f"batch {i} columns {batch.column_names!r} "
+                    "do not match column_names"
+                )
+            for c in names:
+                columns[c].extend(batch.column(c))
+        return cls.from_columns(names, columns)
+
+    def slice(self, start: int, stop: int) -> TabularBatch:
+        """Return rows ``start:stop`` as a new batch in the same layout.
+
+        Returns:
+            A batch holding the selected rows.
+        """
+        if self._rows is not None and self._columns is None:
+            return TabularBatch(
+                self._column_names, self._rows[start:stop], validation="trusted"
+            )
+        return TabularBatch.from_columns(
+            self._column_names,
+            {c: self.column(c)[start:stop] for c in self._column_names},
+        )
+
+    def select(self, column_names: Iterable[str]) -> TabularBatch:
+        """Return a column-major batch holding only ``column_names``.
+
+        Returns:
+            A batch with the selected columns in the given order.
+
+        Raises:
+            ValidationError: If a name is not a column of this batch.
+        """
+        names = tuple(column_names)
+        unknown = [c for c in names if c not in self._column_names]
+        if unknown:
+            raise ValidationError(f"unknown columns {unknown!r}")
+        return TabularBatch.from_columns(
+            names, {c: self.column(c) for c in names}
+        )
+
+    def take(self, indices: Sequence[int]) -> TabularBatch:
+        """Return the rows at ``indices`` as a column-major batch.
+
+        Returns:
+            A batch holding the selected rows in ``indices`` order.
+        """
+        return TabularBatch.from_columns(
+            self._column_names,
+            {
+                c: [column[i] for i in indices]
+                for c, column in self.columns.items()
+            },
+        )
+
+    @staticmethod
+    def _validate_column_names(column_names: tuple[str, ...]) -> set[str]:
+        """Validate column names and return them as a set.
+
+        Returns:
+            The set of column names.
+
+        Raises:
+            ValidationError: If columns are empty or duplicated.
+        """
+        if not column_names:
             raise ValidationError("TabularBatch requires at least one column")
-        col_set = set(self.column_names)
-        if len(col_set) != len(self.column_names):
+        col_set = set(column_names)
+        if len(col_set) != len(column_names):
             raise ValidationError("column_names must be unique")
-        for i, row in enumerate(self.rows):
-            keys = set(row.keys())
+        return col_set
+
+    @staticmethod
+    def _sample_indices(num_rows: int, sample_size: int) -> list[int]:
+        """Return evenly spaced row indices, always including the last row.
+
+        Returns:
+            At most ``sample_size + 1`` sorted row indices.
+        """
+        if num_rows <= sample_size:
+            return list(range(num_rows))
+        step = num_rows // sample_size
+        indices = list(range(0, num_rows, step))[:sample_size]
+        if indices[-1] != num_rows - 1:
+            indices.append(num_rows - 1)
+        return indices
+
+    @staticmethod
+    def _check_row_keys(
+        rows: tuple[Mapping[str, CellValue], ...],
+        indices: Iterable[int],
+        col_set: set[str],
+    ) -> None:
+        """Check that the selected rows are keyed exactly by ``col_set``.
+
+        Raises:
+            ValidationError: If a row's keys differ from the column names.
+        """
+        for i in indices:
+            keys = rows[i].keys()
             if keys != col_set:
                 raise ValidationError(
-                    f"row {i} keys {keys!r} do not match column_names"
+                    f"row {i} keys {set(keys)!r} do not match column_names"
                 )
+
+    def validate_rows(self) -> None:
+        """Run the full per-row key check deferred by trusted construction.
+
+        Column-major batches are always aligned, so this is a no-op for them.
+        """
+        if self._rows is None:
+            return
+        self._check_row_keys(
+            self._rows, range(self._num_rows), set(self._column_names)
+        )
+
+    @property
+    def column_names(self) -> tuple[str, ...]:
+        """Ordered column names."""
+        return self._column_names
+
+    @property
+    def num_rows(self) -> int:
+        """Number of rows in the batch."""
+        return self._num_rows
+
+    @property
+    def rows(self) -> tuple[Mapping[str, CellValue], ...]:
+        """Row view: one mapping per row (built lazily for columnar data)."""
+        if self._rows is None:
+            names = self._column_names
+            cols = [self.column(c) for c in names]
+            rows = tuple(
+                dict(zip(names, vals, strict=True))
+                for vals in zip(*cols, strict=True)
+            )
+            object.__setattr__(self, "_rows", rows)
+            return rows
+        return self._rows
+
+    @property
+    def has_column_view(self) -> bool:
+        """True if columns are held (given or already derived from rows)."""
+        return self._columns is not None
+
+    @property
+    def columns(self) -> Mapping[str, Sequence[CellValue]]:
+        """Column view: one sequence per column name."""
+        if self._columns is None:
+            rows = self.rows
+            columns: dict[str, Sequence[CellValue]] = {
+                c: [row[c] for row in rows] for c in self._column_names
+            }
+            object.__setattr__(self, "_columns", columns)
+            return columns
+        return self._columns
+
+    def column(self, name: str) -> Sequence[CellValue]:
+        """Return the values of one column (``KeyError`` if unknown).
+
+        Returns:
+            The column's values in row order.
+        """
+        return self.columns[name]
+
+    def iter_row_values(self) -> Iterator[tuple[CellValue, ...]]:
+        """Iterate row value tuples in ``column_names`` order.
+
+        Returns:
+            An iterator of tuples, one per row, without building mappings.
+        """
+        if self._rows is not None and self._columns is None:
+            names = self._column_names
+            return (tuple(row[c] for c in names) for row in self._rows)
+        return zip(*(self.column(c) for c in self._column_names), strict=True)
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if both batches hold the same columns and cells."""
+        if not isinstance(other, TabularBatch):
+            return NotImplemented
+        if (
+            self._column_names != other._column_names
+            or self._num_rows != other._num_rows
+        ):
+            return False
+        if self._rows is not None and other._rows is not None:
+            return self._rows == other._rows
+        return all(
+            list(self.column(c)) == list(other.column(c))
+            for c in self._column_names
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a compact representation without cell data."""
+        return (
+            f"TabularBatch(column_names={self._column_names!r}, "
+            f"num_rows={self._num_rows})"
+        )
@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from limbo_core.adapters.connections.errors import MissingPackageError
 from limbo_core.application.interfaces import ConnectionBackend
+from limbo_core.application.interfaces.connections import TableStats
 from limbo_core.validation import ValidationError
 
 if TYPE_CHECKING:
-    from sqlalchemy import Engine
+    from collections.abc import Iterator
+
+    from sqlalchemy import Engine, TableClause
     from sqlalchemy.engine import URL
 
+    from limbo_core.application.interfaces.connections import (
+        KeyRange,
+        RowChunk,
+        TableScan,
+    )
     from limbo_core.domain.entities import ConnectionBackendSpec
 
 SQLALCHEMY_BACKEND_KEY = "sqlalchemy"
@@ -20,7 +29,13 @@ SQLALCHEMY_BACKEND_KEY = "sqlalchemy"
 
 @dataclass(slots=True)
 class SQLAlchemyConnectionBackend(ConnectionBackend):
-    """Runtime SQLAlchemy backend created from a parsed connection spec."""
+    """Runtime SQLAlchemy backend created from a parsed connection spec.
+
+    ``connect`` creates the engine once and returns it on every later call,
+    so all readers of a connection share one connection pool. ``pool_size``,
+    ``max_overflow``, ``pool_pre_ping`` and ``pool_recycle`` (seconds) are
+    passed to ``create_engine`` when set; ``dispose`` closes the pool.
+    """
 
     host: str
     user: str
@@ -30,6 +45,16 @@ class SQLAlchemyConnectionBackend(ConnectionBackend):
     driver: str | None = None
     port: int | None = None
     connection_args: dict[str, Any] = field(default_factory=dict)
+    pool_size: int | None = None
+    max_overflow: int | None = None
+    pool_pre_ping: bool = False
+    pool_recycle: int | None = None
+    _engine: Engine | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_spec(
@@ -73,6 +98,20 @@ class SQLAlchemyConnectionBackend(ConnectionBackend):
             raise ValidationError(
                 "SQLAlchemyConnection: `connection_args` expects a mapping"
             )
+        pool_size = cls._resolve_pool_int(
+            config.pop("pool_size", None), field_name="pool_size", minimum=1
+        )
+        max_overflow = cls._resolve_pool_int(
+            config.pop("max_overflow", None), field_name="max_overflow"
+        )
+        pool_recycle = cls._resolve_pool_int(
+            config.pop("pool_recycle", None), field_name="pool_recycle"
+        )
+        pool_pre_ping = config.pop("pool_pre_ping", False)
+        if not isinstance(pool_pre_ping, bool):
+            raise ValidationError(
+                "SQLAlchemyConnection: `pool_pre_ping` expects a boolean"
+            )
         if config:
             unknown = ", ".join(sorted(config.keys()))
             raise ValidationError(
@@ -88,8 +127,37 @@ class SQLAlchemyConnectionBackend(ConnectionBackend):
             driver=driver,
             port=port,
             connection_args=connection_args,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=pool_pre_ping,
+            pool_recycle=pool_recycle,
         )
 
+    @staticmethod
+    def _resolve_pool_int(
+        value: Any, *, field_name: str, minimum: int = 0
+    ) -> int | None:
+        """Resolve an optional pool setting of at least ``minimum``.
+
+        Returns:
+            The integer value, or None when unset.
+
+        Raises:
+            ValidationError: If value is not an integer or is too small.
+        """
+        if value is None:
+            return None
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ValidationError(
+                f"SQLAlchemyConnection: `{field_name}` expects an integer"
+            )
+        if value < minimum:
+            raise ValidationError(
+                f"SQLAlchemyConnection: `{field_name}` must be at least "
+                f"{minimum}"
+            )
+        return value
+
     @staticmethod
     def _resolve_required_string(value: Any, *, field_name: str) -> str:
         """Resolve required string field from literal value.
@@ -175,19 +243,164 @@ class SQLAlchemyConnectionBackend(ConnectionBackend):
             database=self.database,
         )
 
+    def _engine_options(self) -> dict[str, Any]:
+        """Collect the configured ``create_engine`` pool options.
+
+        Returns:
+            Keyword arguments for ``create_engine``.
+        """
+        options: dict[str, Any] = {"connect_args": self.connection_args}
+        if self.pool_size is not None:
+            options["pool_size"] = self.pool_size
+        if self.max_overflow is not None:
+            options["max_overflow"] = self.max_overflow
+        if self.pool_recycle is not None:
+            options["pool_recycle"] = self.pool_recycle
+        if self.pool_pre_ping:
+            options["pool_pre_ping"] = True
+        return options
+
     def connect(self) -> Engine:
-        """Establish the connection using SQLAlchemy.
+        """Return the connection's engine, creating it on first use.
 
         Returns:
-            SQLAlchemy engine instance.
+            The shared SQLAlchemy engine.
 
         Raises:
             MissingPackageError: If SQLAlchemy is unavailable.
+            ValidationError: If the pool options do not fit the dialect's
+                connection pool.
         """
-        try:
-            from sqlalchemy import create_engine
-        except ImportError:
-            raise MissingPackageError("sqlalchemy") from None
-        return create_engine(
-            self._build_url(), connect_args=self.connection_args
+        with self._lock:
+            if self._engine is not None:
+                return self._engine
+            try:
+                from sqlalchemy import create_engine
+            except ImportError:
+                raise MissingPackageError("sqlalchemy") from None
+            try:
+                self._engine = create_engine(
+                    self._build_url(), **self._engine_options()
+                )
+            except TypeError as err:
+                raise ValidationError(
+                    f"SQLAlchemyConnection: invalid pool options: {err}"
+                ) from err
+            return self._engine
+
+    def dispose(self) -> None:
+        """Close the engine's pooled connections and drop the engine."""
+        with self._lock:
+            engine, self._engine = self._engine, None
+        if engine is not None:
+            engine.dispose()
+
+    def scan(self, scan: TableScan, *, chunk_rows: int) -> Iterator[RowChunk]:
+        """Stream ``scan`` through a server-side cursor.
+
+        The query runs with ``stream_results`` and ``yield_per`` so drivers
+        that support it fetch ``chunk_rows`` rows at a time; the connection
+        is returned to the pool once the iterator is exhausted or closed.
+
+        Yields:
+            Lists of at most ``chunk_rows`` row tuples.
+        """
+        from sqlalchemy import select
+
+        key_range = scan.key_range
+        if key_range is None:
+            query = select(*_table_clause(scan).columns)
+        else:
+            source = _table_clause(scan, key_range.column)
+            query = select(
+                *(source.c[name] for name in scan.column_names)
+            ).where(*_range_filter(source, key_range))
+        with self.connect().connect() as connection:
+            result = connection.execution_options(
+                stream_results=True, yield_per=chunk_rows
+            ).execute(query)
+            for partition in result.partitions():
+                yield [tuple(row) for row in partition]
+
+    def table_stats(
+        self, scan: TableScan, *, updated_at_column: str | None = None
+    ) -> TableStats:
+        """Count the rows of a table and take the max of a timestamp column.
+
+        Both aggregates run in one ``SELECT``, which databases answer from
+        indexes or table statistics without transferring any rows.
+
+        Returns:
+            The row count and max ``updated_at_column`` (None if not given).
+        """
+        from sqlalchemy import func, select
+
+        probed = () if updated_at_column is None else (updated_at_column,)
+        source = _table_clause(scan, *probed)
+        aggregates = [func.count().label("row_count")]
+        if updated_at_column is not None:
+            aggregates.append(
+                func.max(source.c[updated_at_column]).label("max_updated_at")
+            )
+        with self.connect().connect() as connection:
+            row = connection.execute(
+                select(*aggregates).select_from(source)
+            ).one()
+        return TableStats(
+            row_count=int(row[0]),
+            max_updated_at=row[1] if updated_at_column is not None else None,
         )
+
+    def key_bounds(
+        self, scan: TableScan, *, key_column: str
+    ) -> tuple[object | None, object | None]:
+        """Return the min and max of ``key_column`` in one aggregate query.
+
+        Returns:
+            The bounds; both None for an empty table.
+        """
+        from sqlalchemy import func, select
+
+        key = _table_clause(scan, key_column).c[key_column]
+        query = select(
+            func.min(key).label("lower"), func.max(key).label("upper")
+        )
+        with self.connect().connect() as connection:
+            row = connection.execute(query).one()
+        return row[0], row[1]
+
+
+def _table_clause(scan: TableScan, *extra_columns: str) -> TableClause:
+    """Build a lightweight table construct for ``scan``.
+
+    Returns:
+        A table clause with the scanned and ``extra_columns`` columns.
+    """
+    from sqlalchemy import column, table
+
+    names = dict.fromkeys((*scan.column_names, *extra_columns))
+    return table(
+        scan.table_name,
+        *(column(name) for name in names),
+        schema=scan.schema_name,
+    )
+
+
+def _range_filter(source: TableClause, key_range: KeyRange) -> list[Any]:
+    """Build the ``WHERE`` criteria selecting the rows of ``key_range``.
+
+    Returns:
+        Criteria to combine with AND; empty for an unbounded range.
+    """
+    from sqlalchemy import or_
+
+    key = source.c[key_range.column]
+    criteria: list[Any] = []
+    if key_range.lower is None:
+        if key_range.upper is not None:
+            criteria.append(or_(key < key_range.upper, key.is_(None)))
+        return criteria
+    criteria.append(key >= key_range.lower)
+    if key_range.upper is not None:
+        criteria.append(key < key_range.upper)
+    return criteria
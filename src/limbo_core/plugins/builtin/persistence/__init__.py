@@ -1,17 +1,38 @@
 """Built-in persistence backend exports."""
 
+from .arrow_ipc_file_data_persistence_backend import (
+    ArrowIpcFileDataPersistenceBackend,
+    FeatherFileDataPersistenceBackend,
+)
 from .csv_file_data_persistence_backend import CsvFileDataPersistenceBackend
 from .filesystem_path_resolver import FilesystemPathResolver
 from .json_file_data_persistence_backend import JsonFileDataPersistenceBackend
 from .jsonl_file_data_persistence_backend import JsonlFileDataPersistenceBackend
+from .memory_object_store import LocalBucketObjectStore, MemoryObjectStore
+from .object_store_path_resolver import (
+    LocalBucketPathResolver,
+    MemoryPathResolver,
+    ObjectStorePathResolver,
+)
 from .parquet_file_data_persistence_backend import (
     ParquetFileDataPersistenceBackend,
 )
+from .sqlalchemy_data_persistence_backend import (
+    SQLAlchemyDataPersistenceBackend,
+)
 
 __all__ = [
+    "ArrowIpcFileDataPersistenceBackend",
     "CsvFileDataPersistenceBackend",
+    "FeatherFileDataPersistenceBackend",
     "FilesystemPathResolver",
     "JsonFileDataPersistenceBackend",
     "JsonlFileDataPersistenceBackend",
+    "LocalBucketObjectStore",
+    "LocalBucketPathResolver",
+    "MemoryObjectStore",
+    "MemoryPathResolver",
+    "ObjectStorePathResolver",
     "ParquetFileDataPersistenceBackend",
+    "SQLAlchemyDataPersistenceBackend",
 ]
@@ -0,0 +1,183 @@
+"""Arrow IPC (Feather v2) tabular data persistence with memory-mapped loads."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
+
+from limbo_core.application.interfaces.persistence import (
+    DEFAULT_CHUNK_ROWS,
+    DataPersistenceBackend,
+)
+from limbo_core.domain.validation import ValidationError
+from limbo_core.domain.value_objects import LocalFilesystemStorageRef
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from limbo_core.application.interfaces.persistence import (
+        ColumnTypes,
+        RowFilter,
+    )
+    from limbo_core.domain.value_objects import ResolvedStorageRef, TabularBatch
+
+from .tabular_file_utils import (
+    arrow_filter_expression,
+    arrow_table_stream,
+    lazy_batch_from_arrow_table,
+    require_chunk_rows,
+    safe_filename_stem,
+    try_import_pyarrow,
+)
+
+ArrowIpcCompression = Literal["lz4", "zstd"]
+
+
+@dataclass
+class ArrowIpcFileDataPersistenceBackend(DataPersistenceBackend):
+    """Read/write Arrow IPC files via PyArrow.
+
+    Files are written uncompressed by default (``compression=None``) or with
+    ``lz4``/``zstd`` buffer compression. ``load`` memory-maps local files
+    (other ``storage_backend`` refs are read through their stream) and
+    returns a batch whose columns are decoded lazily, so uncompressed files
+    load without copying and are shared between processes through the page
+    cache.
+
+    ``encoding`` is accepted for config compatibility with other file backends
+    but is not used.
+    """
+
+    directory: str | Path
+    encoding: str = "utf-8"
+    compression: ArrowIpcCompression | None = None
+    storage_backend: str = "file"
+
+    suffix: ClassVar[str] = ".arrow"
+
+    def __post_init__(self) -> None:
+        """Coerce ``directory`` to a Path and validate ``compression``.
+
+        Raises:
+            ValidationError: If ``compression`` is not supported.
+        """
+        self.directory = Path(self.directory)
+        if self.compression not in (None, "lz4", "zstd"):
+            raise ValidationError(
+                "compression must be None, 'lz4' or 'zstd', "
+                f"got {self.compression!r}"
+            )
+
+    def storage_object_name(self, logical_name: str) -> str:
+        """Return filename including the IPC file suffix."""
+        return f"{safe_filename_stem(logical_name)}{self.suffix}"
+
+    def save(self, ref: ResolvedStorageRef, data: TabularBatch) -> None:
+        """Serialize ``data`` to the IPC file for ``ref`` (via PyArrow)."""
+        self.save_stream(ref, data.column_names, (data,))
+
+    def save_stream(
+        self,
+        ref: ResolvedStorageRef,
+        column_names: tuple[str, ...],
+        chunks: Iterable[TabularBatch],
+        *,
+        column_types: ColumnTypes | None = None,
+    ) -> None:
+        """Write each chunk as record batch(es) of one IPC file.
+
+        The Arrow schema comes from ``column_types``, with undeclared columns
+        inferred from the leading chunks (see ``arrow_table_stream``).
+        """
+        pa = try_import_pyarrow()
+        schema, tables = arrow_table_stream(column_names, chunks, column_types)
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)
+        with (
+            ref.open_atomic_binary() as out,
+            pa.ipc.new_file(out, schema, options=options) as writer,
+        ):
+            for table in tables:
+                writer.write_table(table)
+
+    def load(self, ref: ResolvedStorageRef) -> TabularBatch:
+        """Memory-map the IPC file for ``ref`` and wrap it lazily.
+
+        Returns:
+            A ``TabularBatch`` whose columns decode on first access.
+        """
+        return lazy_batch_from_arrow_table(self._read_table(ref))
+
+    def load_projected(
+        self,
+        ref: ResolvedStorageRef,
+        *,
+        columns: Sequence[str] | None = None,
+        filters: Sequence[RowFilter] | None = None,
+    ) -> TabularBatch:
+        """Filter and project the memory-mapped table in Arrow.
+
+        Returns:
+            The projected ``TabularBatch`` with lazily decoded columns.
+        """
+        table = self._read_table(ref)
+        if filters:
+            table = table.filter(arrow_filter_expression(filters))
+        if columns is not None:
+            table = table.select(list(columns))
+        return lazy_batch_from_arrow_table(table)
+
+    @staticmethod
+    def _read_table(ref: ResolvedStorageRef) -> Any:
+        """Read the IPC file for ``ref`` as a PyArrow table.
+
+        Local files are memory-mapped; other refs are read as a stream.
+
+        Returns:
+            The table, backed by the mapped file when local and uncompressed.
+
+        Raises:
+            FileNotFoundError: If the file is missing.
+        """
+        if not ref.exists():
+            raise FileNotFoundError(ref.uri)
+        pa = try_import_pyarrow()
+        if not isinstance(ref, LocalFilesystemStorageRef):
+            with ref.open_binary("rb") as inp:
+                return pa.ipc.open_file(inp).read_all()
+        with pa.memory_map(str(ref.as_local_path()), "r") as source:
+            return pa.ipc.open_file(source).read_all()
+
+    def iter_load(
+        self, ref: ResolvedStorageRef, *, chunk_rows: int = DEFAULT_CHUNK_ROWS
+    ) -> Iterator[TabularBatch]:
+        """Slice the memory-mapped IPC file into batches of ``chunk_rows``.
+
+        Missing files raise ``FileNotFoundError`` as in ``load``.
+
+        Returns:
+            An iterator of lazily decoded batches in file order.
+        """
+        require_chunk_rows(chunk_rows)
+        data = self.load(ref)
+        if data.num_rows == 0:
+            return iter((data,))
+        return (
+            data.slice(start, start + chunk_rows)
+            for start in range(0, data.num_rows, chunk_rows)
+        )
+
+    def exists(self, ref: ResolvedStorageRef) -> bool:
+        """Return True if the file for ``ref`` exists."""
+        return ref.exists()
+
+    def cleanup(self, ref: ResolvedStorageRef) -> None:
+        """Remove the file for ``ref`` if present."""
+        ref.unlink()
+
+
+@dataclass
+class FeatherFileDataPersistenceBackend(ArrowIpcFileDataPersistenceBackend):
+    """Arrow IPC backend writing ``.feather`` files (Feather v2)."""
+
+    suffix: ClassVar[str] = ".feather"
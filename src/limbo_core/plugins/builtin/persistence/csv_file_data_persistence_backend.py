@@ -6,44 +6,91 @@ import csv
 from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from limbo_core.application.interfaces.persistence import DataPersistenceBackend
+from limbo_core.application.interfaces.persistence import (
+    DEFAULT_CHUNK_ROWS,
+    FALSE_TEXT,
+    TRUE_TEXT,
+    DataPersistenceBackend,
+    text_converter,
+)
+from limbo_core.domain.entities import DataType
 from limbo_core.domain.validation import ValidationError
 from limbo_core.domain.value_objects import (
     CellValue,
     ResolvedStorageRef,
+    StreamCompression,
     TabularBatch,
 )
 
+from .tabular_dataset import DatasetOptions
 from .tabular_file_utils import (
-    normalize_arrow_scalar,
+    arrow_table_stream,
+    arrow_type_for,
+    batch_from_arrow_table,
+    compressed_filename,
+    iter_batches_from_arrow,
+    iter_checked_chunks,
+    require_chunk_rows,
+    require_stream_compression,
     safe_filename_stem,
     try_import_pyarrow,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from limbo_core.application.interfaces.persistence import ColumnTypes
+
+    from .tabular_dataset import TabularDataset
+
 
 @dataclass
-class CsvFileDataPersistenceBackend(DataPersistenceBackend):
+class CsvFileDataPersistenceBackend(DatasetOptions, DataPersistenceBackend):
     """Read/write CSV under a fixed directory via storage refs.
 
     Config:
         directory: Output directory path.
         encoding: Text encoding (default utf-8).
         csv_engine: ``stdlib`` (default) or ``pyarrow`` for faster I/O.
+        compression: ``gzip``, ``zstd`` or ``brotli`` to stream-compress
+            files (named ``.csv.gz``, ``.csv.zst``, ``.csv.br``).
+        storage_backend: Path resolver backend holding ``directory``
+            (``file`` by default; e.g. ``memory`` or ``bucket``).
+        dataset: Write directories of ``part-NNNNN.csv`` files instead
+            (see ``DatasetOptions`` for sharding and partitioning).
     """
 
     directory: str | Path
     encoding: str = "utf-8"
     csv_engine: str = "stdlib"
+    compression: StreamCompression | None = None
+    storage_backend: str = "file"
 
     def __post_init__(self) -> None:
-        """Coerce ``directory`` to a Path and normalize ``csv_engine``."""
+        """Coerce ``directory``, normalize ``csv_engine``, check options."""
         self.directory = Path(self.directory)
         self.csv_engine = self.csv_engine.strip().lower()
+        self.compression = require_stream_compression(self.compression)
+        self._validate_dataset_options()
 
     def storage_object_name(self, logical_name: str) -> str:
-        """Return filename including ``.csv`` suffix."""
-        return f"{safe_filename_stem(logical_name)}.csv"
+        """Return filename with ``.csv`` and any compression suffix.
+
+        Datasets are named by the bare stem.
+        """
+        stem = safe_filename_stem(logical_name)
+        if self.dataset:
+            return stem
+        return compressed_filename(f"{stem}.csv", self.compression)
+
+    def _parts(self) -> TabularDataset:
+        return self._dataset_layout(
+            compressed_filename(".csv", self.compression),
+            self._save_file_stream,
+            self._load_file,
+        )
 
     @staticmethod
     def _cell_as_text(value: CellValue) -> str:
@@ -57,35 +104,84 @@ class CsvFileDataPersistenceBackend(DataPersistenceBackend):
             return value.isoformat()
         return str(value)
 
-    def save(self, ref: ResolvedStorageRef, data: TabularBatch) -> None:
-        """Write ``data`` to the CSV file for ``ref``.
+    def _require_engine(self) -> None:
+        """Validate the configured CSV engine.
 
         Raises:
             ValidationError: If ``csv_engine`` is not ``stdlib`` or ``pyarrow``.
         """
-        if self.csv_engine == "pyarrow":
-            pa = try_import_pyarrow()
-            import pyarrow.csv as pacsv
-
-            cols = {c: [row[c] for row in data.rows] for c in data.column_names}
-            table = pa.Table.from_pydict(cols)
-            with ref.open_binary("wb") as out:
-                pacsv.write_csv(table, out)
-            return
-        if self.csv_engine != "stdlib":
+        if self.csv_engine not in {"stdlib", "pyarrow"}:
             raise ValidationError(
                 "csv_engine must be 'stdlib' or 'pyarrow', "
                 f"got {self.csv_engine!r}"
             )
-        with ref.open_text("w", encoding=self.encoding, newline="") as fh:
-            writer = csv.DictWriter(
-                fh, fieldnames=list(data.column_names), extrasaction="raise"
+
+    def save(self, ref: ResolvedStorageRef, data: TabularBatch) -> None:
+        """Write ``data`` to the CSV file for ``ref``."""
+        self.save_stream(ref, data.column_names, (data,))
+
+    def save_stream(
+        self,
+        ref: ResolvedStorageRef,
+        column_names: tuple[str, ...],
+        chunks: Iterable[TabularBatch],
+        *,
+        column_types: ColumnTypes | None = None,
+    ) -> None:
+        """Write chunks to the CSV file for ``ref`` one chunk at a time.
+
+        The ``pyarrow`` engine builds its Arrow schema from ``column_types``
+        and the leading chunks (see ``arrow_table_stream``).
+        """
+        self._require_engine()
+        if self.dataset:
+            self._parts().save(
+                ref, column_names, chunks, column_types=column_types
             )
-            writer.writeheader()
-            for row in data.rows:
-                writer.writerow({
-                    k: self._cell_as_text(row[k]) for k in data.column_names
-                })
+            return
+        self._save_file_stream(
+            ref, column_names, chunks, column_types=column_types
+        )
+
+    def _save_file_stream(
+        self,
+        ref: ResolvedStorageRef,
+        column_names: tuple[str, ...],
+        chunks: Iterable[TabularBatch],
+        *,
+        column_types: ColumnTypes | None = None,
+    ) -> None:
+        if self.csv_engine == "pyarrow":
+            self._save_stream_pyarrow(ref, column_names, chunks, column_types)
+            return
+        checked = iter_checked_chunks(column_names, chunks)
+        with ref.open_atomic_text(encoding=self.encoding, newline="") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(column_names)
+            as_text = self._cell_as_text
+            for chunk in checked:
+                writer.writerows(
+                    [as_text(v) for v in values]
+                    for values in chunk.iter_row_values()
+                )
+
+    @staticmethod
+    def _save_stream_pyarrow(
+        ref: ResolvedStorageRef,
+        column_names: tuple[str, ...],
+        chunks: Iterable[TabularBatch],
+        column_types: ColumnTypes | None,
+    ) -> None:
+        try_import_pyarrow()
+        import pyarrow.csv as pacsv
+
+        schema, tables = arrow_table_stream(column_names, chunks, column_types)
+        with (
+            ref.open_atomic_binary() as out,
+            pacsv.CSVWriter(out, schema) as writer,
+        ):
+            for table in tables:
+                writer.write_table(table)
 
     def load(self, ref: ResolvedStorageRef) -> TabularBatch:
         """Load a tabular batch from the CSV file for ``ref``.
@@ -95,43 +191,223 @@ class CsvFileDataPersistenceBackend(DataPersistenceBackend):
 
         Raises:
             FileNotFoundError: If the file is missing.
-            ValidationError: If the CSV has no header row.
         """
+        if self.dataset:
+            return self._parts().load(ref)
         if not ref.exists():
             raise FileNotFoundError(ref.uri)
+        return self._load_file(ref)
+
+    def _load_file(self, ref: ResolvedStorageRef) -> TabularBatch:
         if self.csv_engine == "pyarrow":
             try_import_pyarrow()
             import pyarrow.csv as pacsv
 
             with ref.open_binary("rb") as inp:
                 table = pacsv.read_csv(inp)
-            column_names = tuple(str(c) for c in table.column_names)
-            rows_py = table.to_pylist()
-            normalized = [
-                {c: normalize_arrow_scalar(r.get(c)) for c in column_names}
-                for r in rows_py
-            ]
-            return TabularBatch(
-                column_names=column_names, rows=tuple(normalized)
+            return batch_from_arrow_table(table)
+        return next(self._iter_load_stdlib(ref, chunk_rows=None))
+
+    def load_typed(
+        self, ref: ResolvedStorageRef, column_types: ColumnTypes
+    ) -> TabularBatch:
+        """Load the CSV file for ``ref`` decoding cells to declared types.
+
+        Cells are converted while parsing: the ``pyarrow`` engine passes the
+        types to ``ConvertOptions(column_types=...)`` and the ``stdlib`` engine
+        applies one precompiled converter per column. Both engines accept the
+        ``TRUE_TEXT``/``FALSE_TEXT`` boolean spellings. Empty cells of
+        declared columns load as ``None``; undeclared columns load as with
+        ``load``.
+
+        Returns:
+            The typed ``TabularBatch``.
+
+        Raises:
+            FileNotFoundError: If the file is missing.
+        """
+        if self.dataset:
+            return super().load_typed(ref, column_types)
+        if not ref.exists():
+            raise FileNotFoundError(ref.uri)
+        if self.csv_engine == "pyarrow":
+            return self._load_typed_pyarrow(ref, column_types)
+        return next(
+            self._iter_load_stdlib(
+                ref, chunk_rows=None, column_types=column_types
             )
+        )
+
+    @staticmethod
+    def _load_typed_pyarrow(
+        ref: ResolvedStorageRef, column_types: ColumnTypes
+    ) -> TabularBatch:
+        """Parse with declared Arrow types, post-processing declared columns.
+
+        ``BOOLEAN`` columns are read as text and matched against the stdlib
+        engine's spellings, and empty ``STRING`` cells become null. Setting
+        ``true_values`` or ``strings_can_be_null`` on ``ConvertOptions``
+        would also change how undeclared columns are inferred.
+
+        Returns:
+            The typed ``TabularBatch``.
+        """
+        pa = try_import_pyarrow()
+        import pyarrow.compute as pc
+        import pyarrow.csv as pacsv
+
+        options = pacsv.ConvertOptions(
+            column_types={
+                name: pa.string()
+                if data_type is DataType.BOOLEAN
+                else arrow_type_for(data_type)
+                for name, data_type in column_types.items()
+            }
+        )
+        with ref.open_binary("rb") as inp:
+            table = pacsv.read_csv(inp, convert_options=options)
+        for i, name in enumerate(table.column_names):
+            data_type = column_types.get(name)
+            column = table.column(i)
+            if data_type is DataType.STRING:
+                empty = pc.equal(column, "")
+                column = pc.if_else(empty, pa.scalar(None, pa.string()), column)
+            elif data_type is DataType.BOOLEAN:
+                column = _arrow_booleans(name, column)
+            else:
+                continue
+            table = table.set_column(i, name, column)
+        return batch_from_arrow_table(table)
+
+    def iter_load(
+        self, ref: ResolvedStorageRef, *, chunk_rows: int = DEFAULT_CHUNK_ROWS
+    ) -> Iterator[TabularBatch]:
+        """Stream the CSV file for ``ref`` in batches of ``chunk_rows``.
+
+        Returns:
+            An iterator of decoded batches in file order.
+
+        Raises:
+            FileNotFoundError: If the file is missing.
+        """
+        require_chunk_rows(chunk_rows)
+        if self.dataset:
+            return self._parts().iter_load(ref, chunk_rows=chunk_rows)
+        if not ref.exists():
+            raise FileNotFoundError(ref.uri)
+        if self.csv_engine == "pyarrow":
+            return self._iter_load_pyarrow(ref, chunk_rows=chunk_rows)
+        return self._iter_load_stdlib(ref, chunk_rows=chunk_rows)
+
+    @staticmethod
+    def _iter_load_pyarrow(
+        ref: ResolvedStorageRef, *, chunk_rows: int
+    ) -> Iterator[TabularBatch]:
+        try_import_pyarrow()
+        import pyarrow.csv as pacsv
+
+        with ref.open_binary("rb") as inp:
+            reader = pacsv.open_csv(inp)
+            yield from iter_batches_from_arrow(
+                reader, tuple(reader.schema.names), chunk_rows
+            )
+
+    def _iter_load_stdlib(
+        self,
+        ref: ResolvedStorageRef,
+        *,
+        chunk_rows: int | None,
+        column_types: ColumnTypes | None = None,
+    ) -> Iterator[TabularBatch]:
+        """Decode CSV rows into column-major batches.
+
+        Columns named in ``column_types`` are converted cell by cell as they
+        are read; other columns stay text.
+
+        Yields:
+            Batches of at most ``chunk_rows`` rows (all rows when None); one
+            empty batch if the file has a header but no data rows.
+
+        Raises:
+            ValidationError: If the CSV has no header row.
+        """
         with ref.open_text("r", encoding=self.encoding, newline="") as fh:
-            reader = csv.DictReader(fh)
-            if reader.fieldnames is None:
+            reader = csv.reader(fh)
+            header = next(reader, None)
+            if header is None:
                 raise ValidationError("CSV has no header row")
-            column_names = tuple(reader.fieldnames)
-            rows: list[dict[str, CellValue]] = []
+            column_names = tuple(header)
+            width = len(column_names)
+            types = column_types or {}
+            converters: list[Callable[[str], CellValue] | None] = [
+                text_converter(name, types[name]) if name in types else None
+                for name in column_names
+            ]
+            columns: list[list[CellValue]] = [[] for _ in column_names]
+            pending = 0
+            produced = False
             for raw in reader:
-                row_out: dict[str, CellValue] = {}
-                for col in column_names:
-                    cell = raw.get(col)
-                    row_out[col] = None if cell is None or cell == "" else cell
-                rows.append(row_out)
-        return TabularBatch(column_names=column_names, rows=tuple(rows))
+                if not raw:
+                    continue
+                for i in range(width):
+                    cell = raw[i] if i < len(raw) else ""
+                    convert = converters[i]
+                    if not cell:
+                        columns[i].append(None)
+                    elif convert is None:
+                        columns[i].append(cell)
+                    else:
+                        columns[i].append(convert(cell))
+                pending += 1
+                if pending == chunk_rows:
+                    yield TabularBatch.from_columns(
+                        column_names,
+                        dict(zip(column_names, columns, strict=True)),
+                    )
+                    produced = True
+                    columns = [[] for _ in column_names]
+                    pending = 0
+            if pending or not produced:
+                yield TabularBatch.from_columns(
+                    column_names, dict(zip(column_names, columns, strict=True))
+                )
 
     def exists(self, ref: ResolvedStorageRef) -> bool:
-        """Return True if the file for ``ref`` exists."""
+        """Return True if the file (or dataset) for ``ref`` exists."""
+        if self.dataset:
+            return self._parts().exists(ref)
         return ref.exists()
 
     def cleanup(self, ref: ResolvedStorageRef) -> None:
-        """Remove the file for ``ref`` if present."""
+        """Remove the file (or dataset) for ``ref`` if present."""
+        if self.dataset:
+            self._parts().cleanup(ref)
+            return
         ref.unlink()
+
+
+def _arrow_booleans(name: str, column: Any) -> Any:
+    """Convert a PyArrow text column using ``TRUE_TEXT``/``FALSE_TEXT``.
+
+    Returns:
+        A boolean array; empty cells are null.
+
+    Raises:
+        ValidationError: If a cell is not a boolean spelling.
+    """
+    pa = try_import_pyarrow()
+    import pyarrow.compute as pc
+
+    text = pc.utf8_lower(pc.utf8_trim_whitespace(column))
+    is_true = pc.is_in(text, value_set=pa.array(sorted(TRUE_TEXT)))
+    is_false = pc.is_in(text, value_set=pa.array(sorted(FALSE_TEXT)))
+    empty = pc.equal(text, "")
+    bad = pc.fill_null(
+        pc.invert(pc.or_(pc.or_(is_true, is_false), empty)), False
+    )
+    if pc.any(bad).as_py():
+        value = column.filter(bad)[0].as_py()
+        raise ValidationError(
+            f"Column {name!r}: cannot convert {value!r} to {DataType.BOOLEAN}"
+        )
+    return pc.if_else(empty, pa.scalar(None, pa.bool_()), is_true)
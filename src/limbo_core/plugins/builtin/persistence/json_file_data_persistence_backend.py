@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from limbo_core.application.interfaces.persistence import DataPersistenceBackend
 
 if TYPE_CHECKING:
-    from limbo_core.domain.value_objects import ResolvedStorageRef, TabularBatch
+    from limbo_core.domain.value_objects import (
+        ResolvedStorageRef,
+        StreamCompression,
+        TabularBatch,
+    )
 
 from .tabular_file_utils import (
+    JsonCodec,
+    JsonCodecName,
+    compressed_filename,
     dump_json_bytes,
     load_json_document_from_bytes,
+    require_stream_compression,
+    resolve_json_codec,
     safe_filename_stem,
     tabular_batch_from_json_document,
     tabular_batch_to_json_document,
@@ -22,24 +31,38 @@ from .tabular_file_utils import (
 
 @dataclass
 class JsonFileDataPersistenceBackend(DataPersistenceBackend):
-    """Read/write one JSON document per artifact (orjson when installed)."""
+    """Read/write one JSON document per artifact (msgspec/orjson if present).
+
+    ``compression`` (gzip, zstd, brotli) stream-compresses files and adds the
+    codec suffix to their names. Files live under ``directory`` of the
+    ``storage_backend`` path resolver. ``json_codec`` pins the JSON library
+    as for the JSONL backend.
+    """
 
     directory: str | Path
     encoding: str = "utf-8"
+    compression: StreamCompression | None = None
+    storage_backend: str = "file"
+    json_codec: JsonCodecName | None = None
+    _codec: JsonCodec = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Coerce ``directory`` to a Path."""
+        """Coerce ``directory``, check ``compression``, resolve the codec."""
         self.directory = Path(self.directory)
+        self.compression = require_stream_compression(self.compression)
+        self._codec = resolve_json_codec(self.json_codec)
 
     def storage_object_name(self, logical_name: str) -> str:
-        """Return filename including ``.json`` suffix."""
-        return f"{safe_filename_stem(logical_name)}.json"
+        """Return filename with ``.json`` and any compression suffix."""
+        return compressed_filename(
+            f"{safe_filename_stem(logical_name)}.json", self.compression
+        )
 
     def save(self, ref: ResolvedStorageRef, data: TabularBatch) -> None:
         """Serialize ``data`` to the JSON file for ``ref``."""
         doc = tabular_batch_to_json_document(data)
-        payload = dump_json_bytes(doc)
-        with ref.open_binary("wb") as out:
+        payload = dump_json_bytes(doc, self._codec)
+        with ref.open_atomic_binary() as out:
             out.write(payload)
 
     def load(self, ref: ResolvedStorageRef) -> TabularBatch:
@@ -55,7 +78,7 @@ class JsonFileDataPersistenceBackend(DataPersistenceBackend):
             raise FileNotFoundError(ref.uri)
         with ref.open_binary("rb") as inp:
             raw = inp.read()
-        doc = load_json_document_from_bytes(raw)
+        doc = load_json_document_from_bytes(raw, self._codec)
         return tabular_batch_from_json_document(doc)
 
     def exists(self, ref: ResolvedStorageRef) -> bool:
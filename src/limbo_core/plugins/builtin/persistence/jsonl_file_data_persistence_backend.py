@@ -2,57 +2,148 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import date
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from limbo_core.application.interfaces.persistence import DataPersistenceBackend
+from limbo_core.application.interfaces.persistence import (
+    DEFAULT_CHUNK_ROWS,
+    DataPersistenceBackend,
+)
 from limbo_core.domain.validation import ValidationError
 from limbo_core.domain.value_objects import (
     CellValue,
     ResolvedStorageRef,
+    StreamCompression,
     TabularBatch,
 )
 
+from .tabular_dataset import DatasetOptions
 from .tabular_file_utils import (
+    JsonCodec,
+    JsonCodecName,
     cell_from_json_value,
     cell_to_json_value,
+    compressed_filename,
     dump_json_bytes,
+    empty_batch,
+    iter_checked_chunks,
     load_json_document_from_bytes,
+    require_chunk_rows,
+    require_stream_compression,
+    resolve_json_codec,
     safe_filename_stem,
     tabular_batch_from_json_document,
     tabular_batch_to_json_document,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from limbo_core.application.interfaces.persistence import ColumnTypes
+
+    from .tabular_dataset import TabularDataset
+
 
 @dataclass
-class JsonlFileDataPersistenceBackend(DataPersistenceBackend):
-    """Read/write newline-delimited JSON rows (orjson when installed).
+class JsonlFileDataPersistenceBackend(DatasetOptions, DataPersistenceBackend):
+    """Read/write newline-delimited JSON rows (msgspec or orjson if installed).
 
     With zero data rows, writes a single envelope line (column_names + rows [])
-    so columns are recoverable on load.
+    so columns are recoverable on load. ``json_codec`` pins the JSON library
+    (``msgspec``, ``orjson`` or ``stdlib``); by default the fastest installed
+    one is used. ``compression`` (gzip, zstd, brotli) stream-compresses files
+    and adds the codec suffix to their names. ``storage_backend`` selects the
+    path resolver storing the files. With ``dataset`` set, artifacts are
+    directories of ``part-NNNNN.jsonl`` files (see ``DatasetOptions``).
     """
 
     directory: str | Path
     encoding: str = "utf-8"
+    compression: StreamCompression | None = None
+    storage_backend: str = "file"
+    json_codec: JsonCodecName | None = None
+    _codec: JsonCodec = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Coerce ``directory`` to a Path."""
+        """Coerce ``directory``, check the options and resolve the codec."""
         self.directory = Path(self.directory)
+        self.compression = require_stream_compression(self.compression)
+        self._validate_dataset_options()
+        self._codec = resolve_json_codec(self.json_codec)
 
     def storage_object_name(self, logical_name: str) -> str:
-        """Return filename including ``.jsonl`` suffix."""
-        return f"{safe_filename_stem(logical_name)}.jsonl"
+        """Return filename with ``.jsonl`` and any compression suffix.
+
+        Datasets are named by the bare stem.
+        """
+        stem = safe_filename_stem(logical_name)
+        if self.dataset:
+            return stem
+        return compressed_filename(f"{stem}.jsonl", self.compression)
+
+    def _parts(self) -> TabularDataset:
+        return self._dataset_layout(
+            compressed_filename(".jsonl", self.compression),
+            self._save_file_stream,
+            self._load_file,
+        )
 
     def save(self, ref: ResolvedStorageRef, data: TabularBatch) -> None:
         """Serialize ``data`` to the JSONL file for ``ref``."""
-        with ref.open_binary("wb") as out:
-            if not data.rows:
-                payload = dump_json_bytes(tabular_batch_to_json_document(data))
-                out.write(payload + b"\n")
-                return
-            for row in data.rows:
-                doc = {k: cell_to_json_value(row[k]) for k in data.column_names}
-                out.write(dump_json_bytes(doc) + b"\n")
+        self.save_stream(ref, data.column_names, (data,))
+
+    def save_stream(
+        self,
+        ref: ResolvedStorageRef,
+        column_names: tuple[str, ...],
+        chunks: Iterable[TabularBatch],
+        *,
+        column_types: ColumnTypes | None = None,
+    ) -> None:
+        """Append each chunk's rows to the JSONL file for ``ref`` in turn.
+
+        JSON cells carry their own types, so ``column_types`` is not used.
+        """
+        if self.dataset:
+            self._parts().save(
+                ref, column_names, chunks, column_types=column_types
+            )
+            return
+        self._save_file_stream(ref, column_names, chunks)
+
+    def _save_file_stream(
+        self,
+        ref: ResolvedStorageRef,
+        column_names: tuple[str, ...],
+        chunks: Iterable[TabularBatch],
+        *,
+        column_types: ColumnTypes | None = None,
+    ) -> None:
+        """Encode each chunk's rows and write them with one call per chunk."""
+        del column_types
+        dumps = self._codec.dumps
+        written = 0
+        with ref.open_atomic_binary() as out:
+            for chunk in iter_checked_chunks(column_names, chunks):
+                if not chunk.num_rows:
+                    continue
+                columns = [
+                    _json_column(chunk.column(name)) for name in column_names
+                ]
+                lines = [
+                    dumps(dict(zip(column_names, values, strict=True)))
+                    for values in zip(*columns, strict=True)
+                ]
+                lines.append(b"")
+                out.write(b"\n".join(lines))
+                written += chunk.num_rows
+            if not written:
+                envelope = tabular_batch_to_json_document(
+                    empty_batch(column_names)
+                )
+                out.write(dump_json_bytes(envelope, self._codec) + b"\n")
 
     def load(self, ref: ResolvedStorageRef) -> TabularBatch:
         """Load a tabular batch from the JSONL file for ``ref``.
@@ -62,40 +153,94 @@ class JsonlFileDataPersistenceBackend(DataPersistenceBackend):
 
         Raises:
             FileNotFoundError: If the file is missing.
-            ValidationError: If the file is empty or rows are inconsistent.
         """
+        if self.dataset:
+            return self._parts().load(ref)
+        if not ref.exists():
+            raise FileNotFoundError(ref.uri)
+        return self._load_file(ref)
+
+    def _load_file(self, ref: ResolvedStorageRef) -> TabularBatch:
+        return next(self._iter_load(ref, chunk_rows=None))
+
+    def iter_load(
+        self, ref: ResolvedStorageRef, *, chunk_rows: int = DEFAULT_CHUNK_ROWS
+    ) -> Iterator[TabularBatch]:
+        """Stream the JSONL file for ``ref`` in batches of ``chunk_rows``.
+
+        Returns:
+            An iterator of decoded batches in file order.
+
+        Raises:
+            FileNotFoundError: If the file is missing.
+        """
+        require_chunk_rows(chunk_rows)
+        if self.dataset:
+            return self._parts().iter_load(ref, chunk_rows=chunk_rows)
         if not ref.exists():
             raise FileNotFoundError(ref.uri)
-        lines: list[bytes] = []
+        return self._iter_load(ref, chunk_rows=chunk_rows)
+
+    def _iter_load(
+        self, ref: ResolvedStorageRef, *, chunk_rows: int | None
+    ) -> Iterator[TabularBatch]:
+        """Decode JSONL rows into column-major batches.
+
+        Yields:
+            Batches of at most ``chunk_rows`` rows (all rows when None).
+
+        Raises:
+            ValidationError: If the file is empty or rows are inconsistent.
+        """
         with ref.open_binary("rb") as inp:
-            for ln in inp:
-                s = ln.strip()
-                if s:
-                    lines.append(s)
-        if not lines:
-            raise ValidationError("JSONL file is empty")
-        first = load_json_document_from_bytes(lines[0])
-        if "column_names" in first and "rows" in first:
-            return tabular_batch_from_json_document(first)
-        column_names: tuple[str, ...] = tuple(first.keys())
-        parsed: list[dict[str, CellValue]] = [
-            {k: cell_from_json_value(first[k]) for k in column_names}
-        ]
-        for i, line in enumerate(lines[1:], start=1):
-            obj = load_json_document_from_bytes(line)
-            if tuple(obj.keys()) != column_names:
-                raise ValidationError(
-                    f"JSONL row {i} keys do not match first row"
-                )
-            parsed.append({
-                k: cell_from_json_value(obj[k]) for k in column_names
-            })
-        return TabularBatch(column_names=column_names, rows=tuple(parsed))
+            lines = (s for s in (ln.strip() for ln in inp) if s)
+            first_line = next(lines, None)
+            if first_line is None:
+                raise ValidationError("JSONL file is empty")
+            first = load_json_document_from_bytes(first_line, self._codec)
+            if "column_names" in first and "rows" in first:
+                yield tabular_batch_from_json_document(first)
+                return
+            column_names: tuple[str, ...] = tuple(first.keys())
+            columns: dict[str, list[CellValue]] = {
+                k: [cell_from_json_value(first[k])] for k in column_names
+            }
+            pending = 1
+            for i, line in enumerate(lines, start=1):
+                if pending == chunk_rows:
+                    yield TabularBatch.from_columns(column_names, columns)
+                    columns = {k: [] for k in column_names}
+                    pending = 0
+                obj = load_json_document_from_bytes(line, self._codec)
+                if tuple(obj.keys()) != column_names:
+                    raise ValidationError(
+                        f"JSONL row {i} keys do not match first row"
+                    )
+                for k in column_names:
+                    columns[k].append(cell_from_json_value(obj[k]))
+                pending += 1
+            yield TabularBatch.from_columns(column_names, columns)
 
     def exists(self, ref: ResolvedStorageRef) -> bool:
-        """Return True if the file for ``ref`` exists."""
+        """Return True if the file (or dataset) for ``ref`` exists."""
+        if self.dataset:
+            return self._parts().exists(ref)
         return ref.exists()
 
     def cleanup(self, ref: ResolvedStorageRef) -> None:
-        """Remove the file for ``ref`` if present."""
+        """Remove the file (or dataset) for ``ref`` if present."""
+        if self.dataset:
+            self._parts().cleanup(ref)
+            return
         ref.unlink()
+
+
+def _json_column(values: Sequence[CellValue]) -> Sequence[Any]:
+    """Return a column's JSON values, tagging dates only where present.
+
+    Returns:
+        ``values`` itself unless it holds dates or datetimes.
+    """
+    if any(issubclass(kind, date) for kind in set(map(type, values))):
+        return [cell_to_json_value(value) for value in values]
+    return values
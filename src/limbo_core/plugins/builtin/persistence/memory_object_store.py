@@ -0,0 +1,204 @@
+"""In-process object store clients for tests and benchmarks."""
+
+from __future__ import annotations
+
+import threading
+import uuid
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from limbo_core.domain.value_objects import ObjectStoreClient
+from limbo_core.validation import ValidationError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class UnknownUploadError(ValidationError):
+    """Raised for a multipart upload id that is not in progress."""
+
+    def __init__(self, upload_id: str) -> None:
+        """Initialize the UnknownUploadError."""
+        super().__init__(f"Unknown multipart upload {upload_id!r}")
+
+
+@dataclass(slots=True)
+class MemoryObjectStore(ObjectStoreClient):
+    """Bucket held in RAM; one instance may be shared by many connections.
+
+    All operations take an internal lock, so the store is thread-safe.
+    """
+
+    objects: dict[str, bytes] = field(default_factory=dict)
+    _uploads: dict[str, tuple[str, dict[int, bytes]]] = field(
+        default_factory=dict
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def head(self, key: str) -> int | None:
+        """Return the size of object ``key``, or None if it is missing."""
+        with self._lock:
+            data = self.objects.get(key)
+        return None if data is None else len(data)
+
+    def get_range(self, key: str, start: int, end: int) -> bytes:
+        """Return bytes ``[start, end)`` of object ``key``.
+
+        Raises:
+            ValidationError: If the object does not exist.
+        """
+        with self._lock:
+            data = self.objects.get(key)
+        if data is None:
+            raise ValidationError(f"Object {key!r} does not exist")
+        return data[start:end]
+
+    def delete(self, key: str) -> None:
+        """Remove object ``key`` if present."""
+        with self._lock:
+            self.objects.pop(key, None)
+
+    def list_keys(self, prefix: str) -> list[str]:
+        """Return the sorted keys starting with ``prefix``."""
+        with self._lock:
+            return sorted(k for k in self.objects if k.startswith(prefix))
+
+    def start_upload(self, key: str) -> str:
+        """Begin a multipart upload to ``key``.
+
+        Returns:
+            The upload id.
+        """
+        upload_id = uuid.uuid4().hex
+        with self._lock:
+            self._uploads[upload_id] = (key, {})
+        return upload_id
+
+    def upload_part(
+        self, upload_id: str, part_number: int, data: bytes
+    ) -> None:
+        """Store part ``part_number`` of an upload.
+
+        Raises:
+            UnknownUploadError: If the upload is unknown.
+        """
+        with self._lock:
+            upload = self._uploads.get(upload_id)
+            if upload is None:
+                raise UnknownUploadError(upload_id)
+            upload[1][part_number] = data
+
+    def complete_upload(self, upload_id: str) -> None:
+        """Publish the uploaded parts as the object.
+
+        Raises:
+            UnknownUploadError: If the upload is unknown.
+        """
+        with self._lock:
+            upload = self._uploads.pop(upload_id, None)
+            if upload is None:
+                raise UnknownUploadError(upload_id)
+            key, parts = upload
+            self.objects[key] = b"".join(parts[n] for n in sorted(parts))
+
+    def abort_upload(self, upload_id: str) -> None:
+        """Discard an upload and its parts."""
+        with self._lock:
+            self._uploads.pop(upload_id, None)
+
+
+@dataclass(slots=True)
+class LocalBucketObjectStore(ObjectStoreClient):
+    """Fake bucket storing each object as a file under ``root``.
+
+    Keys map to relative paths. Parts are staged under ``root/.uploads``
+    and concatenated into the object with an atomic rename on completion,
+    mimicking object store visibility on a local disk.
+    """
+
+    root: Path
+
+    @property
+    def _staging(self) -> Path:
+        return self.root / ".uploads"
+
+    def _path(self, key: str) -> Path:
+        return self.root / key
+
+    def head(self, key: str) -> int | None:
+        """Return the size of object ``key``, or None if it is missing."""
+        path = self._path(key)
+        return path.stat().st_size if path.is_file() else None
+
+    def get_range(self, key: str, start: int, end: int) -> bytes:
+        """Return bytes ``[start, end)`` of object ``key``."""
+        with self._path(key).open("rb") as fh:
+            fh.seek(start)
+            return fh.read(max(0, end - start))
+
+    def delete(self, key: str) -> None:
+        """Remove object ``key`` if present."""
+        self._path(key).unlink(missing_ok=True)
+
+    def list_keys(self, prefix: str) -> list[str]:
+        """Return the sorted keys starting with ``prefix``."""
+        if not self.root.is_dir():
+            return []
+        keys = (
+            path.relative_to(self.root).as_posix()
+            for path in self.root.rglob("*")
+            if path.is_file() and self._staging not in path.parents
+        )
+        return sorted(k for k in keys if k.startswith(prefix))
+
+    def start_upload(self, key: str) -> str:
+        """Begin a multipart upload to ``key``.
+
+        Returns:
+            The upload id.
+        """
+        upload_id = uuid.uuid4().hex
+        staging = self._staging / upload_id
+        staging.mkdir(parents=True)
+        (staging / "key").write_text(key, encoding="utf-8")
+        return upload_id
+
+    def upload_part(
+        self, upload_id: str, part_number: int, data: bytes
+    ) -> None:
+        """Store part ``part_number`` of an upload.
+
+        Raises:
+            UnknownUploadError: If the upload is unknown.
+        """
+        staging = self._staging / upload_id
+        if not staging.is_dir():
+            raise UnknownUploadError(upload_id)
+        (staging / f"part-{part_number:05d}").write_bytes(data)
+
+    def complete_upload(self, upload_id: str) -> None:
+        """Concatenate the parts and rename the result over the object.
+
+        Raises:
+            UnknownUploadError: If the upload is unknown.
+        """
+        staging = self._staging / upload_id
+        if not staging.is_dir():
+            raise UnknownUploadError(upload_id)
+        target = self._path((staging / "key").read_text(encoding="utf-8"))
+        assembled = staging / "object"
+        with assembled.open("wb") as out:
+            for part in sorted(staging.glob("part-*")):
+                out.write(part.read_bytes())
+        target.parent.mkdir(parents=True, exist_ok=True)
+        assembled.replace(target)
+        self.abort_upload(upload_id)
+
+    def abort_upload(self, upload_id: str) -> None:
+        """Discard an upload and its parts."""
+        staging = self._staging / upload_id
+        if not staging.is_dir():
+            return
+        for path in staging.iterdir():
+            path.unlink()
+        staging.rmdir()
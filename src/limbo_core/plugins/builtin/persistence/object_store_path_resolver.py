@@ -0,0 +1,103 @@
+"""Path resolvers producing object store storage refs."""
+
+from __future__ import annotations
+
+from abc import abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Any
+
+from limbo_core.application.interfaces import PathResolverBackend
+from limbo_core.domain.value_objects import (
+    DEFAULT_PART_SIZE,
+    ObjectStorePool,
+    ObjectStoreStorageRef,
+)
+
+from .memory_object_store import LocalBucketObjectStore, MemoryObjectStore
+
+if TYPE_CHECKING:
+    from limbo_core.domain.entities import PathSpec
+    from limbo_core.domain.value_objects import ObjectStoreClient
+
+
+@dataclass(slots=True)
+class ObjectStorePathResolver(PathResolverBackend):
+    """Resolve path specs to keys of one bucket behind a connection pool.
+
+    The key is ``base/location`` as a POSIX path without a leading slash.
+    Subclasses provide connections through ``connect``.
+    """
+
+    max_connections: int = 8
+    part_size: int = DEFAULT_PART_SIZE
+    pool: ObjectStorePool = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Create the connection pool."""
+        self.pool = ObjectStorePool(
+            self.connect, max_connections=self.max_connections
+        )
+
+    @abstractmethod
+    def connect(self) -> ObjectStoreClient:
+        """Open one connection to the bucket."""
+        ...
+
+    def resolve(
+        self,
+        path_spec: PathSpec,
+        *,
+        base: Any | None = None,
+        allow_missing: bool = False,
+    ) -> ObjectStoreStorageRef:
+        """Resolve one path spec to an object of the bucket.
+
+        Returns:
+            A ref to the object.
+
+        Raises:
+            FileNotFoundError: If the object does not exist and
+                ``allow_missing`` is False.
+        """
+        location = PurePosixPath(str(base) if base is not None else "")
+        key = (location / path_spec.location).as_posix().lstrip("/")
+        ref = ObjectStoreStorageRef(
+            backend=path_spec.backend,
+            key=key,
+            pool=self.pool,
+            part_size=self.part_size,
+        )
+        if not allow_missing and not ref.exists():
+            raise FileNotFoundError(f"Object {ref.uri} does not exist")
+        return ref
+
+
+@dataclass(slots=True)
+class MemoryPathResolver(ObjectStorePathResolver):
+    """Object store path resolver keeping every object in RAM."""
+
+    store: MemoryObjectStore = field(default_factory=MemoryObjectStore)
+
+    def connect(self) -> MemoryObjectStore:
+        """Return the shared in-memory bucket.
+
+        Returns:
+            ``store``, which is safe to share between connections.
+        """
+        return self.store
+
+
+@dataclass(slots=True)
+class LocalBucketPathResolver(ObjectStorePathResolver):
+    """Object store path resolver backed by a fake bucket directory."""
+
+    root: Path = field(default_factory=Path.cwd)
+
+    def connect(self) -> LocalBucketObjectStore:
+        """Open a connection to the bucket directory.
+
+        Returns:
+            A client for ``root``.
+        """
+        return LocalBucketObjectStore(Path(self.root))
@@ -1,58 +1,137 @@
-"""Parquet tabular data persistence (PyArrow, Snappy)."""
+"""Parquet tabular data persistence (PyArrow)."""
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Literal
 
-from limbo_core.application.interfaces.persistence import DataPersistenceBackend
-from limbo_core.domain.value_objects import ResolvedStorageRef, TabularBatch
+from limbo_core.application.interfaces.persistence import (
+    DEFAULT_CHUNK_ROWS,
+    DataPersistenceBackend,
+)
+from limbo_core.domain.validation import ValidationError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from limbo_core.application.interfaces.persistence import (
+        ColumnTypes,
+        RowFilter,
+    )
+    from limbo_core.domain.value_objects import ResolvedStorageRef, TabularBatch
 
+    from .tabular_dataset import TabularDataset
+
+from .tabular_dataset import DatasetOptions
 from .tabular_file_utils import (
-    normalize_arrow_scalar,
+    arrow_filter_expression,
+    arrow_table_stream,
+    batch_from_arrow_table,
+    iter_batches_from_arrow,
+    require_chunk_rows,
     safe_filename_stem,
     try_import_pyarrow,
 )
 
+ParquetCompression = Literal["none", "snappy", "gzip", "brotli", "zstd", "lz4"]
+
+_PARQUET_CODECS = frozenset(("none", "snappy", "gzip", "brotli", "zstd", "lz4"))
 
-@dataclass
-class ParquetFileDataPersistenceBackend(DataPersistenceBackend):
-    """Read/write Parquet (Snappy) via PyArrow.
 
-    ``encoding`` is accepted for config compatibility with other file backends
-    but is not used for Parquet.
+@dataclass
+class ParquetFileDataPersistenceBackend(DatasetOptions, DataPersistenceBackend):
+    """Read/write Parquet via PyArrow.
+
+    Column chunks are compressed with ``compression`` (Snappy by default) at
+    ``compression_level`` when the codec supports levels. ``encoding`` is
+    accepted for config compatibility with other file backends but is not
+    used for Parquet. ``storage_backend`` names the path resolver (local
+    ``file`` by default) that stores the files. With ``dataset`` set,
+    artifacts are directories of ``part-NNNNN.parquet`` files (see
+    ``DatasetOptions``).
     """
 
     directory: str | Path
     encoding: str = "utf-8"
+    compression: ParquetCompression = "snappy"
+    compression_level: int | None = None
+    storage_backend: str = "file"
 
     def __post_init__(self) -> None:
-        """Coerce ``directory`` to a Path."""
+        """Coerce ``directory`` to a Path and validate the options.
+
+        Raises:
+            ValidationError: If ``compression`` is not a Parquet codec.
+        """
         self.directory = Path(self.directory)
+        self._validate_dataset_options()
+        if self.compression not in _PARQUET_CODECS:
+            raise ValidationError(
+                "compression must be one of "
+                f"{sorted(_PARQUET_CODECS)}, got {self.compression!r}"
+            )
 
     def storage_object_name(self, logical_name: str) -> str:
-        """Return filename including ``.parquet`` suffix."""
-        return f"{safe_filename_stem(logical_name)}.parquet"
+        """Return ``<stem>.parquet``, or the bare stem for datasets."""
+        stem = safe_filename_stem(logical_name)
+        return stem if self.dataset else f"{stem}.parquet"
 
-    def _batch_from_pyarrow_rows(
-        self, column_names: tuple[str, ...], rows: list[dict[str, Any]]
-    ) -> TabularBatch:
-        normalized = [
-            {c: normalize_arrow_scalar(row.get(c)) for c in column_names}
-            for row in rows
-        ]
-        return TabularBatch(column_names=column_names, rows=tuple(normalized))
+    def _parts(self) -> TabularDataset:
+        return self._dataset_layout(
+            ".parquet", self._save_file_stream, self._load_file
+        )
 
     def save(self, ref: ResolvedStorageRef, data: TabularBatch) -> None:
         """Serialize ``data`` to the Parquet file for ``ref`` (via PyArrow)."""
-        pa = try_import_pyarrow()
+        self.save_stream(ref, data.column_names, (data,))
+
+    def save_stream(
+        self,
+        ref: ResolvedStorageRef,
+        column_names: tuple[str, ...],
+        chunks: Iterable[TabularBatch],
+        *,
+        column_types: ColumnTypes | None = None,
+    ) -> None:
+        """Write each chunk as its own row group(s) of the Parquet file.
+
+        The Arrow schema comes from ``column_types``, with undeclared columns
+        inferred from the leading chunks (see ``arrow_table_stream``); for
+        datasets, of each part.
+        """
+        if self.dataset:
+            self._parts().save(
+                ref, column_names, chunks, column_types=column_types
+            )
+            return
+        self._save_file_stream(
+            ref, column_names, chunks, column_types=column_types
+        )
+
+    def _save_file_stream(
+        self,
+        ref: ResolvedStorageRef,
+        column_names: tuple[str, ...],
+        chunks: Iterable[TabularBatch],
+        *,
+        column_types: ColumnTypes | None = None,
+    ) -> None:
+        try_import_pyarrow()
         import pyarrow.parquet as pq
 
-        cols = {c: [row[c] for row in data.rows] for c in data.column_names}
-        table = pa.Table.from_pydict(cols)
-        with ref.open_binary("wb") as out:
-            pq.write_table(table, out, compression="snappy")
+        schema, tables = arrow_table_stream(column_names, chunks, column_types)
+        with (
+            ref.open_atomic_binary() as out,
+            pq.ParquetWriter(
+                out,
+                schema,
+                compression=self.compression,
+                compression_level=self.compression_level,
+            ) as writer,
+        ):
+            for table in tables:
+                writer.write_table(table)
 
     def load(self, ref: ResolvedStorageRef) -> TabularBatch:
         """Load a tabular batch from the Parquet file for ``ref``.
@@ -63,20 +142,98 @@ class ParquetFileDataPersistenceBackend(DataPersistenceBackend):
         Raises:
             FileNotFoundError: If the file is missing.
         """
+        if self.dataset:
+            return self._parts().load(ref)
         if not ref.exists():
             raise FileNotFoundError(ref.uri)
+        return self._load_file(ref)
+
+    @staticmethod
+    def _load_file(ref: ResolvedStorageRef) -> TabularBatch:
         try_import_pyarrow()
         import pyarrow.parquet as pq
 
         with ref.open_binary("rb") as inp:
             table = pq.read_table(inp)
-        column_names = tuple(str(c) for c in table.column_names)
-        return self._batch_from_pyarrow_rows(column_names, table.to_pylist())
+        return batch_from_arrow_table(table)
+
+    def load_projected(
+        self,
+        ref: ResolvedStorageRef,
+        *,
+        columns: Sequence[str] | None = None,
+        filters: Sequence[RowFilter] | None = None,
+    ) -> TabularBatch:
+        """Read only ``columns`` of matching rows via ``pq.read_table``.
+
+        Projection and filters are pushed into the Parquet reader, so
+        unselected columns are never decoded and row groups whose statistics
+        exclude the filters are skipped.
+
+        Returns:
+            The projected ``TabularBatch``.
+
+        Raises:
+            FileNotFoundError: If the file is missing.
+        """
+        if self.dataset:
+            return super().load_projected(ref, columns=columns, filters=filters)
+        if not ref.exists():
+            raise FileNotFoundError(ref.uri)
+        try_import_pyarrow()
+        import pyarrow.parquet as pq
+
+        expression = arrow_filter_expression(filters) if filters else None
+        with ref.open_binary("rb") as inp:
+            table = pq.read_table(
+                inp,
+                columns=None if columns is None else list(columns),
+                filters=expression,
+            )
+        return batch_from_arrow_table(table)
+
+    def iter_load(
+        self, ref: ResolvedStorageRef, *, chunk_rows: int = DEFAULT_CHUNK_ROWS
+    ) -> Iterator[TabularBatch]:
+        """Stream the Parquet file for ``ref`` in batches of ``chunk_rows``.
+
+        Returns:
+            An iterator of decoded batches in file order.
+
+        Raises:
+            FileNotFoundError: If the file is missing.
+        """
+        require_chunk_rows(chunk_rows)
+        if self.dataset:
+            return self._parts().iter_load(ref, chunk_rows=chunk_rows)
+        if not ref.exists():
+            raise FileNotFoundError(ref.uri)
+        try_import_pyarrow()
+        return self._iter_load(ref, chunk_rows=chunk_rows)
+
+    @staticmethod
+    def _iter_load(
+        ref: ResolvedStorageRef, *, chunk_rows: int
+    ) -> Iterator[TabularBatch]:
+        import pyarrow.parquet as pq
+
+        with ref.open_binary("rb") as inp:
+            parquet_file = pq.ParquetFile(inp)
+            yield from iter_batches_from_arrow(
+                parquet_file.iter_batches(batch_size=chunk_rows),
+                tuple(parquet_file.schema_arrow.names),
+                chunk_rows,
+            )
 
     def exists(self, ref: ResolvedStorageRef) -> bool:
-        """Return True if the file for ``ref`` exists."""
+        """Return True if the file (or dataset) for ``ref`` exists."""
+        if self.dataset:
+            return self._parts().exists(ref)
         return ref.exists()
 
     def cleanup(self, ref: ResolvedStorageRef) -> None:
-        """Remove the file for ``ref`` if present."""
+        """Remove the file (or dataset) for ``ref`` if present."""
+        if self.dataset:
+            self._parts().cleanup(ref)
+            return
         ref.unlink()
@@ -0,0 +1,456 @@
+"""Database tabular data persistence through a SQLAlchemy connection."""
+
+from __future__ import annotations
+
+import io
+import itertools
+from contextlib import closing
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+
+from limbo_core.application.interfaces.persistence import (
+    DEFAULT_CHUNK_ROWS,
+    DataPersistenceBackend,
+)
+from limbo_core.domain.entities import DataType
+from limbo_core.domain.validation import ValidationError
+from limbo_core.domain.value_objects import TableStorageRef, TabularBatch
+
+from .tabular_file_utils import iter_checked_chunks, require_chunk_rows
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from sqlalchemy import Connection, Engine, Table
+    from sqlalchemy.types import TypeEngine
+
+    from limbo_core.application.interfaces import ConnectionProviderPort
+    from limbo_core.application.interfaces.persistence import ColumnTypes
+    from limbo_core.domain.value_objects import ResolvedStorageRef
+
+DEFAULT_BATCH_ROWS = 10_000
+
+
+@dataclass
+class SQLAlchemyDataPersistenceBackend(DataPersistenceBackend):
+    """Store each artifact as a table of the configured ``connection``.
+
+    Tables are (re)created from the declared ``column_types``; undeclared
+    columns get the ``DataType`` of their first non-null cell within the
+    leading chunks (see ``_column_data_types``). They are dropped, created
+    and filled in one transaction, so on databases with transactional DDL
+    (PostgreSQL, SQLite) readers never observe a partial table. Dialects
+    whose DDL commits implicitly (MySQL, Oracle) expose the new, still
+    filling table as soon as it is created.
+    Rows are inserted as ``executemany`` batches of ``batch_rows`` rows with
+    values pre-converted column by column by the dialect's bind processors;
+    on PostgreSQL with psycopg 3 or psycopg2 they are streamed through
+    ``COPY ... FROM STDIN`` instead.
+    """
+
+    connection: str
+    schema_name: str | None = None
+    batch_rows: int = DEFAULT_BATCH_ROWS
+    _connections: ConnectionProviderPort | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Validate the connection name and batch size.
+
+        Raises:
+            ValidationError: If ``connection`` is empty or ``batch_rows`` is
+                not positive.
+        """
+        if not self.connection:
+            raise ValidationError("connection must be a non-empty string")
+        if self.batch_rows < 1:
+            raise ValidationError("batch_rows must be at least 1")
+
+    def bind_connections(self, connections: ConnectionProviderPort) -> None:
+        """Keep ``connections`` to open ``connection`` on first use."""
+        self._connections = connections
+
+    def storage_object_name(self, logical_name: str) -> str:
+        """Return the table name, which is the logical name itself."""
+        return logical_name
+
+    def resolve_storage_ref(self, object_name: str) -> TableStorageRef:
+        """Return the ref of table ``object_name`` of ``connection``.
+
+        Returns:
+            A table ref in ``schema_name``.
+        """
+        return TableStorageRef(
+            connection=self.connection,
+            table_name=object_name,
+            schema_name=self.schema_name,
+        )
+
+    def _engine(self) -> Engine:
+        """Return the engine of ``connection``.
+
+        Returns:
+            The shared engine of the configured connection.
+
+        Raises:
+            ValidationError: If no connection provider was bound.
+        """
+        if self._connections is None:
+            raise ValidationError(
+                "SQLAlchemy persistence backend requires a connection "
+                "provider; configure it through a registry with connections"
+            )
+        engine: Engine = self._connections.connect(self.connection)
+        return engine
+
+    def _table_name(self, ref: ResolvedStorageRef) -> str:
+        """Return the table name of ``ref``.
+
+        Returns:
+            The name of the table.
+
+        Raises:
+            ValidationError: If ``ref`` is not a table ref.
+        """
+        if not isinstance(ref, TableStorageRef):
+            raise ValidationError(f"{ref.uri} is not a database table")
+        return ref.table_name
+
+    def save(self, ref: ResolvedStorageRef, data: TabularBatch) -> None:
+        """Replace the table of ``ref`` with ``data``."""
+        self.save_stream(ref, data.column_names, (data,))
+
+    def save_stream(
+        self,
+        ref: ResolvedStorageRef,
+        column_names: tuple[str, ...],
+        chunks: Iterable[TabularBatch],
+        *,
+        column_types: ColumnTypes | None = None,
+    ) -> None:
+        """Replace the table of ``ref`` with the rows of ``chunks``.
+
+        The table is dropped, created with ``column_types`` (undeclared
+        columns inferred from the leading chunks) and filled inside one
+        transaction (atomic only with transactional DDL).
+        """
+        from sqlalchemy import MetaData
+
+        name = self._table_name(ref)
+        checked = iter_checked_chunks(column_names, chunks)
+        data_types, buffered = _column_data_types(
+            column_names, checked, column_types
+        )
+        engine = self._engine()
+        with engine.begin() as connection:
+            table = _table(name, self.schema_name, data_types, MetaData())
+            table.drop(connection, checkfirst=True)
+            table.create(connection)
+            writer = _BatchWriter(connection, table, self.batch_rows)
+            for chunk in itertools.chain(buffered, checked):
+                writer.write(chunk)
+
+    def load(self, ref: ResolvedStorageRef) -> TabularBatch:
+        """Read the whole table of ``ref``.
+
+        Returns:
+            All rows in table order.
+        """
+        batches = list(self._iter_load(ref, chunk_rows=DEFAULT_CHUNK_ROWS))
+        return TabularBatch.concat(batches[0].column_names, batches)
+
+    def iter_load(
+        self, ref: ResolvedStorageRef, *, chunk_rows: int = DEFAULT_CHUNK_ROWS
+    ) -> Iterator[TabularBatch]:
+        """Stream the table of ``ref`` through a server-side cursor.
+
+        Returns:
+            An iterator yielding at least one batch.
+        """
+        require_chunk_rows(chunk_rows)
+        return self._iter_load(ref, chunk_rows=chunk_rows)
+
+    def _iter_load(
+        self, ref: ResolvedStorageRef, *, chunk_rows: int
+    ) -> Iterator[TabularBatch]:
+        """Yield the table of ``ref`` in batches of ``chunk_rows`` rows.
+
+        Yields:
+            Column-major batches, or one empty batch for an empty table.
+
+        Raises:
+            FileNotFoundError: If the table does not exist.
+        """
+        from sqlalchemy import MetaData, Table, select
+        from sqlalchemy.exc import NoSuchTableError
+
+        name = self._table_name(ref)
+        with self._engine().connect() as connection:
+            try:
+                table = Table(
+                    name,
+                    MetaData(),
+                    schema=self.schema_name,
+                    autoload_with=connection,
+                )
+            except NoSuchTableError as err:
+                raise FileNotFoundError(ref.uri) from err
+            names = tuple(column.name for column in table.columns)
+            result = connection.execution_options(
+                stream_results=True, yield_per=chunk_rows
+            ).execute(select(table))
+            empty = True
+            for rows in result.partitions():
+                empty = False
+                yield _batch_from_rows(names, rows)
+            if empty:
+                yield TabularBatch.from_columns(
+                    names, {name: [] for name in names}
+                )
+
+    def exists(self, ref: ResolvedStorageRef) -> bool:
+        """Return True if the table of ``ref`` exists.
+
+        Returns:
+            Whether the table exists in ``schema_name``.
+        """
+        from sqlalchemy import inspect
+
+        name = self._table_name(ref)
+        with self._engine().connect() as connection:
+            return inspect(connection).has_table(name, schema=self.schema_name)
+
+    def cleanup(self, ref: ResolvedStorageRef) -> None:
+        """Drop the table of ``ref`` if present."""
+        from sqlalchemy import MetaData, Table
+
+        name = self._table_name(ref)
+        with self._engine().begin() as connection:
+            Table(name, MetaData(), schema=self.schema_name).drop(
+                connection, checkfirst=True
+            )
+
+
+def _batch_from_rows(
+    names: tuple[str, ...], rows: Sequence[Any]
+) -> TabularBatch:
+    """Transpose fetched rows into a column-major batch.
+
+    Returns:
+        A batch with one list per column.
+    """
+    columns = zip(*rows, strict=True)
+    return TabularBatch.from_columns(
+        names,
+        {
+            name: list(values)
+            for name, values in zip(names, columns, strict=True)
+        },
+    )
+
+
+def _infer_data_type(values: Sequence[Any]) -> DataType:
+    """Infer a column's ``DataType`` from its first non-null value.
+
+    Returns:
+        The data type; ``STRING`` for empty or all-null columns.
+    """
+    value = next((v for v in values if v is not None), None)
+    if isinstance(value, bool):
+        return DataType.BOOLEAN
+    if isinstance(value, int):
+        return DataType.INTEGER
+    if isinstance(value, float):
+        return DataType.FLOAT
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            return DataType.DATETIME
+        return DataType.TIMESTAMP
+    if isinstance(value, date):
+        return DataType.DATE
+    return DataType.STRING
+
+
+def _column_data_types(
+    column_names: tuple[str, ...],
+    chunks: Iterator[TabularBatch],
+    column_types: ColumnTypes | None,
+    *,
+    inference_rows: int = DEFAULT_CHUNK_ROWS,
+) -> tuple[dict[str, DataType], list[TabularBatch]]:
+    """Return the ``DataType`` per column and the chunks read to infer it.
+
+    Declared columns keep their type. Leading chunks of ``chunks`` are
+    buffered until every other column has a non-null value or
+    ``inference_rows`` rows were read; columns that are still all-null
+    become ``STRING``.
+
+    Returns:
+        Data types in column order and the buffered chunks, which precede
+        the rest of ``chunks``.
+    """
+    types = column_types or {}
+    inferred = {name: types[name] for name in column_names if name in types}
+    untyped = [name for name in column_names if name not in inferred]
+    buffered: list[TabularBatch] = []
+    buffered_rows = 0
+    while untyped and buffered_rows < inference_rows:
+        chunk = next(chunks, None)
+        if chunk is None:
+            break
+        buffered.append(chunk)
+        buffered_rows += chunk.num_rows
+        for name in untyped:
+            if any(value is not None for value in chunk.column(name)):
+                inferred[name] = _infer_data_type(chunk.column(name))
+        untyped = [name for name in untyped if name not in inferred]
+    return {
+        name: inferred.get(name, DataType.STRING) for name in column_names
+    }, buffered
+
+
+def _table(
+    name: str,
+    schema_name: str | None,
+    data_types: dict[str, DataType],
+    metadata: Any,
+) -> Table:
+    """Build the table definition for ``data_types``.
+
+    Returns:
+        A SQLAlchemy table bound to ``metadata``.
+    """
+    from sqlalchemy import (
+        BigInteger,
+        Boolean,
+        Column,
+        Date,
+        DateTime,
+        Float,
+        Table,
+        Text,
+    )
+
+    sql_types: dict[DataType, TypeEngine[Any]] = {
+        DataType.STRING: Text(),
+        DataType.INTEGER: BigInteger(),
+        DataType.FLOAT: Float(),
+        DataType.BOOLEAN: Boolean(),
+        DataType.DATE: Date(),
+        DataType.DATETIME: DateTime(),
+        DataType.TIMESTAMP: DateTime(timezone=True),
+    }
+    return Table(
+        name,
+        metadata,
+        *(
+            Column(column, sql_types[data_type])
+            for column, data_type in data_types.items()
+        ),
+        schema=schema_name,
+    )
+
+
+@dataclass(slots=True)
+class _BatchWriter:
+    """Insert column-major batches into ``table`` in ``batch_rows`` slices."""
+
+    connection: Connection
+    table: Table
+    batch_rows: int
+    _statement: str = field(init=False)
+    _keys: tuple[str, ...] = field(init=False)
+    _processors: list[Any] = field(init=False)
+    _copy: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Compile the insert statement and look up bind processors."""
+        from sqlalchemy import insert
+
+        dialect = self.connection.dialect
+        compiled = insert(self.table).compile(
+            dialect=dialect, column_keys=[c.name for c in self.table.columns]
+        )
+        self._statement = str(compiled)
+        self._keys = tuple(
+            compiled.positiontup or [c.name for c in self.table.columns]
+        )
+        self._processors = [
+            self.table.c[key].type.dialect_impl(dialect).bind_processor(dialect)
+            for key in self._keys
+        ]
+        self._copy = dialect.name == "postgresql" and dialect.driver in {
+            "psycopg",
+            "psycopg2",
+        }
+
+    def write(self, batch: TabularBatch) -> None:
+        """Insert all rows of ``batch``."""
+        for start in range(0, batch.num_rows, self.batch_rows):
+            chunk = batch.slice(start, start + self.batch_rows)
+            if self._copy:
+                _copy_rows(self.connection, self.table, chunk)
+                continue
+            columns = [
+                _process(chunk.column(key), processor)
+                for key, processor in zip(
+                    self._keys, self._processors, strict=True
+                )
+            ]
+            rows: list[Any] = list(zip(*columns, strict=True))
+            if not self.connection.dialect.positional:
+                rows = [dict(zip(self._keys, row, strict=True)) for row in rows]
+            self.connection.exec_driver_sql(self._statement, rows)
+
+
+def _process(values: Sequence[Any], processor: Any) -> Sequence[Any]:
+    """Apply a bind processor to the non-null cells of one column.
+
+    Returns:
+        The values to bind.
+    """
+    if processor is None:
+        return values
+    return [None if v is None else processor(v) for v in values]
+
+
+def _copy_rows(
+    connection: Connection, table: Table, batch: TabularBatch
+) -> None:
+    r"""Stream ``batch`` into ``table`` with PostgreSQL ``COPY FROM STDIN``.
+
+    psycopg 3 encodes rows itself; psycopg2 is fed CSV lines built by
+    ``_copy_csv_line``.
+    """
+    preparer = connection.dialect.identifier_preparer
+    columns = ", ".join(preparer.quote(name) for name in batch.column_names)
+    statement = f"COPY {preparer.format_table(table)} ({columns}) FROM STDIN"
+    dbapi_connection: Any = connection.connection.dbapi_connection
+    with closing(dbapi_connection.cursor()) as cursor:
+        if connection.dialect.driver == "psycopg":
+            with cursor.copy(statement) as copy:
+                for row in batch.iter_row_values():
+                    copy.write_row(row)
+            return
+        buffer = io.StringIO()
+        buffer.writelines(map(_copy_csv_line, batch.iter_row_values()))
+        buffer.seek(0)
+        cursor.copy_expert(f"{statement} WITH (FORMAT csv)", buffer)
+
+
+def _copy_csv_line(row: tuple[Any, ...]) -> str:
+    r"""Render one row for CSV ``COPY`` with PostgreSQL's default NULL.
+
+    NULL is an unquoted empty field and every other value is quoted, so
+    empty strings (and strings such as ``\N``) load as themselves.
+
+    Returns:
+        The CSV line, newline-terminated.
+    """
+    fields = (
+        "" if value is None else '"' + str(value).replace('"', '""') + '"'
+        for value in row
+    )
+    return ",".join(fields) + "\n"
@@ -0,0 +1,731 @@
+"""Hive-style partitioned datasets of tabular part files."""
+
+from __future__ import annotations
+
+import io
+import itertools
+import os
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, Protocol, TextIO, cast
+from urllib.parse import quote
+
+from limbo_core.domain.validation import ValidationError
+from limbo_core.domain.value_objects import (
+    CellValue,
+    ResolvedStorageRef,
+    TabularBatch,
+)
+
+from .tabular_file_utils import (
+    cell_from_json_value,
+    cell_to_json_value,
+    dump_json_bytes,
+    empty_batch,
+    iter_checked_chunks,
+    load_json_document_from_bytes,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+    from pathlib import Path
+
+    from limbo_core.application.interfaces.persistence import ColumnTypes
+
+    PartLoader = Callable[[ResolvedStorageRef], TabularBatch]
+
+
+class PartWriter(Protocol):
+    """Single-file writer of one dataset part."""
+
+    def __call__(
+        self,
+        ref: ResolvedStorageRef,
+        column_names: tuple[str, ...],
+        chunks: Iterable[TabularBatch],
+        *,
+        column_types: ColumnTypes | None = None,
+    ) -> None:
+        """Write ``chunks`` to the part file ``ref``."""
+
+
+DATASET_MANIFEST_NAME = "_dataset.json"
+"""Object listing a dataset's parts; ``_`` makes readers skip it."""
+
+DATASET_MANIFEST_VERSION = 1
+
+DEFAULT_PARTITION_BUFFER_ROWS = 100_000
+"""Rows buffered per partition value without ``max_rows_per_file``."""
+
+HIVE_NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+@dataclass(kw_only=True)
+class DatasetOptions:
+    """Config switching a file backend from one file to a dataset.
+
+    With ``dataset`` set an artifact is the directory ``<name>/`` of part
+    files ``part-00000-<write id>.<ext>``, ... A part is closed once it holds
+    ``max_rows_per_file`` rows or ``max_bytes_per_file`` bytes (checked
+    between chunks, before stream compression). ``partition_by`` columns
+    are moved into ``<column>=<value>/`` directories. Parts are read back
+    by up to ``read_workers`` threads.
+    """
+
+    dataset: bool = False
+    max_rows_per_file: int | None = None
+    max_bytes_per_file: int | None = None
+    partition_by: Sequence[str] = ()
+    read_workers: int | None = None
+
+    def _validate_dataset_options(self) -> None:
+        """Check the dataset options and freeze ``partition_by``.
+
+        Raises:
+            ValidationError: If a limit is not positive, or sharding options
+                are set without ``dataset``.
+        """
+        self.partition_by = tuple(self.partition_by)
+        for name in ("max_rows_per_file", "max_bytes_per_file", "read_workers"):
+            value = getattr(self, name)
+            if value is not None and value < 1:
+                raise ValidationError(f"{name} must be at least 1")
+        if not self.dataset and (
+            self.partition_by
+            or self.max_rows_per_file is not None
+            or self.max_bytes_per_file is not None
+        ):
+            raise ValidationError(
+                "partition_by, max_rows_per_file and max_bytes_per_file "
+                "require dataset: true"
+            )
+
+    def _dataset_layout(
+        self, extension: str, write_part: PartWriter, load_part: PartLoader
+    ) -> TabularDataset:
+        """Return the dataset layout of this backend's configuration.
+
+        Returns:
+            A layout writing ``<extension>`` parts with ``write_part``.
+        """
+        return TabularDataset(
+            extension=extension,
+            write_part=write_part,
+            load_part=load_part,
+            max_rows_per_file=self.max_rows_per_file,
+            max_bytes_per_file=self.max_bytes_per_file,
+            partition_by=tuple(self.partition_by),
+            read_workers=self.read_workers,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _Part:
+    """One part file and the partition values of its rows."""
+
+    path: str
+    partition: dict[str, CellValue] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class TabularDataset:
+    """Read and write an artifact as a directory of part files.
+
+    Parts are written and read by the owning backend's single-file
+    ``write_part`` and ``load_part``. The manifest ``_dataset.json`` records
+    the column order, the parts and their partition values, so partition
+    columns load back with their original types. Each write names its parts
+    with a fresh write id and publishes them by replacing the manifest last,
+    so readers see either the previous or the new parts, never a mix; the
+    previous write's parts (and leftovers of interrupted ones) are removed
+    afterwards.
+    """
+
+    extension: str
+    write_part: PartWriter
+    load_part: PartLoader
+    max_rows_per_file: int | None = None
+    max_bytes_per_file: int | None = None
+    partition_by: tuple[str, ...] = ()
+    read_workers: int | None = None
+
+    def save(
+        self,
+        ref: ResolvedStorageRef,
+        column_names: tuple[str, ...],
+        chunks: Iterable[TabularBatch],
+        *,
+        column_types: ColumnTypes | None = None,
+    ) -> None:
+        """Replace the dataset at ``ref`` with the rows of ``chunks``.
+
+        ``column_types`` is passed to every part writer, so parts agree on
+        the types of columns that are all-null within a part.
+
+        Raises:
+            ValidationError: If ``partition_by`` names unknown columns or
+                leaves no data column.
+        """
+        unknown = [c for c in self.partition_by if c not in column_names]
+        if unknown:
+            raise ValidationError(f"unknown partition columns {unknown!r}")
+        file_columns = tuple(
+            c for c in column_names if c not in self.partition_by
+        )
+        if not file_columns:
+            raise ValidationError("partition_by must leave a data column")
+        previous = ref.list_children()
+        checked = iter_checked_chunks(column_names, chunks)
+        write = _PartWrite(self, ref, uuid.uuid4().hex, column_types)
+        if self.partition_by:
+            parts = _PartitionedWriter(write, file_columns).write(checked)
+        else:
+            parts = [
+                _Part(path) for path in write.parts("", file_columns, checked)
+            ]
+        manifest = {
+            "version": DATASET_MANIFEST_VERSION,
+            "column_names": list(column_names),
+            "partition_by": list(self.partition_by),
+            "parts": [
+                {
+                    "path": part.path,
+                    "partition": {
+                        k: cell_to_json_value(v)
+                        for k, v in part.partition.items()
+                    },
+                }
+                for part in parts
+            ],
+        }
+        ref.child(DATASET_MANIFEST_NAME).write_bytes(dump_json_bytes(manifest))
+        written = {part.path for part in parts} | {DATASET_MANIFEST_NAME}
+        for name in previous:
+            if name not in written:
+                ref.child(name).unlink()
+
+    def exists(self, ref: ResolvedStorageRef) -> bool:
+        """Return True if the dataset at ``ref`` has a manifest."""
+        return ref.child(DATASET_MANIFEST_NAME).exists()
+
+    def cleanup(self, ref: ResolvedStorageRef) -> None:
+        """Remove the manifest and every part of the dataset at ``ref``."""
+        for name in ref.list_children():
+            ref.child(name).unlink()
+
+    def load(self, ref: ResolvedStorageRef) -> TabularBatch:
+        """Read every part of the dataset at ``ref`` in parallel.
+
+        Returns:
+            All rows, in part order.
+        """
+        column_names, parts = self._read_manifest(ref)
+        return TabularBatch.concat(
+            column_names, self._iter_parts(ref, column_names, parts)
+        )
+
+    def iter_load(
+        self, ref: ResolvedStorageRef, *, chunk_rows: int
+    ) -> Iterator[TabularBatch]:
+        """Stream the dataset at ``ref`` in batches of ``chunk_rows`` rows.
+
+        Returns:
+            An iterator yielding at least one batch, in part order.
+        """
+        column_names, parts = self._read_manifest(ref)
+        return self._iter_load(ref, column_names, parts, chunk_rows)
+
+    def _iter_load(
+        self,
+        ref: ResolvedStorageRef,
+        column_names: tuple[str, ...],
+        parts: list[_Part],
+        chunk_rows: int,
+    ) -> Iterator[TabularBatch]:
+        """Slice the parts of the dataset into batches.
+
+        Yields:
+            Batches of at most ``chunk_rows`` rows; one empty batch for a
+            dataset without rows.
+        """
+        produced = False
+        for batch in self._iter_parts(ref, column_names, parts):
+            for start in range(0, batch.num_rows, chunk_rows):
+                produced = True
+                yield batch.slice(start, start + chunk_rows)
+        if not produced:
+            yield empty_batch(column_names)
+
+    def _iter_parts(
+        self,
+        ref: ResolvedStorageRef,
+        column_names: tuple[str, ...],
+        parts: list[_Part],
+    ) -> Iterator[TabularBatch]:
+        """Load parts in order, reading ahead on worker threads.
+
+        At most one part per worker is loaded ahead of the consumer; with a
+        single worker parts are read on the calling thread.
+
+        Yields:
+            One batch per part.
+        """
+        workers = self._workers(len(parts))
+        if workers == 1:
+            for part in parts:
+                yield self._load(ref, column_names, part)
+            return
+        executor = ThreadPoolExecutor(workers)
+        remaining = iter(parts)
+        try:
+            pending: deque[Future[TabularBatch]] = deque(
+                executor.submit(self._load, ref, column_names, part)
+                for part in itertools.islice(remaining, workers)
+            )
+            while pending:
+                batch = pending.popleft().result()
+                following = next(remaining, None)
+                if following is not None:
+                    pending.append(
+                        executor.submit(
+                            self._load, ref, column_names, following
+                        )
+                    )
+                yield batch
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def _workers(self, parts: int) -> int:
+        """Return the number of read threads for ``parts`` parts.
+
+        Returns:
+            ``read_workers`` (default as for ``ThreadPoolExecutor``),
+            capped at the number of parts.
+        """
+        workers = self.read_workers or min(32, (os.cpu_count() or 1) + 4)
+        return max(1, min(workers, parts))
+
+    def _load(
+        self,
+        ref: ResolvedStorageRef,
+        column_names: tuple[str, ...],
+        part: _Part,
+    ) -> TabularBatch:
+        """Load one part and restore its partition columns.
+
+        Returns:
+            The part's rows with ``column_names``.
+        """
+        batch = self.load_part(ref.child(part.path))
+        if not part.partition:
+            return batch.select(column_names)
+        rows = batch.num_rows
+        return TabularBatch.from_columns(
+            column_names,
+            {
+                name: (
+                    [part.partition[name]] * rows
+                    if name in part.partition
+                    else batch.column(name)
+                )
+                for name in column_names
+            },
+        )
+
+    @staticmethod
+    def _read_manifest(
+        ref: ResolvedStorageRef,
+    ) -> tuple[tuple[str, ...], list[_Part]]:
+        """Read the column names and parts of the dataset at ``ref``.
+
+        Returns:
+            The dataset's column names and its parts in order.
+
+        Raises:
+            FileNotFoundError: If the dataset has no manifest.
+            ValidationError: If the manifest is malformed.
+        """
+        manifest_ref = ref.child(DATASET_MANIFEST_NAME)
+        if not manifest_ref.exists():
+            raise FileNotFoundError(ref.uri)
+        doc = load_json_document_from_bytes(manifest_ref.read_bytes())
+        if doc.get("version") != DATASET_MANIFEST_VERSION:
+            raise ValidationError(
+                f"{manifest_ref.uri}: dataset manifest version must be "
+                f"{DATASET_MANIFEST_VERSION}"
+            )
+        try:
+            column_names = tuple(str(c) for c in doc["column_names"])
+            parts = [
+                _Part(
+                    str(item["path"]),
+                    {
+                        str(k): cell_from_json_value(v)
+                        for k, v in item["partition"].items()
+                    },
+                )
+                for item in doc["parts"]
+            ]
+        except (KeyError, TypeError, AttributeError) as err:
+            raise ValidationError(
+                f"{manifest_ref.uri}: malformed dataset manifest"
+            ) from err
+        return column_names, parts
+
+
+@dataclass(frozen=True, slots=True)
+class _PartWrite:
+    """Write parts of one ``TabularDataset.save`` under write id ``token``."""
+
+    dataset: TabularDataset
+    ref: ResolvedStorageRef
+    token: str
+    column_types: ColumnTypes | None
+
+    def parts(
+        self,
+        directory: str,
+        column_names: tuple[str, ...],
+        chunks: Iterator[TabularBatch],
+        first_index: int = 0,
+    ) -> list[str]:
+        """Write ``chunks`` as consecutive parts in ``directory``.
+
+        Returns:
+            The paths of the written parts, relative to ``ref``.
+        """
+        dataset = self.dataset
+        feed = _PartFeed(chunks, dataset.max_rows_per_file)
+        paths: list[str] = []
+        while feed.has_more():
+            path = (
+                f"{directory}part-{first_index + len(paths):05d}-"
+                f"{self.token}{dataset.extension}"
+            )
+            target = _CountingStorageRef(self.ref.child(path))
+            dataset.write_part(
+                target,
+                column_names,
+                feed.part(target, dataset.max_bytes_per_file),
+                column_types=self.column_types,
+            )
+            paths.append(path)
+        return paths
+
+
+class _PartitionedWriter:
+    """Route rows to per-partition buffers and write them as parts.
+
+    A partition's rows are written once ``max_rows_per_file`` (default
+    ``DEFAULT_PARTITION_BUFFER_ROWS``) of them are buffered, and at the end
+    of the input, so memory holds at most that many rows per partition.
+    """
+
+    __slots__ = (
+        "_buffered",
+        "_buffers",
+        "_file_columns",
+        "_flush_rows",
+        "_next_index",
+        "_parts",
+        "_write",
+    )
+
+    def __init__(
+        self, write: _PartWrite, file_columns: tuple[str, ...]
+    ) -> None:
+        """Prepare empty buffers for writing parts through ``write``."""
+        self._write = write
+        self._file_columns = file_columns
+        self._flush_rows = (
+            write.dataset.max_rows_per_file or DEFAULT_PARTITION_BUFFER_ROWS
+        )
+        self._buffers: dict[tuple[CellValue, ...], list[TabularBatch]] = {}
+        self._buffered: dict[tuple[CellValue, ...], int] = {}
+        self._next_index: dict[tuple[CellValue, ...], int] = {}
+        self._parts: list[_Part] = []
+
+    def write(self, chunks: Iterator[TabularBatch]) -> list[_Part]:
+        """Write all rows of ``chunks``.
+
+        Returns:
+            The written parts, grouped by partition.
+        """
+        partition_by = self._write.dataset.partition_by
+        for chunk in chunks:
+            keys = zip(*(chunk.column(c) for c in partition_by), strict=True)
+            groups: dict[tuple[CellValue, ...], list[int]] = {}
+            for i, key in enumerate(keys):
+                groups.setdefault(key, []).append(i)
+            rows = chunk.select(self._file_columns)
+            for key, indices in groups.items():
+                part = rows if len(groups) == 1 else rows.take(indices)
+                self._buffers.setdefault(key, []).append(part)
+                self._buffered[key] = self._buffered.get(key, 0) + len(indices)
+                if self._buffered[key] >= self._flush_rows:
+                    self._flush(key, final=False)
+        for key in list(self._buffers):
+            self._flush(key, final=True)
+        self._parts.sort(key=lambda part: part.path)
+        return self._parts
+
+    def _flush(self, key: tuple[CellValue, ...], *, final: bool) -> None:
+        """Write the buffered rows of partition ``key`` as parts.
+
+        Unless ``final``, rows short of a full part stay buffered.
+        """
+        rows = TabularBatch.concat(self._file_columns, self._buffers.pop(key))
+        keep = 0 if final else rows.num_rows % self._flush_rows
+        write_rows = rows.num_rows - keep
+        self._buffered[key] = keep
+        if keep:
+            self._buffers[key] = [rows.slice(write_rows, rows.num_rows)]
+        partition = dict(
+            zip(self._write.dataset.partition_by, key, strict=True)
+        )
+        directory = "".join(
+            f"{_path_segment(c)}={_partition_segment(v)}/"
+            for c, v in partition.items()
+        )
+        paths = self._write.parts(
+            directory,
+            self._file_columns,
+            iter((rows.slice(0, write_rows),)),
+            self._next_index.get(key, 0),
+        )
+        self._next_index[key] = self._next_index.get(key, 0) + len(paths)
+        self._parts.extend(_Part(path, partition) for path in paths)
+
+
+def _path_segment(text: str) -> str:
+    """Escape ``text`` for use as one path segment.
+
+    Returns:
+        ``text`` with ``/``, ``=``, ``%`` and other unsafe characters
+        percent-encoded.
+    """
+    return quote(text, safe="")
+
+
+def _partition_segment(value: CellValue) -> str:
+    """Render a partition value as Hive does in directory names.
+
+    Returns:
+        The escaped value; ``__HIVE_DEFAULT_PARTITION__`` for None.
+    """
+    if value is None:
+        return HIVE_NULL_PARTITION
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (date, datetime)):
+        return _path_segment(value.isoformat())
+    return _path_segment(str(value))
+
+
+class _PartFeed:
+    """Cut a chunk stream into parts, splitting chunks at row limits."""
+
+    __slots__ = ("_chunks", "_max_rows", "_pending")
+
+    def __init__(
+        self, chunks: Iterator[TabularBatch], max_rows: int | None
+    ) -> None:
+        """Feed parts of at most ``max_rows`` rows from ``chunks``."""
+        self._chunks = chunks
+        self._max_rows = max_rows
+        self._pending: TabularBatch | None = None
+
+    def has_more(self) -> bool:
+        """Return True if rows remain, skipping empty chunks."""
+        while self._pending is None:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return False
+            if chunk.num_rows:
+                self._pending = chunk
+        return True
+
+    def part(
+        self, target: _CountingStorageRef, max_bytes: int | None
+    ) -> Iterator[TabularBatch]:
+        """Yield the chunks of one part.
+
+        The part ends at ``max_rows`` rows, or before the next chunk once
+        ``max_bytes`` bytes were written to ``target``; it always takes at
+        least one chunk, since writers may emit headers before reading.
+
+        Yields:
+            Chunks, the last one possibly cut at the row limit.
+        """
+        rows = 0
+        while self.has_more():
+            if (
+                rows
+                and max_bytes is not None
+                and target.bytes_written >= max_bytes
+            ):
+                return
+            chunk = cast("TabularBatch", self._pending)
+            room = None if self._max_rows is None else self._max_rows - rows
+            if room is not None and chunk.num_rows > room:
+                self._pending = chunk.slice(room, chunk.num_rows)
+                yield chunk.slice(0, room)
+                return
+            self._pending = None
+            rows += chunk.num_rows
+            yield chunk
+            if rows == self._max_rows:
+                return
+
+
+class _CountingStorageRef(ResolvedStorageRef):
+    """Ref forwarding to ``target`` that counts the bytes written to it."""
+
+    __slots__ = ("bytes_written", "target")
+
+    def __init__(self, target: ResolvedStorageRef) -> None:
+        """Wrap ``target`` with a zero byte count."""
+        self.target = target
+        self.bytes_written = 0
+
+    @property
+    def backend(self) -> str:
+        """Storage backend of the target."""
+        return self.target.backend
+
+    @property
+    def uri(self) -> str:
+        """URI of the target."""
+        return self.target.uri
+
+    def exists(self) -> bool:
+        """Return True if the target exists."""
+        return self.target.exists()
+
+    def unlink(self) -> None:
+        """Remove the target."""
+        self.target.unlink()
+
+    def as_local_path(self) -> Path:
+        """Return the target's local path."""
+        return self.target.as_local_path()
+
+    def read_bytes(self) -> bytes:
+        """Read the target.
+
+        Returns:
+            The target's bytes.
+        """
+        return self.target.read_bytes()
+
+    def write_bytes(self, data: bytes) -> None:
+        """Replace the target with ``data``."""
+        self.bytes_written += len(data)
+        self.target.write_bytes(data)
+
+    @contextmanager
+    def open_binary(
+        self, mode: Literal["rb", "wb", "ab"]
+    ) -> Iterator[BinaryIO]:
+        """Open the target, counting bytes written through the stream.
+
+        Yields:
+            A stream over the target.
+        """
+        with self.target.open_binary(mode) as raw:
+            if mode == "rb":
+                yield raw
+            else:
+                yield cast("BinaryIO", _CountingWriter(raw, self))
+
+    @contextmanager
+    def open_atomic_binary(self, *, fsync: bool = False) -> Iterator[BinaryIO]:
+        """Atomically replace the target, counting bytes written.
+
+        Yields:
+            A stream over the target's atomic writer.
+        """
+        with self.target.open_atomic_binary(fsync=fsync) as raw:
+            yield cast("BinaryIO", _CountingWriter(raw, self))
+
+    @contextmanager
+    def open_text(
+        self,
+        mode: Literal["r", "w", "a"],
+        *,
+        encoding: str,
+        newline: str | None = None,
+    ) -> Iterator[TextIO]:
+        """Open the target in text mode over a counting binary stream.
+
+        Text is written through unbuffered, so the count stays current.
+
+        Yields:
+            A text stream over the target.
+        """
+        binary_mode = cast("Literal['rb', 'wb', 'ab']", f"{mode}b")
+        with self.open_binary(binary_mode) as raw:
+            yield from _write_through_text(raw, encoding, newline)
+
+    @contextmanager
+    def open_atomic_text(
+        self, *, encoding: str, newline: str | None = None, fsync: bool = False
+    ) -> Iterator[TextIO]:
+        """Open an atomic text stream, written through like ``open_text``.
+
+        Yields:
+            A text stream over the target's atomic writer.
+        """
+        with self.open_atomic_binary(fsync=fsync) as raw:
+            yield from _write_through_text(raw, encoding, newline)
+
+
+def _write_through_text(
+    raw: BinaryIO, encoding: str, newline: str | None
+) -> Iterator[TextIO]:
+    """Yield an unbuffered text wrapper over ``raw``, detached afterwards."""
+    text = io.TextIOWrapper(
+        cast("Any", raw), encoding=encoding, newline=newline, write_through=True
+    )
+    try:
+        yield text
+    finally:
+        text.flush()
+        text.detach()
+
+
+class _CountingWriter(io.RawIOBase):
+    """Write-only stream adding the bytes it forwards to a ref's count."""
+
+    def __init__(self, raw: BinaryIO, ref: _CountingStorageRef) -> None:
+        """Forward writes to ``raw``."""
+        super().__init__()
+        self._raw = raw
+        self._ref = ref
+
+    def writable(self) -> bool:
+        """Return True."""
+        return True
+
+    def tell(self) -> int:
+        """Return the number of bytes written."""
+        return self._ref.bytes_written
+
+    def write(self, data: Any) -> int:
+        """Forward ``data`` to the wrapped stream.
+
+        Returns:
+            The number of bytes written.
+        """
+        size = len(memoryview(data).cast("B"))
+        self._raw.write(data)
+        self._ref.bytes_written += size
+        return size
+
+    def flush(self) -> None:
+        """Flush the wrapped stream."""
+        self._raw.flush()
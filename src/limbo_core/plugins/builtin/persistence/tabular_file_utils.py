@@ -3,13 +3,33 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 from limbo_core.adapters.connections.errors import MissingPackageError
+from limbo_core.application.interfaces.persistence import (
+    DEFAULT_CHUNK_ROWS,
+    validate_row_filters,
+)
+from limbo_core.domain.entities import DataType
 from limbo_core.domain.validation import ValidationError
-from limbo_core.domain.value_objects import CellValue, TabularBatch
+from limbo_core.domain.value_objects import (
+    COMPRESSION_SUFFIXES,
+    CellValue,
+    StreamCompression,
+    TabularBatch,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from limbo_core.application.interfaces.persistence import (
+        ColumnTypes,
+        RowFilter,
+    )
 
 
 def safe_filename_stem(name: str) -> str:
@@ -27,6 +47,38 @@ def safe_filename_stem(name: str) -> str:
     return stem.replace("\x00", "")
 
 
+def require_stream_compression(compression: object) -> StreamCompression | None:
+    """Validate a file backend's ``compression`` setting.
+
+    Returns:
+        The codec, or None for uncompressed files.
+
+    Raises:
+        ValidationError: If the codec is not gzip, zstd or brotli.
+    """
+    if compression is not None and compression not in COMPRESSION_SUFFIXES:
+        raise ValidationError(
+            "compression must be None, 'gzip', 'zstd' or 'brotli', "
+            f"got {compression!r}"
+        )
+    return compression  # type: ignore[return-value]
+
+
+def compressed_filename(
+    filename: str, compression: StreamCompression | None
+) -> str:
+    """Append the codec suffix (e.g. ``.gz``) to ``filename``.
+
+    Storage refs infer the codec from this suffix when reading and writing.
+
+    Returns:
+        ``filename`` with the codec suffix, or unchanged when uncompressed.
+    """
+    if compression is None:
+        return filename
+    return f"{filename}{COMPRESSION_SUFFIXES[compression]}"
+
+
 def ensure_parent_dir(path: Path) -> None:
     """Create parent directories for a file path if missing."""
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -65,6 +117,334 @@ def normalize_arrow_scalar(value: Any) -> CellValue:
     return str(value)
 
 
+def _is_native_arrow_type(data_type: Any) -> bool:
+    """Return True if ``to_pylist`` already yields valid cell values.
+
+    Returns:
+        Whether values of ``data_type`` need no per-cell normalization.
+    """
+    import pyarrow.types as pat
+
+    return bool(
+        pat.is_null(data_type)
+        or pat.is_boolean(data_type)
+        or pat.is_integer(data_type)
+        or pat.is_float32(data_type)
+        or pat.is_float64(data_type)
+        or pat.is_string(data_type)
+        or pat.is_large_string(data_type)
+        or pat.is_date(data_type)
+        or (pat.is_timestamp(data_type) and data_type.unit != "ns")
+    )
+
+
+def arrow_column_to_list(array: Any) -> list[CellValue]:
+    """Convert a PyArrow array to cell values in bulk.
+
+    Natively typed columns (ints, floats, bools, strings, dates, timestamps)
+    are returned as produced by ``to_pylist``; other types are normalized
+    per cell with ``normalize_arrow_scalar``.
+
+    Returns:
+        The column's values as a list.
+    """
+    values: list[CellValue] = array.to_pylist()
+    if _is_native_arrow_type(array.type):
+        return values
+    return [normalize_arrow_scalar(v) for v in values]
+
+
+def arrow_filter_expression(filters: Sequence[RowFilter]) -> Any:
+    """Build a PyArrow compute expression combining ``filters`` with AND.
+
+    Nulls never match, including for ``not in``.
+
+    Returns:
+        A ``pyarrow.compute.Expression`` usable as a dataset/table filter.
+    """
+    import pyarrow.compute as pc
+
+    validate_row_filters(filters)
+    expression: Any = None
+    for column, op, value in filters:
+        field = pc.field(column)
+        if op in ("==", "="):
+            term = field == value
+        elif op == "!=":
+            term = field != value
+        elif op == "<":
+            term = field < value
+        elif op == "<=":
+            term = field <= value
+        elif op == ">":
+            term = field > value
+        elif op == ">=":
+            term = field >= value
+        elif op == "in":
+            term = field.isin(list(value))
+        else:
+            term = field.is_valid() & ~field.isin(list(value))
+        expression = term if expression is None else expression & term
+    return expression
+
+
+def arrow_type_for(data_type: DataType) -> Any:
+    """Return the PyArrow type used to decode ``data_type`` columns.
+
+    ``DATETIME`` maps to a naive and ``TIMESTAMP`` to a UTC ``timestamp``.
+
+    Returns:
+        A ``pyarrow.DataType``.
+    """
+    pa = try_import_pyarrow()
+    return {
+        DataType.STRING: pa.string(),
+        DataType.INTEGER: pa.int64(),
+        DataType.FLOAT: pa.float64(),
+        DataType.BOOLEAN: pa.bool_(),
+        DataType.DATE: pa.date32(),
+        DataType.DATETIME: pa.timestamp("us"),
+        DataType.TIMESTAMP: pa.timestamp("us", tz="UTC"),
+    }[data_type]
+
+
+def batch_from_arrow_table(table: Any) -> TabularBatch:
+    """Convert a PyArrow table to a column-major batch.
+
+    Returns:
+        A ``TabularBatch`` with one converted list per column.
+    """
+    column_names = tuple(str(c) for c in table.column_names)
+    columns = {
+        name: arrow_column_to_list(table.column(i))
+        for i, name in enumerate(column_names)
+    }
+    return TabularBatch.from_columns(column_names, columns)
+
+
+class LazyArrowColumn(Sequence[CellValue]):
+    """Read-only column view over a PyArrow array, decoded on first access.
+
+    ``len`` and contiguous slices stay in Arrow; indexing or iterating
+    converts the whole column to normalized Python values once.
+    """
+
+    __slots__ = ("_array", "_values")
+
+    def __init__(self, array: Any) -> None:
+        """Wrap a PyArrow ``Array`` or ``ChunkedArray``."""
+        self._array = array
+        self._values: list[CellValue] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of values without decoding them."""
+        return len(self._array)
+
+    @overload
+    def __getitem__(self, index: int) -> CellValue: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[CellValue]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """Return one value or a slice (contiguous slices stay lazy).
+
+        Returns:
+            A cell value, or a sequence for slices.
+        """
+        if isinstance(index, slice) and self._values is None:
+            start, stop, step = index.indices(len(self._array))
+            if step == 1:
+                length = max(0, stop - start)
+                return LazyArrowColumn(self._array.slice(start, length))
+        return self.to_list()[index]
+
+    def __iter__(self) -> Iterator[CellValue]:
+        """Iterate the decoded values.
+
+        Returns:
+            An iterator over the cached list of cell values.
+        """
+        return iter(self.to_list())
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the wrapped Arrow buffers in bytes, without decoding."""
+        return int(self._array.nbytes)
+
+    def to_list(self) -> list[CellValue]:
+        """Decode (once) and return the column as normalized Python values.
+
+        Returns:
+            The cached list of cell values.
+        """
+        if self._values is None:
+            self._values = arrow_column_to_list(self._array)
+        return self._values
+
+
+def lazy_batch_from_arrow_table(table: Any) -> TabularBatch:
+    """Wrap a PyArrow table as a batch whose columns decode on first access.
+
+    Returns:
+        A column-major ``TabularBatch`` backed by ``LazyArrowColumn`` views.
+    """
+    column_names = tuple(str(c) for c in table.column_names)
+    columns = {
+        name: LazyArrowColumn(table.column(i))
+        for i, name in enumerate(column_names)
+    }
+    return TabularBatch.from_columns(column_names, columns)
+
+
+def empty_batch(column_names: Iterable[str]) -> TabularBatch:
+    """Return a zero-row batch with the given columns.
+
+    Returns:
+        A column-major ``TabularBatch`` with no rows.
+    """
+    names = tuple(column_names)
+    return TabularBatch.from_columns(names, {c: [] for c in names})
+
+
+def require_chunk_rows(chunk_rows: int) -> None:
+    """Validate a streaming chunk size.
+
+    Raises:
+        ValidationError: If ``chunk_rows`` is not positive.
+    """
+    if chunk_rows < 1:
+        raise ValidationError("chunk_rows must be at least 1")
+
+
+def iter_checked_chunks(
+    column_names: tuple[str, ...], chunks: Iterable[TabularBatch]
+) -> Iterator[TabularBatch]:
+    """Yield chunks, rejecting any whose columns differ from ``column_names``.
+
+    Yields:
+        The input chunks in order.
+
+    Raises:
+        ValidationError: If a chunk has different column names.
+    """
+    for i, chunk in enumerate(chunks):
+        if chunk.column_names != column_names:
+            raise ValidationError(
+                f"chunk {i} columns {chunk.column_names!r} "
+                "do not match column_names"
+            )
+        yield chunk
+
+
+def arrow_table_stream(
+    column_names: tuple[str, ...],
+    chunks: Iterable[TabularBatch],
+    column_types: ColumnTypes | None = None,
+    *,
+    inference_rows: int = DEFAULT_CHUNK_ROWS,
+) -> tuple[Any, Iterator[Any]]:
+    """Convert chunks to PyArrow tables sharing one schema.
+
+    Columns in ``column_types`` get their declared Arrow type. Other columns
+    are inferred: leading chunks are buffered until every such column has a
+    non-null value or ``inference_rows`` rows were read, and their schemas
+    are unified with permissive promotion (``null`` widens to any type,
+    ``int64`` to ``double``). A column that is still all-null keeps Arrow's
+    ``null`` type.
+
+    Returns:
+        The schema and an iterator of tables conforming to it (at least one,
+        empty if there are no chunks).
+    """
+    pa = try_import_pyarrow()
+    types = column_types or {}
+    declared = {
+        name: arrow_type_for(types[name])
+        for name in column_names
+        if name in types
+    }
+    checked = iter_checked_chunks(column_names, chunks)
+    buffered: list[Any] = []
+    buffered_rows = 0
+    untyped = [name for name in column_names if name not in declared]
+    for chunk in checked:
+        table = _arrow_table(pa, chunk, declared)
+        buffered.append(table)
+        buffered_rows += table.num_rows
+        untyped = [
+            name
+            for name in untyped
+            if pa.types.is_null(table.schema.field(name).type)
+        ]
+        if not untyped or buffered_rows >= inference_rows:
+            break
+    if not buffered:
+        buffered.append(_arrow_table(pa, empty_batch(column_names), declared))
+    schema = pa.unify_schemas(
+        [table.schema for table in buffered], promote_options="permissive"
+    )
+    types_by_name = {field.name: field.type for field in schema}
+
+    def tables() -> Iterator[Any]:
+        for table in buffered:
+            yield table.cast(schema)
+        buffered.clear()
+        for chunk in checked:
+            yield _arrow_table(pa, chunk, types_by_name)
+
+    return schema, tables()
+
+
+def _arrow_table(pa: Any, chunk: TabularBatch, types: dict[str, Any]) -> Any:
+    """Build a PyArrow table from ``chunk`` with the given column types.
+
+    Columns missing from ``types`` are inferred by PyArrow.
+
+    Returns:
+        A ``pyarrow.Table``.
+
+    Raises:
+        ValidationError: If a column's values do not fit its type.
+    """
+    arrays = []
+    for name in chunk.column_names:
+        arrow_type = types.get(name)
+        try:
+            arrays.append(pa.array(chunk.column(name), type=arrow_type))
+        except (pa.ArrowException, TypeError, OverflowError) as err:
+            if arrow_type is None:
+                message = f"cannot be converted to Arrow: {err}"
+            elif pa.types.is_null(arrow_type):
+                message = (
+                    "had no values in the leading chunks used to infer "
+                    "the Arrow schema; declare its type via column_types"
+                )
+            else:
+                message = f"does not match Arrow type {arrow_type}: {err}"
+            raise ValidationError(f"Column {name!r} {message}") from err
+    return pa.Table.from_arrays(arrays, names=list(chunk.column_names))
+
+
+def iter_batches_from_arrow(
+    record_batches: Iterable[Any],
+    column_names: tuple[str, ...],
+    chunk_rows: int,
+) -> Iterator[TabularBatch]:
+    """Convert PyArrow record batches to batches of at most ``chunk_rows``.
+
+    Yields:
+        Column-major batches; one empty batch if there are no rows at all.
+    """
+    produced = False
+    for record_batch in record_batches:
+        for start in range(0, record_batch.num_rows, chunk_rows):
+            produced = True
+            yield batch_from_arrow_table(record_batch.slice(start, chunk_rows))
+    if not produced:
+        yield empty_batch(column_names)
+
+
 def cell_to_json_value(value: CellValue) -> Any:
     """Convert a cell to a JSON-serializable value (tagged for dates).
 
@@ -108,11 +488,12 @@ def tabular_batch_to_json_document(batch: TabularBatch) -> dict[str, Any]:
     Returns:
         A mapping with ``column_names`` and ``rows`` suitable for JSON.
     """
+    names = batch.column_names
     return {
-        "column_names": list(batch.column_names),
+        "column_names": list(names),
         "rows": [
-            {k: cell_to_json_value(row[k]) for k in batch.column_names}
-            for row in batch.rows
+            dict(zip(names, map(cell_to_json_value, values), strict=True))
+            for values in batch.iter_row_values()
         ],
     }
 
@@ -135,43 +516,130 @@ def tabular_batch_from_json_document(doc: Any) -> TabularBatch:
     if not isinstance(rows_raw, list):
         raise ValidationError("rows must be a list")
     column_names = tuple(cols)
-    rows: list[dict[str, CellValue]] = []
+    columns: dict[str, list[CellValue]] = {c: [] for c in column_names}
     for i, item in enumerate(rows_raw):
         if not isinstance(item, dict):
             raise ValidationError(f"rows[{i}] must be an object")
-        rows.append({k: cell_from_json_value(item[k]) for k in column_names})
-    return TabularBatch(column_names=column_names, rows=tuple(rows))
+        for k in column_names:
+            columns[k].append(cell_from_json_value(item[k]))
+    return TabularBatch.from_columns(column_names, columns)
+
+
+JsonCodecName = Literal["msgspec", "orjson", "stdlib"]
+
+JSON_CODEC_PREFERENCE: tuple[JsonCodecName, ...] = (
+    "msgspec",
+    "orjson",
+    "stdlib",
+)
+"""Codecs tried, fastest first, when none is configured."""
+
+
+@dataclass(frozen=True, slots=True)
+class JsonCodec:
+    """Compact UTF-8 JSON encoder and decoder of one library."""
+
+    name: JsonCodecName
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+
+def _stdlib_json_codec() -> JsonCodec:
+    encoder = json.JSONEncoder(separators=(",", ":"))
+    decoder = json.JSONDecoder()
+
+    def dumps(doc: Any) -> bytes:
+        return encoder.encode(doc).encode("utf-8")
+
+    def loads(raw: bytes) -> Any:
+        return decoder.decode(raw.decode("utf-8"))
+
+    return JsonCodec(name="stdlib", dumps=dumps, loads=loads)
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
 
+    return JsonCodec(name="orjson", dumps=orjson.dumps, loads=orjson.loads)
 
-def dump_json_bytes(doc: dict[str, Any]) -> bytes:
-    """Serialize document to UTF-8 bytes (orjson if available).
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec
+
+    return JsonCodec(
+        name="msgspec",
+        dumps=msgspec.json.Encoder().encode,
+        loads=msgspec.json.Decoder().decode,
+    )
+
+
+_JSON_CODEC_FACTORIES: dict[str, Callable[[], JsonCodec]] = {
+    "msgspec": _msgspec_codec,
+    "orjson": _orjson_codec,
+    "stdlib": _stdlib_json_codec,
+}
+
+
+def resolve_json_codec(name: str | None = None) -> JsonCodec:
+    """Import the JSON codec ``name``, or the fastest installed one.
+
+    Resolve codecs once (per module or backend) and reuse them: resolving
+    imports the library.
 
     Returns:
-        UTF-8 encoded JSON bytes.
+        The codec; the stdlib one when neither msgspec nor orjson imports.
+
+    Raises:
+        ValidationError: If ``name`` is not a known codec.
+        MissingPackageError: If the library of ``name`` is not installed.
     """
-    try:
-        import orjson
+    if name is not None:
+        factory = _JSON_CODEC_FACTORIES.get(name)
+        if factory is None:
+            raise ValidationError(
+                f"json_codec must be one of {list(JSON_CODEC_PREFERENCE)}, "
+                f"got {name!r}"
+            )
+        try:
+            return factory()
+        except ImportError as err:
+            raise MissingPackageError(name) from err
+    for candidate in JSON_CODEC_PREFERENCE[:-1]:
+        try:
+            return _JSON_CODEC_FACTORIES[candidate]()
+        except ImportError:
+            continue
+    return _stdlib_json_codec()
+
+
+DEFAULT_JSON_CODEC = resolve_json_codec()
+"""Codec used by ``dump_json_bytes`` and ``load_json_document_from_bytes``."""
+
+
+def dump_json_bytes(
+    doc: dict[str, Any], codec: JsonCodec | None = None
+) -> bytes:
+    """Serialize document to compact UTF-8 JSON bytes.
 
-        return orjson.dumps(doc)
-    except ImportError:
-        return json.dumps(doc, separators=(",", ":")).encode("utf-8")
+    Returns:
+        UTF-8 encoded JSON bytes from ``codec`` (default
+        ``DEFAULT_JSON_CODEC``).
+    """
+    return (codec or DEFAULT_JSON_CODEC).dumps(doc)
 
 
-def load_json_document_from_bytes(raw: bytes) -> dict[str, Any]:
-    """Parse a JSON object from UTF-8 bytes (orjson if available).
+def load_json_document_from_bytes(
+    raw: bytes, codec: JsonCodec | None = None
+) -> dict[str, Any]:
+    """Parse a JSON object from UTF-8 bytes.
 
     Returns:
-        The parsed root object as a dict.
+        The root object decoded by ``codec`` (default ``DEFAULT_JSON_CODEC``).
 
     Raises:
         ValidationError: If the root JSON value is not an object.
     """
-    try:
-        import orjson
-
-        result = orjson.loads(raw)
-    except ImportError:
-        result = json.loads(raw.decode("utf-8"))
+    result = (codec or DEFAULT_JSON_CODEC).loads(raw)
     if not isinstance(result, dict):
         raise ValidationError("JSON root must be an object")
     return result
@@ -11,11 +11,16 @@ from limbo_core.application.interfaces import (
     ValueReaderBackend,
 )
 from limbo_core.plugins.builtin.persistence import (
+    ArrowIpcFileDataPersistenceBackend,
     CsvFileDataPersistenceBackend,
+    FeatherFileDataPersistenceBackend,
     FilesystemPathResolver,
     JsonFileDataPersistenceBackend,
     JsonlFileDataPersistenceBackend,
+    LocalBucketPathResolver,
+    MemoryPathResolver,
     ParquetFileDataPersistenceBackend,
+    SQLAlchemyDataPersistenceBackend,
 )
 from limbo_core.plugins.markers import hookimpl
 
@@ -59,12 +64,17 @@ class BuiltinPlugin:
         """Register built-in path resolver backends.
 
         Returns:
-            List with the default filesystem resolver type.
+            The filesystem resolver plus the in-memory and local-directory
+            object store resolvers.
         """
         return [
             BackendRegistration(
                 key="file", backend_class=FilesystemPathResolver
-            )
+            ),
+            BackendRegistration(key="memory", backend_class=MemoryPathResolver),
+            BackendRegistration(
+                key="bucket", backend_class=LocalBucketPathResolver
+            ),
         ]
 
     @hookimpl
@@ -74,7 +84,8 @@ class BuiltinPlugin:
         """Register built-in tabular data persistence backends.
 
         Returns:
-            CSV, JSON, JSONL, and Parquet backends under fixed directories.
+            CSV, JSON, JSONL, Parquet and Arrow IPC/Feather backends under
+            fixed directories, and the SQLAlchemy table backend.
         """
         return [
             BackendRegistration(
@@ -89,6 +100,15 @@ class BuiltinPlugin:
             BackendRegistration(
                 key="parquet", backend_class=ParquetFileDataPersistenceBackend
             ),
+            BackendRegistration(
+                key="arrow", backend_class=ArrowIpcFileDataPersistenceBackend
+            ),
+            BackendRegistration(
+                key="feather", backend_class=FeatherFileDataPersistenceBackend
+            ),
+            BackendRegistration(
+                key="sqlalchemy", backend_class=SQLAlchemyDataPersistenceBackend
+            ),
         ]
 
     @hookimpl
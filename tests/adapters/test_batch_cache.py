@@ -0,0 +1,174 @@
+"""Tests for the byte-bounded batch cache."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, NoReturn
+
+import pytest
+
+from limbo_core.adapters.persistence import BatchCache, estimate_batch_bytes
+from limbo_core.domain.value_objects import TabularBatch
+from limbo_core.validation import ValidationError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _batch(start: int, rows: int = 100) -> TabularBatch:
+    return TabularBatch.from_columns(
+        ("id", "name"),
+        {
+            "id": list(range(start, start + rows)),
+            "name": [f"user-{i}" for i in range(start, start + rows)],
+        },
+    )
+
+
+def test_estimate_grows_with_rows() -> None:
+    """Size estimates scale with the number of rows."""
+    small = estimate_batch_bytes(_batch(0, rows=10))
+    large = estimate_batch_bytes(_batch(0, rows=10_000))
+
+    assert 0 < small < large
+
+
+class _SizedColumn(Sequence[int]):
+    """Column reporting its size; reading a cell fails the test."""
+
+    nbytes = 4096
+
+    def __len__(self) -> int:
+        return 1000
+
+    def __getitem__(self, index: object) -> NoReturn:
+        raise AssertionError(f"cell {index!r} was read")
+
+
+def test_estimate_uses_nbytes_without_reading_cells() -> None:
+    """Columns with ``nbytes`` (lazy Arrow columns) are not decoded."""
+    batch = TabularBatch.from_columns(("blob",), {"blob": _SizedColumn()})
+
+    assert estimate_batch_bytes(batch) >= _SizedColumn.nbytes
+
+
+def test_estimate_keeps_row_major_batches_row_major() -> None:
+    """Row-major batches are sized without building their column view."""
+    batch = TabularBatch(
+        ("id", "name"),
+        tuple({"id": i, "name": f"user-{i}"} for i in range(100)),
+    )
+
+    assert estimate_batch_bytes(batch) > 0
+    assert not batch.has_column_view
+
+
+def test_unbounded_cache_keeps_everything() -> None:
+    """Without max_bytes nothing is evicted."""
+    cache = BatchCache()
+    for i in range(5):
+        cache.put(f"t{i}", _batch(i), spill=False)
+
+    assert all(f"t{i}" in cache for i in range(5))
+    assert cache.nbytes > 0
+
+
+def test_lru_eviction_drops_non_spill_entries(tmp_path: Path) -> None:
+    """Least recently used non-spill entries are dropped over budget."""
+    budget = estimate_batch_bytes(_batch(0)) * 2
+    cache = BatchCache(max_bytes=budget, spill_dir=tmp_path)
+    cache.put("a", _batch(0), spill=False)
+    cache.put("b", _batch(0), spill=False)
+    assert cache.get("a") is not None
+
+    cache.put("c", _batch(0), spill=False)
+
+    assert "b" not in cache
+    assert "a" in cache
+    assert "c" in cache
+    assert cache.nbytes <= budget
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spilled_entries_reload_transparently(tmp_path: Path) -> None:
+    """Evicted spill entries are written to disk and reloaded on get."""
+    budget = estimate_batch_bytes(_batch(100)) * 3 // 2
+    cache = BatchCache(max_bytes=budget, spill_dir=tmp_path)
+    cache.put("a", _batch(0), spill=True)
+    cache.put("b", _batch(100), spill=True)
+
+    assert "a" in cache
+    assert len(list(tmp_path.iterdir())) == 1
+
+    assert cache.get("a") == _batch(0)
+    assert cache.get("b") == _batch(100)
+
+
+def test_reloaded_entries_reuse_their_spill_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A reloaded entry evicted again keeps its file instead of rewriting."""
+    cache = BatchCache(max_bytes=0, spill_dir=tmp_path)
+    cache.put("a", _batch(0), spill=True)
+    (spill_file,) = tmp_path.iterdir()
+
+    def fail(*_: object) -> NoReturn:
+        raise AssertionError("spill file rewritten")
+
+    monkeypatch.setattr(BatchCache, "_write_spill", fail)
+
+    assert cache.get("a") == _batch(0)
+    assert cache.get("a") == _batch(0)
+    assert list(tmp_path.iterdir()) == [spill_file]
+
+
+def test_failed_spill_keeps_entry_in_memory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An entry whose spill write fails is not lost."""
+    cache = BatchCache(max_bytes=0, spill_dir=tmp_path)
+
+    def fail(*_: object) -> NoReturn:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(BatchCache, "_write_spill", fail)
+
+    with pytest.raises(OSError, match="disk full"):
+        cache.put("a", _batch(0), spill=True)
+
+    assert cache.get("a") == _batch(0)
+
+
+def test_pop_and_clear_remove_spill_files(tmp_path: Path) -> None:
+    """Removing entries deletes their spill files."""
+    cache = BatchCache(max_bytes=0, spill_dir=tmp_path)
+    cache.put("a", _batch(0), spill=True)
+    cache.put("b", _batch(0), spill=True)
+    assert len(list(tmp_path.iterdir())) == 2
+
+    cache.pop("a")
+    assert "a" not in cache
+    assert len(list(tmp_path.iterdir())) == 1
+
+    cache.clear()
+    assert "b" not in cache
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_owned_scratch_dir_is_removed_on_clear() -> None:
+    """A temporary spill directory is created lazily and removed by clear."""
+    cache = BatchCache(max_bytes=0)
+    cache.put("a", _batch(0), spill=True)
+    scratch = cache._owned_dir
+    assert scratch is not None
+    assert scratch.exists()
+
+    cache.clear()
+
+    assert not scratch.exists()
+
+
+def test_negative_budget_raises() -> None:
+    """max_bytes must not be negative."""
+    with pytest.raises(ValidationError, match="max_bytes"):
+        BatchCache(max_bytes=-1)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import pytest
 
@@ -14,11 +15,16 @@ from limbo_core.adapters.persistence.path_resolver_registry import (
     PathResolverRegistry,
 )
 from limbo_core.application.interfaces.persistence import DataPersistenceBackend
+from limbo_core.domain.entities import DataType
 from limbo_core.domain.entities.backends import DestinationBackendSpec
 from limbo_core.domain.value_objects import ResolvedStorageRef, TabularBatch
 from limbo_core.plugins.builtin.persistence import FilesystemPathResolver
 from limbo_core.validation import ValidationError
 
+if TYPE_CHECKING:
+    from limbo_core.domain.entities.resources.path_spec import PathSpec
+    from limbo_core.domain.value_objects import LocalFilesystemStorageRef
+
 
 @dataclass(slots=True)
 class _MemoryWriteBackend(DataPersistenceBackend):
@@ -141,3 +147,160 @@ def test_data_persistence_registry_without_path_resolver_joins_root_to_artifact(
     assert registry.load("mem", "users") == payload
     registry.cleanup("mem", "users")
     assert not registry.exists("mem", "users")
+
+
+def test_data_persistence_registry_streams_through_default_fallbacks() -> None:
+    """save_stream/iter_load fall back to whole-batch save/load."""
+    registry = _registry_with_path()
+    registry.register("memory", _MemoryWriteBackend)
+    registry.configure(DestinationBackendSpec(name="mem", type="memory"))
+    chunks = [
+        TabularBatch.from_columns(("id",), {"id": [1, 2]}),
+        TabularBatch.from_columns(("id",), {"id": [3]}),
+    ]
+
+    registry.save_stream("mem", "users", ("id",), iter(chunks))
+    loaded = list(registry.iter_load("mem", "users", chunk_rows=2))
+
+    assert [chunk.column("id") for chunk in loaded] == [[1, 2], [3]]
+
+
+def test_data_persistence_registry_iter_load_rejects_bad_chunk_rows() -> None:
+    registry = _registry_with_path()
+    registry.register("memory", _MemoryWriteBackend)
+    registry.configure(DestinationBackendSpec(name="mem", type="memory"))
+
+    with pytest.raises(ValidationError, match="chunk_rows"):
+        registry.iter_load("mem", "users", chunk_rows=0)
+
+
+def test_data_persistence_registry_load_projected() -> None:
+    registry = _registry_with_path()
+    registry.register("memory", _MemoryWriteBackend)
+    registry.configure(DestinationBackendSpec(name="mem", type="memory"))
+    registry.save(
+        "mem",
+        "users",
+        TabularBatch.from_columns(
+            ("id", "name"), {"id": [1, 2, None], "name": ["a", "b", "c"]}
+        ),
+    )
+
+    loaded = registry.load_projected(
+        "mem", "users", columns=("name",), filters=[("id", ">", 1)]
+    )
+
+    assert loaded.rows == ({"name": "b"},)
+
+
+def test_data_persistence_registry_load_typed() -> None:
+    registry = _registry_with_path()
+    registry.register("memory", _MemoryWriteBackend)
+    registry.configure(DestinationBackendSpec(name="mem", type="memory"))
+    registry.save(
+        "mem",
+        "users",
+        TabularBatch.from_columns(("id",), {"id": ["1", "", None]}),
+    )
+
+    loaded = registry.load_typed("mem", "users", {"id": DataType.INTEGER})
+
+    assert loaded.column("id") == [1, None, None]
+
+
+@dataclass(slots=True)
+class _CountingPathResolver(FilesystemPathResolver):
+    created: ClassVar[int] = 0
+    resolved: ClassVar[int] = 0
+
+    def __post_init__(self) -> None:
+        type(self).created += 1
+
+    def resolve(
+        self,
+        path_spec: PathSpec,
+        *,
+        base: Any | None = None,
+        allow_missing: bool = False,
+    ) -> LocalFilesystemStorageRef:
+        type(self).resolved += 1
+        return FilesystemPathResolver.resolve(
+            self, path_spec, base=base, allow_missing=allow_missing
+        )
+
+
+@pytest.fixture
+def counting_registry() -> DataPersistenceRegistry:
+    _CountingPathResolver.created = 0
+    _CountingPathResolver.resolved = 0
+    pr = PathResolverRegistry()
+    pr.register("file", _CountingPathResolver)
+    registry = DataPersistenceRegistry(path_resolver_registry=pr)
+    registry.register("memory", _MemoryWriteBackend)
+    registry.configure(DestinationBackendSpec(name="mem", type="memory"))
+    return registry
+
+
+def test_data_persistence_registry_memoizes_storage_refs(
+    counting_registry: DataPersistenceRegistry,
+) -> None:
+    payload = TabularBatch(column_names=("id",), rows=({"id": 1},))
+
+    counting_registry.save("mem", "users", payload)
+    counting_registry.load("mem", "users")
+    counting_registry.exists("mem", "users")
+    counting_registry.exists("mem", "orders")
+
+    assert _CountingPathResolver.resolved == 2
+    assert _CountingPathResolver.created == 1
+
+
+def test_data_persistence_registry_configure_drops_memoized_refs(
+    counting_registry: DataPersistenceRegistry,
+) -> None:
+    counting_registry.exists("mem", "users")
+
+    counting_registry.configure(
+        DestinationBackendSpec(
+            name="mem", type="memory", config={"_root": Path("/other")}
+        )
+    )
+    counting_registry.save(
+        "mem", "users", TabularBatch(column_names=("id",), rows=({"id": 1},))
+    )
+
+    assert _CountingPathResolver.resolved == 2
+    backend = counting_registry.get_instances()["mem"]
+    assert isinstance(backend, _MemoryWriteBackend)
+    assert "users" in backend.store
+
+
+def test_data_persistence_registry_clear_instances_drops_memoized_refs(
+    counting_registry: DataPersistenceRegistry,
+) -> None:
+    counting_registry.exists("mem", "users")
+    counting_registry.clear_instances()
+
+    with pytest.raises(ValidationError, match="not configured"):
+        counting_registry.exists("mem", "users")
+
+
+def test_data_persistence_registry_resolver_changes_drop_memoized_refs(
+    counting_registry: DataPersistenceRegistry,
+) -> None:
+    counting_registry.exists("mem", "users")
+    resolvers = counting_registry.path_resolver_registry
+    assert isinstance(resolvers, PathResolverRegistry)
+
+    resolvers.register("file", _CountingPathResolver)
+    counting_registry.exists("mem", "users")
+    counting_registry.exists("mem", "users")
+
+    assert _CountingPathResolver.resolved == 2
+
+    replacement = PathResolverRegistry()
+    replacement.register("file", _CountingPathResolver)
+    counting_registry.path_resolver_registry = replacement
+    counting_registry.exists("mem", "users")
+
+    assert _CountingPathResolver.resolved == 3
@@ -8,6 +8,7 @@ from pathlib import Path
 import pytest
 
 from limbo_core.adapters.persistence import (
+    BatchCache,
     DataPersistenceRegistry,
     DefaultPersistor,
     PathResolverRegistry,
@@ -207,3 +208,96 @@ class TestDefaultPersistorCleanup:
     ) -> None:
         """Cleanup of unknown artifact does not raise."""
         persistor.cleanup("nonexistent")
+
+
+class TestDefaultPersistorRelease:
+    """Tests for release behaviour."""
+
+    def test_release_keeps_materialized_data(
+        self,
+        persistor: DefaultPersistor,
+        data_registry: DataPersistenceRegistry,
+    ) -> None:
+        """Release drops the cache entry but not the backend copy."""
+        persistor.save("users", _batch_id(1), materialize=True)
+
+        persistor.release("users")
+
+        assert persistor.load("users") == _batch_id(1)
+        data_registry.cleanup("memory", "users")
+        assert not persistor.exists("users")
+
+    def test_release_drops_cache_only_artifact(
+        self, persistor: DefaultPersistor
+    ) -> None:
+        """Released cache-only artifacts no longer exist."""
+        persistor.save("users", _batch_id(1), materialize=False)
+
+        persistor.release("users")
+
+        assert not persistor.exists("users")
+
+
+class TestDefaultPersistorSaveStream:
+    """Tests for streamed saves."""
+
+    def test_materialized_stream_goes_to_backend(
+        self,
+        persistor: DefaultPersistor,
+        data_registry: DataPersistenceRegistry,
+    ) -> None:
+        """Materialized streams are written to the backend, not cached."""
+        persistor.save("users", _batch_id(0), materialize=False)
+
+        persistor.save_stream(
+            "users", ("id",), [_batch_id(1), _batch_id(2)], materialize=True
+        )
+
+        assert data_registry.load("memory", "users").column("id") == [1, 2]
+        assert persistor.load("users").column("id") == [1, 2]
+
+    def test_cache_only_stream_is_concatenated(
+        self,
+        persistor: DefaultPersistor,
+        data_registry: DataPersistenceRegistry,
+    ) -> None:
+        """Non-materialized streams are cached as one batch."""
+        persistor.save_stream(
+            "users", ("id",), [_batch_id(1), _batch_id(2)], materialize=False
+        )
+
+        assert persistor.load("users").column("id") == [1, 2]
+        assert not data_registry.exists("memory", "users")
+
+
+class TestDefaultPersistorBoundedCache:
+    """Tests for the byte-bounded cache."""
+
+    def test_spilled_intermediate_loads_and_exists(
+        self, data_registry: DataPersistenceRegistry, tmp_path: Path
+    ) -> None:
+        """Evicted cache-only artifacts are reloaded from spill files."""
+        persistor = DefaultPersistor(
+            data_resolver=data_registry,
+            backend_key="memory",
+            cache=BatchCache(max_bytes=0, spill_dir=tmp_path),
+        )
+        persistor.save("users", _batch_id(1), materialize=False)
+
+        assert persistor.exists("users")
+        assert persistor.load("users") == _batch_id(1)
+        assert not data_registry.exists("memory", "users")
+
+    def test_evicted_materialized_data_loads_from_backend(
+        self, data_registry: DataPersistenceRegistry, tmp_path: Path
+    ) -> None:
+        """Evicted materialized artifacts are not spilled."""
+        persistor = DefaultPersistor(
+            data_resolver=data_registry,
+            backend_key="memory",
+            cache=BatchCache(max_bytes=0, spill_dir=tmp_path),
+        )
+        persistor.save("users", _batch_id(1), materialize=True)
+
+        assert list(tmp_path.iterdir()) == []
+        assert persistor.load("users") == _batch_id(1)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import gzip
 from pathlib import Path
 
 import pytest
@@ -23,6 +24,7 @@ from limbo_core.domain.entities import (
     LookupValue,
     PathBackendSpec,
     PathSpec,
+    SeedFile,
     ValueReaderBackendSpec,
 )
 from limbo_core.domain.value_objects import LocalFilesystemStorageRef
@@ -331,6 +333,23 @@ class TestPathBackendRegistryResolve:
         ref = registry.resolve_spec(spec, base=tmp_path, allow_missing=False)
         assert ref.as_local_path() == tmp_path / "seed.csv"
 
+    def test_resolve_seed_file_applies_compression(
+        self, file_registry: PathResolverRegistry, tmp_path: Path
+    ) -> None:
+        """Explicit seed compression overrides the file suffix."""
+        path = tmp_path / "seed.csv"
+        path.write_bytes(gzip.compress(b"id\n1\n"))
+        seed_file = SeedFile(
+            compression="gzip",
+            path=PathSpec(backend="file", location=str(path)),
+        )
+
+        ref = file_registry.resolve_seed_file(seed_file)
+
+        assert ref.read_bytes() == b"id\n1\n"
+        seed_file.compression = "infer"
+        assert file_registry.resolve_seed_file(seed_file).compression is None
+
 
 class TestPathBackendRegistryErrors:
     """Tests for PathBackendRegistry error paths."""
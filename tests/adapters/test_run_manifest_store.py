@@ -0,0 +1,51 @@
+"""Tests for the JSON run manifest store."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from limbo_core.adapters.persistence import (
+    MANIFEST_OBJECT_NAME,
+    FileRunManifestStore,
+)
+from limbo_core.domain.value_objects import (
+    ArtifactKey,
+    LocalFilesystemStorageRef,
+    ManifestEntry,
+    RunManifest,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _store(tmp_path: Path) -> FileRunManifestStore:
+    path = tmp_path / MANIFEST_OBJECT_NAME
+    return FileRunManifestStore(
+        LocalFilesystemStorageRef(
+            backend="file", uri=str(path), local_path=path
+        )
+    )
+
+
+def test_missing_manifest_loads_empty(tmp_path: Path) -> None:
+    assert _store(tmp_path).load() == RunManifest()
+
+
+def test_manifest_round_trips_through_json(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    manifest = RunManifest()
+    manifest.record(
+        ArtifactKey("table", "orders"),
+        ManifestEntry(
+            fingerprint="abc",
+            upstream={"table 'users'": "def"},
+            seed=7,
+            num_rows=10,
+        ),
+    )
+
+    store.save(manifest)
+
+    assert store.load() == manifest
+    assert (tmp_path / MANIFEST_OBJECT_NAME).read_text().startswith("{")
@@ -0,0 +1,97 @@
+"""Tests for the artifact scheduler."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from limbo_core.application.services import ArtifactScheduler
+from limbo_core.domain.value_objects import ArtifactGraph, ArtifactKey
+from limbo_core.validation import ValidationError
+
+_A = ArtifactKey("seed", "a")
+_B = ArtifactKey("source", "b")
+_C = ArtifactKey("table", "c")
+_D = ArtifactKey("table", "d")
+
+
+def _graph() -> ArtifactGraph:
+    return ArtifactGraph.from_dependencies({
+        _A: set(),
+        _B: set(),
+        _C: {_A, _B},
+        _D: {_C},
+    })
+
+
+def _name_length(key: ArtifactKey) -> int:
+    return len(key.type)
+
+
+def test_runs_in_dependency_order_and_releases() -> None:
+    """Dependents start after their dependencies; upstream is released."""
+    events: list[str] = []
+    lock = threading.Lock()
+
+    def task(key: ArtifactKey) -> str:
+        with lock:
+            events.append(f"run:{key.name}")
+        return key.name.upper()
+
+    results = ArtifactScheduler(max_workers=2).run(
+        _graph(), task, release=lambda key: events.append(f"release:{key.name}")
+    )
+
+    assert results == {_A: "A", _B: "B", _C: "C", _D: "D"}
+    assert events.index("run:c") > max(
+        events.index("run:a"), events.index("run:b")
+    )
+    assert events.index("release:a") > events.index("run:c")
+    assert events.index("run:d") > events.index("run:c")
+    assert "release:c" in events
+    assert "release:d" not in events
+
+
+def test_independent_artifacts_run_concurrently() -> None:
+    """Roots without dependencies overlap on the pool."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def task(key: ArtifactKey) -> None:
+        if key in (_A, _B):
+            barrier.wait()
+
+    ArtifactScheduler(max_workers=2).run(_graph(), task)
+
+
+def test_failure_stops_dependents() -> None:
+    """A failing task raises and its dependents never start."""
+    started: list[ArtifactKey] = []
+
+    def task(key: ArtifactKey) -> None:
+        started.append(key)
+        if key == _C:
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        ArtifactScheduler(max_workers=1).run(_graph(), task)
+    assert _D not in started
+
+
+def test_process_executor_runs_picklable_tasks() -> None:
+    """The process pool runs module-level tasks and returns results."""
+    results = ArtifactScheduler(executor="process", max_workers=2).run(
+        _graph(), _name_length
+    )
+
+    assert results == {_A: 4, _B: 6, _C: 5, _D: 5}
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [({"executor": "fiber"}, "executor"), ({"max_workers": 0}, "max_workers")],
+)
+def test_invalid_settings_raise(kwargs: dict[str, object], match: str) -> None:
+    """Unknown executors and non-positive worker counts are rejected."""
+    with pytest.raises(ValidationError, match=match):
+        ArtifactScheduler(**kwargs)  # type: ignore[arg-type]
@@ -0,0 +1,494 @@
+"""Tests for resumable generation runs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from limbo_core.adapters.generators import GeneratorRegistry
+from limbo_core.adapters.persistence import PathResolverRegistry
+from limbo_core.application.context import ResolutionContext, RuntimeContext
+from limbo_core.application.interfaces import (
+    ConnectionProviderPort,
+    Persistor,
+    ValueResolverPort,
+)
+from limbo_core.application.interfaces.connections import TableStats
+from limbo_core.application.interfaces.generators import (
+    Generator,
+    GeneratorRegistration,
+    generates_batch,
+)
+from limbo_core.application.interfaces.persistence import RunManifestStorePort
+from limbo_core.application.services import (
+    ArtifactScheduler,
+    GenerationRunService,
+    SourceReaderService,
+    TableGenerationService,
+)
+from limbo_core.domain.entities import (
+    DataType,
+    LiteralValue,
+    LookupValue,
+    PathSpec,
+    Project,
+    Seed,
+    SeedColumn,
+    SeedConfig,
+    SeedFile,
+    Source,
+    SourceColumn,
+    SourceConfig,
+    Table,
+    TableColumn,
+    TableConfig,
+    TableReference,
+    TableRelationship,
+)
+from limbo_core.domain.value_objects import ArtifactKey, RunManifest
+from limbo_core.plugins.builtin.persistence import FilesystemPathResolver
+from limbo_core.validation import ValidationError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from limbo_core.application.interfaces.connections import TableScan
+    from limbo_core.domain.entities import GenerationContext, ValueSpec
+    from limbo_core.domain.value_objects import TabularBatch
+
+
+@dataclass(slots=True)
+class _MemoryPersistor(Persistor):
+    saved: dict[str, TabularBatch] = field(default_factory=dict)
+    ephemeral: set[str] = field(default_factory=set)
+
+    def save(
+        self, name: str, data: TabularBatch, *, materialize: bool = True
+    ) -> None:
+        self.saved[name] = data
+        if not materialize:
+            self.ephemeral.add(name)
+
+    def load(self, name: str) -> TabularBatch:
+        return self.saved[name]
+
+    def exists(self, name: str) -> bool:
+        return name in self.saved
+
+    def cleanup(self, name: str) -> None:
+        self.saved.pop(name, None)
+
+    def release(self, name: str) -> None:
+        if name in self.ephemeral:
+            self.saved.pop(name, None)
+
+
+@dataclass(slots=True)
+class _MemoryManifestStore(RunManifestStorePort):
+    document: dict[str, Any] | None = None
+    saves: int = 0
+
+    def load(self) -> RunManifest:
+        if self.document is None:
+            return RunManifest()
+        return RunManifest.from_document(self.document)
+
+    def save(self, manifest: RunManifest) -> None:
+        self.document = manifest.to_document()
+        self.saves += 1
+
+
+class _CountingGenerator(Generator):
+    calls: list[str] = []  # noqa: RUF012
+    fail_on: str | None = None
+
+    @generates_batch("id")
+    def ids(
+        self, context: GenerationContext, count: int, **options: Any
+    ) -> list[int]:
+        if context.table_name == self.fail_on:
+            raise RuntimeError(f"boom in {context.table_name}")
+        self.calls.append(context.table_name)
+        return list(range(context.row_index, context.row_index + count))
+
+
+@dataclass(slots=True)
+class _DictValueResolver(ValueResolverPort):
+    values: dict[str, str]
+
+    def resolve(self, lookup: LookupValue) -> str:
+        return self.values[lookup.key]
+
+
+@dataclass(slots=True)
+class _StatsConnections(ConnectionProviderPort):
+    stats: TableStats
+    probes: list[str | None] = field(default_factory=list)
+
+    def connect(self, name: str) -> Any:
+        raise NotImplementedError
+
+    def table_stats(
+        self,
+        name: str,
+        scan: TableScan,
+        *,
+        updated_at_column: str | None = None,
+    ) -> TableStats:
+        self.probes.append(updated_at_column)
+        return self.stats
+
+
+def _table(
+    name: str,
+    *,
+    depends_on: str | None = None,
+    depends_type: str = "table",
+    options: dict[str, ValueSpec] | None = None,
+    materialize: bool = True,
+) -> Table:
+    references = (
+        [
+            TableReference(
+                depends_type,  # type: ignore[arg-type]
+                depends_on,
+                TableRelationship.MANY_TO_ONE,
+            )
+        ]
+        if depends_on
+        else None
+    )
+    return Table(
+        name=name,
+        config=TableConfig(materialize=materialize),
+        columns=[
+            TableColumn(
+                name="id",
+                data_type=DataType.INTEGER,
+                generator="count.id",
+                options=options,
+            )
+        ],
+        references=references,
+    )
+
+
+def _project(users_options: dict[str, ValueSpec] | None = None) -> Project:
+    return Project(
+        destinations=[],
+        tables=[
+            _table("users", options=users_options),
+            _table("orders", depends_on="users"),
+            _table("products"),
+        ],
+    )
+
+
+@pytest.fixture
+def context() -> RuntimeContext:
+    _CountingGenerator.calls = []
+    _CountingGenerator.fail_on = None
+    registry = GeneratorRegistry()
+    registry.register(
+        GeneratorRegistration(
+            namespace="count", generator_class=_CountingGenerator
+        )
+    )
+    return RuntimeContext(generator_registry=registry)
+
+
+def _service(
+    persistor: _MemoryPersistor, store: _MemoryManifestStore
+) -> GenerationRunService:
+    return GenerationRunService(
+        generation=TableGenerationService(persistor=persistor),
+        manifest_store=store,
+    )
+
+
+_ROWS = {"users": 3, "orders": 5, "products": 2}
+_USERS, _ORDERS, _PRODUCTS = (
+    ArtifactKey("table", "users"),
+    ArtifactKey("table", "orders"),
+    ArtifactKey("table", "products"),
+)
+
+
+def test_run_generates_all_tables_and_checkpoints(
+    context: RuntimeContext,
+) -> None:
+    persistor, store = _MemoryPersistor(), _MemoryManifestStore()
+
+    statuses = _service(persistor, store).run(
+        _project(), num_rows=_ROWS, context=context
+    )
+
+    assert statuses == {
+        _USERS: "generated",
+        _ORDERS: "generated",
+        _PRODUCTS: "generated",
+    }
+    assert sorted(_CountingGenerator.calls) == ["orders", "products", "users"]
+    assert store.saves == 3
+    assert set(store.load().entries) == set(statuses)
+
+
+def test_resume_skips_complete_tables(context: RuntimeContext) -> None:
+    persistor, store = _MemoryPersistor(), _MemoryManifestStore()
+    service = _service(persistor, store)
+    service.run(_project(), num_rows=_ROWS, context=context)
+    _CountingGenerator.calls = []
+
+    statuses = service.run(
+        _project(), num_rows=_ROWS, context=context, resume=True
+    )
+
+    assert set(statuses.values()) == {"skipped"}
+    assert _CountingGenerator.calls == []
+
+
+def test_resume_regenerates_changed_tables_and_dependents(
+    context: RuntimeContext,
+) -> None:
+    persistor, store = _MemoryPersistor(), _MemoryManifestStore()
+    service = _service(persistor, store)
+    service.run(_project(), num_rows=_ROWS, context=context)
+    _CountingGenerator.calls = []
+
+    service.run(
+        _project(), num_rows={**_ROWS, "users": 4}, context=context, resume=True
+    )
+
+    assert _CountingGenerator.calls == ["users", "orders"]
+
+
+def _ephemeral_project() -> Project:
+    return Project(
+        destinations=[],
+        tables=[
+            _table("users", materialize=False),
+            _table("orders", depends_on="users"),
+            _table("products"),
+        ],
+    )
+
+
+def test_resume_skips_ephemeral_tables_with_clean_dependents(
+    context: RuntimeContext,
+) -> None:
+    persistor, store = _MemoryPersistor(), _MemoryManifestStore()
+    service = _service(persistor, store)
+    service.run(_ephemeral_project(), num_rows=_ROWS, context=context)
+    assert not persistor.exists("users")
+    _CountingGenerator.calls = []
+
+    statuses = service.run(
+        _ephemeral_project(), num_rows=_ROWS, context=context, resume=True
+    )
+
+    assert set(statuses.values()) == {"skipped"}
+    assert _CountingGenerator.calls == []
+
+
+def test_resume_regenerates_ephemeral_tables_for_dirty_dependents(
+    context: RuntimeContext,
+) -> None:
+    persistor, store = _MemoryPersistor(), _MemoryManifestStore()
+    service = _service(persistor, store)
+    service.run(_ephemeral_project(), num_rows=_ROWS, context=context)
+    _CountingGenerator.calls = []
+
+    service.run(
+        _ephemeral_project(),
+        num_rows={**_ROWS, "orders": 6},
+        context=context,
+        resume=True,
+    )
+
+    assert _CountingGenerator.calls == ["users", "orders"]
+
+
+def test_plan_reports_tables_with_changed_options_and_dependents(
+    context: RuntimeContext,
+) -> None:
+    service = _service(_MemoryPersistor(), _MemoryManifestStore())
+    start = {"start": LiteralValue(1, DataType.INTEGER)}
+    service.run(_project(start), num_rows=_ROWS, context=context)
+    changed = {"start": LiteralValue(2, DataType.INTEGER)}
+
+    unchanged = service.plan(_project(start), num_rows=_ROWS, context=context)
+    plan = service.plan(_project(changed), num_rows=_ROWS, context=context)
+
+    assert unchanged.dirty == ()
+    assert plan.dirty == (_USERS, _ORDERS)
+
+
+def test_plan_reports_changed_lookup_values(context: RuntimeContext) -> None:
+    resolver = _DictValueResolver({"START": "1"})
+    service = GenerationRunService(
+        generation=TableGenerationService(
+            persistor=_MemoryPersistor(), value_resolver=resolver
+        ),
+        manifest_store=_MemoryManifestStore(),
+    )
+    options: dict[str, ValueSpec] = {
+        "start": LookupValue(reader="env", key="START")
+    }
+    service.run(_project(options), num_rows=_ROWS, context=context)
+    resolver.values["START"] = "2"
+
+    plan = service.plan(_project(options), num_rows=_ROWS, context=context)
+
+    assert plan.dirty == (_USERS, _ORDERS)
+
+
+def test_plan_reports_changed_generator_version(
+    context: RuntimeContext, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service = _service(_MemoryPersistor(), _MemoryManifestStore())
+    service.run(_project(), num_rows=_ROWS, context=context)
+    monkeypatch.setattr(_CountingGenerator, "version", "2.0")
+
+    plan = service.plan(_project(), num_rows=_ROWS, context=context)
+
+    assert set(plan.dirty) == {_USERS, _ORDERS, _PRODUCTS}
+
+
+def test_plan_without_resume_marks_every_table_dirty(
+    context: RuntimeContext,
+) -> None:
+    service = _service(_MemoryPersistor(), _MemoryManifestStore())
+    service.run(_project(), num_rows=_ROWS, context=context)
+
+    plan = service.plan(
+        _project(), num_rows=_ROWS, context=context, resume=False
+    )
+
+    assert set(plan.dirty) == {_USERS, _ORDERS, _PRODUCTS}
+
+
+def test_resume_regenerates_missing_outputs(context: RuntimeContext) -> None:
+    persistor, store = _MemoryPersistor(), _MemoryManifestStore()
+    service = _service(persistor, store)
+    service.run(_project(), num_rows=_ROWS, context=context)
+    persistor.cleanup("orders")
+    _CountingGenerator.calls = []
+
+    statuses = service.run(
+        _project(), num_rows=_ROWS, context=context, resume=True
+    )
+
+    assert statuses[_USERS] == "skipped"
+    assert _CountingGenerator.calls == ["orders"]
+
+
+def test_resume_after_failure_continues_where_it_stopped(
+    context: RuntimeContext,
+) -> None:
+    persistor, store = _MemoryPersistor(), _MemoryManifestStore()
+    service = _service(persistor, store)
+    _CountingGenerator.fail_on = "orders"
+    with pytest.raises(RuntimeError, match="boom"):
+        service.run(_project(), num_rows=_ROWS, context=context)
+    _CountingGenerator.fail_on = None
+    _CountingGenerator.calls = []
+
+    statuses = service.run(
+        _project(), num_rows=_ROWS, context=context, resume=True
+    )
+
+    assert statuses[_USERS] == "skipped"
+    assert statuses[_ORDERS] == "generated"
+    assert _CountingGenerator.calls == ["orders"]
+
+
+def test_run_requires_row_counts(context: RuntimeContext) -> None:
+    service = _service(_MemoryPersistor(), _MemoryManifestStore())
+    with pytest.raises(ValidationError, match="orders"):
+        service.run(
+            _project(), num_rows={"users": 1, "products": 1}, context=context
+        )
+
+
+def test_run_rejects_process_scheduler(context: RuntimeContext) -> None:
+    service = GenerationRunService(
+        generation=TableGenerationService(persistor=_MemoryPersistor()),
+        manifest_store=_MemoryManifestStore(),
+        scheduler=ArtifactScheduler(executor="process"),
+    )
+    with pytest.raises(ValidationError, match="thread"):
+        service.run(_project(), num_rows=_ROWS, context=context)
+
+
+def _input_project() -> Project:
+    return Project(
+        destinations=[],
+        tables=[
+            _table("users", depends_on="countries", depends_type="seed"),
+            _table("orders", depends_on="shops", depends_type="source"),
+            _table("products"),
+        ],
+        seeds=[
+            Seed(
+                name="countries",
+                config=SeedConfig(),
+                columns=[SeedColumn(name="id", data_type=DataType.INTEGER)],
+                seed_file=SeedFile(
+                    path=PathSpec(
+                        backend="file", location="countries.csv", base="this"
+                    )
+                ),
+            )
+        ],
+        sources=[
+            Source(
+                name="shops",
+                config=SourceConfig(connection="db"),
+                columns=[SourceColumn(name="id", data_type=DataType.INTEGER)],
+            )
+        ],
+    )
+
+
+def test_plan_reports_dependents_of_changed_inputs(
+    context: RuntimeContext, tmp_path: Path
+) -> None:
+    paths = PathResolverRegistry()
+    paths.register("file", FilesystemPathResolver)
+    connections = _StatsConnections(TableStats(row_count=2))
+    service = GenerationRunService(
+        generation=TableGenerationService(persistor=_MemoryPersistor()),
+        manifest_store=_MemoryManifestStore(),
+        path_registry=paths,
+        source_reader=SourceReaderService(connections=connections),
+    )
+    seed_path = tmp_path / "countries.csv"
+    seed_path.write_text("id\n1\n")
+    resolution = ResolutionContext(source_dir=tmp_path)
+    service.run(
+        _input_project(),
+        num_rows=_ROWS,
+        context=context,
+        resolution_context=resolution,
+    )
+
+    unchanged = service.plan(
+        _input_project(),
+        num_rows=_ROWS,
+        context=context,
+        resolution_context=resolution,
+    )
+    seed_path.write_text("id\n1\n2\n")
+    connections.stats = TableStats(row_count=3)
+    changed = service.plan(
+        _input_project(),
+        num_rows=_ROWS,
+        context=context,
+        resolution_context=resolution,
+    )
+
+    assert unchanged.dirty == ()
+    assert changed.dirty == (_USERS, _ORDERS)
+    assert connections.probes == [None, None, None]
@@ -32,6 +32,7 @@ from limbo_core.application.services.project_validator import (
     GeneratorNotFoundError,
     UnknownSourceConnectionError,
 )
+from limbo_core.domain.value_objects import ArtifactCycleError
 from limbo_core.plugins import PluginManager
 from limbo_core.plugins.builtin.connections import SQLAlchemyConnectionBackend
 
@@ -223,6 +224,28 @@ class TestLoadProjectWithContext:
         with pytest.raises(UnknownSourceConnectionError):
             loader.load(payload, context=context, resolution_context=res_ctx)
 
+    def test_reference_cycle_raises(
+        self, loader: ProjectLoaderService, tmp_path: Path
+    ) -> None:
+        """Raise if table references form a cycle."""
+        (tmp_path / "seed.csv").write_text("value\nx\n")
+        payload = _base_payload()
+        users = payload["tables"][0]  # type: ignore[index]
+        orders = {**users, "name": "orders"}
+        users["references"] = [
+            {"type": "table", "name": "orders", "relationship": "one_to_many"}
+        ]
+        orders["references"] = [
+            {"type": "table", "name": "users", "relationship": "many_to_one"}
+        ]
+        payload["tables"] = [users, orders]
+        context = RuntimeContext(
+            generator_registry=_StaticGeneratorRegistry({"gen.ok"})
+        )
+        res_ctx = ResolutionContext(source_dir=tmp_path)
+        with pytest.raises(ArtifactCycleError, match="cycle"):
+            loader.load(payload, context=context, resolution_context=res_ctx)
+
 
 class TestLoadProjectWithoutContext:
     """Tests that exercise parse-only mode (no RuntimeContext)."""
@@ -24,6 +24,7 @@ from limbo_core.domain.entities import (
     DataType,
     LiteralValue,
     LookupValue,
+    SourceSnapshot,
     TableRelationship,
 )
 from limbo_core.domain.value_objects import ResolvedStorageRef  # noqa: TC001
@@ -216,6 +217,50 @@ class TestParseSourceConfig:
         assert config.connection == "main"
         assert config.schema_name is None
         assert config.table_name is None
+        assert config.snapshot is None
+
+    def test_snapshot_true_uses_row_count_probe(
+        self, project_parser: ProjectParser
+    ) -> None:
+        """``snapshot: true`` enables a snapshot with default freshness."""
+        config = project_parser.parse_source_config({
+            "connection": "main",
+            "snapshot": True,
+        })
+        assert config.snapshot == SourceSnapshot()
+
+    def test_snapshot_mapping(self, project_parser: ProjectParser) -> None:
+        """Snapshot mapping sets the freshness check and its options."""
+        config = project_parser.parse_source_config({
+            "connection": "main",
+            "snapshot": {
+                "freshness": "updated_at",
+                "updated_at_column": "modified",
+            },
+        })
+        assert config.snapshot == SourceSnapshot(
+            freshness="updated_at", updated_at_column="modified"
+        )
+
+    def test_rejects_unknown_snapshot_freshness(
+        self, project_parser: ProjectParser
+    ) -> None:
+        """Snapshot freshness must be a supported check."""
+        with pytest.raises(ParseError, match="snapshot\\.freshness"):
+            project_parser.parse_source_config({
+                "connection": "main",
+                "snapshot": {"freshness": "always"},
+            })
+
+    def test_rejects_ttl_snapshot_without_ttl(
+        self, project_parser: ProjectParser
+    ) -> None:
+        """TTL freshness requires a positive ttl_seconds."""
+        with pytest.raises(ParseError, match="ttl_seconds"):
+            project_parser.parse_source_config({
+                "connection": "main",
+                "snapshot": {"freshness": "ttl", "ttl_seconds": "1h"},
+            })
 
 
 # -------------------------------------------------------------------
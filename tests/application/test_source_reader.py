@@ -0,0 +1,257 @@
+"""Tests for streaming source table reads."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from limbo_core.adapters.connections import ConnectionRegistry
+from limbo_core.application.interfaces import ConnectionProviderPort, Persistor
+from limbo_core.application.services import SourceReaderService
+from limbo_core.application.services.source_reader import split_key_range
+from limbo_core.domain.entities import (
+    ConnectionBackendSpec,
+    DataType,
+    Source,
+    SourceColumn,
+    SourceConfig,
+)
+from limbo_core.domain.value_objects import TabularBatch
+from limbo_core.plugins.builtin.connections import SQLAlchemyConnectionBackend
+from limbo_core.validation import ValidationError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+    from limbo_core.application.interfaces.persistence import ColumnTypes
+
+
+@dataclass(slots=True)
+class _StreamingPersistor(Persistor):
+    chunks: dict[str, list[TabularBatch]] = field(default_factory=dict)
+
+    def save(
+        self, name: str, data: TabularBatch, *, materialize: bool = True
+    ) -> None:
+        self.chunks[name] = [data]
+
+    def save_stream(
+        self,
+        name: str,
+        column_names: tuple[str, ...],
+        chunks: Iterable[TabularBatch],
+        *,
+        materialize: bool = True,
+        column_types: ColumnTypes | None = None,
+    ) -> None:
+        self.chunks[name] = list(chunks)
+
+    def load(self, name: str) -> TabularBatch:
+        return TabularBatch.concat(
+            self.chunks[name][0].column_names, self.chunks[name]
+        )
+
+    def exists(self, name: str) -> bool:
+        return name in self.chunks
+
+    def cleanup(self, name: str) -> None:
+        self.chunks.pop(name, None)
+
+
+@pytest.fixture
+def connections(tmp_path: Path) -> Iterator[ConnectionRegistry]:
+    registry = ConnectionRegistry()
+    registry.register("sqlalchemy", SQLAlchemyConnectionBackend)
+    registry.configure(
+        ConnectionBackendSpec(
+            name="db",
+            type="sqlalchemy",
+            config={
+                "host": "",
+                "user": "",
+                "password": "",
+                "database": str(tmp_path / "source.db"),
+            },
+        )
+    )
+    with registry.connect("db").begin() as connection:
+        connection.execute(
+            text("CREATE TABLE users (id INTEGER, born TEXT, score TEXT)")
+        )
+        connection.execute(
+            text("INSERT INTO users VALUES (:id, :born, :score)"),
+            [
+                {"id": i, "born": f"2000-01-0{i}", "score": str(i * 1.5)}
+                for i in range(1, 6)
+            ],
+        )
+        connection.execute(text("INSERT INTO users VALUES (6, NULL, NULL)"))
+    yield registry
+    registry.dispose()
+
+
+def _source(name: str = "users", **config: str) -> Source:
+    return Source(
+        name=name,
+        config=SourceConfig(connection="db", **config),
+        columns=[
+            SourceColumn(name="id", data_type=DataType.INTEGER),
+            SourceColumn(name="born", data_type=DataType.DATE),
+            SourceColumn(name="score", data_type=DataType.FLOAT),
+        ],
+    )
+
+
+def test_iter_batches_streams_typed_chunks(
+    connections: ConnectionRegistry,
+) -> None:
+    reader = SourceReaderService(connections=connections)
+
+    batches = list(reader.iter_batches(_source(), chunk_rows=4))
+
+    assert [batch.num_rows for batch in batches] == [4, 2]
+    assert batches[0].column("born")[0] == date(2000, 1, 1)
+    assert batches[0].column("score")[:2] == [1.5, 3.0]
+    assert batches[1].rows[-1] == {"id": 6, "born": None, "score": None}
+
+
+def test_table_name_overrides_source_name(
+    connections: ConnectionRegistry,
+) -> None:
+    reader = SourceReaderService(connections=connections)
+
+    batches = list(
+        reader.iter_batches(
+            _source("people", table_name="users"), chunk_rows=10
+        )
+    )
+
+    assert batches[0].num_rows == 6
+
+
+def test_copy_to_feeds_save_stream(connections: ConnectionRegistry) -> None:
+    reader = SourceReaderService(connections=connections)
+    persistor = _StreamingPersistor()
+
+    reader.copy_to(_source(), persistor, chunk_rows=2)
+
+    assert [chunk.num_rows for chunk in persistor.chunks["users"]] == [2, 2, 2]
+    assert persistor.load("users").column("id") == [1, 2, 3, 4, 5, 6]
+
+
+def test_iter_batches_rejects_bad_chunk_rows(
+    connections: ConnectionRegistry,
+) -> None:
+    reader = SourceReaderService(connections=connections)
+    with pytest.raises(ValidationError, match="chunk_rows"):
+        reader.iter_batches(_source(), chunk_rows=0)
+
+
+def test_iter_partitioned_reads_every_row_once(
+    connections: ConnectionRegistry,
+) -> None:
+    reader = SourceReaderService(connections=connections)
+
+    batches = list(
+        reader.iter_partitioned(
+            _source(), key_column="id", partitions=3, chunk_rows=1
+        )
+    )
+
+    ids = sorted(i for batch in batches for i in batch.column("id"))
+    assert ids == [1, 2, 3, 4, 5, 6]
+    assert all(batch.num_rows == 1 for batch in batches)
+
+
+def test_partitioned_copy_includes_null_keys(
+    connections: ConnectionRegistry,
+) -> None:
+    with connections.connect("db").begin() as connection:
+        connection.execute(text("INSERT INTO users VALUES (NULL, NULL, '1')"))
+    reader = SourceReaderService(connections=connections)
+    persistor = _StreamingPersistor()
+
+    reader.copy_to(_source(), persistor, key_column="id", partitions=4)
+
+    ids = persistor.load("users").column("id")
+    assert sorted(ids, key=lambda i: -1 if i is None else i) == [
+        None,
+        1,
+        2,
+        3,
+        4,
+        5,
+        6,
+    ]
+
+
+def test_partitioned_read_of_empty_table(
+    connections: ConnectionRegistry,
+) -> None:
+    with connections.connect("db").begin() as connection:
+        connection.execute(text("DELETE FROM users"))
+    reader = SourceReaderService(connections=connections)
+
+    batches = reader.iter_partitioned(_source(), key_column="id", partitions=4)
+
+    assert list(batches) == []
+
+
+def test_partitioned_read_reraises_worker_errors(
+    connections: ConnectionRegistry,
+) -> None:
+    reader = SourceReaderService(connections=connections)
+    source = Source(
+        name="users",
+        config=SourceConfig(connection="db"),
+        columns=[SourceColumn(name="missing", data_type=DataType.INTEGER)],
+    )
+
+    batches = reader.iter_partitioned(source, key_column="id", partitions=2)
+
+    with pytest.raises(OperationalError, match="missing"):
+        list(batches)
+
+
+class _ConnectOnlyProvider(ConnectionProviderPort):
+    def connect(self, name: str) -> Any:
+        return None
+
+
+def test_provider_without_table_reads_reports_unsupported() -> None:
+    reader = SourceReaderService(connections=_ConnectOnlyProvider())
+    scan = reader.scan_for(_source())
+
+    with pytest.raises(ValidationError, match="cannot scan tables"):
+        list(reader.iter_batches(_source()))
+    with pytest.raises(ValidationError, match="cannot probe tables"):
+        reader.connections.table_stats("db", scan)
+    with pytest.raises(ValidationError, match="cannot probe tables"):
+        list(reader.iter_partitioned(_source(), key_column="id", partitions=2))
+
+
+def test_split_key_range_covers_ints_and_dates() -> None:
+    ranges = split_key_range("id", 1, 10, 3)
+
+    assert [(r.lower, r.upper) for r in ranges] == [
+        (None, 4),
+        (4, 7),
+        (7, None),
+    ]
+    days = split_key_range("day", date(2024, 1, 1), date(2024, 1, 4), 2)
+    assert [(r.lower, r.upper) for r in days] == [
+        (None, date(2024, 1, 3)),
+        (date(2024, 1, 3), None),
+    ]
+
+
+def test_split_key_range_merges_narrow_spans() -> None:
+    assert len(split_key_range("id", 5, 5, 4)) == 1
+    with pytest.raises(ValidationError, match="cannot be split"):
+        split_key_range("name", "a", "z", 2)
@@ -0,0 +1,252 @@
+"""Tests for the local source snapshot cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import text
+
+from limbo_core.adapters.connections import ConnectionRegistry
+from limbo_core.adapters.persistence import (
+    SNAPSHOT_INDEX_OBJECT_NAME,
+    DataPersistenceRegistry,
+    FileSnapshotIndexStore,
+)
+from limbo_core.application.interfaces.connections import TableStats
+from limbo_core.application.services import (
+    SourceReaderService,
+    SourceSnapshotService,
+)
+from limbo_core.domain.entities import (
+    ConnectionBackendSpec,
+    DataType,
+    DestinationBackendSpec,
+    Source,
+    SourceColumn,
+    SourceConfig,
+    SourceSnapshot,
+)
+from limbo_core.domain.validation import ValidationError
+from limbo_core.domain.value_objects import SnapshotIndex, SnapshotRecord
+from limbo_core.plugins.builtin.connections import SQLAlchemyConnectionBackend
+from limbo_core.plugins.builtin.persistence import (
+    ArrowIpcFileDataPersistenceBackend,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def connections(tmp_path: Path) -> Iterator[ConnectionRegistry]:
+    registry = ConnectionRegistry()
+    registry.register("sqlalchemy", SQLAlchemyConnectionBackend)
+    registry.configure(
+        ConnectionBackendSpec(
+            name="db",
+            type="sqlalchemy",
+            config={
+                "host": "",
+                "user": "",
+                "password": "",
+                "database": str(tmp_path / "source.db"),
+            },
+        )
+    )
+    _execute(
+        registry,
+        "CREATE TABLE users (id INTEGER, name TEXT, updated_at TEXT)",
+        "INSERT INTO users VALUES (1, 'ann', '2024-01-01')",
+        "INSERT INTO users VALUES (2, 'bob', '2024-01-02')",
+    )
+    yield registry
+    registry.dispose()
+
+
+def _execute(registry: ConnectionRegistry, *statements: str) -> None:
+    with registry.connect("db").begin() as connection:
+        for statement in statements:
+            connection.execute(text(statement))
+
+
+@pytest.fixture
+def persistence(tmp_path: Path) -> DataPersistenceRegistry:
+    registry = DataPersistenceRegistry()
+    registry.register("arrow", ArrowIpcFileDataPersistenceBackend)
+    registry.configure(
+        DestinationBackendSpec(
+            name="snapshots",
+            type="arrow",
+            config={"directory": tmp_path / "snapshots"},
+        )
+    )
+    return registry
+
+
+def _service(
+    connections: ConnectionRegistry,
+    persistence: DataPersistenceRegistry,
+    clock: _Clock | None = None,
+) -> SourceSnapshotService:
+    ref = persistence.storage_ref("snapshots", SNAPSHOT_INDEX_OBJECT_NAME)
+    return SourceSnapshotService(
+        reader=SourceReaderService(connections=connections),
+        persistence=persistence,
+        backend_key="snapshots",
+        index_store=FileSnapshotIndexStore(ref),
+        clock=clock or _Clock(),
+    )
+
+
+def _source(
+    snapshot: SourceSnapshot | None = None, *, columns: int = 2
+) -> Source:
+    return Source(
+        name="users",
+        config=SourceConfig(connection="db", snapshot=snapshot),
+        columns=[
+            SourceColumn(name="id", data_type=DataType.INTEGER),
+            SourceColumn(name="name", data_type=DataType.STRING),
+            SourceColumn(name="updated_at", data_type=DataType.STRING),
+        ][:columns],
+    )
+
+
+def _names(service: SourceSnapshotService, source: Source) -> list[str]:
+    return list(service.load(source).column("name"))
+
+
+def test_row_count_probe_serves_snapshot_until_count_changes(
+    connections: ConnectionRegistry, persistence: DataPersistenceRegistry
+) -> None:
+    service = _service(connections, persistence)
+    source = _source(SourceSnapshot())
+
+    assert _names(service, source) == ["ann", "bob"]
+    _execute(connections, "UPDATE users SET name = 'amy' WHERE id = 1")
+    assert service.is_fresh(source)
+    assert _names(service, source) == ["ann", "bob"]
+
+    _execute(connections, "INSERT INTO users VALUES (3, 'cy', '2024-01-03')")
+    assert not service.is_fresh(source)
+    assert _names(service, source) == ["amy", "bob", "cy"]
+
+
+def test_updated_at_probe_detects_updates(
+    connections: ConnectionRegistry, persistence: DataPersistenceRegistry
+) -> None:
+    service = _service(connections, persistence)
+    source = _source(
+        SourceSnapshot(freshness="updated_at", updated_at_column="updated_at")
+    )
+    service.refresh(source)
+
+    _execute(
+        connections,
+        "UPDATE users SET name = 'amy', updated_at = '2024-02-01' WHERE id = 1",
+    )
+
+    assert not service.is_fresh(source)
+    assert _names(service, source) == ["amy", "bob"]
+
+
+def test_ttl_trusts_snapshot_without_probing(
+    connections: ConnectionRegistry, persistence: DataPersistenceRegistry
+) -> None:
+    clock = _Clock()
+    service = _service(connections, persistence, clock)
+    source = _source(SourceSnapshot(freshness="ttl", ttl_seconds=60))
+    service.refresh(source)
+
+    _execute(connections, "INSERT INTO users VALUES (3, 'cy', '2024-01-03')")
+    clock.now += 59
+    assert _names(service, source) == ["ann", "bob"]
+    clock.now += 1
+    assert _names(service, source) == ["ann", "bob", "cy"]
+
+
+def test_index_survives_new_service(
+    connections: ConnectionRegistry, persistence: DataPersistenceRegistry
+) -> None:
+    source = _source(SourceSnapshot())
+    _service(connections, persistence).refresh(source)
+
+    assert _service(connections, persistence).is_fresh(source)
+
+
+def test_column_change_replaces_snapshot(
+    connections: ConnectionRegistry, persistence: DataPersistenceRegistry
+) -> None:
+    service = _service(connections, persistence)
+    old, new = _source(SourceSnapshot()), _source(SourceSnapshot(), columns=3)
+    service.refresh(old)
+
+    assert service.snapshot_name(old) != service.snapshot_name(new)
+    assert not service.is_fresh(new)
+    assert service.load(new).column_names == ("id", "name", "updated_at")
+    assert not persistence.exists("snapshots", service.snapshot_name(old))
+
+
+def test_snapshot_keeps_types_when_first_chunk_is_null(
+    connections: ConnectionRegistry, persistence: DataPersistenceRegistry
+) -> None:
+    service = _service(connections, persistence)
+    source = _source(SourceSnapshot())
+    _execute(connections, "UPDATE users SET name = NULL WHERE id = 1")
+
+    assert list(service.load(source, chunk_rows=1).column("name")) == [
+        None,
+        "bob",
+    ]
+
+
+def test_sources_without_snapshot_read_the_database(
+    connections: ConnectionRegistry, persistence: DataPersistenceRegistry
+) -> None:
+    service = _service(connections, persistence)
+    source = _source()
+
+    assert [b.num_rows for b in service.iter_batches(source)] == [2]
+    assert not service.is_fresh(source)
+    assert not persistence.exists("snapshots", service.snapshot_name(source))
+
+
+def test_table_stats_counts_rows_and_max_updated_at(
+    connections: ConnectionRegistry,
+) -> None:
+    reader = SourceReaderService(connections=connections)
+    scan = reader.scan_for(_source())
+
+    assert connections.table_stats("db", scan) == TableStats(row_count=2)
+    assert connections.table_stats(
+        "db", scan, updated_at_column="updated_at"
+    ) == TableStats(row_count=2, max_updated_at="2024-01-02")
+
+
+def test_snapshot_index_round_trips() -> None:
+    index = SnapshotIndex()
+    index.record(
+        "users",
+        SnapshotRecord(object_name="users-0f", taken_at=1.5, row_count=2),
+    )
+
+    assert SnapshotIndex.from_document(index.to_document()) == index
+    with pytest.raises(ValidationError, match="version 1"):
+        SnapshotIndex.from_document({"version": 2})
+
+
+def test_snapshot_config_requires_probe_options() -> None:
+    with pytest.raises(ValidationError, match="updated_at_column"):
+        SourceSnapshot(freshness="updated_at")
+    with pytest.raises(ValidationError, match="ttl_seconds"):
+        SourceSnapshot(freshness="ttl", ttl_seconds=0)
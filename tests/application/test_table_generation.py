@@ -0,0 +1,411 @@
+"""Tests for the table generation service."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from limbo_core.adapters.generators import GeneratorRegistry
+from limbo_core.adapters.persistence import (
+    DataPersistenceRegistry,
+    DefaultPersistor,
+)
+from limbo_core.application.context import RuntimeContext
+from limbo_core.application.interfaces import Persistor
+from limbo_core.application.interfaces.generators import (
+    Generator,
+    GeneratorRegistration,
+    generates,
+    generates_batch,
+)
+from limbo_core.application.services import TableGenerationService
+from limbo_core.domain.entities import (
+    DataType,
+    DestinationBackendSpec,
+    GenerationContext,
+    LiteralValue,
+    Table,
+    TableColumn,
+    TableConfig,
+)
+from limbo_core.plugins.builtin.persistence import (
+    JsonFileDataPersistenceBackend,
+)
+from limbo_core.validation import ValidationError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+    from limbo_core.application.interfaces.persistence import ColumnTypes
+    from limbo_core.domain.value_objects import TabularBatch
+
+
+@dataclass(slots=True)
+class _MemoryPersistor(Persistor):
+    saved: dict[str, tuple[TabularBatch, bool]] = field(default_factory=dict)
+
+    def save(
+        self, name: str, data: TabularBatch, *, materialize: bool = True
+    ) -> None:
+        self.saved[name] = (data, materialize)
+
+    def load(self, name: str) -> TabularBatch:
+        return self.saved[name][0]
+
+    def exists(self, name: str) -> bool:
+        return name in self.saved
+
+    def cleanup(self, name: str) -> None:
+        self.saved.pop(name, None)
+
+    def release(self, name: str) -> None:
+        self.saved.pop(name, None)
+
+
+@dataclass(slots=True)
+class _StreamingPersistor(_MemoryPersistor):
+    chunk_rows: list[int] = field(default_factory=list)
+    column_types: ColumnTypes | None = None
+
+    def save_stream(
+        self,
+        name: str,
+        column_names: tuple[str, ...],
+        chunks: Iterable[TabularBatch],
+        *,
+        materialize: bool = True,
+        column_types: ColumnTypes | None = None,
+    ) -> None:
+        self.column_types = column_types
+
+        def counted() -> Iterator[TabularBatch]:
+            for chunk in chunks:
+                self.chunk_rows.append(chunk.num_rows)
+                yield chunk
+
+        Persistor.save_stream(
+            self, name, column_names, counted(), materialize=materialize
+        )
+
+
+class _UserGenerator(Generator):
+    instances = 0
+    events: list[str] = []  # noqa: RUF012
+
+    def __init__(self) -> None:
+        type(self).instances += 1
+
+    def setup(self, context: GenerationContext) -> None:
+        self.events.append(f"setup:{context.table_name}")
+
+    def teardown(self, context: GenerationContext) -> None:
+        self.events.append(f"teardown:{context.table_name}")
+
+    @generates_batch("id")
+    def ids(
+        self, context: GenerationContext, count: int, **options: Any
+    ) -> list[int]:
+        start = options.get("start", 0)
+        return list(
+            range(start + context.row_index, start + context.row_index + count)
+        )
+
+    @generates("email")
+    def email(self, context: GenerationContext, **options: Any) -> str:
+        domain = options.get("domain", "example.com")
+        return f"user{context.row_data['id']}@{domain}"
+
+
+class _RandomGenerator(Generator):
+    @generates_batch("value")
+    def values(
+        self, context: GenerationContext, count: int, **options: Any
+    ) -> list[int]:
+        stream = context.random_stream()
+        return [stream.randrange(1_000_000) for _ in range(count)]
+
+
+def _table(*, materialize: bool = True) -> Table:
+    return Table(
+        name="users",
+        config=TableConfig(materialize=materialize),
+        columns=[
+            TableColumn(
+                name="id",
+                data_type=DataType.INTEGER,
+                generator="users.id",
+                options={
+                    "start": LiteralValue(value=1, data_type=DataType.INTEGER)
+                },
+            ),
+            TableColumn(
+                name="email",
+                data_type=DataType.STRING,
+                generator="users.email",
+                options={
+                    "domain": LiteralValue(
+                        value="test.com", data_type=DataType.STRING
+                    )
+                },
+            ),
+        ],
+    )
+
+
+@pytest.fixture
+def context() -> RuntimeContext:
+    _UserGenerator.instances = 0
+    _UserGenerator.events = []
+    registry = GeneratorRegistry()
+    registry.register(
+        GeneratorRegistration(namespace="users", generator_class=_UserGenerator)
+    )
+    registry.register(
+        GeneratorRegistration(
+            namespace="rand", generator_class=_RandomGenerator
+        )
+    )
+    return RuntimeContext(generator_registry=registry)
+
+
+def test_generate_builds_batch_and_saves(context: RuntimeContext) -> None:
+    """Generated rows are saved under the table name."""
+    persistor = _MemoryPersistor()
+    service = TableGenerationService(persistor=persistor)
+
+    service.generate(
+        _table(materialize=False), num_rows=5, context=context, batch_rows=2
+    )
+
+    data, materialize = persistor.saved["users"]
+    assert data.column("id") == [1, 2, 3, 4, 5]
+    assert data.column("email") == [f"user{i}@test.com" for i in range(1, 6)]
+    assert materialize is False
+    assert _UserGenerator.instances == 1
+    assert _UserGenerator.events == ["setup:users", "teardown:users"]
+
+
+def test_generate_streams_batches_to_persistor(context: RuntimeContext) -> None:
+    """Batches reach save_stream one by one with the declared types."""
+    persistor = _StreamingPersistor()
+    service = TableGenerationService(persistor=persistor)
+
+    service.generate(_table(), num_rows=5, context=context, batch_rows=2)
+
+    assert persistor.chunk_rows == [2, 2, 1]
+    assert persistor.column_types == {
+        "id": DataType.INTEGER,
+        "email": DataType.STRING,
+    }
+    assert persistor.load("users").column("id") == [1, 2, 3, 4, 5]
+
+
+def test_iter_batches_respects_batch_rows(context: RuntimeContext) -> None:
+    """Batches hold at most batch_rows rows and start at start_row."""
+    service = TableGenerationService(persistor=_MemoryPersistor())
+
+    batches = list(
+        service.iter_batches(
+            _table(), num_rows=5, context=context, batch_rows=2, start_row=10
+        )
+    )
+
+    assert [b.num_rows for b in batches] == [2, 2, 1]
+    assert batches[-1].column("id") == [15]
+
+
+def test_zero_rows_yields_one_empty_batch(context: RuntimeContext) -> None:
+    """Zero rows still produce a batch carrying the column names."""
+    service = TableGenerationService(persistor=_MemoryPersistor())
+
+    batches = list(service.iter_batches(_table(), num_rows=0, context=context))
+
+    assert len(batches) == 1
+    assert batches[0].column_names == ("id", "email")
+    assert batches[0].num_rows == 0
+
+
+@pytest.mark.parametrize(
+    ("num_rows", "batch_rows", "match"),
+    [(-1, 10, "num_rows"), (1, 0, "batch_rows")],
+)
+def test_invalid_sizes_raise(
+    context: RuntimeContext, num_rows: int, batch_rows: int, match: str
+) -> None:
+    """Negative row counts and non-positive batch sizes are rejected."""
+    service = TableGenerationService(persistor=_MemoryPersistor())
+
+    with pytest.raises(ValidationError, match=match):
+        service.iter_batches(
+            _table(), num_rows=num_rows, context=context, batch_rows=batch_rows
+        )
+
+
+def test_teardown_runs_when_iteration_stops_early(
+    context: RuntimeContext,
+) -> None:
+    """Closing the iterator early still tears generators down."""
+    service = TableGenerationService(persistor=_MemoryPersistor())
+
+    batches = service.iter_batches(
+        _table(), num_rows=10, context=context, batch_rows=2
+    )
+    next(batches)
+    batches.close()
+
+    assert _UserGenerator.events == ["setup:users", "teardown:users"]
+
+
+def _random_table(name: str = "numbers") -> Table:
+    return Table(
+        name=name,
+        config=TableConfig(),
+        columns=[
+            TableColumn(
+                name="id", data_type=DataType.INTEGER, generator="users.id"
+            ),
+            TableColumn(
+                name="value", data_type=DataType.INTEGER, generator="rand.value"
+            ),
+        ],
+    )
+
+
+def test_random_streams_ignore_batch_size(context: RuntimeContext) -> None:
+    """Per-column streams make output independent of batch_rows."""
+    persistor = _MemoryPersistor()
+    service = TableGenerationService(persistor=persistor)
+
+    service.generate(
+        _random_table(), num_rows=6, context=context, batch_rows=1, seed=3
+    )
+    small = persistor.load("numbers")
+    service.generate(
+        _random_table(), num_rows=6, context=context, batch_rows=4, seed=3
+    )
+
+    assert small == persistor.load("numbers")
+
+
+class TestGenerateSharded:
+    """Tests for multi-process sharded generation."""
+
+    def test_merge_is_independent_of_worker_count(
+        self, context: RuntimeContext
+    ) -> None:
+        """Merged output only depends on seed and shard size."""
+        outputs = []
+        for workers in (1, 3):
+            persistor = _MemoryPersistor()
+            service = TableGenerationService(persistor=persistor)
+            names = service.generate_sharded(
+                _random_table(),
+                num_rows=10,
+                context=context,
+                shard_rows=3,
+                max_workers=workers,
+                seed=7,
+            )
+            assert names == ["numbers"]
+            outputs.append(persistor.saved["numbers"][0])
+
+        assert outputs[0] == outputs[1]
+        assert outputs[0].column("id") == list(range(10))
+        values = outputs[0].column("value")
+        assert values[0:3] != values[3:6]
+
+    def test_parts_saves_one_artifact_per_shard(
+        self, context: RuntimeContext
+    ) -> None:
+        """Each shard is saved as a part in row order."""
+        persistor = _MemoryPersistor()
+        service = TableGenerationService(persistor=persistor)
+
+        names = service.generate_sharded(
+            _random_table(),
+            num_rows=5,
+            context=context,
+            shard_rows=2,
+            max_workers=2,
+            output="parts",
+        )
+
+        assert names == [
+            "numbers.part-00000",
+            "numbers.part-00001",
+            "numbers.part-00002",
+        ]
+        assert persistor.saved["numbers.part-00002"][0].column("id") == [4]
+
+    def test_parts_of_different_tables_get_distinct_files(
+        self, context: RuntimeContext, tmp_path: Path
+    ) -> None:
+        """Part names survive file backends' basename sanitizing."""
+        registry = DataPersistenceRegistry()
+        registry.register("json", JsonFileDataPersistenceBackend)
+        registry.configure(
+            DestinationBackendSpec(
+                name="out", type="json", config={"directory": tmp_path}
+            )
+        )
+        persistor = DefaultPersistor(data_resolver=registry, backend_key="out")
+        service = TableGenerationService(persistor=persistor)
+
+        for name in ("numbers", "others"):
+            service.generate_sharded(
+                _random_table(name),
+                num_rows=3,
+                context=context,
+                shard_rows=2,
+                max_workers=1,
+                output="parts",
+            )
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "numbers.part-00000.json",
+            "numbers.part-00001.json",
+            "others.part-00000.json",
+            "others.part-00001.json",
+        ]
+        persistor.cache.clear()
+        assert persistor.load("numbers.part-00001").column("id") == [2]
+
+    def test_seed_changes_output(self, context: RuntimeContext) -> None:
+        """Different project seeds produce different values."""
+        outputs = []
+        for seed in (1, 2):
+            persistor = _MemoryPersistor()
+            TableGenerationService(persistor=persistor).generate_sharded(
+                _random_table(),
+                num_rows=4,
+                context=context,
+                shard_rows=4,
+                max_workers=1,
+                seed=seed,
+            )
+            outputs.append(persistor.saved["numbers"][0].column("value"))
+
+        assert outputs[0] != outputs[1]
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"shard_rows": 0}, "shard_rows"),
+            ({"max_workers": 0}, "max_workers"),
+            ({"output": "zip"}, "output"),
+        ],
+    )
+    def test_invalid_arguments_raise(
+        self, context: RuntimeContext, kwargs: dict[str, Any], match: str
+    ) -> None:
+        """Invalid shard settings are rejected before any work starts."""
+        service = TableGenerationService(persistor=_MemoryPersistor())
+        arguments: dict[str, Any] = {"shard_rows": 2, **kwargs}
+
+        with pytest.raises(ValidationError, match=match):
+            service.generate_sharded(
+                _random_table(), num_rows=4, context=context, **arguments
+            )
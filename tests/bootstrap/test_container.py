@@ -5,12 +5,25 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import pytest
+
+from limbo_core.adapters.persistence import (
+    MANIFEST_OBJECT_NAME,
+    DefaultPersistor,
+    FileRunManifestStore,
+)
 from limbo_core.application.interfaces.persistence import DataPersistenceBackend
 from limbo_core.bootstrap import Container, get_container
+from limbo_core.domain.entities import DestinationBackendSpec
+from limbo_core.domain.validation import ValidationError
 from limbo_core.domain.value_objects import (  # noqa: TC001
     ResolvedStorageRef,
     TabularBatch,
 )
+from limbo_core.plugins.builtin.persistence import (
+    FilesystemPathResolver,
+    SQLAlchemyDataPersistenceBackend,
+)
 
 
 @dataclass(slots=True)
@@ -72,3 +85,58 @@ class TestContainer:
         }
         project = container.load_project(payload)
         assert project.tables[0].name == "users"
+
+    def test_table_generation_service_persists_via_backend_key(self) -> None:
+        """Built service saves through the named data persistence backend."""
+        container = Container()
+        service = container.table_generation_service("default")
+
+        assert isinstance(service.persistor, DefaultPersistor)
+        assert service.persistor.backend_key == "default"
+        assert (
+            service.persistor.data_resolver
+            is container.data_persistence_registry
+        )
+        assert service.value_resolver is container.value_reader_registry
+
+    def test_generation_run_service_stores_manifest_next_to_outputs(
+        self,
+    ) -> None:
+        """The run manifest lives in the destination backend's directory."""
+        container = Container()
+        container.path_resolver_registry.register(
+            "file", FilesystemPathResolver
+        )
+        container.data_persistence_registry.register(
+            "memory", _StubWriteBackend
+        )
+        container.data_persistence_registry.configure(
+            DestinationBackendSpec(name="out", type="memory")
+        )
+
+        service = container.generation_run_service("out")
+
+        assert isinstance(service.manifest_store, FileRunManifestStore)
+        assert service.manifest_store.ref.as_local_path() == Path(
+            "/__limbo_stub__", MANIFEST_OBJECT_NAME
+        )
+        persistor = service.generation.persistor
+        assert isinstance(persistor, DefaultPersistor)
+        assert persistor.backend_key == "out"
+
+    def test_document_stores_reject_table_backends(self) -> None:
+        """Manifests and snapshot indexes cannot live in database tables."""
+        container = Container()
+        container.data_persistence_registry.register(
+            "sqlalchemy", SQLAlchemyDataPersistenceBackend
+        )
+        container.data_persistence_registry.configure(
+            DestinationBackendSpec(
+                name="db", type="sqlalchemy", config={"connection": "dw"}
+            )
+        )
+
+        with pytest.raises(ValidationError, match="stores database tables"):
+            container.generation_run_service("db")
+        with pytest.raises(ValidationError, match="stores database tables"):
+            container.source_snapshot_service("db")
@@ -1,10 +1,14 @@
 """Tests for SQLAlchemy connection backend."""
 
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+from sqlalchemy.pool import QueuePool
 
+from limbo_core.adapters.connections import ConnectionRegistry
 from limbo_core.adapters.connections.errors import MissingPackageError
+from limbo_core.application.context.errors import ConnectionNotFoundError
 from limbo_core.domain.entities import ConnectionBackendSpec
 from limbo_core.plugins.builtin.connections import SQLAlchemyConnectionBackend
 from limbo_core.validation import ValidationError
@@ -260,3 +264,118 @@ class TestSQLAlchemyConnectionBackendConnect:
             pytest.raises(MissingPackageError, match="sqlalchemy"),
         ):
             backend.connect()
+
+    def test_connect_reuses_engine(self) -> None:
+        backend = SQLAlchemyConnectionBackend.from_spec(
+            _sqlalchemy_spec(host="", user="", password="", database="")
+        )
+        assert backend.connect() is backend.connect()
+
+    def test_dispose_drops_engine(self) -> None:
+        backend = SQLAlchemyConnectionBackend.from_spec(
+            _sqlalchemy_spec(host="", user="", password="", database="")
+        )
+        engine = backend.connect()
+
+        backend.dispose()
+
+        assert backend.connect() is not engine
+
+    def test_pool_options_are_passed_to_engine(self, tmp_path: Path) -> None:
+        backend = SQLAlchemyConnectionBackend.from_spec(
+            _sqlalchemy_spec(
+                host="",
+                user="",
+                password="",
+                database=str(tmp_path / "pool.db"),
+                pool_size=3,
+                max_overflow=0,
+                pool_pre_ping=True,
+                pool_recycle=60,
+            )
+        )
+        pool = backend.connect().pool
+
+        assert isinstance(pool, QueuePool)
+        assert pool.size() == 3
+        assert pool._max_overflow == 0
+        assert pool._pre_ping
+        assert pool._recycle == 60
+
+    def test_pool_options_unsupported_by_pool_are_rejected(self) -> None:
+        backend = SQLAlchemyConnectionBackend.from_spec(
+            _sqlalchemy_spec(
+                host="",
+                user="",
+                password="",
+                database=":memory:",
+                max_overflow=2,
+            )
+        )
+        with pytest.raises(ValidationError, match="invalid pool options"):
+            backend.connect()
+
+
+class TestSQLAlchemyConnectionBackendPoolConfig:
+    """Tests for pool option parsing."""
+
+    @pytest.mark.parametrize(
+        ("config", "message"),
+        [
+            ({"pool_size": 0}, "`pool_size` must be at least 1"),
+            ({"max_overflow": -1}, "`max_overflow` must be at least 0"),
+            ({"pool_recycle": "60"}, "`pool_recycle` expects an integer"),
+            ({"pool_size": True}, "`pool_size` expects an integer"),
+            ({"pool_pre_ping": "yes"}, "`pool_pre_ping` expects a boolean"),
+        ],
+    )
+    def test_rejects_invalid_pool_options(
+        self, config: dict[str, object], message: str
+    ) -> None:
+        with pytest.raises(ValidationError, match=message):
+            SQLAlchemyConnectionBackend.from_spec(
+                _sqlalchemy_spec(
+                    host="", user="", password="", database="", **config
+                )
+            )
+
+
+class TestConnectionRegistryDispose:
+    """Tests for engine lifecycle management in the registry."""
+
+    @staticmethod
+    def _registry() -> ConnectionRegistry:
+        registry = ConnectionRegistry()
+        registry.register("sqlalchemy", SQLAlchemyConnectionBackend)
+        registry.configure(
+            _sqlalchemy_spec(host="", user="", password="", database="")
+        )
+        return registry
+
+    def test_connect_returns_shared_engine(self) -> None:
+        registry = self._registry()
+        assert registry.connect("main_db") is registry.connect("main_db")
+
+    def test_dispose_releases_engines(self) -> None:
+        registry = self._registry()
+        engine = registry.connect("main_db")
+
+        registry.dispose()
+
+        assert registry.connect("main_db") is not engine
+
+    def test_dispose_unknown_name_raises(self) -> None:
+        with pytest.raises(ConnectionNotFoundError):
+            self._registry().dispose("other")
+
+    def test_reconfigure_disposes_replaced_backend(self) -> None:
+        registry = self._registry()
+        previous = registry.get_instances()["main_db"]
+        registry.connect("main_db")
+
+        registry.configure(
+            _sqlalchemy_spec(host="", user="", password="", database="")
+        )
+
+        assert isinstance(previous, SQLAlchemyConnectionBackend)
+        assert previous._engine is None
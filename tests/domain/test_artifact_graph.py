@@ -0,0 +1,110 @@
+"""Tests for the artifact dependency graph."""
+
+from __future__ import annotations
+
+import pytest
+
+from limbo_core.domain.entities import (
+    DataType,
+    Project,
+    Source,
+    SourceColumn,
+    SourceConfig,
+    Table,
+    TableColumn,
+    TableConfig,
+    TableReference,
+    TableRelationship,
+)
+from limbo_core.domain.validation import ValidationError
+from limbo_core.domain.value_objects import (
+    ArtifactCycleError,
+    ArtifactGraph,
+    ArtifactKey,
+    UnknownArtifactReferenceError,
+)
+
+
+def _table(name: str, *refs: tuple[str, str]) -> Table:
+    return Table(
+        name=name,
+        config=TableConfig(),
+        columns=[
+            TableColumn(
+                name="id", data_type=DataType.INTEGER, generator="gen.id"
+            )
+        ],
+        references=[
+            TableReference(
+                type=ref_type,  # type: ignore[arg-type]
+                name=ref_name,
+                relationship=TableRelationship.MANY_TO_ONE,
+            )
+            for ref_type, ref_name in refs
+        ]
+        or None,
+    )
+
+
+def _project(*tables: Table) -> Project:
+    return Project(
+        destinations=[],
+        tables=list(tables),
+        sources=[
+            Source(
+                name="companies",
+                config=SourceConfig(connection="db"),
+                columns=[SourceColumn(name="id", data_type=DataType.INTEGER)],
+            )
+        ],
+    )
+
+
+def test_from_project_builds_edges_and_order() -> None:
+    """Dependencies precede dependents in the topological order."""
+    graph = ArtifactGraph.from_project(
+        _project(
+            _table("orders", ("table", "users")),
+            _table("users", ("source", "companies")),
+            _table("products"),
+        )
+    )
+
+    users = ArtifactKey("table", "users")
+    assert graph.dependencies[users] == {ArtifactKey("source", "companies")}
+    assert graph.dependents[users] == {ArtifactKey("table", "orders")}
+    assert graph.topological_order() == [
+        ArtifactKey("source", "companies"),
+        ArtifactKey("table", "products"),
+        users,
+        ArtifactKey("table", "orders"),
+    ]
+
+
+def test_unknown_reference_raises() -> None:
+    """References must name declared artifacts."""
+    with pytest.raises(UnknownArtifactReferenceError, match="seed 'missing'"):
+        ArtifactGraph.from_project(
+            _project(_table("users", ("seed", "missing")))
+        )
+
+
+def test_duplicate_artifact_raises() -> None:
+    """Artifact names are unique per type."""
+    with pytest.raises(ValidationError, match="Duplicate table 'users'"):
+        ArtifactGraph.from_project(_project(_table("users"), _table("users")))
+
+
+def test_cycle_raises_with_path() -> None:
+    """Cycles are reported with the artifacts involved."""
+    project = _project(
+        _table("a", ("table", "b")),
+        _table("b", ("table", "c")),
+        _table("c", ("table", "a")),
+        _table("d", ("table", "a")),
+    )
+
+    with pytest.raises(ArtifactCycleError) as exc_info:
+        ArtifactGraph.from_project(project)
+
+    assert [key.name for key in exc_info.value.cycle] == ["a", "b", "c", "a"]
@@ -14,6 +14,7 @@ from limbo_core.application.interfaces import (
     GeneratorRegistryPort,
     ReferenceResolver,
 )
+from limbo_core.domain.entities.generation import GenerationContext, derive_seed
 
 if TYPE_CHECKING:
     from limbo_core.application.interfaces.generators import (
@@ -88,3 +89,26 @@ class TestConnectionNotFoundError:
             "my_db", available_connections=["pg", "redis"]
         )
         assert err.available_connections == ("pg", "redis")
+
+
+class TestGenerationContextSeeding:
+    """Tests for deterministic shard seeds."""
+
+    def test_shard_seed_is_stable_and_keyed(self) -> None:
+        """Shard seeds depend on seed, table and shard index only."""
+        base = GenerationContext(table_name="users", seed=7, shard_index=1)
+
+        assert base.shard_seed == derive_seed(7, "users", 1)
+        assert base.shard_seed == (
+            GenerationContext(
+                table_name="users", seed=7, shard_index=1, row_index=99
+            ).shard_seed
+        )
+        assert base.shard_seed != (
+            GenerationContext(table_name="users", seed=7).shard_seed
+        )
+        assert base.shard_seed != (
+            GenerationContext(
+                table_name="orders", seed=7, shard_index=1
+            ).shard_seed
+        )
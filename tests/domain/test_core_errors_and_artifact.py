@@ -63,3 +63,18 @@ class TestArtifactValidation:
             name="users", config=ArtifactConfig(), columns=[col]
         )
         assert artifact.columns == [col]
+
+    def test_column_types_maps_names_to_data_types(self) -> None:
+        """column_types exposes each column's declared DataType."""
+        artifact = _DemoArtifact(
+            name="users",
+            config=ArtifactConfig(),
+            columns=[
+                ArtifactColumn(name="id", data_type=DataType.INTEGER),
+                ArtifactColumn(name="born", data_type=DataType.DATE),
+            ],
+        )
+        assert artifact.column_types == {
+            "id": DataType.INTEGER,
+            "born": DataType.DATE,
+        }
@@ -0,0 +1,78 @@
+"""Tests for counter-based random streams."""
+
+from __future__ import annotations
+
+import pytest
+
+from limbo_core.domain.entities import GenerationContext, RandomStream
+from limbo_core.domain.validation import ValidationError
+
+
+def test_same_key_reproduces_sequence() -> None:
+    """Streams with the same key yield the same values."""
+    first = RandomStream.for_key(1, "users", "age", 0)
+    second = RandomStream.for_key(1, "users", "age", 0)
+
+    assert [first.next_uint64() for _ in range(5)] == [
+        second.next_uint64() for _ in range(5)
+    ]
+    assert first.counter == 5
+
+
+def test_jump_and_seek_match_sequential_draws() -> None:
+    """Jumping ahead yields the values sequential draws would reach."""
+    sequential = RandomStream(42)
+    values = [sequential.random() for _ in range(10)]
+
+    jumped = RandomStream(42)
+    jumped.jump(7)
+    assert jumped.random() == values[7]
+    jumped.seek(2)
+    assert jumped.random_batch(3) == values[2:5]
+
+
+def test_split_is_independent_and_stable() -> None:
+    """Children depend on parent key and parts, not parent position."""
+    parent = RandomStream(5)
+    child = parent.split("a")
+    parent.jump(100)
+
+    assert parent.split("a").next_uint64() == child.next_uint64()
+    assert parent.split("b").key != parent.split("a").key
+
+
+def test_bounded_draws_stay_in_range() -> None:
+    """Integer and choice helpers respect their bounds."""
+    stream = RandomStream(9)
+
+    assert {stream.randrange(3) for _ in range(200)} == {0, 1, 2}
+    assert all(10 <= stream.randint(10, 12) <= 12 for _ in range(50))
+    assert stream.choice(["x"]) == "x"
+    assert all(0.0 <= stream.random() < 1.0 for _ in range(50))
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda s: s.randrange(0),
+        lambda s: s.randrange(5, 5),
+        lambda s: s.choice([]),
+        lambda s: s.seek(-1),
+    ],
+)
+def test_invalid_arguments_raise(call: object) -> None:
+    """Empty ranges, empty choices and negative counters are rejected."""
+    with pytest.raises(ValidationError):
+        call(RandomStream(1))  # type: ignore[operator]
+
+
+def test_context_streams_are_keyed_per_column_and_shard() -> None:
+    """Context streams depend on seed, table, column and shard."""
+    context = GenerationContext(table_name="users", seed=3, column_name="age")
+
+    stream = context.random_stream()
+    assert context.random_stream("age") is stream
+    assert stream.key == RandomStream.for_key(3, "users", "age", 0).key
+    assert context.random_stream("name").key != stream.key
+    other_shard = GenerationContext(table_name="users", seed=3, shard_index=1)
+    assert other_shard.random_stream("age").key != stream.key
@@ -2,11 +2,25 @@
 
 from __future__ import annotations
 
+import gzip
+import sys
+import zlib
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Literal, TextIO, cast
 
 import pytest
 
-from limbo_core.domain.value_objects import LocalFilesystemStorageRef
+from limbo_core.domain.validation import ValidationError
+from limbo_core.domain.value_objects import (
+    LocalFilesystemStorageRef,
+    MissingCodecError,
+    ResolvedStorageRef,
+    infer_compression,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 def _ref(
@@ -90,3 +104,249 @@ def test_open_binary_write_read_append(tmp_path: Path) -> None:
         out.write(b"c")
     with ref.open_binary("rb") as inp:
         assert inp.read() == b"abc"
+
+
+def test_gzip_suffix_is_compressed_transparently(tmp_path: Path) -> None:
+    p = tmp_path / "t.csv.gz"
+    ref = _ref(local_path=p, uri=str(p))
+    with ref.open_text("w", encoding="utf-8", newline="") as fh:
+        fh.write("a,b\n1,2\n")
+    with ref.open_binary("ab") as out:
+        out.write(b"3,4\n")
+
+    assert ref.compression == "gzip"
+    assert gzip.decompress(p.read_bytes()) == b"a,b\n1,2\n3,4\n"
+    with ref.open_text("r", encoding="utf-8", newline="") as fh:
+        assert fh.read() == "a,b\n1,2\n3,4\n"
+
+
+def test_with_compression_overrides_suffix(tmp_path: Path) -> None:
+    p = tmp_path / "seed.csv"
+    ref = _ref(local_path=p, uri=str(p)).with_compression("gzip")
+    ref.write_bytes(b"payload")
+
+    assert gzip.decompress(p.read_bytes()) == b"payload"
+    assert ref.read_bytes() == b"payload"
+    assert ref.with_compression(None).read_bytes() == p.read_bytes()
+    assert ref != _ref(local_path=p, uri=str(p))
+
+
+def test_infer_compression_from_suffix() -> None:
+    assert infer_compression(Path("a.jsonl.zst")) == "zstd"
+    assert infer_compression(Path("a.csv.BR")) == "brotli"
+    assert infer_compression(Path("a.parquet")) is None
+
+
+def test_invalid_compression_raises() -> None:
+    with pytest.raises(ValidationError, match="compression"):
+        _ref().with_compression("lzma")  # type: ignore[arg-type]
+
+
+def test_brotli_append_raises(tmp_path: Path) -> None:
+    p = tmp_path / "t.br"
+    ref = _ref(local_path=p, uri=str(p))
+    with pytest.raises(ValidationError, match="append"), ref.open_binary("ab"):
+        pass
+
+
+def test_missing_codec_package_raises(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+    p = tmp_path / "t.zst"
+    ref = _ref(local_path=p, uri=str(p))
+    with pytest.raises(MissingCodecError, match="zstandard"):
+        ref.write_bytes(b"x")
+
+
+@pytest.mark.parametrize(
+    ("suffix", "package"), [(".zst", "zstandard"), (".br", "brotli")]
+)
+def test_optional_codecs_round_trip(
+    tmp_path: Path, suffix: str, package: str
+) -> None:
+    pytest.importorskip(package)
+    p = tmp_path / f"t.txt{suffix}"
+    ref = _ref(local_path=p, uri=str(p))
+    with ref.open_text("w", encoding="utf-8") as fh:
+        fh.write("x" * 100_000)
+    assert p.stat().st_size < 1_000
+    with ref.open_text("r", encoding="utf-8") as fh:
+        assert fh.read() == "x" * 100_000
+
+
+class _ZlibBrotli:
+    """``brotli`` module stand-in built on zlib, for the stream wrappers."""
+
+    class Compressor:
+        def __init__(self) -> None:
+            self._zlib = zlib.compressobj()
+
+        def process(self, data: bytes) -> bytes:
+            return self._zlib.compress(data)
+
+        def finish(self) -> bytes:
+            return self._zlib.flush()
+
+    class Decompressor:
+        def __init__(self) -> None:
+            self._zlib = zlib.decompressobj()
+
+        def process(self, data: bytes) -> bytes:
+            return self._zlib.decompress(data)
+
+        def is_finished(self) -> bool:
+            return self._zlib.eof
+
+
+def test_brotli_wrappers_round_trip_and_detect_truncation(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setitem(sys.modules, "brotli", _ZlibBrotli)
+    p = tmp_path / "t.txt.br"
+    ref = _ref(local_path=p, uri=str(p))
+    payload = b"0123456789" * 20_000
+    ref.write_bytes(payload)
+
+    assert ref.read_bytes() == payload
+    p.write_bytes(p.read_bytes()[:-8])
+    with pytest.raises(EOFError, match="end-of-stream"):
+        ref.read_bytes()
+
+
+class _GzipZstandard:
+    """``zstandard`` module stand-in built on gzip, for the stream wrappers."""
+
+    class ZstdCompressor:
+        def stream_writer(self, raw: BinaryIO, *, closefd: bool) -> BinaryIO:
+            assert not closefd
+            return cast("BinaryIO", gzip.GzipFile(fileobj=raw, mode="wb"))
+
+    class ZstdDecompressor:
+        def stream_reader(
+            self, raw: BinaryIO, *, read_across_frames: bool, closefd: bool
+        ) -> BinaryIO:
+            assert read_across_frames
+            assert not closefd
+            return cast("BinaryIO", gzip.GzipFile(fileobj=raw, mode="rb"))
+
+
+def test_zstd_wrapper_round_trips_and_appends_frames(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setitem(sys.modules, "zstandard", _GzipZstandard)
+    p = tmp_path / "t.txt.zst"
+    ref = _ref(local_path=p, uri=str(p))
+    ref.write_bytes(b"a\n")
+    with ref.open_binary("ab") as out:
+        out.write(b"b\n")
+
+    assert ref.read_bytes() == b"a\nb\n"
+
+
+def test_atomic_write_keeps_original_on_failure(tmp_path: Path) -> None:
+    p = tmp_path / "t.bin"
+    ref = _ref(local_path=p, uri=str(p))
+    ref.write_bytes(b"old")
+
+    def _write() -> None:
+        with ref.open_atomic_binary() as out:
+            out.write(b"partial")
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        _write()
+
+    assert p.read_bytes() == b"old"
+    assert sorted(tmp_path.iterdir()) == [p]
+
+
+def test_atomic_write_replaces_on_success(tmp_path: Path) -> None:
+    p = tmp_path / "sub" / "t.txt.gz"
+    ref = _ref(local_path=p, uri=str(p))
+    with ref.open_atomic_text(encoding="utf-8", fsync=True) as fh:
+        fh.write("new")
+        assert not p.exists()
+
+    assert gzip.decompress(p.read_bytes()) == b"new"
+    assert sorted(p.parent.iterdir()) == [p]
+
+
+class _LegacyRef(ResolvedStorageRef):
+    """In-memory ref implementing only the original abstract methods."""
+
+    def __init__(self) -> None:
+        self.data: bytes | None = None
+        self.writes = 0
+
+    @property
+    def backend(self) -> str:
+        return "memory"
+
+    @property
+    def uri(self) -> str:
+        return "memory://x"
+
+    def exists(self) -> bool:
+        return self.data is not None
+
+    def unlink(self) -> None:
+        self.data = None
+
+    def as_local_path(self) -> Path:
+        raise ValidationError("not local")
+
+    def read_bytes(self) -> bytes:
+        return self.data or b""
+
+    def write_bytes(self, data: bytes) -> None:
+        self.data = data
+        self.writes += 1
+
+    @contextmanager
+    def open_binary(
+        self, mode: Literal["rb", "wb", "ab"]
+    ) -> Iterator[BinaryIO]:
+        raise NotImplementedError
+
+    @contextmanager
+    def open_text(
+        self,
+        mode: Literal["r", "w", "a"],
+        *,
+        encoding: str,
+        newline: str | None = None,
+    ) -> Iterator[TextIO]:
+        raise NotImplementedError
+
+
+def test_atomic_fallback_writes_once_on_success() -> None:
+    """Refs without atomic support store the whole content via write_bytes."""
+    ref = _LegacyRef()
+    with ref.open_atomic_text(encoding="utf-8") as fh:
+        fh.write("héllo")
+        assert not ref.exists()
+
+    assert ref.data == "héllo".encode()
+    assert ref.writes == 1
+
+    def _write() -> None:
+        with ref.open_atomic_binary() as out:
+            out.write(b"partial")
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        _write()
+
+    assert ref.data == "héllo".encode()
+
+
+def test_children_are_files_below_the_path(tmp_path: Path) -> None:
+    ref = _ref(local_path=tmp_path / "ds", uri="file:///ds")
+    assert ref.list_children() == []
+
+    ref.child("b=1/part-00000.csv").write_bytes(b"x")
+    ref.child("_dataset.json").write_bytes(b"{}")
+
+    assert ref.child("a.csv").uri == "file:///ds/a.csv"
+    assert ref.list_children() == ["_dataset.json", "b=1/part-00000.csv"]
@@ -0,0 +1,97 @@
+"""Tests for run manifests and definition fingerprints."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+
+from limbo_core.domain.entities import (
+    DataType,
+    LiteralValue,
+    Table,
+    TableColumn,
+    TableConfig,
+)
+from limbo_core.domain.validation import ValidationError
+from limbo_core.domain.value_objects import (
+    ArtifactKey,
+    ManifestEntry,
+    RunManifest,
+    fingerprint,
+)
+
+
+@dataclass(frozen=True)
+class _Point:
+    x: int
+
+
+def _table(start: int = 1) -> Table:
+    return Table(
+        name="users",
+        config=TableConfig(),
+        columns=[
+            TableColumn(
+                name="id",
+                data_type=DataType.INTEGER,
+                generator="users.id",
+                options={
+                    "start": LiteralValue(
+                        value=start, data_type=DataType.INTEGER
+                    )
+                },
+            )
+        ],
+    )
+
+
+def test_fingerprint_is_stable_and_tracks_definition_changes() -> None:
+    assert fingerprint(_table()) == fingerprint(_table())
+    assert fingerprint(_table()) != fingerprint(_table(start=2))
+    assert fingerprint({"a": 1, "b": 2}) == fingerprint({"b": 2, "a": 1})
+    assert len(fingerprint(_table())) == 32
+
+
+def test_fingerprint_orders_sets_of_mappings() -> None:
+    first = fingerprint({frozenset({("a", 1)}), frozenset({("b", 2)})})
+    second = fingerprint({frozenset({("b", 2)}), frozenset({("a", 1)})})
+
+    assert first == second
+    assert fingerprint([{"k": 1}]) != fingerprint([{"k": 2}])
+    assert fingerprint({_Point(1), _Point(2)}) == fingerprint({
+        _Point(2),
+        _Point(1),
+    })
+
+
+def test_fingerprint_rejects_values_without_a_stable_form() -> None:
+    with pytest.raises(TypeError, match="object"):
+        fingerprint(object())
+
+
+def test_manifest_document_round_trip() -> None:
+    manifest = RunManifest()
+    key = ArtifactKey("table", "users")
+    entry = ManifestEntry(fingerprint="f", seed=3, num_rows=9)
+    manifest.record(key, entry)
+
+    restored = RunManifest.from_document(manifest.to_document())
+
+    assert restored.is_complete(key, entry)
+    assert not restored.is_complete(key, ManifestEntry(fingerprint="g"))
+    restored.discard(key)
+    assert restored.entries == {}
+
+
+@pytest.mark.parametrize(
+    "doc",
+    [
+        [],
+        {"version": 99, "artifacts": []},
+        {"version": 1, "artifacts": [{"type": "table"}]},
+    ],
+)
+def test_manifest_rejects_malformed_documents(doc: object) -> None:
+    with pytest.raises(ValidationError, match="manifest"):
+        RunManifest.from_document(doc)
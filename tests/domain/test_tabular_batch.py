@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import pickle
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from limbo_core.domain.validation import ValidationError
@@ -37,3 +40,138 @@ def test_tabular_batch_allows_none_cell() -> None:
         column_names=("id", "note"), rows=({"id": 1, "note": None},)
     )
     assert batch.rows[0]["note"] is None
+
+
+def test_tabular_batch_from_columns_exposes_row_view() -> None:
+    batch = TabularBatch.from_columns(
+        ("id", "name"), {"id": [1, 2], "name": ["a", "b"]}
+    )
+    assert batch.num_rows == 2
+    assert batch.column("name") == ["a", "b"]
+    assert batch.rows == ({"id": 1, "name": "a"}, {"id": 2, "name": "b"})
+
+
+def test_tabular_batch_row_major_exposes_column_view() -> None:
+    batch = TabularBatch(
+        column_names=("id", "name"),
+        rows=({"id": 1, "name": "a"}, {"id": 2, "name": "b"}),
+    )
+    assert batch.column("id") == [1, 2]
+    assert list(batch.iter_row_values()) == [(1, "a"), (2, "b")]
+
+
+def test_tabular_batch_equality_across_layouts() -> None:
+    rows = TabularBatch(column_names=("id",), rows=({"id": 1}, {"id": 2}))
+    cols = TabularBatch.from_columns(("id",), {"id": (1, 2)})
+    assert rows == cols
+    assert cols != TabularBatch.from_columns(("id",), {"id": (1, 3)})
+
+
+def test_tabular_batch_from_columns_rejects_key_mismatch() -> None:
+    with pytest.raises(ValidationError, match="column keys"):
+        TabularBatch.from_columns(("id", "name"), {"id": [1]})
+
+
+def test_tabular_batch_from_columns_rejects_ragged_columns() -> None:
+    with pytest.raises(ValidationError, match="same length"):
+        TabularBatch.from_columns(("id", "name"), {"id": [1, 2], "name": []})
+
+
+def test_tabular_batch_from_columns_rejects_duplicate_column_names() -> None:
+    with pytest.raises(ValidationError, match="unique"):
+        TabularBatch.from_columns(("id", "id"), {"id": [1]})
+
+
+def test_tabular_batch_trusted_skips_row_check() -> None:
+    batch = TabularBatch(
+        column_names=("id",), rows=({"other": 1},), validation="trusted"
+    )
+    assert batch.num_rows == 1
+    with pytest.raises(ValidationError, match="row 0 keys"):
+        batch.validate_rows()
+
+
+def test_tabular_batch_sampled_checks_first_and_last_rows() -> None:
+    rows = [{"id": i} for i in range(1000)]
+    rows[-1] = {"other": 1}
+    with pytest.raises(ValidationError, match="row 999 keys"):
+        TabularBatch(
+            column_names=("id",),
+            rows=tuple(rows),
+            validation="sampled",
+            sample_size=8,
+        )
+
+
+def test_tabular_batch_sampled_accepts_unsampled_mismatch() -> None:
+    rows = [{"id": i} for i in range(1000)]
+    rows[1] = {"other": 1}
+    batch = TabularBatch(
+        column_names=("id",),
+        rows=tuple(rows),
+        validation="sampled",
+        sample_size=8,
+    )
+    assert batch.num_rows == 1000
+
+
+def test_tabular_batch_rejects_unknown_validation_mode() -> None:
+    with pytest.raises(ValidationError, match="validation must be"):
+        TabularBatch(
+            column_names=("id",),
+            rows=(),
+            validation="lazy",  # type: ignore[arg-type]
+        )
+
+
+def test_tabular_batch_rejects_non_positive_sample_size() -> None:
+    with pytest.raises(ValidationError, match="sample_size"):
+        TabularBatch(
+            column_names=("id",), rows=(), validation="sampled", sample_size=0
+        )
+
+
+def test_tabular_batch_concat_and_slice() -> None:
+    first = TabularBatch(column_names=("id",), rows=({"id": 1}, {"id": 2}))
+    second = TabularBatch.from_columns(("id",), {"id": [3]})
+    merged = TabularBatch.concat(("id",), [first, second])
+    assert merged.column("id") == [1, 2, 3]
+    assert merged.slice(1, 3).column("id") == [2, 3]
+    assert first.slice(1, 2).rows == ({"id": 2},)
+
+
+def test_tabular_batch_concat_rejects_mismatched_columns() -> None:
+    other = TabularBatch.from_columns(("x",), {"x": [1]})
+    with pytest.raises(ValidationError, match="batch 0 columns"):
+        TabularBatch.concat(("id",), [other])
+
+
+def test_tabular_batch_select_and_take() -> None:
+    batch = TabularBatch.from_columns(
+        ("id", "name"), {"id": [1, 2, 3], "name": ["a", "b", "c"]}
+    )
+    assert batch.select(("name",)).column("name") == ["a", "b", "c"]
+    assert batch.take([2, 0]).rows == (
+        {"id": 3, "name": "c"},
+        {"id": 1, "name": "a"},
+    )
+    with pytest.raises(ValidationError, match="unknown columns"):
+        batch.select(("missing",))
+
+
+def test_tabular_batch_rejects_attribute_assignment() -> None:
+    batch = TabularBatch.from_columns(("id",), {"id": [1, 2]})
+    assert batch.rows == ({"id": 1}, {"id": 2})
+    with pytest.raises(FrozenInstanceError):
+        batch._num_rows = 5  # type: ignore[misc]
+    with pytest.raises(FrozenInstanceError):
+        del batch._rows  # type: ignore[misc]
+
+
+def test_tabular_batch_pickles_both_layouts() -> None:
+    columnar = TabularBatch.from_columns(("id",), {"id": [1, 2]})
+    row_major = TabularBatch(("id",), ({"id": 1}, {"id": 2}))
+    for batch in (columnar, row_major):
+        restored = pickle.loads(pickle.dumps(batch))
+        assert restored == batch
+        assert restored.column("id") == [1, 2]
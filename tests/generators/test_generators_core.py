@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from importlib import metadata
 from typing import Any
 from unittest.mock import Mock
 
@@ -19,6 +20,7 @@ from limbo_core.application.interfaces.generators import (
     GeneratorRegistration,
     GeneratorRegistryPort,
     generates,
+    generates_batch,
 )
 from limbo_core.domain.entities import GenerationContext
 
@@ -186,3 +188,120 @@ def test_generator_class_rejects_duplicate_local_hooks() -> None:
             @generates("email")
             def second(self, context: GenerationContext, **options: Any) -> str:
                 return "second@example.com"
+
+
+class _BatchGenerator(Generator):
+    """Generator mixing native batch, scalar-only and batch-only hooks."""
+
+    @generates("seq")
+    def seq(self, context: GenerationContext, **options: Any) -> int:
+        return context.row_index + options.get("offset", 0)
+
+    @generates_batch("seq")
+    def seq_batch(
+        self, context: GenerationContext, count: int, **options: Any
+    ) -> list[int]:
+        start = context.row_index + options.get("offset", 0)
+        return list(range(start, start + count))
+
+    @generates("scalar_only")
+    def scalar_only(self, context: GenerationContext, **options: Any) -> int:
+        return context.row_index * 10
+
+    @generates_batch("batch_only")
+    def batch_only(
+        self, context: GenerationContext, count: int, **options: Any
+    ) -> list[str]:
+        return ["b"] * count
+
+    @generates_batch("short")
+    def short(
+        self, context: GenerationContext, count: int, **options: Any
+    ) -> list[int]:
+        return []
+
+
+def test_generator_get_hooks_includes_batch_only_hooks() -> None:
+    assert _BatchGenerator.get_hooks() == frozenset({
+        "seq",
+        "scalar_only",
+        "batch_only",
+        "short",
+    })
+    assert _BatchGenerator.has_batch_hook("seq")
+    assert not _BatchGenerator.has_batch_hook("scalar_only")
+
+
+def test_plugin_version_prefers_declared_version() -> None:
+    class _Versioned(_SampleGenerator):
+        version = "3.1"
+
+    assert _Versioned.plugin_version() == "3.1"
+
+
+def test_plugin_version_falls_back_to_distribution() -> None:
+    class _Packaged(_SampleGenerator):
+        __module__ = "pluggy.generators"
+
+    assert _Packaged.plugin_version() == metadata.version("pluggy")
+    assert _SampleGenerator.plugin_version() is None
+
+
+def test_generate_batch_uses_native_batch_method() -> None:
+    ctx = GenerationContext(row_index=5)
+    assert _BatchGenerator().generate_batch("seq", ctx, 3, offset=1) == [
+        6,
+        7,
+        8,
+    ]
+
+
+def test_generate_batch_falls_back_to_scalar_loop() -> None:
+    ctx = GenerationContext(row_index=2)
+    values = _BatchGenerator().generate_batch("scalar_only", ctx, 3)
+    assert values == [20, 30, 40]
+    assert ctx.row_index == 2
+
+
+def test_generate_uses_batch_only_hook_for_single_value() -> None:
+    assert _BatchGenerator().generate("batch_only", GenerationContext()) == "b"
+
+
+def test_generate_batch_rejects_wrong_length() -> None:
+    with pytest.raises(ValueError, match="returned 0 values, expected 2"):
+        _BatchGenerator().generate_batch("short", GenerationContext(), 2)
+
+
+def test_generate_batch_unknown_hook_raises() -> None:
+    with pytest.raises(ValueError, match="not supported"):
+        _BatchGenerator().generate_batch("missing", GenerationContext(), 1)
+
+
+def test_generator_registry_resolve_hook_reports_batch_support() -> None:
+    registry = GeneratorRegistry()
+    registry.register(
+        GeneratorRegistration(namespace="num", generator_class=_BatchGenerator)
+    )
+
+    resolved = registry.resolve_hook("num.seq")
+    assert resolved.generator_class is _BatchGenerator
+    assert resolved.local_hook == "seq"
+    assert resolved.supports_batch
+    assert not registry.resolve_hook("num.scalar_only").supports_batch
+
+
+def test_generator_class_rejects_duplicate_batch_hooks() -> None:
+    with pytest.raises(TypeError, match="Duplicate batch hook 'n'"):
+
+        class _DuplicateBatchGenerator(Generator):
+            @generates_batch("n")
+            def first(
+                self, context: GenerationContext, count: int, **options: Any
+            ) -> list[int]:
+                return [1] * count
+
+            @generates_batch("n")
+            def second(
+                self, context: GenerationContext, count: int, **options: Any
+            ) -> list[int]:
+                return [2] * count
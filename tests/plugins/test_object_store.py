@@ -0,0 +1,253 @@
+"""Tests for object store refs, clients and path resolvers."""
+
+from __future__ import annotations
+
+import gzip
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from limbo_core.adapters.persistence import (
+    DataPersistenceRegistry,
+    PathResolverRegistry,
+)
+from limbo_core.domain.entities.backends import (
+    DestinationBackendSpec,
+    PathBackendSpec,
+)
+from limbo_core.domain.entities.resources.path_spec import PathSpec
+from limbo_core.domain.validation import ValidationError
+from limbo_core.domain.value_objects import (
+    ObjectStorePool,
+    ObjectStoreStorageRef,
+    TabularBatch,
+)
+from limbo_core.plugins.builtin.persistence import (
+    ArrowIpcFileDataPersistenceBackend,
+    CsvFileDataPersistenceBackend,
+    JsonlFileDataPersistenceBackend,
+    LocalBucketObjectStore,
+    LocalBucketPathResolver,
+    MemoryObjectStore,
+    MemoryPathResolver,
+    ParquetFileDataPersistenceBackend,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from limbo_core.application.interfaces.persistence import (
+        DataPersistenceBackend,
+    )
+
+
+def _ref(
+    store: MemoryObjectStore, key: str = "data.bin", *, part_size: int = 4
+) -> ObjectStoreStorageRef:
+    return ObjectStoreStorageRef(
+        backend="memory",
+        key=key,
+        pool=ObjectStorePool(lambda: store),
+        part_size=part_size,
+    )
+
+
+def test_multipart_write_and_ranged_reads_roundtrip() -> None:
+    store = MemoryObjectStore()
+    ref = _ref(store)
+
+    ref.write_bytes(b"0123456789")
+
+    assert store.objects["data.bin"] == b"0123456789"
+    assert ref.size() == 10
+    assert ref.read_range(3, 6) == b"345"
+    assert ref.read_bytes() == b"0123456789"
+    with ref.open_binary("rb") as fh:
+        fh.seek(7)
+        assert fh.read() == b"789"
+
+
+def test_empty_write_creates_empty_object() -> None:
+    store = MemoryObjectStore()
+
+    _ref(store).write_bytes(b"")
+
+    assert store.objects == {"data.bin": b""}
+
+
+def test_failed_write_leaves_previous_object() -> None:
+    store = MemoryObjectStore(objects={"data.bin": b"old"})
+    ref = _ref(store)
+
+    def _write() -> None:
+        with ref.open_binary("wb") as fh:
+            fh.write(b"new contents spanning parts")
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        _write()
+
+    assert store.objects == {"data.bin": b"old"}
+    assert ref.read_bytes() == b"old"
+
+
+def test_append_and_local_path_are_rejected() -> None:
+    ref = _ref(MemoryObjectStore())
+    with pytest.raises(ValidationError, match="append"):
+        ref.open_binary("ab").__enter__()
+    with pytest.raises(ValidationError, match="not filesystem-backed"):
+        ref.as_local_path()
+
+
+def test_missing_object_cannot_be_read() -> None:
+    ref = _ref(MemoryObjectStore())
+    assert not ref.exists()
+    with pytest.raises(ValidationError, match="does not exist"):
+        ref.read_bytes()
+
+
+def test_compression_is_inferred_from_key_suffix() -> None:
+    store = MemoryObjectStore()
+    ref = _ref(store, "rows.jsonl.gz")
+
+    with ref.open_text("w", encoding="utf-8") as fh:
+        fh.write("hello\n")
+
+    assert gzip.decompress(store.objects["rows.jsonl.gz"]) == b"hello\n"
+    with ref.open_text("r", encoding="utf-8") as fh:
+        assert fh.read() == "hello\n"
+
+
+def test_pool_bounds_concurrent_connections() -> None:
+    store = MemoryObjectStore()
+    active, peak = 0, 0
+    lock = threading.Lock()
+    pool = ObjectStorePool(lambda: store, max_connections=2)
+
+    def borrow(_: int) -> None:
+        nonlocal active, peak
+        with pool.connection():
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            threading.Event().wait(0.01)
+            with lock:
+                active -= 1
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(borrow, range(16)))
+
+    assert peak <= 2
+    assert pool.opened == 2
+
+
+def test_pool_rejects_non_positive_size() -> None:
+    with pytest.raises(ValidationError, match="max_connections"):
+        ObjectStorePool(MemoryObjectStore, max_connections=0)
+
+
+def test_local_bucket_publishes_objects_on_completion(tmp_path: Path) -> None:
+    bucket = LocalBucketObjectStore(tmp_path)
+    ref = ObjectStoreStorageRef(
+        backend="bucket",
+        key="out/data.bin",
+        pool=ObjectStorePool(lambda: bucket),
+        part_size=3,
+    )
+
+    with ref.open_binary("wb") as fh:
+        fh.write(b"abcdefg")
+        assert not ref.exists()
+        assert bucket.list_keys("") == []
+
+    assert (tmp_path / "out" / "data.bin").read_bytes() == b"abcdefg"
+    assert bucket.list_keys("out/") == ["out/data.bin"]
+    assert ref.read_range(2, 5) == b"cde"
+    ref.unlink()
+    assert bucket.list_keys("") == []
+
+
+def test_path_resolver_joins_base_and_location() -> None:
+    resolver = MemoryPathResolver()
+    spec = PathSpec(backend="memory", location="users.csv", base=None)
+
+    ref = resolver.resolve(spec, base="exports", allow_missing=True)
+
+    assert ref.key == "exports/users.csv"
+    assert ref.uri == "memory://exports/users.csv"
+    with pytest.raises(FileNotFoundError):
+        resolver.resolve(spec, base="exports")
+
+
+@pytest.mark.parametrize(
+    "backend_class",
+    [
+        CsvFileDataPersistenceBackend,
+        JsonlFileDataPersistenceBackend,
+        ParquetFileDataPersistenceBackend,
+        ArrowIpcFileDataPersistenceBackend,
+    ],
+)
+def test_file_backends_persist_to_memory_store(
+    backend_class: type[DataPersistenceBackend],
+) -> None:
+    paths = PathResolverRegistry()
+    paths.register("memory", MemoryPathResolver)
+    registry = DataPersistenceRegistry(path_resolver_registry=paths)
+    registry.register("tabular", backend_class)
+    registry.configure(
+        DestinationBackendSpec(
+            name="out",
+            type="tabular",
+            config={"directory": "exports", "storage_backend": "memory"},
+        )
+    )
+    batch = TabularBatch.from_columns(
+        ("id", "name"), {"id": ["1", "2"], "name": ["a", "b"]}
+    )
+
+    registry.save("out", "users", batch)
+
+    assert registry.exists("out", "users")
+    assert list(registry.load("out", "users").column("name")) == ["a", "b"]
+    registry.cleanup("out", "users")
+    assert not registry.exists("out", "users")
+
+
+def test_configured_bucket_resolver_writes_under_root(tmp_path: Path) -> None:
+    paths = PathResolverRegistry()
+    paths.register("bucket", LocalBucketPathResolver)
+    paths.configure(
+        PathBackendSpec(name="bucket", type="bucket", config={"root": tmp_path})
+    )
+    registry = DataPersistenceRegistry(path_resolver_registry=paths)
+    registry.register("csv", CsvFileDataPersistenceBackend)
+    registry.configure(
+        DestinationBackendSpec(
+            name="out",
+            type="csv",
+            config={"directory": "exports", "storage_backend": "bucket"},
+        )
+    )
+
+    registry.save(
+        "out", "users", TabularBatch.from_columns(("id",), {"id": ["1"]})
+    )
+
+    assert (tmp_path / "exports" / "users.csv").read_text() == "id\n1\n"
+
+
+def test_registry_without_path_resolver_rejects_object_storage() -> None:
+    registry = DataPersistenceRegistry()
+    registry.register("csv", CsvFileDataPersistenceBackend)
+    registry.configure(
+        DestinationBackendSpec(
+            name="out",
+            type="csv",
+            config={"directory": "exports", "storage_backend": "memory"},
+        )
+    )
+    with pytest.raises(ValidationError, match="requires a path resolver"):
+        registry.exists("out", "users")
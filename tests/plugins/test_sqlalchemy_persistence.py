@@ -0,0 +1,191 @@
+"""Tests for the SQLAlchemy table DataPersistenceBackend."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import BIGINT, DATE, inspect
+
+from limbo_core.adapters.connections import ConnectionRegistry
+from limbo_core.adapters.persistence import DataPersistenceRegistry
+from limbo_core.domain.entities import (
+    ConnectionBackendSpec,
+    DataType,
+    DestinationBackendSpec,
+)
+from limbo_core.domain.validation import ValidationError
+from limbo_core.domain.value_objects import TableStorageRef, TabularBatch
+from limbo_core.plugins.builtin.connections import SQLAlchemyConnectionBackend
+from limbo_core.plugins.builtin.persistence import (
+    SQLAlchemyDataPersistenceBackend,
+)
+from limbo_core.plugins.builtin.persistence.sqlalchemy_data_persistence_backend import (  # noqa: E501
+    _copy_csv_line,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture
+def connections(tmp_path: Path) -> Iterator[ConnectionRegistry]:
+    registry = ConnectionRegistry()
+    registry.register("sqlalchemy", SQLAlchemyConnectionBackend)
+    registry.configure(
+        ConnectionBackendSpec(
+            name="warehouse",
+            type="sqlalchemy",
+            config={
+                "host": "",
+                "user": "",
+                "password": "",
+                "database": str(tmp_path / "warehouse.db"),
+            },
+        )
+    )
+    yield registry
+    registry.dispose()
+
+
+@pytest.fixture
+def persistence(connections: ConnectionRegistry) -> DataPersistenceRegistry:
+    registry = DataPersistenceRegistry(connection_provider=connections)
+    registry.register("sqlalchemy", SQLAlchemyDataPersistenceBackend)
+    registry.configure(
+        DestinationBackendSpec(
+            name="db",
+            type="sqlalchemy",
+            config={"connection": "warehouse", "batch_rows": 3},
+        )
+    )
+    return registry
+
+
+def _batch(start: int, stop: int) -> TabularBatch:
+    ids = list(range(start, stop))
+    return TabularBatch.from_columns(
+        ("id", "name", "score", "born"),
+        {
+            "id": ids,
+            "name": [None if i % 4 == 0 else f"n{i}" for i in ids],
+            "score": [i / 2 for i in ids],
+            "born": [date(2024, 1, 1 + i % 28) for i in ids],
+        },
+    )
+
+
+def test_round_trips_typed_columns(
+    persistence: DataPersistenceRegistry,
+) -> None:
+    data = _batch(0, 8)
+
+    persistence.save("db", "users", data)
+
+    assert persistence.load("db", "users") == data
+
+
+def test_save_stream_replaces_table_in_batches(
+    persistence: DataPersistenceRegistry,
+) -> None:
+    persistence.save("db", "users", _batch(100, 102))
+    chunks = [_batch(0, 5), _batch(5, 11)]
+
+    persistence.save_stream("db", "users", chunks[0].column_names, chunks)
+
+    loaded = list(persistence.iter_load("db", "users", chunk_rows=4))
+    assert [batch.num_rows for batch in loaded] == [4, 4, 3]
+    assert TabularBatch.concat(chunks[0].column_names, loaded) == (
+        TabularBatch.concat(chunks[0].column_names, chunks)
+    )
+
+
+def test_empty_stream_creates_empty_table(
+    persistence: DataPersistenceRegistry,
+) -> None:
+    persistence.save_stream("db", "empty", ("id", "name"), [])
+
+    loaded = persistence.load("db", "empty")
+    assert loaded.column_names == ("id", "name")
+    assert loaded.num_rows == 0
+
+
+def test_save_stream_infers_types_past_null_leading_chunks(
+    persistence: DataPersistenceRegistry,
+) -> None:
+    names = ("id", "born")
+    chunks = [
+        TabularBatch.from_columns(names, {"id": [None], "born": [None]}),
+        TabularBatch.from_columns(
+            names, {"id": [5], "born": [date(2024, 1, 2)]}
+        ),
+    ]
+
+    persistence.save_stream("db", "users", names, chunks)
+
+    loaded = persistence.load("db", "users")
+    assert loaded.column("id") == [None, 5]
+    assert loaded.column("born") == [None, date(2024, 1, 2)]
+
+
+def test_save_stream_uses_declared_column_types(
+    connections: ConnectionRegistry, persistence: DataPersistenceRegistry
+) -> None:
+    names = ("id", "born")
+    chunk = TabularBatch.from_columns(names, {"id": [None], "born": [None]})
+
+    persistence.save_stream(
+        "db",
+        "users",
+        names,
+        [chunk],
+        column_types={"id": DataType.INTEGER, "born": DataType.DATE},
+    )
+
+    with connections.connect("warehouse").connect() as connection:
+        columns = inspect(connection).get_columns("users")
+    assert [type(column["type"]) for column in columns] == [BIGINT, DATE]
+
+
+def test_exists_and_cleanup(persistence: DataPersistenceRegistry) -> None:
+    assert not persistence.exists("db", "users")
+    persistence.save("db", "users", _batch(0, 2))
+    assert persistence.exists("db", "users")
+
+    persistence.cleanup("db", "users")
+
+    assert not persistence.exists("db", "users")
+    with pytest.raises(FileNotFoundError, match="warehouse://users"):
+        persistence.load("db", "users")
+
+
+def test_copy_csv_keeps_empty_and_marker_strings_distinct_from_null() -> None:
+    line = _copy_csv_line((None, "", "\\N", 7, 'say "hi"', date(2024, 1, 2)))
+
+    assert line == ',"","\\N","7","say ""hi""","2024-01-02"\n'
+
+
+def test_requires_bound_connections() -> None:
+    backend = SQLAlchemyDataPersistenceBackend(connection="warehouse")
+
+    with pytest.raises(ValidationError, match="connection provider"):
+        backend.exists(backend.resolve_storage_ref("users"))
+
+
+def test_rejects_invalid_config() -> None:
+    with pytest.raises(ValidationError, match="connection"):
+        SQLAlchemyDataPersistenceBackend(connection="")
+    with pytest.raises(ValidationError, match="batch_rows"):
+        SQLAlchemyDataPersistenceBackend(connection="db", batch_rows=0)
+
+
+def test_table_ref_has_no_bytes() -> None:
+    ref = TableStorageRef(
+        connection="warehouse", table_name="users", schema_name="raw"
+    )
+
+    assert ref.uri == "warehouse://raw.users"
+    with pytest.raises(ValidationError, match="not a byte stream"):
+        ref.read_bytes()
@@ -0,0 +1,276 @@
+"""Tests for partitioned dataset output of tabular file backends."""
+
+from __future__ import annotations
+
+import re
+from datetime import date
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from limbo_core.adapters.persistence import (
+    DataPersistenceRegistry,
+    PathResolverRegistry,
+)
+from limbo_core.domain.entities import DataType, DestinationBackendSpec
+from limbo_core.domain.validation import ValidationError
+from limbo_core.domain.value_objects import TabularBatch
+from limbo_core.plugins.builtin.persistence import (
+    CsvFileDataPersistenceBackend,
+    FilesystemPathResolver,
+    JsonlFileDataPersistenceBackend,
+    MemoryPathResolver,
+    ParquetFileDataPersistenceBackend,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+    from limbo_core.application.interfaces.persistence import (
+        DataPersistenceBackend,
+    )
+
+
+def _registry(
+    backend_class: type[DataPersistenceBackend], **config: Any
+) -> DataPersistenceRegistry:
+    paths = PathResolverRegistry()
+    paths.register("file", FilesystemPathResolver)
+    paths.register("memory", MemoryPathResolver)
+    registry = DataPersistenceRegistry(path_resolver_registry=paths)
+    registry.register("tabular", backend_class)
+    registry.configure(
+        DestinationBackendSpec(
+            name="out", type="tabular", config={"dataset": True, **config}
+        )
+    )
+    return registry
+
+
+def _batch(rows: int) -> TabularBatch:
+    return TabularBatch.from_columns(
+        ("id", "region", "day"),
+        {
+            "id": list(range(rows)),
+            "region": [("eu", "us/east", None)[i % 3] for i in range(rows)],
+            "day": [date(2024, 1, 1 + i % 2) for i in range(rows)],
+        },
+    )
+
+
+_WRITE_ID = re.compile(r"-[0-9a-f]{32}(?=\.)")
+
+
+def _without_write_ids(names: Iterable[str]) -> list[str]:
+    return sorted(_WRITE_ID.sub("", name) for name in names)
+
+
+def _files(root: Path) -> list[str]:
+    return _without_write_ids(
+        p.relative_to(root).as_posix() for p in root.rglob("*") if p.is_file()
+    )
+
+
+def test_parquet_shards_by_row_count(tmp_path: Path) -> None:
+    registry = _registry(
+        ParquetFileDataPersistenceBackend,
+        directory=tmp_path,
+        max_rows_per_file=4,
+        read_workers=1,
+    )
+    data = _batch(10)
+
+    registry.save_stream(
+        "out", "users", data.column_names, [data.slice(0, 3), data.slice(3, 10)]
+    )
+
+    assert _files(tmp_path / "users") == [
+        "_dataset.json",
+        "part-00000.parquet",
+        "part-00001.parquet",
+        "part-00002.parquet",
+    ]
+    assert registry.load("out", "users") == data
+    assert [
+        batch.num_rows
+        for batch in registry.iter_load("out", "users", chunk_rows=3)
+    ] == [3, 1, 3, 1, 2]
+
+
+def test_jsonl_partitions_by_column_values(tmp_path: Path) -> None:
+    registry = _registry(
+        JsonlFileDataPersistenceBackend,
+        directory=tmp_path,
+        partition_by=["region", "day"],
+        read_workers=4,
+    )
+    data = _batch(6)
+
+    registry.save("out", "users", data)
+
+    assert _files(tmp_path / "users") == [
+        "_dataset.json",
+        "region=__HIVE_DEFAULT_PARTITION__/day=2024-01-01/part-00000.jsonl",
+        "region=__HIVE_DEFAULT_PARTITION__/day=2024-01-02/part-00000.jsonl",
+        "region=eu/day=2024-01-01/part-00000.jsonl",
+        "region=eu/day=2024-01-02/part-00000.jsonl",
+        "region=us%2Feast/day=2024-01-01/part-00000.jsonl",
+        "region=us%2Feast/day=2024-01-02/part-00000.jsonl",
+    ]
+    loaded = registry.load("out", "users")
+    assert loaded.column_names == data.column_names
+    assert sorted(loaded.iter_row_values(), key=itemgetter(0)) == list(
+        data.iter_row_values()
+    )
+
+
+def test_csv_shards_by_bytes_and_compresses_parts(tmp_path: Path) -> None:
+    registry = _registry(
+        CsvFileDataPersistenceBackend,
+        directory=tmp_path,
+        compression="gzip",
+        max_bytes_per_file=1,
+    )
+    data = TabularBatch.from_columns(
+        ("id", "name"), {"id": ["1", "2", "3"], "name": ["a", "b", "c"]}
+    )
+
+    registry.save_stream(
+        "out",
+        "users",
+        data.column_names,
+        [data.slice(i, i + 1) for i in range(3)],
+    )
+
+    assert _files(tmp_path / "users") == [
+        "_dataset.json",
+        "part-00000.csv.gz",
+        "part-00001.csv.gz",
+        "part-00002.csv.gz",
+    ]
+    assert registry.load("out", "users") == data
+
+
+def test_rewrite_removes_stale_parts(tmp_path: Path) -> None:
+    registry = _registry(
+        JsonlFileDataPersistenceBackend, directory=tmp_path, max_rows_per_file=2
+    )
+    registry.save("out", "users", _batch(5))
+
+    registry.save("out", "users", _batch(2))
+
+    assert _files(tmp_path / "users") == ["_dataset.json", "part-00000.jsonl"]
+    assert registry.load("out", "users") == _batch(2)
+
+
+def test_interrupted_rewrite_keeps_previous_dataset(tmp_path: Path) -> None:
+    registry = _registry(
+        JsonlFileDataPersistenceBackend, directory=tmp_path, max_rows_per_file=2
+    )
+    registry.save("out", "users", _batch(5))
+
+    def failing() -> Iterator[TabularBatch]:
+        yield _batch(7).slice(3, 7)
+        raise RuntimeError("interrupted")
+
+    with pytest.raises(RuntimeError, match="interrupted"):
+        registry.save_stream("out", "users", _batch(0).column_names, failing())
+
+    assert registry.load("out", "users") == _batch(5)
+    registry.save("out", "users", _batch(2))
+    assert _files(tmp_path / "users") == ["_dataset.json", "part-00000.jsonl"]
+    assert registry.load("out", "users") == _batch(2)
+
+
+def test_parts_share_declared_column_types(tmp_path: Path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    registry = _registry(
+        ParquetFileDataPersistenceBackend,
+        directory=tmp_path,
+        max_rows_per_file=1,
+    )
+    data = TabularBatch.from_columns(
+        ("id", "score"), {"id": [None, 1], "score": [None, 2.5]}
+    )
+
+    registry.save_stream(
+        "out",
+        "users",
+        data.column_names,
+        [data],
+        column_types={"id": DataType.INTEGER, "score": DataType.FLOAT},
+    )
+
+    schemas = {
+        str(pq.read_schema(path).types)
+        for path in (tmp_path / "users").glob("*.parquet")
+    }
+    assert schemas == {"[DataType(int64), DataType(double)]"}
+    assert registry.load("out", "users") == data
+
+
+def test_empty_dataset_keeps_columns(tmp_path: Path) -> None:
+    registry = _registry(JsonlFileDataPersistenceBackend, directory=tmp_path)
+
+    registry.save_stream("out", "users", ("id", "name"), [])
+
+    assert _files(tmp_path / "users") == ["_dataset.json"]
+    batches = list(registry.iter_load("out", "users"))
+    assert [b.column_names for b in batches] == [("id", "name")]
+    assert batches[0].num_rows == 0
+
+
+def test_exists_and_cleanup_on_object_store() -> None:
+    registry = _registry(
+        JsonlFileDataPersistenceBackend,
+        directory="exports",
+        storage_backend="memory",
+        partition_by=["region"],
+    )
+    with pytest.raises(FileNotFoundError, match="users"):
+        registry.load("out", "users")
+
+    registry.save("out", "users", _batch(3))
+
+    assert registry.exists("out", "users")
+    assert _without_write_ids(
+        registry.storage_ref("out", "users").list_children()
+    ) == [
+        "_dataset.json",
+        "region=__HIVE_DEFAULT_PARTITION__/part-00000.jsonl",
+        "region=eu/part-00000.jsonl",
+        "region=us%2Feast/part-00000.jsonl",
+    ]
+    registry.cleanup("out", "users")
+    assert not registry.exists("out", "users")
+    assert registry.storage_ref("out", "users").list_children() == []
+
+
+@pytest.mark.parametrize(
+    ("config", "match"),
+    [
+        ({"dataset": False, "max_rows_per_file": 10}, "require dataset"),
+        ({"dataset": True, "max_bytes_per_file": 0}, "max_bytes_per_file"),
+        ({"dataset": True, "read_workers": 0}, "read_workers"),
+    ],
+)
+def test_invalid_dataset_options_raise(
+    tmp_path: Path, config: dict[str, Any], match: str
+) -> None:
+    with pytest.raises(ValidationError, match=match):
+        JsonlFileDataPersistenceBackend(directory=tmp_path, **config)
+
+
+def test_partition_columns_must_exist_and_leave_data(tmp_path: Path) -> None:
+    registry = _registry(
+        JsonlFileDataPersistenceBackend,
+        directory=tmp_path,
+        partition_by=["region"],
+    )
+
+    with pytest.raises(ValidationError, match="unknown partition"):
+        registry.save("out", "users", _batch(2).select(("id",)))
+    with pytest.raises(ValidationError, match="data column"):
+        registry.save("out", "users", _batch(2).select(("region",)))
@@ -11,15 +11,18 @@ from typing import TYPE_CHECKING, Any
 import pytest
 
 from limbo_core.adapters.connections.errors import MissingPackageError
+from limbo_core.domain.entities import DataType
 from limbo_core.domain.validation import ValidationError
 from limbo_core.domain.value_objects import TabularBatch
 from limbo_core.plugins.builtin.persistence.tabular_file_utils import (
+    arrow_table_stream,
     cell_from_json_value,
     cell_to_json_value,
     dump_json_bytes,
     ensure_parent_dir,
     load_json_document_from_bytes,
     normalize_arrow_scalar,
+    resolve_json_codec,
     safe_filename_stem,
     tabular_batch_from_json_document,
     tabular_batch_to_json_document,
@@ -106,6 +109,58 @@ class TestNormalizeArrowScalar:
         assert normalize_arrow_scalar(Odd()) == "odd"
 
 
+def _chunk(**columns: list[Any]) -> TabularBatch:
+    return TabularBatch.from_columns(tuple(columns), columns)
+
+
+class TestArrowTableStream:
+    def test_null_leading_chunk_takes_type_from_later_chunk(self) -> None:
+        pytest.importorskip("pyarrow")
+        chunks = [_chunk(x=[None, None], y=[1, 2]), _chunk(x=["a"], y=[2.5])]
+
+        schema, tables = arrow_table_stream(("x", "y"), chunks)
+
+        assert [str(t) for t in schema.types] == ["string", "double"]
+        assert [t.column("x").to_pylist() for t in tables] == [
+            [None, None],
+            ["a"],
+        ]
+
+    def test_declared_types_fix_the_schema(self) -> None:
+        pytest.importorskip("pyarrow")
+        chunks = [_chunk(x=[1], y=[None]), _chunk(x=[2], y=[date(2024, 1, 2)])]
+
+        schema, tables = arrow_table_stream(
+            ("x", "y"), chunks, {"x": DataType.FLOAT, "y": DataType.DATE}
+        )
+
+        assert [str(t) for t in schema.types] == ["double", "date32[day]"]
+        assert sum(t.num_rows for t in tables) == 2
+
+    def test_no_chunks_yield_one_empty_table(self) -> None:
+        pytest.importorskip("pyarrow")
+        schema, tables = arrow_table_stream(("x",), [], {"x": DataType.STRING})
+
+        assert [t.num_rows for t in tables] == [0]
+        assert str(schema.field("x").type) == "string"
+
+    def test_column_null_past_inference_rows_asks_for_types(self) -> None:
+        pytest.importorskip("pyarrow")
+        chunks = [_chunk(x=[None]), _chunk(x=[None]), _chunk(x=["a"])]
+
+        _, tables = arrow_table_stream(("x",), chunks, inference_rows=2)
+
+        with pytest.raises(ValidationError, match="column_types"):
+            list(tables)
+
+    def test_value_not_matching_declared_type_raises(self) -> None:
+        pytest.importorskip("pyarrow")
+        with pytest.raises(ValidationError, match="Column 'x'"):
+            arrow_table_stream(
+                ("x",), [_chunk(x=["a"])], {"x": DataType.INTEGER}
+            )
+
+
 class TestCellToJsonValue:
     def test_datetime_tagged(self) -> None:
         dt = datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
@@ -203,29 +258,22 @@ def _import_except(real_import: Any, blocked: str) -> Any:
     return fake
 
 
-class TestDumpJsonBytes:
-    def test_stdlib_fallback_when_orjson_missing(
+class TestResolveJsonCodec:
+    def test_falls_back_to_stdlib_without_fast_codecs(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         monkeypatch.delitem(sys.modules, "orjson", raising=False)
+        monkeypatch.delitem(sys.modules, "msgspec", raising=False)
+        blocked = _import_except(builtins.__import__, "orjson")
         monkeypatch.setattr(
-            builtins,
-            "__import__",
-            _import_except(builtins.__import__, "orjson"),
+            builtins, "__import__", _import_except(blocked, "msgspec")
         )
-        doc = {"a": 1}
-        raw = dump_json_bytes(doc)
-        assert raw == b'{"a":1}'
-
-    def test_orjson_when_available(self) -> None:
-        orjson = pytest.importorskip("orjson")
-        doc = {"b": [1, 2]}
-        raw = dump_json_bytes(doc)
-        assert raw == orjson.dumps(doc)
+        codec = resolve_json_codec()
+        assert codec.name == "stdlib"
+        assert codec.dumps({"a": 1}) == b'{"a":1}'
+        assert codec.loads(b'{"x":1}') == {"x": 1}
 
-
-class TestLoadJsonDocumentFromBytes:
-    def test_stdlib_fallback_when_orjson_missing(
+    def test_named_codec_must_be_installed(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         monkeypatch.delitem(sys.modules, "orjson", raising=False)
@@ -234,12 +282,45 @@ class TestLoadJsonDocumentFromBytes:
             "__import__",
             _import_except(builtins.__import__, "orjson"),
         )
-        assert load_json_document_from_bytes(b'{"x":1}') == {"x": 1}
+        with pytest.raises(MissingPackageError, match="orjson"):
+            resolve_json_codec("orjson")
+
+    def test_unknown_codec_raises(self) -> None:
+        with pytest.raises(ValidationError, match="json_codec"):
+            resolve_json_codec("yaml")
+
+    @pytest.mark.parametrize("name", ["msgspec", "orjson", "stdlib"])
+    def test_codecs_agree(self, name: str) -> None:
+        if name != "stdlib":
+            pytest.importorskip(name)
+        codec = resolve_json_codec(name)
+        doc = {"b": [1, 2.5, None, True], "s": "x"}
+        assert codec.loads(codec.dumps(doc)) == doc
+        assert codec.dumps(doc) == resolve_json_codec("stdlib").dumps(doc)
+
 
-    def test_orjson_when_available(self) -> None:
-        pytest.importorskip("orjson")
+class TestDumpJsonBytes:
+    def test_uses_the_given_codec(self) -> None:
+        doc = {"a": 1}
+        raw = dump_json_bytes(doc, resolve_json_codec("stdlib"))
+        assert raw == b'{"a":1}'
+
+    def test_default_codec_is_resolved_once(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def fail_import(name: str, *args: Any, **kwargs: Any) -> Any:
+            raise AssertionError(f"imported {name} per call")
+
+        monkeypatch.setattr(builtins, "__import__", fail_import)
+        assert dump_json_bytes({"b": [1, 2]}) == b'{"b":[1,2]}'
         assert load_json_document_from_bytes(b'{"y":2}') == {"y": 2}
 
+
+class TestLoadJsonDocumentFromBytes:
+    def test_uses_the_given_codec(self) -> None:
+        codec = resolve_json_codec("stdlib")
+        assert load_json_document_from_bytes(b'{"x":1}', codec) == {"x": 1}
+
     def test_non_object_root_raises(self) -> None:
         with pytest.raises(ValidationError, match="must be an object"):
             load_json_document_from_bytes(b"[]")
@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+import gzip
 from datetime import UTC, date, datetime
 from typing import TYPE_CHECKING
 
 import pytest
 
-from limbo_core.adapters.persistence import PathResolverRegistry
+from limbo_core.adapters.persistence import (
+    PathResolverRegistry,
+    estimate_batch_bytes,
+)
+from limbo_core.domain.entities import DataType, SeedColumn
 from limbo_core.domain.entities.resources.path_spec import PathSpec
 from limbo_core.domain.validation import ValidationError
 from limbo_core.domain.value_objects import ResolvedStorageRef, TabularBatch
 from limbo_core.plugins.builtin.persistence import (
+    ArrowIpcFileDataPersistenceBackend,
     CsvFileDataPersistenceBackend,
+    FeatherFileDataPersistenceBackend,
     FilesystemPathResolver,
     JsonFileDataPersistenceBackend,
     JsonlFileDataPersistenceBackend,
@@ -21,11 +28,21 @@ from limbo_core.plugins.builtin.persistence import (
 from limbo_core.plugins.plugin_manager import PluginManager
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
     from limbo_core.application.interfaces.persistence import (
         DataPersistenceBackend,
     )
+    from limbo_core.plugins.builtin.persistence.tabular_file_utils import (
+        JsonCodecName,
+    )
+
+
+_PYARROW_BACKENDS = (
+    ParquetFileDataPersistenceBackend,
+    ArrowIpcFileDataPersistenceBackend,
+)
 
 
 def _path_registry() -> PathResolverRegistry:
@@ -75,11 +92,12 @@ def _empty_row_batch() -> TabularBatch:
         JsonFileDataPersistenceBackend,
         JsonlFileDataPersistenceBackend,
         ParquetFileDataPersistenceBackend,
+        ArrowIpcFileDataPersistenceBackend,
     ],
 )
 def test_round_trip_save_load(tmp_path: Path, backend_cls: type) -> None:
     """save then load returns an equivalent batch (lossless formats)."""
-    if backend_cls is ParquetFileDataPersistenceBackend:
+    if backend_cls in _PYARROW_BACKENDS:
         pytest.importorskip("pyarrow")
     d = tmp_path / "out"
     d.mkdir()
@@ -95,6 +113,28 @@ def test_round_trip_save_load(tmp_path: Path, backend_cls: type) -> None:
     assert not backend.exists(_tabular_ref(backend, "users"))
 
 
+@pytest.mark.parametrize(
+    "backend_cls",
+    [
+        JsonFileDataPersistenceBackend,
+        JsonlFileDataPersistenceBackend,
+        ParquetFileDataPersistenceBackend,
+        ArrowIpcFileDataPersistenceBackend,
+    ],
+)
+def test_columnar_batch_round_trip(tmp_path: Path, backend_cls: type) -> None:
+    """Column-major batches save without a row view and load back equal."""
+    if backend_cls in _PYARROW_BACKENDS:
+        pytest.importorskip("pyarrow")
+    backend = backend_cls(directory=tmp_path)
+    sample = _sample_batch()
+    batch = TabularBatch.from_columns(sample.column_names, sample.columns)
+    ref = _tabular_ref(backend, "users")
+    backend.save(ref, batch)
+    loaded = backend.load(ref)
+    assert loaded == batch
+
+
 def test_csv_stdlib_round_trip_coerces_scalars(tmp_path: Path) -> None:
     """CSV load yields strings; bool/date/datetime written as text."""
     d = tmp_path / "csvout"
@@ -121,11 +161,12 @@ def test_csv_stdlib_round_trip_coerces_scalars(tmp_path: Path) -> None:
         JsonFileDataPersistenceBackend,
         JsonlFileDataPersistenceBackend,
         ParquetFileDataPersistenceBackend,
+        ArrowIpcFileDataPersistenceBackend,
     ],
 )
 def test_empty_rows_round_trip(tmp_path: Path, backend_cls: type) -> None:
     """Zero-row batches round-trip for JSON, JSONL, Parquet."""
-    if backend_cls is ParquetFileDataPersistenceBackend:
+    if backend_cls in _PYARROW_BACKENDS:
         pytest.importorskip("pyarrow")
     d = tmp_path / "empty"
     d.mkdir()
@@ -157,10 +198,11 @@ def test_csv_empty_rows_round_trip(tmp_path: Path) -> None:
         JsonFileDataPersistenceBackend,
         JsonlFileDataPersistenceBackend,
         ParquetFileDataPersistenceBackend,
+        ArrowIpcFileDataPersistenceBackend,
     ],
 )
 def test_load_missing_raises(tmp_path: Path, backend_cls: type) -> None:
-    if backend_cls is ParquetFileDataPersistenceBackend:
+    if backend_cls in _PYARROW_BACKENDS:
         pytest.importorskip("pyarrow")
     backend = backend_cls(directory=tmp_path)
     ref = _tabular_ref(backend, "nope")
@@ -175,10 +217,11 @@ def test_load_missing_raises(tmp_path: Path, backend_cls: type) -> None:
         JsonFileDataPersistenceBackend,
         JsonlFileDataPersistenceBackend,
         ParquetFileDataPersistenceBackend,
+        ArrowIpcFileDataPersistenceBackend,
     ],
 )
 def test_invalid_name_raises(backend_cls: type, tmp_path: Path) -> None:
-    if backend_cls is ParquetFileDataPersistenceBackend:
+    if backend_cls in _PYARROW_BACKENDS:
         pytest.importorskip("pyarrow")
     d = tmp_path / "inv"
     d.mkdir()
@@ -256,8 +299,33 @@ def test_jsonl_row_key_mismatch_raises(tmp_path: Path) -> None:
         backend.load(ref)
 
 
+@pytest.mark.parametrize("codec", ["msgspec", "orjson", "stdlib"])
+@pytest.mark.parametrize(
+    "backend_class",
+    [JsonFileDataPersistenceBackend, JsonlFileDataPersistenceBackend],
+)
+def test_json_backends_use_configured_codec(
+    tmp_path: Path,
+    backend_class: type[
+        JsonFileDataPersistenceBackend | JsonlFileDataPersistenceBackend
+    ],
+    codec: JsonCodecName,
+) -> None:
+    if codec != "stdlib":
+        pytest.importorskip(codec)
+    backend = backend_class(directory=tmp_path, json_codec=codec)
+    ref = _tabular_ref(backend, "codec")
+    data = _sample_batch()
+
+    backend.save(ref, data)
+
+    assert backend.load(ref) == data
+    with pytest.raises(ValidationError, match="json_codec"):
+        backend_class(directory=tmp_path, json_codec="yaml")  # type: ignore[arg-type]
+
+
 def test_builtin_registers_tabular_write_backends() -> None:
-    """Builtin plugin registers csv, json, jsonl, parquet data backends."""
+    """Builtin plugin registers the built-in tabular data backends."""
     from limbo_core.adapters.connections import ConnectionRegistry
     from limbo_core.adapters.generators import GeneratorRegistry
     from limbo_core.adapters.persistence import (
@@ -278,5 +346,455 @@ def test_builtin_registers_tabular_write_backends() -> None:
     )
     manager.load_plugins()
     types = manager._data_persistence_registry.get_types()
-    for key in ("csv", "json", "jsonl", "parquet"):
+    for key in (
+        "csv",
+        "json",
+        "jsonl",
+        "parquet",
+        "arrow",
+        "feather",
+        "sqlalchemy",
+    ):
         assert key in types
+
+
+def _int_chunks(total: int, size: int) -> list[TabularBatch]:
+    return [
+        TabularBatch.from_columns(
+            ("id", "name"),
+            {
+                "id": list(range(start, min(start + size, total))),
+                "name": [
+                    f"n{i}" for i in range(start, min(start + size, total))
+                ],
+            },
+        )
+        for start in range(0, total, size)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("backend_cls", "config"),
+    [
+        (JsonFileDataPersistenceBackend, {}),
+        (JsonlFileDataPersistenceBackend, {}),
+        (ParquetFileDataPersistenceBackend, {}),
+        (ArrowIpcFileDataPersistenceBackend, {}),
+        (ArrowIpcFileDataPersistenceBackend, {"compression": "lz4"}),
+        (CsvFileDataPersistenceBackend, {"csv_engine": "pyarrow"}),
+    ],
+)
+def test_save_stream_then_iter_load_round_trip(
+    tmp_path: Path, backend_cls: type, config: dict[str, str]
+) -> None:
+    """Chunks written by save_stream read back in bounded chunks."""
+    if backend_cls in _PYARROW_BACKENDS or config:
+        pytest.importorskip("pyarrow")
+    backend = backend_cls(directory=tmp_path, **config)
+    ref = _tabular_ref(backend, "stream")
+    chunks = _int_chunks(total=25, size=7)
+    backend.save_stream(ref, ("id", "name"), iter(chunks))
+
+    loaded = list(backend.iter_load(ref, chunk_rows=10))
+
+    assert all(chunk.num_rows <= 10 for chunk in loaded)
+    assert TabularBatch.concat(("id", "name"), loaded) == TabularBatch.concat(
+        ("id", "name"), chunks
+    )
+
+
+def test_csv_stdlib_iter_load_chunks_rows(tmp_path: Path) -> None:
+    backend = CsvFileDataPersistenceBackend(directory=tmp_path)
+    ref = _tabular_ref(backend, "stream")
+    backend.save_stream(ref, ("id", "name"), _int_chunks(total=5, size=2))
+
+    loaded = list(backend.iter_load(ref, chunk_rows=2))
+
+    assert [chunk.num_rows for chunk in loaded] == [2, 2, 1]
+    assert loaded[2].column("id") == ["4"]
+
+
+@pytest.mark.parametrize(
+    "backend_cls",
+    [
+        CsvFileDataPersistenceBackend,
+        JsonlFileDataPersistenceBackend,
+        ParquetFileDataPersistenceBackend,
+        ArrowIpcFileDataPersistenceBackend,
+    ],
+)
+def test_save_stream_without_chunks_keeps_columns(
+    tmp_path: Path, backend_cls: type
+) -> None:
+    if backend_cls in _PYARROW_BACKENDS:
+        pytest.importorskip("pyarrow")
+    backend = backend_cls(directory=tmp_path)
+    ref = _tabular_ref(backend, "empty")
+    backend.save_stream(ref, ("id",), iter(()))
+
+    loaded = list(backend.iter_load(ref))
+
+    assert len(loaded) == 1
+    assert loaded[0].column_names == ("id",)
+    assert loaded[0].num_rows == 0
+
+
+def test_save_stream_rejects_mismatched_chunk(tmp_path: Path) -> None:
+    backend = JsonlFileDataPersistenceBackend(directory=tmp_path)
+    ref = _tabular_ref(backend, "bad")
+    other = TabularBatch.from_columns(("x",), {"x": [1]})
+    with pytest.raises(ValidationError, match="chunk 0 columns"):
+        backend.save_stream(ref, ("id",), [other])
+
+
+@pytest.mark.parametrize(
+    ("backend_cls", "config"),
+    [
+        (ParquetFileDataPersistenceBackend, {}),
+        (ArrowIpcFileDataPersistenceBackend, {}),
+        (CsvFileDataPersistenceBackend, {"csv_engine": "pyarrow"}),
+    ],
+)
+@pytest.mark.parametrize("leading", [[None, None], []], ids=["null", "empty"])
+def test_arrow_save_stream_types_columns_missing_from_first_chunk(
+    tmp_path: Path,
+    backend_cls: type,
+    config: dict[str, str],
+    leading: list[str | None],
+) -> None:
+    pytest.importorskip("pyarrow")
+    backend = backend_cls(directory=tmp_path, **config)
+    ref = _tabular_ref(backend, "sparse")
+    chunks = [
+        TabularBatch.from_columns(
+            ("id", "name"), {"id": list(range(len(leading))), "name": leading}
+        ),
+        TabularBatch.from_columns(("id", "name"), {"id": [9], "name": ["x"]}),
+    ]
+
+    backend.save_stream(ref, ("id", "name"), chunks)
+    loaded = backend.load(ref)
+
+    assert loaded.num_rows == len(leading) + 1
+    assert list(loaded.column("name"))[-1] == "x"
+
+
+def test_parquet_save_stream_uses_declared_column_types(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    backend = ParquetFileDataPersistenceBackend(directory=tmp_path)
+    ref = _tabular_ref(backend, "typed")
+    chunks = [
+        TabularBatch.from_columns(("v",), {"v": [1, 2]}),
+        TabularBatch.from_columns(("v",), {"v": [2.5]}),
+    ]
+
+    backend.save_stream(ref, ("v",), chunks, column_types={"v": DataType.FLOAT})
+
+    assert backend.load(ref).column("v") == [1.0, 2.0, 2.5]
+
+
+def test_iter_load_rejects_non_positive_chunk_rows(tmp_path: Path) -> None:
+    backend = CsvFileDataPersistenceBackend(directory=tmp_path)
+    ref = _tabular_ref(backend, "t")
+    backend.save(ref, _empty_row_batch())
+    with pytest.raises(ValidationError, match="chunk_rows"):
+        backend.iter_load(ref, chunk_rows=0)
+
+
+def test_arrow_ipc_load_decodes_columns_lazily(tmp_path: Path) -> None:
+    """Loaded IPC columns stay in Arrow until a value is accessed."""
+    pytest.importorskip("pyarrow")
+    from limbo_core.plugins.builtin.persistence.tabular_file_utils import (
+        LazyArrowColumn,
+    )
+
+    backend = ArrowIpcFileDataPersistenceBackend(directory=tmp_path)
+    ref = _tabular_ref(backend, "users")
+    backend.save(ref, TabularBatch.concat(("id", "name"), _int_chunks(10, 4)))
+
+    loaded = backend.load(ref)
+    column = loaded.column("id")
+
+    assert isinstance(column, LazyArrowColumn)
+    assert estimate_batch_bytes(loaded) >= column.nbytes > 0
+    assert column._values is None
+    tail = column[8:]
+    assert isinstance(tail, LazyArrowColumn)
+    assert list(tail) == [8, 9]
+    assert column._values is None
+    assert column[3] == 3
+    assert loaded.column("name")[0] == "n0"
+
+
+def test_feather_backend_uses_feather_suffix(tmp_path: Path) -> None:
+    """The feather alias writes .feather files."""
+    backend = FeatherFileDataPersistenceBackend(directory=tmp_path)
+    assert backend.storage_object_name("users") == "users.feather"
+
+
+def test_arrow_ipc_invalid_compression_raises(tmp_path: Path) -> None:
+    """Only lz4 and zstd buffer compression are supported."""
+    with pytest.raises(ValidationError, match="compression"):
+        ArrowIpcFileDataPersistenceBackend(
+            directory=tmp_path,
+            compression="gzip",  # type: ignore[arg-type]
+        )
+
+
+@pytest.mark.parametrize("backend_cls", _PYARROW_BACKENDS)
+def test_load_projected_pushes_columns_and_filters(
+    tmp_path: Path, backend_cls: type
+) -> None:
+    """Arrow-backed loads read only selected columns of matching rows."""
+    pytest.importorskip("pyarrow")
+    backend = backend_cls(directory=tmp_path)
+    ref = _tabular_ref(backend, "users")
+    backend.save_stream(ref, ("id", "name"), iter(_int_chunks(20, 6)))
+
+    loaded = backend.load_projected(
+        ref, columns=("name",), filters=[("id", ">=", 15), ("id", "!=", 17)]
+    )
+
+    assert loaded.column_names == ("name",)
+    assert list(loaded.column("name")) == ["n15", "n16", "n18", "n19"]
+
+
+@pytest.mark.parametrize("backend_cls", _PYARROW_BACKENDS)
+def test_load_projected_not_in_skips_nulls(
+    tmp_path: Path, backend_cls: type
+) -> None:
+    """Nulls never satisfy a filter, matching the generic fallback."""
+    pytest.importorskip("pyarrow")
+    backend = backend_cls(directory=tmp_path)
+    ref = _tabular_ref(backend, "t")
+    batch = TabularBatch.from_columns(
+        ("id", "note"), {"id": [1, 2, 3], "note": ["a", None, "b"]}
+    )
+    backend.save(ref, batch)
+
+    loaded = backend.load_projected(ref, filters=[("note", "not in", ["a"])])
+
+    assert list(loaded.column("id")) == [3]
+    assert loaded.column_names == ("id", "note")
+
+
+def test_load_projected_falls_back_to_in_memory_filtering(
+    tmp_path: Path,
+) -> None:
+    """Backends without pushdown filter the loaded batch."""
+    backend = JsonlFileDataPersistenceBackend(directory=tmp_path)
+    ref = _tabular_ref(backend, "users")
+    backend.save(ref, TabularBatch.concat(("id", "name"), _int_chunks(5, 5)))
+
+    loaded = backend.load_projected(
+        ref, columns=("name", "id"), filters=[("id", "in", [1, 3])]
+    )
+
+    assert loaded.column_names == ("name", "id")
+    assert loaded.column("name") == ["n1", "n3"]
+
+
+def test_parquet_load_projected_missing_raises(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    backend = ParquetFileDataPersistenceBackend(directory=tmp_path)
+    with pytest.raises(FileNotFoundError):
+        backend.load_projected(_tabular_ref(backend, "nope"), columns=("id",))
+
+
+def test_load_projected_rejects_unknown_operator(tmp_path: Path) -> None:
+    backend = JsonlFileDataPersistenceBackend(directory=tmp_path)
+    ref = _tabular_ref(backend, "users")
+    backend.save(ref, TabularBatch.concat(("id", "name"), _int_chunks(2, 2)))
+    with pytest.raises(ValidationError, match="operator"):
+        backend.load_projected(
+            ref,
+            filters=[("id", "~", 1)],  # type: ignore[list-item]
+        )
+
+
+_CSV_TYPED_TEXT = (
+    "id,flag,score,born,seen,at,note\n"
+    "1,true,1.5,2024-01-02,2024-01-02T03:04:05,2024-01-02T03:04:05+00:00,x\n"
+    "2,false,,2025-06-07,2025-06-07T08:09:10,2025-06-07T08:09:10+00:00,\n"
+)
+
+_CSV_SEED_COLUMNS = [
+    SeedColumn(name="id", data_type=DataType.INTEGER),
+    SeedColumn(name="flag", data_type=DataType.BOOLEAN),
+    SeedColumn(name="score", data_type=DataType.FLOAT),
+    SeedColumn(name="born", data_type=DataType.DATE),
+    SeedColumn(name="seen", data_type=DataType.DATETIME),
+    SeedColumn(name="at", data_type=DataType.TIMESTAMP),
+]
+
+
+@pytest.mark.parametrize("engine", ["stdlib", "pyarrow"])
+def test_csv_load_typed_decodes_declared_types(
+    tmp_path: Path, engine: str
+) -> None:
+    """Declared column types are applied while parsing, for both engines."""
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    backend = CsvFileDataPersistenceBackend(
+        directory=tmp_path, csv_engine=engine
+    )
+    ref = _tabular_ref(backend, "seed")
+    (tmp_path / "seed.csv").write_text(_CSV_TYPED_TEXT, encoding="utf-8")
+    column_types = {c.name: c.data_type for c in _CSV_SEED_COLUMNS}
+
+    loaded = backend.load_typed(ref, column_types)
+
+    assert loaded.rows[0] == {
+        "id": 1,
+        "flag": True,
+        "score": 1.5,
+        "born": date(2024, 1, 2),
+        "seen": datetime(2024, 1, 2, 3, 4, 5),  # noqa: DTZ001
+        "at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC),
+        "note": "x",
+    }
+    assert loaded.rows[1]["score"] is None
+    assert loaded.rows[1]["flag"] is False
+    assert loaded.rows[1]["note"] == backend.load(ref).rows[1]["note"]
+
+
+@pytest.mark.parametrize("engine", ["stdlib", "pyarrow"])
+def test_csv_load_typed_leaves_undeclared_columns_as_load(
+    tmp_path: Path, engine: str
+) -> None:
+    """Only declared columns get null handling; boolean spellings agree."""
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    backend = CsvFileDataPersistenceBackend(
+        directory=tmp_path, csv_engine=engine
+    )
+    ref = _tabular_ref(backend, "seed")
+    (tmp_path / "seed.csv").write_text(
+        "flag,note,extra\nyes,,\nN,x,y\n", encoding="utf-8"
+    )
+
+    loaded = backend.load_typed(
+        ref, {"flag": DataType.BOOLEAN, "note": DataType.STRING}
+    )
+
+    assert loaded.column("flag") == [True, False]
+    assert loaded.column("note") == [None, "x"]
+    assert loaded.column("extra") == backend.load(ref).column("extra")
+    (tmp_path / "seed.csv").write_text("flag\nmaybe\n", encoding="utf-8")
+    with pytest.raises(ValidationError, match="Column 'flag'"):
+        backend.load_typed(ref, {"flag": DataType.BOOLEAN})
+
+
+def test_csv_stdlib_load_typed_rejects_bad_cells(tmp_path: Path) -> None:
+    backend = CsvFileDataPersistenceBackend(directory=tmp_path)
+    ref = _tabular_ref(backend, "seed")
+    (tmp_path / "seed.csv").write_text("id\nabc\n", encoding="utf-8")
+    with pytest.raises(ValidationError, match="Column 'id'"):
+        backend.load_typed(ref, {"id": DataType.INTEGER})
+
+
+def test_load_typed_falls_back_to_converting_loaded_batch(
+    tmp_path: Path,
+) -> None:
+    """Backends without typed decoding convert after ``load``."""
+    backend = JsonlFileDataPersistenceBackend(directory=tmp_path)
+    ref = _tabular_ref(backend, "t")
+    backend.save(
+        ref, TabularBatch.from_columns(("id", "n"), {"id": [1, 2], "n": [1, 2]})
+    )
+
+    loaded = backend.load_typed(
+        ref, {"id": DataType.STRING, "n": DataType.FLOAT}
+    )
+
+    assert loaded.column("id") == ["1", "2"]
+    assert loaded.column("n") == [1.0, 2.0]
+    assert isinstance(loaded.column("n")[0], float)
+
+
+@pytest.mark.parametrize(
+    ("backend_cls", "extra"),
+    [
+        (CsvFileDataPersistenceBackend, {}),
+        (CsvFileDataPersistenceBackend, {"csv_engine": "pyarrow"}),
+        (JsonFileDataPersistenceBackend, {}),
+        (JsonlFileDataPersistenceBackend, {}),
+    ],
+)
+def test_compressed_text_backends_round_trip(
+    tmp_path: Path, backend_cls: type, extra: dict[str, str]
+) -> None:
+    """Compressed backends add the codec suffix and gzip the stream."""
+    if extra.get("csv_engine") == "pyarrow":
+        pytest.importorskip("pyarrow")
+    backend = backend_cls(directory=tmp_path, compression="gzip", **extra)
+    name = backend.storage_object_name("users")
+    ref = _tabular_ref(backend, "users")
+    data = TabularBatch.concat(("id", "name"), _int_chunks(50, 50))
+
+    backend.save(ref, data)
+
+    assert name.endswith(".gz")
+    assert (tmp_path / name).read_bytes()[:2] == b"\x1f\x8b"
+    gzip.decompress((tmp_path / name).read_bytes())
+    assert [int(v) for v in backend.load(ref).column("id")] == list(range(50))
+
+
+def test_text_backend_invalid_compression_raises(tmp_path: Path) -> None:
+    with pytest.raises(ValidationError, match="compression"):
+        JsonlFileDataPersistenceBackend(
+            directory=tmp_path,
+            compression="lzma",  # type: ignore[arg-type]
+        )
+
+
+def test_parquet_compression_is_configurable(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    backend = ParquetFileDataPersistenceBackend(
+        directory=tmp_path, compression="zstd", compression_level=5
+    )
+    ref = _tabular_ref(backend, "users")
+    backend.save(ref, TabularBatch.concat(("id", "name"), _int_chunks(5, 5)))
+
+    meta = pq.ParquetFile(tmp_path / "users.parquet").metadata
+    assert meta.row_group(0).column(0).compression == "ZSTD"
+    assert backend.load(ref).column("id") == [0, 1, 2, 3, 4]
+
+
+def test_parquet_invalid_compression_raises(tmp_path: Path) -> None:
+    with pytest.raises(ValidationError, match="compression"):
+        ParquetFileDataPersistenceBackend(
+            directory=tmp_path,
+            compression="lzma",  # type: ignore[arg-type]
+        )
+
+
+@pytest.mark.parametrize(
+    "backend_cls",
+    [
+        CsvFileDataPersistenceBackend,
+        JsonlFileDataPersistenceBackend,
+        *_PYARROW_BACKENDS,
+    ],
+)
+def test_failed_save_stream_keeps_previous_file(
+    tmp_path: Path, backend_cls: type
+) -> None:
+    """Backends write atomically, so a failed write leaves no partial file."""
+    if backend_cls in _PYARROW_BACKENDS:
+        pytest.importorskip("pyarrow")
+    backend = backend_cls(directory=tmp_path)
+    ref = _tabular_ref(backend, "users")
+    backend.save(ref, TabularBatch.concat(("id", "name"), _int_chunks(3, 3)))
+
+    def _failing() -> Iterator[TabularBatch]:
+        yield from _int_chunks(10, 5)
+        raise RuntimeError("generator crashed")
+
+    with pytest.raises(RuntimeError, match="crashed"):
+        backend.save_stream(ref, ("id", "name"), _failing())
+
+    assert [int(v) for v in backend.load(ref).column("id")] == [0, 1, 2]
+    assert [p.name for p in tmp_path.iterdir()] == [ref.as_local_path().name]